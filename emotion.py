@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Compiled Naive Bayes scoring for the emotion classifier.
+
+The pickled classifier (classifierdata.dat) is an nltk NaiveBayesClassifier
+holding one ELEProbDist per (label, 'contains(word)') pair. Scoring a post
+through nltk means building a featureset with one boolean per word in
+word_features and summing a log-probability for every one of them.
+
+Every feature is boolean, so the sum splits into a part that does not
+depend on the post at all (every word absent) and a correction for the
+words that are present:
+
+    score(label) = base[label] + sum(delta[label][i] for i in present)
+
+where base[label] = logP(label) + sum(logP(word=False|label)) and
+delta[label][i] = logP(word_i=True|label) - logP(word_i=False|label).
+CompiledClassifier stores those two tables, so the cost of classifying a
+post tracks the number of words in the post, not the size of the vocabulary.
+A list of posts can be classified in one batch: the posts become a sparse
+post-by-word matrix and, if numpy is available, all label scores come out of
+one sparse matrix product.
+'''
+
+import math, hashlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import jieba
+
+from features import FeatureIndex
+
+# the same approximation of log(0) nltk.probability uses:
+_NINF = float('-1e300')
+
+class CompiledClassifier(object):
+    '''
+    A NaiveBayesClassifier compiled against a fixed FeatureIndex.
+    '''
+
+    def __init__(self, labels, word_features, base, delta):
+        '''
+        Args:
+            labels: list of labels.
+            word_features: FeatureIndex or list of distinct words, the i-th
+                word is feature column i.
+            base: list of per-label scores when no word is present.
+            delta: list of per-label lists, delta[k][i] is added to the score
+                of labels[k] when feature column i is present.
+        '''
+        if not isinstance(word_features, FeatureIndex):
+            word_features = FeatureIndex(word_features)
+        self._labels = list(labels)
+        self._features = word_features
+        self._base = list(base)
+        self._delta = [list(d) for d in delta]
+
+    @classmethod
+    def compile(cls, classifier, word_features):
+        '''
+        Compile a trained nltk NaiveBayesClassifier for features of the form
+        u'contains(word)' = True/False, as built by gender_features().
+
+        The per-feature log-probabilities come from the classifier's own
+        probability distributions, and features the classifier has never
+        seen are ignored, exactly as NaiveBayesClassifier.prob_classify()
+        does.
+        '''
+        if not isinstance(word_features, FeatureIndex):
+            word_features = FeatureIndex(word_features)
+        labels = classifier.labels()
+        feature_probdist = classifier._feature_probdist
+        label_probdist = classifier._label_probdist
+        base = [label_probdist.logprob(label) for label in labels]
+        delta = [[0.0] * len(word_features) for label in labels]
+        for i in xrange(len(word_features)):
+            fname = word_features.fname(i)
+            if not any((label, fname) in feature_probdist for label in labels):
+                continue
+            for k, label in enumerate(labels):
+                if (label, fname) in feature_probdist:
+                    probdist = feature_probdist[label, fname]
+                    absent = probdist.logprob(False)
+                    base[k] += absent
+                    delta[k][i] = probdist.logprob(True) - absent
+                else:
+                    base[k] += _NINF
+        return cls(labels, word_features, base, delta)
+
+    def labels(self):
+        return self._labels
+
+    def version(self):
+        '''
+        Return a digest of the compiled model, which changes whenever the
+        model or its word features change.
+
+        >>> CompiledClassifier(['0', '1'], [u'a'], [-1.0, -2.0], [[0.0], [3.0]]).version()
+        'da77e47c3469'
+        '''
+        if not hasattr(self, '_version'):
+            md5 = hashlib.md5()
+            md5.update(repr(self._labels))
+            md5.update(u'\n'.join(self._features.words()).encode('utf-8'))
+            md5.update(repr(self._base))
+            md5.update(repr(self._delta))
+            self._version = md5.hexdigest()[:12]
+        return self._version
+
+    def word_features(self):
+        return self._features
+
+    def features(self, words):
+        '''
+        Return the set of feature columns present in a segmented text.
+        '''
+        return self._features.ids(words)
+
+    def logprobs(self, ids):
+        '''
+        Return the unnormalized log2 score of each label, as a list aligned
+        with labels(), for a set of present feature columns.
+        '''
+        scores = list(self._base)
+        for k, d in enumerate(self._delta):
+            s = scores[k]
+            for i in ids:
+                s += d[i]
+            scores[k] = s
+        return scores
+
+    def classify_features(self, ids):
+        '''
+        Return the most probable label for a set of present feature columns.
+        Ties are broken the same way nltk's DictionaryProbDist.max() does.
+
+        >>> c = CompiledClassifier(['0', '1'], [u'a', u'b'], [-1.0, -2.0], [[0.0, 0.0], [3.0, 0.0]])
+        >>> c.classify_features(set())
+        '0'
+        >>> c.classify_features(set([0]))
+        '1'
+        '''
+        return max(zip(self.logprobs(ids), self._labels))[1]
+
+    def logprobs_many(self, id_sets):
+        '''
+        Return the label scores for a list of feature column sets, as a list
+        of lists aligned with labels().
+        '''
+        if numpy is None:
+            return [self.logprobs(ids) for ids in id_sets]
+        rows = []
+        cols = []
+        for row, ids in enumerate(id_sets):
+            rows.extend([row] * len(ids))
+            cols.extend(ids)
+        n = len(id_sets)
+        rows = numpy.array(rows, dtype=int)
+        cols = numpy.array(cols, dtype=int)
+        scores = numpy.empty((n, len(self._labels)))
+        for k, d in enumerate(self._delta_array()):
+            scores[:, k] = numpy.bincount(rows, weights=d[cols], minlength=n)
+            scores[:, k] += self._base[k]
+        return scores.tolist()
+
+    def _delta_array(self):
+        if not hasattr(self, '_delta_np'):
+            self._delta_np = numpy.array(self._delta, dtype=float).reshape(len(self._labels), -1)
+        return self._delta_np
+
+    def classify_features_many(self, id_sets):
+        '''
+        >>> c = CompiledClassifier(['0', '1'], [u'a', u'b'], [-1.0, -2.0], [[0.0, 0.0], [3.0, 0.0]])
+        >>> c.classify_features_many([set(), set([0]), set([0, 1])])
+        ['0', '1', '1']
+        '''
+        labels = self._labels
+        return [max(zip(scores, labels))[1] for scores in self.logprobs_many(id_sets)]
+
+    def prob_classify_many(self, texts):
+        '''
+        Segment and score a list of texts in one batch, and return for each
+        text a dict mapping every label to its probability.
+
+        >>> c = CompiledClassifier(['0', '1'], [u'a'], [-1.0, -1.0], [[0.0], [1.0]])
+        >>> [sorted(p.items()) for p in c.prob_classify_many([u'b', u'a'])]
+        [[('0', 0.5), ('1', 0.5)], [('0', 0.3333333333333333), ('1', 0.6666666666666666)]]
+        '''
+        result = []
+        for scores in self.logprobs_many([self.features(words) for words in jieba.cut_many(list(texts))]):
+            top = max(scores)
+            probs = [2.0 ** (s - top) for s in scores]
+            total = math.fsum(probs)
+            result.append(dict(zip(self._labels, [p / total for p in probs])))
+        return result
+
+    def classify_many(self, texts):
+        '''
+        Segment and classify a list of texts in one batch, and return the
+        list of most probable labels. Large batches are segmented by
+        jieba.cut_many(), which cuts them in this process in the web
+        workers, whose threads make forking unsafe.
+        '''
+        return self.classify_features_many([self.features(words) for words in jieba.cut_many(list(texts))])
+
+    def classify_words(self, words):
+        return self.classify_features(self.features(words))
+
+    def classify(self, text):
+        '''
+        Segment text with jieba and return the most probable label.
+        '''
+        if isinstance(text, unicode):
+            return self.classify_features(self._features.ids_at(text, jieba.cut_ends(text)))
+        return self.classify_words(jieba.cut(text))
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
@@ -12,7 +12,10 @@ from fabric.api import *
 _TAR_FILE = 'miniweibo.tar.gz'
 
 def build():
-    includes = ['static', 'transwarp', 'favicon.ico', 'index.wsgi', 'urls.py', 'weibo.py']
+    # the compiled jieba dictionary, loaded by the workers instead of
+    # compiling dict.txt in their first request:
+    local('python jieba/dictfile.py jieba/dict.txt jieba/dict.bin')
+    includes = ['static', 'transwarp', 'jieba', 'favicon.ico', 'index.wsgi', 'urls.py', 'weibo.py', 'emotion.py', 'features.py', 'modelfile.py', 'modelregistry.py', 'model.bin', 'timeline.py', 'pipeline.py', 'resultcache.py', 'statusstore.py']
     excludes = ['.*', '*.pyc', '*.pyo', 'static/css/less/*']
     local('rm -f %s' % _TAR_FILE)
     cmd = ['tar', '--dereference', '-czvf', _TAR_FILE]
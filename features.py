@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Word features of the emotion classifier.
+
+The classifier uses one boolean feature u'contains(word)' per word in
+word_features.dat. FeatureIndex maps every word to a feature column, so the
+features present in a post are found with one dict lookup per token instead
+of scanning the token list once per vocabulary word.
+
+Usage from the training scripts in test/local:
+
+    import sys
+    sys.path.append('../..')
+    from features import FeatureIndex
+
+    index = FeatureIndex(word_features)
+    featureset = index.featureset(jieba.cut(text))
+'''
+
+import os, pickle, threading
+
+class FeatureIndex(object):
+    '''
+    An index from feature words to feature columns.
+
+    >>> index = FeatureIndex([u'a', u'b', u'a', u'c'])
+    >>> len(index)
+    3
+    >>> index.words()
+    [u'a', u'b', u'c']
+    >>> sorted(index.ids([u'c', u' ', u'x a']))
+    [0, 2]
+    >>> index.fname(2)
+    u'contains(c)'
+    >>> sorted(index.featureset([u'c']).items())
+    [(u'contains(a)', False), (u'contains(b)', False), (u'contains(c)', True)]
+    >>> sorted(index.ids_at(u'ca bx', [1, 2, 3, 5]))
+    [0, 2]
+    '''
+
+    def __init__(self, word_features):
+        self._words = []
+        self._index = {}
+        for w in word_features:
+            if w not in self._index:
+                self._index[w] = len(self._words)
+                self._words.append(w)
+        self._fnames = [u'contains(%s)' % w for w in self._words]
+        self._longest = max([len(w) for w in self._words] or [0])
+        self._absent = dict.fromkeys(self._fnames, False)
+
+    @staticmethod
+    def load(path='word_features.dat'):
+        '''
+        Load a pickled word_features list. The index is built only once per
+        file, and built again if the file is modified.
+        '''
+        path = os.path.abspath(path)
+        mtime = os.path.getmtime(path)
+        with _LOCK:
+            cached = _CACHE.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+        with open(path, 'r') as f:
+            index = FeatureIndex(pickle.load(f))
+        with _LOCK:
+            _CACHE[path] = (mtime, index)
+        return index
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word):
+        return word in self._index
+
+    def words(self):
+        return self._words
+
+    def column(self, word):
+        '''
+        Return the feature column of word, or None if it is not a feature.
+        '''
+        return self._index.get(word)
+
+    def fname(self, i):
+        return self._fnames[i]
+
+    def ids(self, tokens):
+        '''
+        Return the set of feature columns present in a token stream, such as
+        the output of jieba.cut(). Tokens are re-split on whitespace, exactly
+        like (" ".join(tokens)).split() does.
+        '''
+        index = self._index
+        ids = set()
+        for t in tokens:
+            for w in t.split():
+                i = index.get(w)
+                if i is not None:
+                    ids.add(i)
+        return ids
+
+    def ids_at(self, text, ends):
+        '''
+        Return the set of feature columns present in text cut at the end
+        offsets ends, such as jieba.cut_ends(text) returns; the same as
+        ids() of the words, without building them. Words longer than every
+        feature word are not even sliced.
+        '''
+        index, longest = self._index, self._longest
+        ids = set()
+        start = 0
+        for end in ends:
+            if end - start <= longest:
+                i = index.get(text[start:end])
+                if i is not None:
+                    ids.add(i)
+            start = end
+        return ids
+
+    def featureset(self, tokens):
+        '''
+        Return the nltk featureset of a token stream, a dict mapping every
+        u'contains(word)' to True or False.
+        '''
+        fs = self._absent.copy()
+        fnames = self._fnames
+        for i in self.ids(tokens):
+            fs[fnames[i]] = True
+        return fs
+
+_LOCK = threading.Lock()
+_CACHE = {}
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
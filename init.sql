@@ -3,3 +3,7 @@
 create table settings (id varchar(50) not null, value varchar(1000) not null, primary key(id));
 
 create table users (id varchar(200) not null, name varchar(50) not null, image_url varchar(1000) not null, statuses_count bigint not null, friends_count bigint not null, followers_count bigint not null, verified bool not null, verified_type int not null, auth_token varchar(2000) not null, expired_time real not null, primary key(id));
+
+create table statuses (id bigint not null, user_id varchar(200) not null, created_date varchar(8) not null, status_data mediumtext not null, primary key(id), index(user_id, created_date));
+
+create table timelines (user_id varchar(200) not null, since_id bigint not null, max_id bigint not null, synced_date varchar(8) not null, last_sync real not null, primary key(user_id));
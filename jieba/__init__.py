@@ -8,47 +8,32 @@ import sys
 import finalseg
 import time
 import tempfile
-import marshal
+import dictfile
+import atomicfile
+import blockcache
 from math import log
-import random
+from array import array
 import threading
 from functools import wraps
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 DICTIONARY = "dict.txt"
 DICT_LOCK = threading.RLock()
-trie = None # to be initialized
-FREQ = {}
+FREQ = {} # to be initialized, a dictfile.DictFile
 min_freq = 0.0
 total =0.0
 user_word_tag_tab={}
 initialized = False
-
-def gen_trie(f_name):
-    lfreq = {}
-    trie = {}
-    ltotal = 0.0
-    with open(f_name, 'rb') as f:
-        lineno = 0 
-        for line in f.read().rstrip().decode('utf-8').split('\n'):
-            lineno += 1
-            try:
-                word,freq,_ = line.split(' ')
-                freq = float(freq)
-                lfreq[word] = freq
-                ltotal+=freq
-                p = trie
-                for c in word:
-                    if not c in p:
-                        p[c] ={}
-                    p = p[c]
-                p['']='' #ending flag
-            except ValueError, e:
-                print >> sys.stderr, f_name, ' at line', lineno, line
-                raise e
-    return trie, lfreq,ltotal
+block_cache = None # a blockcache.BlockCache, see enable_cache()
+cut_pool = None # worker processes of cut_many()
+CUT_POOL_LOCK = threading.Lock()
 
 def initialize(*args):
-    global trie, FREQ, total, min_freq, initialized
+    global FREQ, total, min_freq, initialized
     if len(args)==0:
         dictionary = DICTIONARY
     else:
@@ -56,52 +41,80 @@ def initialize(*args):
     with DICT_LOCK:
         if initialized:
             return
-        if trie:
-            del trie
-            trie = None
         _curpath=os.path.normpath( os.path.join( os.getcwd(), os.path.dirname(__file__) )  )
 
-        abs_path = os.path.join(_curpath,dictionary)
-        print >> sys.stderr, "Building Trie..., from " + abs_path
-        t1 = time.time()
-        if abs_path == os.path.join(_curpath,"dict.txt"): #defautl dictionary
-            cache_file = os.path.join(tempfile.gettempdir(),"jieba.cache")
-        else: #customer dictionary
-            cache_file = os.path.join(tempfile.gettempdir(),"jieba.user."+str(hash(abs_path))+".cache")
-
-        load_from_cache_fail = True
-        if os.path.exists(cache_file) and os.path.getmtime(cache_file)>os.path.getmtime(abs_path):
-            print >> sys.stderr, "loading model from cache " + cache_file
-            try:
-                trie,FREQ,total,min_freq = marshal.load(open(cache_file,'rb'))
-                load_from_cache_fail = False
-            except:
-                load_from_cache_fail = True
-
-        if load_from_cache_fail:
-            trie,FREQ,total = gen_trie(abs_path)
-            FREQ = dict([(k,log(float(v)/total)) for k,v in FREQ.iteritems()]) #normalize
-            min_freq = min(FREQ.itervalues())
-            print >> sys.stderr, "dumping model to file cache " + cache_file
-            try:
-                tmp_suffix = "."+str(random.random())
-                with open(cache_file+tmp_suffix,'wb') as temp_cache_file:
-                    marshal.dump((trie,FREQ,total,min_freq),temp_cache_file)
-                if os.name=='nt':
-                    import shutil
-                    replace_file = shutil.move
-                else:
-                    replace_file = os.rename
-                replace_file(cache_file+tmp_suffix,cache_file)
-            except:
-                print >> sys.stderr, "dump cache file failed."
-                import traceback
-                print >> sys.stderr, traceback.format_exc()
+        FREQ = load_dict(os.path.join(_curpath,dictionary))
+        total, min_freq = FREQ.total, FREQ.min_freq
 
         initialized = True
 
-        print >> sys.stderr, "loading model cost ", time.time() - t1, "seconds."
-        print >> sys.stderr, "Trie has been built succesfully."
+def load_dict(abs_path):
+    '''
+    Return the dictionary file abs_path as a dictfile.DictFile. It is the
+    compiled file next to abs_path, e.g. the dict.bin made by "fab build",
+    or else a file compiled to the temp directory the first time, and again
+    when abs_path changes.
+    '''
+    _curpath=os.path.normpath( os.path.join( os.getcwd(), os.path.dirname(__file__) )  )
+    print >> sys.stderr, "Building Trie..., from " + abs_path
+    t1 = time.time()
+    if abs_path == os.path.join(_curpath,"dict.txt"): #defautl dictionary
+        cache_file = os.path.join(tempfile.gettempdir(),"jieba.dict")
+    else: #customer dictionary
+        cache_file = os.path.join(tempfile.gettempdir(),"jieba.user."+str(hash(abs_path))+".dict")
+
+    # the compiled dictionary is mmapped, so processes share its pages:
+    freq = _load_compiled(os.path.splitext(abs_path)[0]+".bin", abs_path)
+    if freq is None:
+        freq = _load_compiled(cache_file, abs_path)
+    if freq is None:
+        # compiling takes half a minute: the workers starting meanwhile
+        # wait for the first one, and load the file it writes
+        with _file_lock(cache_file+".lock"):
+            freq = _load_compiled(cache_file, abs_path)
+            if freq is None:
+                data = dictfile.compile_dict(abs_path)
+                print >> sys.stderr, "dumping model to file cache " + cache_file
+                try:
+                    atomicfile.write_file(data, cache_file)
+                    freq = dictfile.DictFile(cache_file)
+                except:
+                    print >> sys.stderr, "dump cache file failed."
+                    import traceback
+                    print >> sys.stderr, traceback.format_exc()
+                    freq = dictfile.DictFile(data=data)
+
+    print >> sys.stderr, "loading model cost ", time.time() - t1, "seconds."
+    print >> sys.stderr, "Trie has been built succesfully."
+    return freq
+
+def _load_compiled(f_name, abs_path):
+    # the compiled dictionary f_name, or None if it is missing, older than
+    # the dictionary abs_path or broken
+    if not (os.path.exists(f_name) and os.path.getmtime(f_name)>=os.path.getmtime(abs_path)):
+        return None
+    print >> sys.stderr, "loading model from cache " + f_name
+    try:
+        return dictfile.DictFile(f_name)
+    except Exception, e:
+        print >> sys.stderr, "load cache file failed: %s" % e
+        return None
+
+@contextmanager
+def _file_lock(f_name):
+    # an exclusive lock between processes, where flock is available
+    f = None
+    if fcntl is not None:
+        try:
+            f = open(f_name, 'a')
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        except (IOError, OSError):
+            pass
+    try:
+        yield
+    finally:
+        if f is not None:
+            f.close()
 
 
 def require_initialized(fn):
@@ -118,20 +131,6 @@ def require_initialized(fn):
     return wrapped
 
 
-def __cut_all(sentence):
-    dag = get_DAG(sentence)
-    old_j = -1
-    for k,L in dag.iteritems():
-        if len(L)==1 and k>old_j:
-            yield sentence[k:L[0]+1]
-            old_j = L[0] 
-        else:
-            for j in L:
-                if j>k:
-                    yield sentence[k:j+1]
-                    old_j = j
-
-
 def calc(sentence,DAG,idx,route):
     N = len(sentence)
     route[N] = (0.0,'')
@@ -139,151 +138,326 @@ def calc(sentence,DAG,idx,route):
         candidates = [ ( FREQ.get(sentence[idx:x+1],min_freq) + route[x+1][0],x ) for x in DAG[idx] ]
         route[idx] = max(candidates)
 
-@require_initialized
-def get_DAG(sentence):
-    N = len(sentence)
-    i,j=0,0
-    p = trie
-    DAG = {}
-    while i<N:
-        c = sentence[j]
-        if c in p:
-            p = p[c]
-            if '' in p:
-                if not i in DAG:
-                    DAG[i]=[]
-                DAG[i].append(j)
-            j+=1
-            if j>=N:
-                i+=1
-                j=i
-                p=trie
+class Tokenizer(object):
+    '''
+    A segmenter with a dictionary of its own, whose cut, cut_ends,
+    cut_for_search and tokenize are those of the module, which use the
+    default dictionary. Tokenizer(dictionary) loads a dictionary file,
+    compiled to the temp directory as the default one is, and Tokenizer()
+    the default dictionary, sharing its pages.
+
+    t.overlay() returns a Tokenizer of the dictionary of t and of the words
+    added to the overlay, e.g. the user dictionary of one model: the
+    dictionary of t is not changed or copied, so an overlay costs only its
+    own words. Add words to t before making overlays of it; an overlay sees
+    them, but the blocks it has cached are not cleared.
+    '''
+
+    def __init__(self, dictionary=None, base=None):
+        if base is not None:
+            self.FREQ = dictfile.OverlayDict(base.FREQ)
+            self.user_word_tag_tab = dict(base.user_word_tag_tab)
         else:
-            p = trie
-            i+=1
-            j=i
-    for i in xrange(len(sentence)):
-        if not i in DAG:
-            DAG[i] =[i]
-    return DAG
-
-
-def __cut_DAG(sentence):
-    DAG = get_DAG(sentence)
-    route ={}
-    calc(sentence,DAG,0,route=route)
-    x = 0
-    buf =u''
-    N = len(sentence)
-    while x<N:
-        y = route[x][1]+1
-        l_word = sentence[x:y]
-        if y-x==1:
-            buf+= l_word
+            if dictionary is None:
+                dictionary = get_abs_path_dict()
+            self.FREQ = load_dict(os.path.normpath(os.path.join(os.getcwd(), dictionary)))
+            self.user_word_tag_tab = {}
+        self.block_cache = None
+
+    def overlay(self, f=None):
+        '''
+        Return a Tokenizer of the dictionary of this one and of the words
+        added to it, first those of the user dictionary f if given.
+        '''
+        t = Tokenizer(base=self)
+        if f is not None:
+            t.load_userdict(f)
+        return t
+
+    def get_DAG(self, sentence):
+        DAG = {}
+        for i, found in enumerate(self.FREQ.all_prefixes(sentence)):
+            DAG[i] = [j for j, freq in found] or [i]
+        return DAG
+
+    def _cut_all(self, sentence):
+        dag = self.get_DAG(sentence)
+        old_j = -1
+        for k,L in dag.iteritems():
+            if len(L)==1 and k>old_j:
+                yield sentence[k:L[0]+1]
+                old_j = L[0]
+            else:
+                for j in L:
+                    if j>k:
+                        yield sentence[k:j+1]
+                        old_j = j
+
+    def _calc_route(self, sentence):
+        # get_DAG and calc in one pass over the dictionary
+        FREQ = self.FREQ
+        min_freq = FREQ.min_freq
+        N = len(sentence)
+        edges = FREQ.all_prefixes(sentence)
+        route = {N: (0.0,'')}
+        for idx in xrange(N-1,-1,-1):
+            route[idx] = max([ (freq + route[x+1][0], x) for x, freq in edges[idx] ] or [(min_freq + route[idx+1][0], idx)])
+        return route
+
+    def _cut_DAG(self, sentence):
+        begin = 0
+        for end in self._cut_DAG_ends(sentence):
+            yield sentence[begin:end]
+            begin = end
+
+    def _cut_DAG_ends(self, sentence):
+        # the end offsets of the words of a block
+        cache = self.block_cache
+        if cache is None:
+            return self._calc_ends(sentence)
+        ends = cache.get(sentence)
+        if ends is None:
+            # the generation before cutting, in case the dictionary changes
+            # meanwhile:
+            generation = cache.generation
+            ends = tuple(self._calc_ends(sentence))
+            cache.put(sentence, ends, generation)
+        return ends
+
+    def _calc_ends(self, sentence):
+        route = self._calc_route(sentence)
+        ends = []
+        x = 0
+        buf = None # start of a run of single chars
+        N = len(sentence)
+        while x<N:
+            y = route[x][1]+1
+            if y-x==1:
+                if buf is None:
+                    buf = x
+            else:
+                if buf is not None:
+                    self._buf_ends(sentence, buf, x, ends)
+                    buf = None
+                ends.append(y)
+            x =y
+        if buf is not None:
+            self._buf_ends(sentence, buf, N, ends)
+        return ends
+
+    def _buf_ends(self, sentence, start, end, ends):
+        # a run of single chars is an unknown word for finalseg, unless it
+        # is a word of the dictionary
+        if end-start>1 and not (sentence[start:end] in self.FREQ):
+            ends.extend(finalseg.cut_ends(sentence[start:end], start))
         else:
-            if len(buf)>0:
-                if len(buf)==1:
-                    yield buf
-                    buf=u''
-                else:
-                    if not (buf in FREQ):
-                        regognized = finalseg.cut(buf)
-                        for t in regognized:
-                            yield t
+            ends.extend(xrange(start+1, end+1))
+
+    def cut(self, sentence, cut_all=False):
+        if not isinstance(sentence, unicode):
+            try:
+                sentence = sentence.decode('utf-8')
+            except UnicodeDecodeError:
+                sentence = sentence.decode('gbk','ignore')
+        re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5a-zA-Z0-9+#&\._]+)", re.U), re.compile(ur"(\r\n|\s)", re.U)
+        if cut_all:
+            re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5]+)", re.U), re.compile(ur"[^a-zA-Z0-9+#\n]", re.U)
+        blocks = re_han.split(sentence)
+        cut_block = self._cut_DAG
+        if cut_all:
+            cut_block = self._cut_all
+        for blk in blocks:
+            if re_han.match(blk):
+                for word in cut_block(blk):
+                    yield word
+            else:
+                tmp = re_skip.split(blk)
+                for x in tmp:
+                    if re_skip.match(x):
+                        yield x
+                    elif not cut_all:
+                        for xx in x:
+                            yield xx
                     else:
-                        for elem in buf:
-                            yield elem
-                    buf=u''
-            yield l_word        
-        x =y
-
-    if len(buf)>0:
-        if len(buf)==1:
-            yield buf
+                        yield x
+
+    def cut_ends(self, unicode_sentence):
+        '''
+        Return the end offsets of the words cut(unicode_sentence) yields, as
+        an array('i'): word k is unicode_sentence[ends[k-1]:ends[k]], and
+        the first starts at 0.
+        '''
+        if not isinstance(unicode_sentence, unicode):
+            raise Exception("jieba: the input parameter should  unicode.")
+        ends = array('i')
+        start = 0
+        for blk in re_han_default.split(unicode_sentence):
+            if re_han_default.match(blk):
+                ends.extend([start+end for end in self._cut_DAG_ends(blk)])
+            else:
+                pos = start
+                for x in re_skip_default.split(blk):
+                    if re_skip_default.match(x):
+                        pos += len(x)
+                        ends.append(pos)
+                    else:
+                        ends.extend(xrange(pos+1, pos+len(x)+1))
+                        pos += len(x)
+            start += len(blk)
+        return ends
+
+    def cut_for_search(self, sentence):
+        FREQ = self.FREQ
+        words = self.cut(sentence)
+        for w in words:
+            if len(w)>2:
+                for i in xrange(len(w)-1):
+                    gram2 = w[i:i+2]
+                    if gram2 in FREQ:
+                        yield gram2
+            if len(w)>3:
+                for i in xrange(len(w)-2):
+                    gram3 = w[i:i+3]
+                    if gram3 in FREQ:
+                        yield gram3
+            yield w
+
+    def tokenize(self, unicode_sentence, mode="default"):
+        #mode ("default" or "search")
+        if not isinstance(unicode_sentence, unicode):
+            raise Exception("jieba: the input parameter should  unicode.")
+        start = 0
+        if mode=='default':
+            for end in self.cut_ends(unicode_sentence):
+                yield (unicode_sentence[start:end],start,end)
+                start=end
         else:
-            if not (buf in FREQ):
-                regognized = finalseg.cut(buf)
-                for t in regognized:
-                    yield t
+            FREQ = self.FREQ
+            for end in self.cut_ends(unicode_sentence):
+                w = unicode_sentence[start:end]
+                if len(w)>2:
+                    for i in xrange(len(w)-1):
+                        gram2 = w[i:i+2]
+                        if gram2 in FREQ:
+                            yield (gram2,start+i,start+i+2)
+                if len(w)>3:
+                    for i in xrange(len(w)-2):
+                        gram3 = w[i:i+3]
+                        if gram3 in FREQ:
+                            yield (gram3,start+i,start+i+3)
+                yield (w,start,end)
+                start=end
+
+    def load_userdict(self, f):
+        if isinstance(f, (str, unicode)):
+            f = open(f, 'rb')
+        content = f.read().decode('utf-8')
+        line_no = 0
+        for line in content.split("\n"):
+            line_no+=1
+            if line.rstrip()=='': continue
+            tup =line.split(" ")
+            word,freq = tup[0],tup[1]
+            if line_no==1:
+                word = word.replace(u'\ufeff',u"") #remove bom flag if it exists
+            if len(tup)==3:
+                self.add_word(word, freq, tup[2])
             else:
-                for elem in buf:
-                    yield elem
+                self.add_word(word, freq)
+
+    def add_word(self, word, freq, tag=None):
+        FREQ = self.FREQ
+        FREQ[word] = log(float(freq) / FREQ.total)
+        if tag is not None:
+            self.user_word_tag_tab[word] = tag.strip()
+        if self.block_cache is not None:
+            self.block_cache.clear()
+
+    def enable_cache(self, maxsize=10000):
+        '''
+        Cache the words of the last maxsize distinct blocks cut, e.g.
+        retweeted texts, hashtags and emoticons that recur in a timeline.
+        The cache is cleared when add_word or load_userdict changes the
+        dictionary.
+        '''
+        self.block_cache = blockcache.BlockCache(maxsize)
+
+    def disable_cache(self):
+        self.block_cache = None
+
+    def cache_stats(self):
+        '''
+        Return the hits, misses, hit_rate, size, maxsize and invalidations
+        of the block cache, or None when it is disabled.
+        '''
+        cache = self.block_cache
+        return None if cache is None else cache.stats()
+
+class _DefaultTokenizer(Tokenizer):
+    # the tokenizer of the module functions: its dictionary is the module
+    # FREQ, loaded by initialize() on first use, and its block cache the
+    # module block_cache
+
+    def __init__(self):
+        self.user_word_tag_tab = user_word_tag_tab
+
+    @property
+    def FREQ(self):
+        if not initialized:
+            initialize(DICTIONARY)
+        return FREQ
+
+    def _get_block_cache(self):
+        return block_cache
+
+    def _set_block_cache(self, cache):
+        global block_cache
+        block_cache = cache
+
+    block_cache = property(_get_block_cache, _set_block_cache)
+
+    def add_word(self, word, freq, tag=None):
+        Tokenizer.add_word(self, word, freq, tag)
+        # the workers were forked with the old dictionary:
+        close_cut_pool()
+
+re_han_default, re_skip_default = re.compile(ur"([\u4E00-\u9FA5a-zA-Z0-9+#&\._]+)", re.U), re.compile(ur"(\r\n|\s)", re.U)
+
+dt = _DefaultTokenizer()
+
+def get_DAG(sentence):
+    return dt.get_DAG(sentence)
 
 def cut(sentence,cut_all=False):
-    if not isinstance(sentence, unicode):
-        try:
-            sentence = sentence.decode('utf-8')
-        except UnicodeDecodeError:
-            sentence = sentence.decode('gbk','ignore')
-    re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5a-zA-Z0-9+#&\._]+)", re.U), re.compile(ur"(\r\n|\s)", re.U)
-    if cut_all:
-        re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5]+)", re.U), re.compile(ur"[^a-zA-Z0-9+#\n]", re.U)
-    blocks = re_han.split(sentence)
-    cut_block = __cut_DAG
-    if cut_all:
-        cut_block = __cut_all
-    for blk in blocks:
-        if re_han.match(blk):
-            #pprint.pprint(__cut_DAG(blk))
-            for word in cut_block(blk):
-                yield word
-        else:
-            tmp = re_skip.split(blk)
-            for x in tmp:
-                if re_skip.match(x):
-                    yield x
-                elif not cut_all:
-                    for xx in x:
-                        yield xx
-                else:
-                    yield x
+    return dt.cut(sentence,cut_all)
+
+def cut_ends(unicode_sentence):
+    '''
+    Return the end offsets of the words cut(unicode_sentence) yields, as an
+    array('i'): word k is unicode_sentence[ends[k-1]:ends[k]], and the
+    first starts at 0.
+    '''
+    return dt.cut_ends(unicode_sentence)
 
 def cut_for_search(sentence):
-    words = cut(sentence)
-    for w in words:
-        if len(w)>2:
-            for i in xrange(len(w)-1):
-                gram2 = w[i:i+2]
-                if gram2 in FREQ:
-                    yield gram2
-        if len(w)>3:
-            for i in xrange(len(w)-2):
-                gram3 = w[i:i+3]
-                if gram3 in FREQ:
-                    yield gram3
-        yield w
+    return dt.cut_for_search(sentence)
 
-@require_initialized
 def load_userdict(f):
-    global trie,total,FREQ
-    if isinstance(f, (str, unicode)):
-        f = open(f, 'rb')
-    content = f.read().decode('utf-8')
-    line_no = 0
-    for line in content.split("\n"):
-        line_no+=1
-        if line.rstrip()=='': continue
-        tup =line.split(" ")
-        word,freq = tup[0],tup[1]
-        if line_no==1:
-            word = word.replace(u'\ufeff',u"") #remove bom flag if it exists
-        if len(tup)==3:
-            add_word(word, freq, tup[2])
-        else:
-            add_word(word, freq)
+    dt.load_userdict(f)
 
 def add_word(word, freq, tag=None):
-    global FREQ, trie, total, user_word_tag_tab
-    freq = float(freq)
-    FREQ[word] = log(freq / total)
-    if tag is not None:
-        user_word_tag_tab[word] = tag.strip()
-    p = trie
-    for c in word:
-        if not c in p:
-            p[c] = {}
-        p = p[c]
-    p[''] = ''                  # ending flag
+    dt.add_word(word, freq, tag)
+
+def overlay(f=None):
+    '''
+    Return a Tokenizer of the default dictionary and of the words added to
+    it, first those of the user dictionary f if given, leaving the default
+    dictionary, and so the module functions, unchanged.
+    '''
+    return dt.overlay(f)
+
+def tokenize(unicode_sentence,mode="default"):
+    return dt.tokenize(unicode_sentence,mode)
 
 __ref_cut = cut
 __ref_cut_for_search = cut_for_search
@@ -336,6 +510,54 @@ def disable_parallel():
     cut = __ref_cut
     cut_for_search = __ref_cut_for_search
 
+@require_initialized
+def cut_many(texts, cut_all=False, chunksize=64, processnum=None):
+    '''
+    Cut a list of texts, e.g. posts, and return the list of the words of
+    each, in order. The texts are sent chunksize at a time to worker
+    processes, forked on first use after the dictionary is loaded so they
+    share its pages, and kept for the next calls; processnum defaults to
+    the number of cpus. A list of at most one chunk, or processnum=1, is
+    cut in this process.
+
+    With processnum=None, nothing is forked on a single cpu, where workers
+    only add their overhead, nor in a process that runs other threads,
+    e.g. a web worker: the child would inherit the locks those threads
+    hold, e.g. of logging or of the dictionary, and could wait on them
+    forever. Pass processnum to fork anyway.
+    '''
+    lcut = __lcut_all if cut_all else __lcut
+    if len(texts) <= chunksize or processnum == 1 or os.name == 'nt':
+        return map(lcut, texts)
+    pool = _get_cut_pool(processnum)
+    if pool is None:
+        return map(lcut, texts)
+    return pool.map(lcut, texts, chunksize)
+
+def _get_cut_pool(processnum):
+    # the worker processes of cut_many(), or None if the texts are better
+    # cut in this process
+    global cut_pool
+    with CUT_POOL_LOCK:
+        if cut_pool is None:
+            from multiprocessing import Pool, cpu_count
+            if processnum is None and (cpu_count() == 1 or threading.active_count() > 1):
+                return None
+            cut_pool = Pool(processnum)
+        return cut_pool
+
+def close_cut_pool():
+    '''
+    Stop the worker processes of cut_many(), and the threads handling them,
+    e.g. before forking; cut_many() forks new ones when called again.
+    '''
+    global cut_pool
+    with CUT_POOL_LOCK:
+        if cut_pool is not None:
+            cut_pool.close()
+            cut_pool.join()
+            cut_pool = None
+
 def set_dictionary(dictionary_path):
     global initialized, DICTIONARY
     with DICT_LOCK:
@@ -344,35 +566,30 @@ def set_dictionary(dictionary_path):
             raise Exception("jieba: path does not exists:" + abs_path)
         DICTIONARY = abs_path
         initialized = False
+        if block_cache is not None:
+            block_cache.clear()
+        close_cut_pool()
+
+def enable_cache(maxsize=10000):
+    '''
+    Cache the words of the last maxsize distinct blocks cut, e.g. retweeted
+    texts, hashtags and emoticons that recur in a timeline. The cache is
+    cleared when add_word, load_userdict or set_dictionary changes the
+    dictionary.
+    '''
+    dt.enable_cache(maxsize)
+
+def disable_cache():
+    dt.disable_cache()
+
+def cache_stats():
+    '''
+    Return the hits, misses, hit_rate, size, maxsize and invalidations of
+    the block cache, or None when it is disabled.
+    '''
+    return dt.cache_stats()
 
 def get_abs_path_dict():
     _curpath=os.path.normpath( os.path.join( os.getcwd(), os.path.dirname(__file__) )  )
     abs_path = os.path.join(_curpath,DICTIONARY)
     return abs_path
-
-def tokenize(unicode_sentence,mode="default"):
-    #mode ("default" or "search")
-    if not isinstance(unicode_sentence, unicode):
-        raise Exception("jieba: the input parameter should  unicode.")
-    start = 0 
-    if mode=='default':
-        for w in cut(unicode_sentence):
-            width = len(w)
-            yield (w,start,start+width)
-            start+=width
-    else:
-        for w in cut(unicode_sentence):
-            width = len(w)
-            if len(w)>2:
-                for i in xrange(len(w)-1):
-                    gram2 = w[i:i+2]
-                    if gram2 in FREQ:
-                        yield (gram2,start+i,start+i+2)
-            if len(w)>3:
-                for i in xrange(len(w)-2):
-                    gram3 = w[i:i+3]
-                    if gram3 in FREQ:
-                        yield (gram3,start+i,start+i+3)
-            yield (w,start,start+width)
-            start+=width
-
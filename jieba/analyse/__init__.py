@@ -1,38 +1,112 @@
 import jieba
 import os
+import heapq
+import threading
+import idffile
 try:
 	from analyzer import ChineseAnalyzer
 except ImportError:
 	pass
 
 _curpath=os.path.normpath( os.path.join( os.getcwd(), os.path.dirname(__file__) )  )
-f_name = os.path.join(_curpath,"idf.txt")
-content = open(f_name,'rb').read().decode('utf-8')
+IDF_PATH = os.path.join(_curpath,"idf.txt")
+IDF_LOCK = threading.Lock()
+idf_table = None # loaded on first use, an idffile.IdfFile
 
-idf_freq = {}
-lines = content.split('\n')
-for line in lines:
-    word,freq = line.split(' ')
-    idf_freq[word] = float(freq)
+def get_idf():
+    '''
+    Return the IDF table, loaded from IDF_PATH on first use: an
+    idffile.IdfFile (get, [], in, len) with its median, in place of the
+    idf_freq dict and median_idf of the versions before.
+    '''
+    global idf_table
+    with IDF_LOCK:
+        if idf_table is None:
+            idf_table = idffile.load_idf(IDF_PATH)
+        return idf_table
 
-median_idf = sorted(idf_freq.values())[len(idf_freq)/2]
+def set_idf_path(idf_path):
+    '''
+    Use the IDF text file idf_path, one "word idf" per line, instead of
+    idf.txt, e.g. a table of our own posts written by build_idf().
+    '''
+    global IDF_PATH, idf_table
+    abs_path = os.path.normpath( os.path.join( os.getcwd(), idf_path )  )
+    if not os.path.exists(abs_path):
+        raise Exception("jieba: path does not exists:" + abs_path)
+    with IDF_LOCK:
+        IDF_PATH = abs_path
+        idf_table = None
+
+def build_idf(documents, out_path):
+    '''
+    Write to out_path the IDF table of documents, each a list of words,
+    e.g. build_idf(jieba.cut_many(texts), 'weibo.idf.txt').
+    '''
+    idffile.write_idf(idffile.compute_idf(documents), out_path)
 stop_words= set([
 "the","of","is","and","to","in","that","we","for","an","are","by","be","as","on","with","can","if","from","which","you","it","this","then","at","have","all","not","one","has","or","that"
 ])
 
-def extract_tags(sentence,topK=20):
-    words = jieba.cut(sentence)
-    freq = {}
+def term_freqs(words, freq=None):
+    '''
+    Count the words that may be keywords, those of 2 chars or more that are
+    not stop words, into the dict freq, and return it.
+    '''
+    if freq is None:
+        freq = {}
     for w in words:
         if len(w.strip())<2: continue
         if w.lower() in stop_words: continue
         freq[w]=freq.get(w,0.0)+1.0
-    total = sum(freq.values())
-    freq = [(k,v/total) for k,v in freq.iteritems()]
+    return freq
+
+def top_tags(freq,topK=20):
+    '''
+    Return the topK words of the term frequencies freq with the highest
+    tf-idf, from a heap rather than sorting them all.
+    '''
+    total = sum(freq.itervalues())
+    idf = get_idf()
+    median_idf = idf.median
+    tf_idf = ((v/total * idf.get(k,median_idf),k) for k,v in freq.iteritems())
+    return [a[1] for a in heapq.nlargest(topK,tf_idf)]
+
+def extract_tags(sentence,topK=20):
+    return extract_tags_from_words(jieba.cut(sentence),topK)
+
+def extract_tags_from_words(words,topK=20):
+    '''
+    extract_tags() of a sentence already cut into words.
+    '''
+    return top_tags(term_freqs(words),topK)
+
+class KeywordAggregator(object):
+    '''
+    The keywords of many documents together, e.g. of a timeline: the term
+    frequencies of every document are summed as they come, and top() ranks
+    the words by tf-idf over all of them.
+    '''
+
+    def __init__(self):
+        self._freq = {}
+        self.documents = 0
+
+    def add_words(self, words):
+        '''
+        Add a document cut into words.
+        '''
+        term_freqs(words, self._freq)
+        self.documents += 1
 
-    tf_idf_list = [(v * idf_freq.get(k,median_idf),k) for k,v in freq]
-    st_list = sorted(tf_idf_list,reverse=True)
+    def add_freqs(self, freq):
+        '''
+        Add a document as its term_freqs().
+        '''
+        total = self._freq
+        for w, n in freq.iteritems():
+            total[w] = total.get(w, 0.0) + n
+        self.documents += 1
 
-    top_tuples= st_list[:topK]
-    tags = [a[1] for a in top_tuples]
-    return tags
+    def top(self, topK=20):
+        return top_tags(self._freq, topK)
@@ -0,0 +1,190 @@
+from __future__ import with_statement
+import os
+import sys
+import mmap
+import struct
+import tempfile
+from math import log
+
+from jieba.atomicfile import write_file
+
+# A compiled IDF table, used through mmap so that it loads at once and its
+# pages are shared by every process using it.
+#
+# Layout, little endian:
+#
+#   header   MAGIC, n_words, blob_size, median
+#   values   float64 * n_words          the idf of each word, in word order
+#   offsets  int32 * (n_words+1)        utf-8 offsets of the words in blob
+#   buckets  int32 * 65537              the first word of each value of the
+#                                       first two utf-8 bytes of a word
+#   blob     the utf-8 encoded words, sorted as bytes
+#
+# A word is found by binary search within its bucket.
+
+MAGIC = 'JBIDF001'
+_HEADER = struct.Struct('<8siid')
+_PAIR = struct.Struct('<ii')
+_DOUBLE = struct.Struct('<d')
+_N_BUCKETS = 65536
+
+def _bucket(key):
+    # the first two bytes of an utf-8 key
+    if len(key) == 1:
+        return ord(key[0]) << 8
+    return (ord(key[0]) << 8) | ord(key[1])
+
+def compile_idf(f_name):
+    '''
+    Compile an IDF text file, one "word idf" per line, and return the
+    compiled table as a str.
+    '''
+    idf = {}
+    with open(f_name, 'rb') as f:
+        lineno = 0
+        for line in f.read().decode('utf-8').split('\n'):
+            lineno += 1
+            if not line.strip():
+                continue
+            try:
+                word, freq = line.split(' ')
+                idf[word] = float(freq)
+            except ValueError, e:
+                print >> sys.stderr, f_name, ' at line', lineno, line
+                raise e
+    return compile_table(idf)
+
+def compile_table(idf):
+    '''
+    Compile a dict of words to idf and return it as a str.
+    '''
+    items = sorted((w.encode('utf-8'), v) for w, v in idf.iteritems())
+    values = [v for k, v in items]
+    offsets = [0]
+    for k, v in items:
+        offsets.append(offsets[-1] + len(k))
+    buckets = [0] * (_N_BUCKETS + 1)
+    for k, v in items:
+        buckets[_bucket(k) + 1] += 1
+    for i in xrange(_N_BUCKETS):
+        buckets[i + 1] += buckets[i]
+    blob = ''.join(k for k, v in items)
+    median = sorted(values)[len(values) / 2] if values else 0.0
+    return ''.join([_HEADER.pack(MAGIC, len(items), len(blob), median),
+                    struct.pack('<%dd' % len(values), *values),
+                    struct.pack('<%di' % len(offsets), *offsets),
+                    struct.pack('<%di' % len(buckets), *buckets),
+                    blob])
+
+class IdfFile(object):
+    '''
+    A compiled IDF table opened with mmap, with the get() of a dict of words
+    to idf, and the median idf, used for the words not in it.
+
+    >>> t = IdfFile(data=compile_table({u'a': 1.0, u'ab': 2.0, u'\u4e2d': 3.0}))
+    >>> t.get(u'ab'), t.get(u'\u4e2d'), t.get(u'b'), t.get(u'', 0.5), len(t), t.median
+    (2.0, 3.0, None, 0.5, 3, 2.0)
+    >>> t[u'a'], u'b' in t
+    (1.0, False)
+    '''
+
+    def __init__(self, f_name=None, data=None):
+        if f_name is None:
+            self._mm = data
+        else:
+            with open(f_name, 'rb') as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, blob_size, self.median = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError('jieba: not a compiled idf table: %s' % f_name)
+        self._n = n
+        self._values = _HEADER.size
+        self._offsets = self._values + 8 * n
+        self._buckets = self._offsets + 4 * (n + 1)
+        self._blob = self._buckets + 4 * (_N_BUCKETS + 1)
+        if self._blob + blob_size != len(self._mm):
+            raise ValueError('jieba: broken compiled idf table: %s' % f_name)
+
+    def __len__(self):
+        return self._n
+
+    def _find(self, key):
+        # the index of an utf-8 key, or -1
+        if not key:
+            return -1
+        mm, blob, offsets = self._mm, self._blob, self._offsets
+        lo, hi = _PAIR.unpack_from(mm, self._buckets + 4 * _bucket(key))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = _PAIR.unpack_from(mm, offsets + 4 * mid)
+            k = mm[blob + start:blob + end]
+            if k < key:
+                lo = mid + 1
+            elif k > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def get(self, word, default=None):
+        i = self._find(word.encode('utf-8'))
+        if i < 0:
+            return default
+        return _DOUBLE.unpack_from(self._mm, self._values + 8 * i)[0]
+
+    def __getitem__(self, word):
+        idf = self.get(word)
+        if idf is None:
+            raise KeyError(word)
+        return idf
+
+    def __contains__(self, word):
+        return self._find(word.encode('utf-8')) >= 0
+
+def load_idf(f_name):
+    '''
+    Return the IdfFile of the IDF text file f_name, compiled to the temp
+    directory the first time, and again when f_name changes.
+    '''
+    abs_path = os.path.abspath(f_name)
+    cache_file = os.path.join(tempfile.gettempdir(), "jieba.idf." + str(hash(abs_path)) + ".bin")
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) > os.path.getmtime(abs_path):
+        try:
+            return IdfFile(cache_file)
+        except Exception, e:
+            print >> sys.stderr, "load idf cache file failed: %s" % e
+    data = compile_idf(abs_path)
+    try:
+        write_file(data, cache_file)
+        return IdfFile(cache_file)
+    except:
+        print >> sys.stderr, "dump idf cache file failed."
+        return IdfFile(data=data)
+
+def compute_idf(documents):
+    '''
+    Return the idf, log(N / document frequency), of the words of N
+    documents, each an iterable of words, e.g. the lists of jieba.cut_many().
+    '''
+    df = {}
+    n = 0
+    for words in documents:
+        n += 1
+        for w in set(words):
+            df[w] = df.get(w, 0) + 1
+    return dict((w, log(float(n) / d)) for w, d in df.iteritems())
+
+def write_idf(idf, f_name):
+    '''
+    Write a dict of words to idf as an IDF text file.
+    '''
+    with open(f_name, 'wb') as f:
+        for w in sorted(idf):
+            # one word per line, with no whitespace
+            if w.split() != [w]:
+                continue
+            f.write(('%s %.9f\n' % (w, idf[w])).encode('utf-8'))
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,15 @@
+from __future__ import with_statement
+import os
+
+def write_file(data, out_name):
+    '''
+    Write the str data to out_name, e.g. a compiled dictionary or model. The
+    file is written to a temporary name and renamed, so processes never see
+    a partial file.
+    '''
+    tmp_name = '%s.%d' % (out_name, os.getpid())
+    with open(tmp_name, 'wb') as f:
+        f.write(data)
+    if os.name == 'nt' and os.path.exists(out_name):
+        os.remove(out_name)
+    os.rename(tmp_name, out_name)
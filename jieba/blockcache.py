@@ -0,0 +1,70 @@
+from __future__ import with_statement
+import threading
+from collections import OrderedDict
+
+class BlockCache(object):
+    '''
+    A thread-safe LRU cache of the words of text blocks, bounded to maxsize
+    blocks. clear() starts a new generation: a result computed before it,
+    with the old dictionary, is not stored by put().
+
+    >>> c = BlockCache(2)
+    >>> gen = c.generation
+    >>> c.put(u'a', (u'a',), gen); c.put(u'b', (u'b',), gen)
+    >>> c.get(u'a'), c.get(u'x')
+    ((u'a',), None)
+    >>> c.put(u'c', (u'c',), gen)
+    >>> c.get(u'b'), len(c)
+    (None, 2)
+    >>> c.clear(); c.put(u'd', (u'd',), gen)
+    >>> c.get(u'd'), sorted(c.stats().items())
+    (None, [('hit_rate', 0.25), ('hits', 1), ('invalidations', 1), ('maxsize', 2), ('misses', 3), ('size', 0)])
+    '''
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.generation = 0
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def get(self, block):
+        with self._lock:
+            words = self._blocks.pop(block, None)
+            if words is None:
+                self._misses += 1
+                return None
+            # most recently used last:
+            self._blocks[block] = words
+            self._hits += 1
+            return words
+
+    def put(self, block, words, generation):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._blocks.pop(block, None)
+            self._blocks[block] = words
+            if len(self._blocks) > self.maxsize:
+                self._blocks.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self.generation += 1
+            self._invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            n = self._hits + self._misses
+            return dict(hits=self._hits, misses=self._misses, hit_rate=float(self._hits) / n if n else 0.0,
+                        size=len(self._blocks), maxsize=self.maxsize, invalidations=self._invalidations)
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
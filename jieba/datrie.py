@@ -0,0 +1,259 @@
+from __future__ import with_statement
+import re
+import struct
+from array import array
+from collections import deque
+
+# A double-array trie of unicode words, each word mapped to an int value.
+#
+# Characters are mapped to codes 1, 2, ... The trie is an array of cells of
+# three int32, (base, check, value): the child of state s by code c is state
+# t = base[s] + c, which exists iff check[t] == s, and value[t] is the value
+# of the word leading to t, or -1. State 0 is the root, a state without
+# children has base 0, and a free cell has check -1.
+#
+# The cells are any sequence of ints, three per state: an array when the
+# trie is built, or a ctypes array over the cells saved with tostring() in
+# an mmapped file, which is used without loading it. A trie is not changed
+# once built; dictfile.DictFile keeps the words added later apart.
+
+_FREE = -1
+
+def _free_cells_re(codes):
+    # a re matching free cells at all the offsets codes[i] - codes[0]
+    L = ['\\x00']
+    for i in xrange(1, len(codes)):
+        gap = codes[i] - codes[i - 1] - 1
+        if gap:
+            L.append('.{%d}' % gap)
+        L.append('\\x00')
+    return re.compile(''.join(L), re.S)
+
+class DoubleArrayTrie(object):
+    '''
+    >>> t = DoubleArrayTrie.build([u'ab', u'abc', u'b'])
+    >>> t.find(u'abc'), t.find(u'a'), t.find(u'x')
+    (1, -1, -1)
+    >>> t.prefixes(u'xabcd', 1)
+    [(2, 0), (3, 1)]
+    >>> t.all_prefixes(u'abx')
+    [[(1, 0)], [(1, 2)], []]
+    >>> t2 = DoubleArrayTrie(t.tostring(), t.codes_tostring())
+    >>> t2.prefixes(u'abcd', 0), t2.find(u'b'), len(t2)
+    ([(1, 0), (2, 1)], 2, 3)
+    '''
+
+    def __init__(self, cells=None, codes=None):
+        '''
+        Use the cells saved by tostring(), or a sequence of their ints, and
+        the character codes saved by codes_tostring(), or make an empty trie
+        for build().
+        '''
+        self._count = None
+        if cells is None:
+            self._buf = array('i', [0, 0, -1])
+            self._size = 1
+            self._codes = {}
+            self._count = 0
+            # the used cells, and where to look for free ones:
+            self._used = bytearray('\1')
+            self._next_free = self._far = 1
+        else:
+            if isinstance(cells, str):
+                cells = array('i', cells)
+            self._buf = cells
+            self._size = len(cells) // 3
+            raw = struct.unpack('<%di' % (len(codes) // 4), codes)
+            self._codes = dict((unichr(raw[i]), raw[i + 1]) for i in xrange(0, len(raw), 2))
+
+    @staticmethod
+    def build(words):
+        '''
+        Build a trie of sorted unique words, the value of a word being its
+        index in words.
+        '''
+        t = DoubleArrayTrie()
+        chars = {}
+        for w in words:
+            for c in w:
+                chars[c] = chars.get(c, 0) + 1
+        # frequent characters get small codes, which packs the array better:
+        for i, c in enumerate(sorted(chars, key=lambda c: -chars[c])):
+            t._codes[c] = i + 1
+        cells = [0, 0, -1]
+        # (state, depth, lo, hi): words[lo:hi] all start with the prefix of
+        # length depth that leads to state. Breadth first, so the states
+        # with many children, near the root, are placed before the rest.
+        queue = deque([(0, 0, 0, len(words))])
+        while queue:
+            s, d, lo, hi = queue.popleft()
+            i = lo
+            if len(words[i]) == d:
+                cells[3 * s + 2] = i
+                i += 1
+            if i == hi:
+                continue
+            children = []
+            while i < hi:
+                c = words[i][d]
+                j = i + 1
+                while j < hi and words[j][d] == c:
+                    j += 1
+                children.append((t._codes[c], i, j))
+                i = j
+            b = t._find_base(cells, [code for code, i, j in children])
+            cells[3 * s] = b
+            for code, i, j in children:
+                n = b + code
+                cells[3 * n + 1] = s
+                queue.append((n, d + 1, i, j))
+        t._buf = array('i', cells)
+        t._size = len(cells) // 3
+        t._count = len(words)
+        return t
+
+    def _find_base(self, cells, codes):
+        # a base b >= 1 such that all cells b + code are free; these cells
+        # are marked used, and added to cells as needed
+        codes = sorted(codes)
+        used = self._used
+        first, last = codes[0], codes[-1]
+        size = len(cells) // 3
+        # used is kept longer than cells, so that used[b + c] needs no
+        # bounds check below:
+        if len(used) < size + last + 2:
+            used.extend('\0' * (size + last + 2 + 4096 - len(used)))
+        rest = codes[1:]
+        pos = max(self._next_free, first + 1)
+        tries = 8
+        while True:
+            # skip the used cells at C speed:
+            pos = used.find('\0', pos)
+            b = pos - first
+            for c in rest:
+                if used[b + c]:
+                    break
+            else:
+                break
+            pos += 1
+            tries -= 1
+            if not tries:
+                # a state with many children, let re try the positions after
+                # the last such state, leaving the holes before to states
+                # with fewer children; the free tail of used always matches
+                pos = max(pos, self._far)
+                b = _free_cells_re(codes).search(used, pos).start() - first
+                self._far = b + first
+                break
+        top = b + last + 1
+        if top > size:
+            cells.extend([0, _FREE, -1] * (top - size))
+        for c in codes:
+            used[b + c] = 1
+        # like darts, give up the few holes left in a region 95% used
+        pos = b + first
+        if pos - self._next_free > 16 and used.count('\1', self._next_free, pos) >= 0.95 * (pos - self._next_free):
+            self._next_free = pos
+        self._next_free = used.find('\0', self._next_free)
+        return b
+
+    def __len__(self):
+        if self._count is None:
+            self._count = sum(1 for i in xrange(self._size) if self._cell(i)[2] >= 0)
+        return self._count
+
+    def _cell(self, n):
+        if n >= self._size:
+            return 0, _FREE, -1
+        cells = self._buf
+        return cells[3 * n], cells[3 * n + 1], cells[3 * n + 2]
+
+    def find(self, word):
+        '''
+        Return the value of word, or -1 if word is not in the trie.
+        '''
+        cells, size, codes = self._buf, self._size, self._codes
+        s = 0
+        for ch in word:
+            c = codes.get(ch)
+            if c is None:
+                return -1
+            t = cells[3 * s] + c
+            if t >= size or cells[3 * t + 1] != s:
+                return -1
+            s = t
+        return cells[3 * s + 2]
+
+    def prefixes(self, sentence, k):
+        '''
+        Return a (j, value) pair for every word sentence[k:j+1] in the trie,
+        in order of j.
+        '''
+        cells, size, codes = self._buf, self._size, self._codes
+        found = []
+        s = 0
+        base = cells[0]
+        for j in xrange(k, len(sentence)):
+            c = codes.get(sentence[j])
+            if c is None:
+                break
+            t = base + c
+            if t >= size:
+                break
+            n = 3 * t
+            if cells[n + 1] != s:
+                break
+            base = cells[n]
+            value = cells[n + 2]
+            if value >= 0:
+                found.append((j, value))
+            s = t
+        return found
+
+    def all_prefixes(self, sentence):
+        '''
+        Return prefixes(sentence, k) for every position k of sentence.
+        '''
+        cells, size, codes = self._buf, self._size, self._codes
+        # the codes of the characters, 0 for those of no word:
+        cs = [codes.get(ch, 0) for ch in sentence]
+        root_base = cells[0]
+        N = len(cs)
+        result = []
+        for k in xrange(N):
+            found = []
+            s = 0
+            base = root_base
+            for j in xrange(k, N):
+                t = base + cs[j]
+                if t == base or t >= size:
+                    break
+                n = 3 * t
+                if cells[n + 1] != s:
+                    break
+                base = cells[n]
+                value = cells[n + 2]
+                if value >= 0:
+                    found.append((j, value))
+                s = t
+            result.append(found)
+        return result
+
+    def tostring(self):
+        '''
+        Return the cells as a str, to be saved with the codes.
+        '''
+        if isinstance(self._buf, array):
+            return self._buf.tostring()
+        return array('i', self._buf).tostring()
+
+    def codes_tostring(self):
+        L = []
+        for ch, c in self._codes.iteritems():
+            L.append(ord(ch))
+            L.append(c)
+        return struct.pack('<%di' % len(L), *L)
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,260 @@
+from __future__ import with_statement
+import sys
+import mmap
+import struct
+import ctypes
+from math import log
+from datrie import DoubleArrayTrie
+from atomicfile import write_file
+
+# A compiled, read-only jieba dictionary that is used through mmap, so it
+# loads in milliseconds and its pages are shared by every process using it.
+#
+# Layout, little endian, every section 8-byte aligned:
+#
+#   header   MAGIC, n_words, n_cells, codes_size, blob_size, total, min_freq
+#   freqs    float64 * n_words          log(freq/total), in word order
+#   offsets  int32 * (n_words+1)        utf-8 offsets of the words in blob
+#   cells    (int32, int32, int32) * n_cells
+#            a datrie.DoubleArrayTrie of the words, the value of a word
+#            being its word id
+#   codes    (int32, int32) * n_chars   the characters and their trie codes
+#   blob     the utf-8 encoded words, sorted
+#
+# Compiling takes half a minute, most of it building the trie; "fab build"
+# runs "python dictfile.py dict.txt dict.bin" to do it ahead of time, and
+# jieba loads dict.bin instead of compiling dict.txt.
+
+MAGIC = 'JBDICT02'
+_HEADER = struct.Struct('<8siiiidd')
+_INT32 = ctypes.c_int32.__ctype_le__
+_DOUBLE = ctypes.c_double.__ctype_le__
+
+def _align(n):
+    return (n + 7) & ~7
+
+def _view(buf, offset, ctype, n):
+    # the array of n ctype at offset of buf, in place if buf is writable
+    t = ctype * n
+    if isinstance(buf, str):
+        return t.from_buffer_copy(buf, offset)
+    return t.from_buffer(buf, offset)
+
+def compile_dict(f_name):
+    '''
+    Compile a dictionary text file, one "word freq [tag]" per line, and
+    return the compiled dictionary as a str.
+    '''
+    lfreq = {}
+    ltotal = 0.0
+    with open(f_name, 'rb') as f:
+        lineno = 0
+        for line in f.read().rstrip().decode('utf-8').split('\n'):
+            lineno += 1
+            try:
+                word,freq,_ = line.split(' ')
+                freq = float(freq)
+                lfreq[word] = freq
+                ltotal += freq
+            except ValueError, e:
+                print >> sys.stderr, f_name, ' at line', lineno, line
+                raise e
+    words = sorted(lfreq)
+    encoded = [w.encode('utf-8') for w in words]
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    blob = ''.join(encoded)
+    trie = DoubleArrayTrie.build(words)
+    cells, codes = trie.tostring(), trie.codes_tostring()
+
+    freqs = [log(lfreq[w] / ltotal) for w in words]
+    L = [_HEADER.pack(MAGIC, len(words), len(cells) // 12, len(codes), len(blob), ltotal, min(freqs)),
+         struct.pack('<%dd' % len(freqs), *freqs),
+         struct.pack('<%di' % len(offsets), *offsets)]
+    size = sum(map(len, L))
+    L.append('\0' * (_align(size) - size))
+    L.extend([cells, codes, blob])
+    return ''.join(L)
+
+def _add_word(words, prefixes, word, freq):
+    words[word] = freq
+    for i in xrange(1, len(word) + 1):
+        prefixes.add(word[:i])
+
+def _merge_prefixes(found, words, prefixes, sentence, k):
+    # the (j, freq) pairs found, and those of the words starting at k; the
+    # set of every prefix of the words stops the scan at the first position
+    # where none of them can match
+    if not (sentence[k:k+1] in prefixes):
+        return found
+    found = dict(found)
+    j = k + 1
+    while j <= len(sentence) and sentence[k:j] in prefixes:
+        freq = words.get(sentence[k:j])
+        if freq is not None:
+            found[j - 1] = freq
+        j += 1
+    return sorted(found.iteritems())
+
+class DictFile(object):
+    '''
+    A compiled dictionary opened with mmap. Acts as a dict from words to log
+    frequencies, and finds the words starting at a position of a sentence.
+    Words set after loading, e.g. by jieba.add_word, are kept apart from
+    the trie, as in an OverlayDict, so the trie is never copied.
+    '''
+
+    def __init__(self, f_name=None, data=None):
+        '''
+        Open the compiled dictionary file f_name, or use the compiled
+        dictionary str data when the file cannot be written, e.g. on a
+        read-only file system.
+        '''
+        if f_name is None:
+            self._mm = data
+        else:
+            with open(f_name, 'rb') as f:
+                # a private mapping, as ctypes arrays need a writable buffer;
+                # it is never written, so its pages stay shared
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, n, n_cells, codes_size, blob_size, self.total, self.min_freq = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError('jieba: not a compiled dictionary: %s' % f_name)
+        self._n = n
+        self._offsets = _HEADER.size + 8 * n
+        cells = _align(self._offsets + 4 * (n + 1))
+        codes = cells + 12 * n_cells
+        self._blob = codes + codes_size
+        if self._blob + blob_size != len(self._mm):
+            raise ValueError('jieba: broken compiled dictionary: %s' % f_name)
+        # the trie and the frequencies are read in place, from the mmap:
+        self._trie = DoubleArrayTrie(_view(self._mm, cells, _INT32, 3 * n_cells), self._mm[codes:self._blob])
+        self._freqs = _view(self._mm, _HEADER.size, _DOUBLE, n)
+        # the words set later, and every prefix of them:
+        self._words = {}
+        self._prefixes = set()
+
+    def __len__(self):
+        return len(self._trie) + sum(1 for w in self._words if self._file_get(w) is None)
+
+    def get(self, word, default=None):
+        if self._words:
+            freq = self._words.get(word)
+            if freq is not None:
+                return freq
+        freq = self._file_get(word)
+        if freq is None:
+            return default
+        return freq
+
+    def _file_get(self, word):
+        # the log frequency of word in the file, or None
+        i = self._trie.find(word)
+        if i < 0:
+            return None
+        return self._freqs[i]
+
+    def __getitem__(self, word):
+        freq = self.get(word)
+        if freq is None:
+            raise KeyError(word)
+        return freq
+
+    def __setitem__(self, word, freq):
+        _add_word(self._words, self._prefixes, word, freq)
+
+    def __contains__(self, word):
+        return word in self._words or self._trie.find(word) >= 0
+
+    def words(self):
+        '''
+        Generate the words of the file, sorted, then the words set later
+        only.
+        '''
+        offsets = struct.unpack_from('<%di' % (self._n + 1), self._mm, self._offsets)
+        for i in xrange(self._n):
+            yield self._mm[self._blob + offsets[i]:self._blob + offsets[i + 1]].decode('utf-8')
+        for w in self._words:
+            if self._file_get(w) is None:
+                yield w
+
+    def prefixes(self, sentence, k):
+        '''
+        Return the end indexes j of the words sentence[k:j+1], and their log
+        frequencies, as a list of (j, freq) pairs.
+        '''
+        freqs = self._freqs
+        found = [(j, freqs[i]) for j, i in self._trie.prefixes(sentence, k)]
+        if self._words:
+            return _merge_prefixes(found, self._words, self._prefixes, sentence, k)
+        return found
+
+    def all_prefixes(self, sentence):
+        '''
+        Return prefixes(sentence, k) for every position k of sentence.
+        '''
+        if self._words:
+            return [self.prefixes(sentence, k) for k in xrange(len(sentence))]
+        freqs = self._freqs
+        return [[(j, freqs[i]) for j, i in found] for found in self._trie.all_prefixes(sentence)]
+
+class OverlayDict(object):
+    '''
+    The words of a base dictionary, a DictFile or another OverlayDict, and
+    words set on top of it. The base is not changed and not copied, so an
+    overlay costs only its own words and many can share one base.
+    '''
+
+    def __init__(self, base):
+        self.base = base
+        self.total, self.min_freq = base.total, base.min_freq
+        self._words = {}
+        # every prefix of the words, so prefixes() stops at the first
+        # position where no word of the overlay can match:
+        self._prefixes = set()
+
+    def __len__(self):
+        return len(self.base) + sum(1 for w in self._words if not (w in self.base))
+
+    def get(self, word, default=None):
+        freq = self._words.get(word)
+        if freq is None:
+            return self.base.get(word, default)
+        return freq
+
+    def __getitem__(self, word):
+        freq = self.get(word)
+        if freq is None:
+            raise KeyError(word)
+        return freq
+
+    def __setitem__(self, word, freq):
+        _add_word(self._words, self._prefixes, word, freq)
+
+    def __contains__(self, word):
+        return word in self._words or word in self.base
+
+    def words(self):
+        '''
+        Generate the words of the base, then the words set on the overlay
+        only.
+        '''
+        for w in self.base.words():
+            yield w
+        for w in self._words:
+            if not (w in self.base):
+                yield w
+
+    def prefixes(self, sentence, k):
+        return _merge_prefixes(self.base.prefixes(sentence, k), self._words, self._prefixes, sentence, k)
+
+    def all_prefixes(self, sentence):
+        '''
+        Return prefixes(sentence, k) for every position k of sentence.
+        '''
+        return [self.prefixes(sentence, k) for k in xrange(len(sentence))]
+
+if __name__=='__main__':
+    # python dictfile.py dict.txt dict.bin
+    write_file(compile_dict(sys.argv[1]), sys.argv[2])
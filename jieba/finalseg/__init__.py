@@ -9,6 +9,7 @@ MIN_FLOAT=-3.14e100
 PROB_START_P = "prob_start.p"
 PROB_TRANS_P = "prob_trans.p"
 PROB_EMIT_P = "prob_emit.p"
+HMM_BIN = "hmm.bin"
 
 
 PrevStatus = {
@@ -44,8 +45,24 @@ def load_model():
 if sys.platform.startswith("java"):
     start_P, trans_P, emit_P = load_model()    
 else:
-    import prob_start,prob_trans,prob_emit
-    start_P, trans_P, emit_P = prob_start.P, prob_trans.P, prob_emit.P
+    from jieba import hmmfile
+    _hmm = hmmfile.HMMFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), HMM_BIN))
+    start_P, trans_P, emit_P = _hmm.start_p, _hmm.trans_p, _hmm.emit_p
+
+try:
+    import dense
+except ImportError:
+    dense = None
+_dense_model = None
+
+def get_dense_model():
+    '''
+    The model compiled to arrays, built on first use, or None without numpy.
+    '''
+    global _dense_model
+    if _dense_model is None and dense is not None:
+        _dense_model = dense.DenseModel(start_P, trans_P, emit_P, PrevStatus)
+    return _dense_model
 
 def viterbi(obs, states, start_p, trans_p, emit_p):
     V = [{}] #tabular
@@ -68,38 +85,76 @@ def viterbi(obs, states, start_p, trans_p, emit_p):
     return (prob, path[state])
 
 
-def __cut(sentence):
+def __cut_ends(sentence, pos_list=None, start=0):
+    # the end offsets of the words, plus start: a word ends at every E or S
     global emit_P
-    prob, pos_list =  viterbi(sentence,('B','M','E','S'), start_P, trans_P, emit_P)
-    begin, next = 0,0
-    #print pos_list, sentence
-    for i,char in enumerate(sentence):
-        pos = pos_list[i]
-        if pos=='B':
-            begin = i
-        elif pos=='E':
-            yield sentence[begin:i+1]
-            next = i+1
-        elif pos=='S':
-            yield char
-            next = i+1
-    if next<len(sentence):
-        yield sentence[next:]
+    if pos_list is None:
+        prob, pos_list =  viterbi(sentence,('B','M','E','S'), start_P, trans_P, emit_P)
+    ends = [start+i+1 for i,pos in enumerate(pos_list) if pos=='E' or pos=='S']
+    if not ends or ends[-1]<start+len(sentence):
+        ends.append(start+len(sentence))
+    return ends
 
-def cut(sentence):
+def __cut(sentence, pos_list=None):
+    begin = 0
+    for end in __cut_ends(sentence, pos_list):
+        yield sentence[begin:end]
+        begin = end
+
+re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5]+)"), re.compile(ur"(\d+\.\d+|[a-zA-Z0-9]+)")
+
+def _decode(sentence):
     if not ( type(sentence) is unicode):
         try:
             sentence = sentence.decode('utf-8')
         except:
             sentence = sentence.decode('gbk','ignore')
-    re_han, re_skip = re.compile(ur"([\u4E00-\u9FA5]+)"), re.compile(ur"(\d+\.\d+|[a-zA-Z0-9]+)")
-    blocks = re_han.split(sentence)
-    for blk in blocks:
+    return sentence
+
+def cut(sentence):
+    sentence = _decode(sentence)
+    begin = 0
+    for end in cut_ends(sentence):
+        yield sentence[begin:end]
+        begin = end
+
+def cut_ends(sentence, start=0):
+    '''
+    Return the end offsets of the words cut() finds in the unicode
+    sentence, plus start.
+    '''
+    ends = []
+    for blk in re_han.split(sentence):
         if re_han.match(blk):
-            for word in __cut(blk):
-                yield word
+            ends.extend(__cut_ends(blk, start=start))
         else:
-            tmp = re_skip.split(blk)
-            for x in tmp:
+            pos = start
+            for x in re_skip.split(blk):
                 if x!="":
-                    yield x
+                    pos += len(x)
+                    ends.append(pos)
+        start += len(blk)
+    return ends
+
+def cut_many(sentences):
+    '''
+    Return the words of each sentence, as a list per sentence, the same as
+    list(cut(sentence)). With numpy, the Chinese blocks of all the sentences,
+    e.g. the unknown words of a set of posts, are decoded together.
+    '''
+    model = get_dense_model()
+    if model is None:
+        return [list(cut(s)) for s in sentences]
+    split = [re_han.split(_decode(s)) for s in sentences]
+    han = [blk for blocks in split for blk in blocks if re_han.match(blk)]
+    paths = iter(model.viterbi_many(han))
+    results = []
+    for blocks in split:
+        words = []
+        for blk in blocks:
+            if re_han.match(blk):
+                words.extend(__cut(blk, paths.next()[1]))
+            else:
+                words.extend(x for x in re_skip.split(blk) if x!="")
+        results.append(words)
+    return results
@@ -0,0 +1,88 @@
+import numpy
+
+# The B/M/E/S HMM of finalseg compiled into dense arrays, and a Viterbi
+# over them with integer back pointers.
+#
+# The states are kept in the order S, M, E, B: numpy.argmax returns the
+# first of equal maxima, which is then the greatest state name, like the
+# max() of (prob, state) tuples in finalseg.viterbi, so both give the same
+# path even when probabilities tie, e.g. on characters never seen.
+
+MIN_FLOAT=-3.14e100
+
+STATES = ('S','M','E','B')
+
+class DenseModel(object):
+    '''
+    start: float64[4], trans: float64[4,4] with trans[y0,y] = -inf when y0
+    may not precede y, emit: float64[4,n_chars+1] whose last column is for
+    the characters not in index, index: {char: column}.
+    '''
+
+    def __init__(self, start_p, trans_p, emit_p, prev_status):
+        n = len(STATES)
+        self.start = numpy.array([start_p[y] for y in STATES])
+        self.trans = numpy.empty((n, n))
+        self.trans.fill(-numpy.inf)
+        for j, y in enumerate(STATES):
+            for y0 in prev_status[y]:
+                self.trans[STATES.index(y0), j] = trans_p[y0].get(y, MIN_FLOAT)
+        chars = set()
+        for y in STATES:
+            chars.update(emit_p[y])
+        self.index = dict((c, i) for i, c in enumerate(sorted(chars)))
+        self.emit = numpy.empty((n, len(self.index) + 1))
+        self.emit.fill(MIN_FLOAT)
+        for i, y in enumerate(STATES):
+            for c, p in emit_p[y].iteritems():
+                self.emit[i, self.index[c]] = p
+        self._end = numpy.array([y in ('E','S') for y in STATES])
+
+    def columns(self, obs):
+        unknown = len(self.index)
+        get = self.index.get
+        return numpy.array([get(c, unknown) for c in obs], dtype=numpy.intp)
+
+    def viterbi(self, obs):
+        '''
+        Return (prob, path) like finalseg.viterbi(obs, ...).
+        '''
+        return self.viterbi_many([obs])[0]
+
+    def viterbi_many(self, obs_list):
+        '''
+        Decode many observation sequences together, one step of all of them
+        per character. Return a (prob, path) per sequence.
+        '''
+        n = len(obs_list)
+        if n == 0:
+            return []
+        lens = numpy.array([len(obs) for obs in obs_list])
+        T = lens.max()
+        # cols[t, k] is the emission column of obs_list[k][t], padded with
+        # the unknown column:
+        cols = numpy.empty((T, n), dtype=numpy.intp)
+        cols.fill(len(self.index))
+        for k, obs in enumerate(obs_list):
+            cols[:len(obs), k] = self.columns(obs)
+        emit, trans = self.emit, self.trans
+        V = self.start[:, None] + emit[:, cols[0]]
+        back = numpy.empty((T, len(STATES), n), dtype=numpy.int8)
+        for t in xrange(1, T):
+            # scores[y0, y, k], added in the same order as finalseg.viterbi:
+            scores = (V[:, None, :] + trans[:, :, None]) + emit[:, cols[t]][None, :, :]
+            back[t] = scores.argmax(axis=0)
+            best = scores.max(axis=0)
+            # sequences already over keep their last column:
+            V = numpy.where(t < lens, best, V)
+        last = numpy.where(self._end[:, None], V, -numpy.inf).argmax(axis=0)
+        results = []
+        for k in xrange(n):
+            state = last[k]
+            prob = V[state, k]
+            path = [None] * lens[k]
+            for t in xrange(lens[k] - 1, -1, -1):
+                path[t] = STATES[state]
+                state = back[t, state, k]
+            results.append((prob, path))
+        return results
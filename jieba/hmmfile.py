@@ -0,0 +1,222 @@
+from __future__ import with_statement
+import os
+import sys
+import mmap
+import struct
+import marshal
+from array import array
+from bisect import bisect_left
+from itertools import izip, imap
+
+# The tables of an HMM of finalseg or posseg in one binary file, used
+# through mmap and decoded to dicts only as they are used, instead of
+# Python modules of dict literals compiled or unmarshalled at import.
+#
+# Layout, little endian:
+#
+#   header      MAGIC, n_states, n_trans, n_emit, n_chars, n_char_states,
+#               names_size
+#   start       float64 * n_states
+#   trans_vals  float64 * n_trans       log probs of the transitions, and
+#   emit_vals   float64 * n_emit        of the emissions, row by row
+#   trans_rows  int32 * (n_states+1)    offsets of the row of each state
+#   trans_cols  int32 * n_trans         sorted successor states of a row
+#   emit_rows   int32 * (n_states+1)
+#   emit_chars  int32 * n_emit          sorted code points of a row
+#   chars       int32 * n_chars         char_state_tab: sorted code points,
+#   char_rows   int32 * (n_chars+1)     the offsets of their states,
+#   char_states int32 * n_char_states   and the states
+#   names       the state names, '\n' separated; a (BMES, tag) state of
+#               posseg is written 'B\tn'
+#
+# The log probs are kept as float64, so the decoders give the same results
+# as with the Python modules.
+
+MAGIC = 'JBHMM001'
+_HEADER = struct.Struct('<8siiiiii')
+
+def _name(state):
+    if isinstance(state, tuple):
+        return '\t'.join(state)
+    return state
+
+def _state(name):
+    if '\t' in name:
+        return tuple(name.split('\t'))
+    return name
+
+def compile_hmm(start_p, trans_p, emit_p, char_state_tab=None):
+    '''
+    Return the HMM tables, dicts as in prob_start.p, prob_trans.p,
+    prob_emit.p and char_state_tab.p, compiled to a str.
+    '''
+    states = sorted(set(start_p) | set(trans_p) | set(emit_p))
+    index = dict((y, i) for i, y in enumerate(states))
+    trans_rows, trans_cols, trans_vals = [0], [], []
+    emit_rows, emit_chars, emit_vals = [0], [], []
+    for y in states:
+        row = sorted((index[y1], p) for y1, p in trans_p.get(y, {}).iteritems())
+        trans_cols.extend(j for j, p in row)
+        trans_vals.extend(p for j, p in row)
+        trans_rows.append(len(trans_cols))
+        row = sorted((ord(c), p) for c, p in emit_p.get(y, {}).iteritems())
+        emit_chars.extend(c for c, p in row)
+        emit_vals.extend(p for c, p in row)
+        emit_rows.append(len(emit_chars))
+    chars, char_rows, char_states = [], [0], []
+    for c in sorted(char_state_tab or ()):
+        chars.append(ord(c))
+        char_states.extend(index[y] for y in char_state_tab[c])
+        char_rows.append(len(char_states))
+    if not char_state_tab:
+        char_rows = []
+    names = '\n'.join(_name(y) for y in states)
+    L = [_HEADER.pack(MAGIC, len(states), len(trans_cols), len(emit_chars), len(chars), len(char_states), len(names))]
+    for typecode, values in (('d', [start_p.get(y, 0.0) for y in states]), ('d', trans_vals), ('d', emit_vals),
+                             ('i', trans_rows), ('i', trans_cols), ('i', emit_rows), ('i', emit_chars),
+                             ('i', chars), ('i', char_rows), ('i', char_states)):
+        L.append(struct.pack('<%d%s' % (len(values), typecode), *values))
+    L.append(names)
+    return ''.join(L)
+
+class _Rows(dict):
+    # a read-only dict of states to rows, each row decoded on first use by
+    # __missing__; a dict so that the decoders' lookups stay at C speed
+    def __init__(self, states, decode):
+        dict.__init__(self)
+        self._states = states
+        self._decode = decode
+
+    def __missing__(self, state):
+        row = self[state] = self._decode(self._states[state])
+        return row
+
+    def get(self, state, default=None):
+        if state in self._states:
+            return self[state]
+        return default
+
+    def keys(self):
+        return list(self._states)
+
+    def __iter__(self):
+        return iter(self._states)
+
+    def __len__(self):
+        return len(self._states)
+
+    def __contains__(self, state):
+        return state in self._states
+
+    def iteritems(self):
+        for state in self._states:
+            yield state, self[state]
+
+    def items(self):
+        return list(self.iteritems())
+
+    def values(self):
+        return [row for state, row in self.iteritems()]
+
+class _CharStates(object):
+    # char_state_tab: the states of a char, found by bisect in the sorted
+    # code points
+    def __init__(self, hmm):
+        self._hmm = hmm
+        self._chars = None
+        self._cache = {}
+
+    def get(self, char, default=None):
+        states = self._cache.get(char)
+        if states is None:
+            hmm = self._hmm
+            if self._chars is None:
+                self._chars = hmm._array('i', hmm._chars, hmm.n_chars)
+            i = bisect_left(self._chars, ord(char))
+            if i == len(self._chars) or self._chars[i] != ord(char):
+                return default
+            a, b = hmm._array('i', hmm._char_rows + 4 * i, 2)
+            states = tuple(hmm.states[j] for j in hmm._array('i', hmm._char_states + 4 * a, b - a))
+            self._cache[char] = states
+        return states
+
+    def __getitem__(self, char):
+        states = self.get(char)
+        if states is None:
+            raise KeyError(char)
+        return states
+
+    def __contains__(self, char):
+        return self.get(char) is not None
+
+class HMMFile(object):
+    '''
+    A compiled HMM opened with mmap. start_p, trans_p, emit_p and
+    char_state_tab act as the dicts they were compiled from.
+    '''
+
+    def __init__(self, f_name):
+        with open(f_name, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, n_trans, n_emit, self.n_chars, n_char_states, names_size = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError('jieba: not a compiled HMM: %s' % f_name)
+        self._start = _HEADER.size
+        self._trans_vals = self._start + 8 * n
+        self._emit_vals = self._trans_vals + 8 * n_trans
+        self._trans_rows = self._emit_vals + 8 * n_emit
+        self._trans_cols = self._trans_rows + 4 * (n + 1)
+        self._emit_rows = self._trans_cols + 4 * n_trans
+        self._emit_chars = self._emit_rows + 4 * (n + 1)
+        self._chars = self._emit_chars + 4 * n_emit
+        self._char_rows = self._chars + 4 * self.n_chars
+        self._char_states = self._char_rows + 4 * (self.n_chars + 1 if self.n_chars else 0)
+        names = self._char_states + 4 * n_char_states
+        if names + names_size != len(self._mm):
+            raise ValueError('jieba: broken compiled HMM: %s' % f_name)
+        self.states = [_state(s) for s in self._mm[names:].split('\n')]
+        index = dict((y, i) for i, y in enumerate(self.states))
+        self.start_p = dict(izip(self.states, self._array('d', self._start, n)))
+        self.trans_p = _Rows(index, self._trans_row)
+        self.emit_p = _Rows(index, self._emit_row)
+        self.char_state_tab = _CharStates(self)
+
+    def _array(self, typecode, offset, n):
+        a = array(typecode)
+        a.fromstring(self._mm[offset:offset + a.itemsize * n])
+        if sys.byteorder == 'big':
+            a.byteswap()
+        return a
+
+    def _row(self, rows, i):
+        return self._array('i', rows + 4 * i, 2)
+
+    def _trans_row(self, i):
+        a, b = self._row(self._trans_rows, i)
+        states = self.states
+        cols = self._array('i', self._trans_cols + 4 * a, b - a)
+        return dict(izip((states[j] for j in cols), self._array('d', self._trans_vals + 8 * a, b - a)))
+
+    def _emit_row(self, i):
+        a, b = self._row(self._emit_rows, i)
+        chars = self._array('i', self._emit_chars + 4 * a, b - a)
+        return dict(izip(imap(unichr, chars), self._array('d', self._emit_vals + 8 * a, b - a)))
+
+def load_marshal(dir_name, names):
+    # the dicts of the marshalled .p files of dir_name
+    L = []
+    for name in names:
+        with open(os.path.join(dir_name, name), 'rb') as f:
+            L.append(marshal.load(f))
+    return L
+
+if __name__=='__main__':
+    # python hmmfile.py finalseg|posseg: compile the .p files of the package
+    # to hmm.bin
+    from atomicfile import write_file
+    package = sys.argv[1]
+    dir_name = os.path.join(os.path.dirname(os.path.abspath(__file__)), package)
+    names = ['prob_start.p', 'prob_trans.p', 'prob_emit.p']
+    if package == 'posseg':
+        names.append('char_state_tab.p')
+    write_file(compile_hmm(*load_marshal(dir_name, names)), os.path.join(dir_name, 'hmm.bin'))
@@ -12,6 +12,7 @@ PROB_START_P = "prob_start.p"
 PROB_TRANS_P = "prob_trans.p"
 PROB_EMIT_P = "prob_emit.p"
 CHAR_STATE_TAB_P = "char_state_tab.p"
+HMM_BIN = "hmm.bin"
 
 def load_model(f_name,isJython=True):
     _curpath=os.path.normpath( os.path.join( os.getcwd(), os.path.dirname(__file__) )  )
@@ -56,13 +57,29 @@ def load_model(f_name,isJython=True):
 if sys.platform.startswith("java"):
     char_state_tab_P, start_P, trans_P, emit_P, word_tag_tab = load_model(jieba.get_abs_path_dict())
 else:
-    import char_state_tab, prob_start, prob_trans, prob_emit
-    char_state_tab_P, start_P, trans_P, emit_P = char_state_tab.P, prob_start.P, prob_trans.P, prob_emit.P
+    from jieba import hmmfile
+    _hmm = hmmfile.HMMFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), HMM_BIN))
+    char_state_tab_P, start_P, trans_P, emit_P = _hmm.char_state_tab, _hmm.start_p, _hmm.trans_p, _hmm.emit_p
     word_tag_tab = load_model(jieba.get_abs_path_dict(),isJython=False)
 
 if jieba.user_word_tag_tab:
     word_tag_tab.update(jieba.user_word_tag_tab)
 
+decoder = None # built on first use, a viterbi.BeamDecoder
+beam_width = None
+
+def set_beam_width(K):
+    '''
+    Keep the K best states per character when tagging unknown words,
+    instead of all of them, the default, restored with K=None. The beam
+    changes the output: on sentimentweibo.txt and data3.txt, K=16 gives
+    the state of the exact decoder to 99.81% of the characters and 99.76%
+    of the blocks, and cut() runs 3.7 times as fast. python viterbi.py
+    corpus.txt reports the accuracy and time of each width.
+    '''
+    global beam_width
+    beam_width = K
+
 class pair(object):
     def __init__(self,word,flag):
         self.word = word
@@ -81,7 +98,13 @@ class pair(object):
         return self.__unicode__().encode(arg)
 
 def __cut(sentence):
-    prob, pos_list =  viterbi.viterbi(sentence,char_state_tab_P, start_P, trans_P, emit_P)
+    global decoder
+    if beam_width is None:
+        prob, pos_list =  viterbi.viterbi(sentence,char_state_tab_P, start_P, trans_P, emit_P)
+    else:
+        if decoder is None:
+            decoder = viterbi.BeamDecoder(char_state_tab_P, start_P, trans_P, emit_P)
+        prob, pos_list =  decoder.decode(sentence, beam_width)
     begin, next = 0,0
 
     for i,char in enumerate(sentence):
@@ -1,5307 +0,0 @@
-P={('B', 'a'): {('E', 'a'): -0.0050648453069648755,
-              ('M', 'a'): -5.287963037107507},
- ('B', 'ad'): {('E', 'ad'): -0.0007479013978476627,
-               ('M', 'ad'): -7.198613337130562},
- ('B', 'ag'): {},
- ('B', 'an'): {('E', 'an'): 0.0},
- ('B', 'b'): {('E', 'b'): -0.06753917715798491,
-              ('M', 'b'): -2.7286269787493125},
- ('B', 'bg'): {},
- ('B', 'c'): {('E', 'c'): -0.04442738163948101,
-              ('M', 'c'): -3.1360307468646766},
- ('B', 'd'): {('E', 'd'): -0.04677309521554972,
-              ('M', 'd'): -3.0857425240950174},
- ('B', 'df'): {('E', 'df'): 0.0},
- ('B', 'dg'): {},
- ('B', 'e'): {('E', 'e'): -0.05870760082677792,
-              ('M', 'e'): -2.864396271492904},
- ('B', 'en'): {},
- ('B', 'f'): {('E', 'f'): -0.01914032315305203,
-              ('M', 'f'): -3.965512906408017},
- ('B', 'g'): {},
- ('B', 'h'): {('E', 'h'): 0.0},
- ('B', 'i'): {('E', 'i'): -7.5100009018967535,
-              ('M', 'i'): -0.0005477305718588087},
- ('B', 'in'): {('M', 'in'): 0.0},
- ('B', 'j'): {('E', 'j'): -0.2543207374058728,
-              ('M', 'j'): -1.4936259227444613},
- ('B', 'jn'): {('M', 'jn'): 0.0},
- ('B', 'k'): {},
- ('B', 'l'): {('E', 'l'): -3.68054609970312, ('M', 'l'): -0.02553239955770466},
- ('B', 'ln'): {('M', 'ln'): 0.0},
- ('B', 'm'): {('E', 'm'): -0.1861592793620009,
-              ('M', 'm'): -1.7727887176378618},
- ('B', 'mg'): {},
- ('B', 'mq'): {('E', 'mq'): -0.9316228008055788,
-               ('M', 'mq'): -0.5007333022296009},
- ('B', 'n'): {('E', 'n'): -0.1386970766026951, ('M', 'n'): -2.04401015913586},
- ('B', 'ng'): {},
- ('B', 'nr'): {('E', 'nr'): -0.9187994754319938,
-               ('M', 'nr'): -0.5091566178045187},
- ('B', 'nrfg'): {('E', 'nrfg'): -0.6898863081052478,
-                 ('M', 'nrfg'): -0.6964187211005602},
- ('B', 'nrt'): {('E', 'nrt'): -0.19889046807373303,
-                ('M', 'nrt'): -1.7127985687430378},
- ('B', 'ns'): {('E', 'ns'): -0.30583032091031265,
-               ('M', 'ns'): -1.333745856818688},
- ('B', 'nt'): {('E', 'nt'): -5.85632199504386,
-               ('M', 'nt'): -0.0028658525153568088},
- ('B', 'nz'): {('E', 'nz'): -0.5116528585143264,
-               ('M', 'nz'): -0.9150511614331327},
- ('B', 'o'): {('E', 'o'): -0.15615808279732152,
-              ('M', 'o'): -1.9339496252366735},
- ('B', 'p'): {('E', 'p'): -0.0005180550387437946,
-              ('M', 'p'): -7.565688085284925},
- ('B', 'q'): {('E', 'q'): -0.23327551934156823,
-              ('M', 'q'): -1.5699064300606476},
- ('B', 'qe'): {('E', 'qe'): 0.0},
- ('B', 'qg'): {},
- ('B', 'r'): {('E', 'r'): -0.01687625300447763,
-              ('M', 'r'): -4.090274052396829},
- ('B', 'rg'): {},
- ('B', 'rr'): {('E', 'rr'): -2.239526957026909,
-               ('M', 'rr'): -0.11261887810814913},
- ('B', 'rz'): {('E', 'rz'): 0.0},
- ('B', 's'): {('E', 's'): -0.015465951118050396,
-              ('M', 's'): -4.176837382501129},
- ('B', 't'): {('E', 't'): -0.06198448272867337,
-              ('M', 't'): -2.8117033638171693},
- ('B', 'tg'): {},
- ('B', 'u'): {('E', 'u'): -2.170492159178564e-05,
-              ('M', 'u'): -10.7379823741081},
- ('B', 'ud'): {},
- ('B', 'ug'): {},
- ('B', 'uj'): {},
- ('B', 'ul'): {},
- ('B', 'uv'): {},
- ('B', 'uz'): {},
- ('B', 'v'): {('E', 'v'): -0.012409266514635869,
-              ('M', 'v'): -4.395510002912934},
- ('B', 'vd'): {('E', 'vd'): 0.0},
- ('B', 'vg'): {},
- ('B', 'vi'): {('M', 'vi'): 0.0},
- ('B', 'vn'): {('E', 'vn'): -0.01102649184048478,
-               ('M', 'vn'): -4.512962732418981},
- ('B', 'vq'): {('E', 'vq'): 0.0},
- ('B', 'w'): {},
- ('B', 'x'): {},
- ('B', 'y'): {('E', 'y'): -0.0046236917718409775,
-              ('M', 'y'): -5.378872763286892},
- ('B', 'yg'): {},
- ('B', 'z'): {('E', 'z'): -0.5543440297742611, ('M', 'z'): -0.854370382921828},
- ('B', 'zg'): {},
- ('E', 'a'): {('B', 'a'): -3.4301509494938407,
-              ('B', 'ad'): -6.530359369866237,
-              ('B', 'an'): -6.905890270156357,
-              ('B', 'b'): -5.525983558928292,
-              ('B', 'c'): -4.069370617491082,
-              ('B', 'd'): -4.117261312051237,
-              ('B', 'df'): -9.965267808870705,
-              ('B', 'e'): -11.323391293023898,
-              ('B', 'f'): -5.717589226727901,
-              ('B', 'i'): -6.038496946808002,
-              ('B', 'j'): -6.104838894944724,
-              ('B', 'l'): -5.522952743340017,
-              ('B', 'm'): -4.436632687260457,
-              ('B', 'mq'): -8.361560571145588,
-              ('B', 'n'): -1.479406075636878,
-              ('B', 'nr'): -4.831656636089442,
-              ('B', 'nrfg'): -8.451711668139886,
-              ('B', 'nrt'): -7.1944663972050185,
-              ('B', 'ns'): -5.321701425373129,
-              ('B', 'nt'): -7.642880088580479,
-              ('B', 'nz'): -6.519370248290642,
-              ('B', 'o'): -9.78294625207675,
-              ('B', 'p'): -6.0958541085369085,
-              ('B', 'q'): -7.907487763972047,
-              ('B', 'r'): -4.479759806376397,
-              ('B', 'rr'): -13.520615870360118,
-              ('B', 'rz'): -9.965267808870705,
-              ('B', 's'): -6.188246664431055,
-              ('B', 't'): -5.039464450291145,
-              ('B', 'u'): -6.332203133863164,
-              ('B', 'v'): -2.2068977276606287,
-              ('B', 'vd'): -8.586141937229426,
-              ('B', 'vi'): -11.574705721304804,
-              ('B', 'vn'): -3.354802515634624,
-              ('B', 'vq'): -12.827468689800172,
-              ('B', 'y'): -8.458020837333152,
-              ('B', 'z'): -6.33069369961431,
-              ('S', 'a'): -4.841303829467445,
-              ('S', 'ad'): -10.812565669257907,
-              ('S', 'ag'): -7.868126690091467,
-              ('S', 'an'): -10.812565669257907,
-              ('S', 'b'): -7.3657577763437,
-              ('S', 'c'): -3.544575125142281,
-              ('S', 'd'): -3.378426427593927,
-              ('S', 'dg'): -9.649414859452227,
-              ('S', 'e'): -9.031979500627978,
-              ('S', 'f'): -5.155641891921391,
-              ('S', 'g'): -7.752294874566346,
-              ('S', 'h'): -9.736426236441856,
-              ('S', 'j'): -6.561217358226142,
-              ('S', 'k'): -6.495966839906481,
-              ('S', 'm'): -4.73967475678773,
-              ('S', 'mg'): -11.574705721304804,
-              ('S', 'n'): -4.191071250905458,
-              ('S', 'ng'): -4.934829887478268,
-              ('S', 'nr'): -6.3589938674209305,
-              ('S', 'o'): -10.630244112463952,
-              ('S', 'p'): -3.686853600315555,
-              ('S', 'q'): -4.984600924703292,
-              ('S', 'r'): -3.947717891287047,
-              ('S', 'rg'): -12.827468689800172,
-              ('S', 'tg'): -7.777612682550635,
-              ('S', 'u'): -4.923872400185871,
-              ('S', 'ud'): -5.816254702449806,
-              ('S', 'ug'): -7.628971658534347,
-              ('S', 'uj'): -1.5134881880027917,
-              ('S', 'ul'): -4.426247674636356,
-              ('S', 'uv'): -3.4773228981331137,
-              ('S', 'uz'): -7.270640628100635,
-              ('S', 'v'): -3.1548103981230424,
-              ('S', 'vg'): -6.3809555343951985,
-              ('S', 'vn'): -9.994255345743957,
-              ('S', 'x'): -9.230156429211727,
-              ('S', 'y'): -5.506941727527432},
- ('E', 'ad'): {('B', 'a'): -3.669490663077246,
-               ('B', 'ad'): -5.577421564067343,
-               ('B', 'an'): -7.408859517113575,
-               ('B', 'b'): -6.442419001553947,
-               ('B', 'c'): -5.341996757640598,
-               ('B', 'd'): -4.558153015609841,
-               ('B', 'df'): -9.172448109374933,
-               ('B', 'f'): -6.6204021567493045,
-               ('B', 'i'): -5.892163656378089,
-               ('B', 'j'): -6.861564213566192,
-               ('B', 'l'): -5.997872543403312,
-               ('B', 'm'): -5.595897840234916,
-               ('B', 'mq'): -8.824141415106718,
-               ('B', 'n'): -2.6719094715397667,
-               ('B', 'nr'): -5.990928071050501,
-               ('B', 'nrfg'): -9.259459486364563,
-               ('B', 'nrt'): -7.745331753734787,
-               ('B', 'ns'): -6.245708707307894,
-               ('B', 'nt'): -8.949304558060723,
-               ('B', 'nz'): -7.482967489267296,
-               ('B', 'o'): -9.577913217483097,
-               ('B', 'p'): -5.436764589063194,
-               ('B', 'q'): -9.259459486364563,
-               ('B', 'r'): -5.405450875997045,
-               ('B', 's'): -7.062234909028343,
-               ('B', 't'): -6.152023223230571,
-               ('B', 'u'): -6.379240099932416,
-               ('B', 'v'): -0.6987018824779084,
-               ('B', 'vd'): -9.018297429547674,
-               ('B', 'vi'): -10.964207578602988,
-               ('B', 'vn'): -3.0646831065707905,
-               ('B', 'y'): -9.71144461010762,
-               ('B', 'z'): -7.8506922693926136,
-               ('S', 'a'): -5.554796164549365,
-               ('S', 'ad'): -9.865595289934879,
-               ('S', 'ag'): -9.172448109374933,
-               ('S', 'b'): -8.884766036923152,
-               ('S', 'c'): -4.4880047424923335,
-               ('S', 'd'): -3.535874384412182,
-               ('S', 'dg'): -10.271060398043042,
-               ('S', 'e'): -10.964207578602988,
-               ('S', 'f'): -5.483568655260997,
-               ('S', 'g'): -8.712915779996493,
-               ('S', 'h'): -9.865595289934879,
-               ('S', 'j'): -7.725529126438608,
-               ('S', 'k'): -7.275328124489052,
-               ('S', 'm'): -5.537057340211983,
-               ('S', 'n'): -5.825472281879416,
-               ('S', 'ng'): -6.8290410218606326,
-               ('S', 'nr'): -7.745331753734787,
-               ('S', 'o'): -9.172448109374933,
-               ('S', 'p'): -3.226155280913672,
-               ('S', 'q'): -6.01544768822482,
-               ('S', 'r'): -5.2772322222631685,
-               ('S', 'tg'): -9.172448109374933,
-               ('S', 'u'): -7.2147035026726165,
-               ('S', 'ud'): -7.380688640146878,
-               ('S', 'ug'): -7.968475305048997,
-               ('S', 'uj'): -2.7833266366065983,
-               ('S', 'ul'): -5.257097313854112,
-               ('S', 'uv'): -3.6745970571518205,
-               ('S', 'uz'): -8.884766036923152,
-               ('S', 'v'): -2.244971905780595,
-               ('S', 'vg'): -6.300768484490921,
-               ('S', 'x'): -9.71144461010762,
-               ('S', 'y'): -7.3006459324733415},
- ('E', 'ag'): {},
- ('E', 'an'): {('B', 'a'): -3.6052367516663226,
-               ('B', 'ad'): -5.932878424497706,
-               ('B', 'an'): -5.820082930352362,
-               ('B', 'b'): -5.474131949776605,
-               ('B', 'c'): -3.354245843284712,
-               ('B', 'd'): -3.24087671226596,
-               ('B', 'df'): -9.038958755220563,
-               ('B', 'f'): -4.96708704885052,
-               ('B', 'i'): -5.847111602740281,
-               ('B', 'j'): -5.978687960529,
-               ('B', 'l'): -5.428040842576338,
-               ('B', 'm'): -4.790463513171203,
-               ('B', 'mq'): -7.940346466552453,
-               ('B', 'n'): -1.6296204338393674,
-               ('B', 'nr'): -4.682249928530971,
-               ('B', 'nrfg'): -8.191660894833358,
-               ('B', 'nrt'): -7.304357699832456,
-               ('B', 'ns'): -5.350079301106626,
-               ('B', 'nt'): -7.572621686427135,
-               ('B', 'nz'): -6.641063482422192,
-               ('B', 'o'): -10.137571043888672,
-               ('B', 'p'): -5.446223161659528,
-               ('B', 'q'): -8.345811574660617,
-               ('B', 'r'): -4.104484822089871,
-               ('B', 's'): -6.353381409970411,
-               ('B', 't'): -4.849304013194137,
-               ('B', 'u'): -6.736373662226517,
-               ('B', 'v'): -2.148688790579445,
-               ('B', 'vd'): -9.038958755220563,
-               ('B', 'vi'): -9.444423863328726,
-               ('B', 'vn'): -3.0106802349898643,
-               ('B', 'y'): -8.191660894833358,
-               ('B', 'z'): -6.148586997324398,
-               ('S', 'a'): -5.094145926969426,
-               ('S', 'ad'): -10.137571043888672,
-               ('S', 'ag'): -8.058129502208836,
-               ('S', 'b'): -7.304357699832456,
-               ('S', 'c'): -2.728434599968544,
-               ('S', 'd'): -2.9349098473654345,
-               ('S', 'dg'): -8.751276682768781,
-               ('S', 'e'): -7.834985950894627,
-               ('S', 'f'): -4.565417011710908,
-               ('S', 'g'): -7.652664394100672,
-               ('S', 'h'): -9.444423863328726,
-               ('S', 'j'): -6.526653131244448,
-               ('S', 'k'): -7.498513714273414,
-               ('S', 'm'): -4.699491734965477,
-               ('S', 'n'): -4.64040281859547,
-               ('S', 'ng'): -5.100618441475043,
-               ('S', 'nr'): -6.959517213540726,
-               ('S', 'p'): -3.524186825509113,
-               ('S', 'q'): -5.8068377036023415,
-               ('S', 'r'): -3.5135058160887787,
-               ('S', 'tg'): -6.641063482422192,
-               ('S', 'u'): -4.478088828129051,
-               ('S', 'ud'): -6.010436658843581,
-               ('S', 'ug'): -7.364982321648891,
-               ('S', 'uj'): -2.0789273316730545,
-               ('S', 'ul'): -4.363019498344264,
-               ('S', 'uv'): -4.271102986955375,
-               ('S', 'uz'): -6.641063482422192,
-               ('S', 'v'): -3.071957680290955,
-               ('S', 'vg'): -6.026697179715361,
-               ('S', 'x'): -9.444423863328726,
-               ('S', 'y'): -5.22491615815262},
- ('E', 'b'): {('B', 'a'): -4.707673302574278,
-              ('B', 'ad'): -7.800150133419737,
-              ('B', 'an'): -6.283289297017788,
-              ('B', 'b'): -4.557557781934221,
-              ('B', 'c'): -6.218462133938539,
-              ('B', 'd'): -5.577520032648095,
-              ('B', 'f'): -5.6289933828534355,
-              ('B', 'h'): -12.354027025020278,
-              ('B', 'i'): -7.343391730924022,
-              ('B', 'j'): -5.482935730409732,
-              ('B', 'l'): -5.224729476090905,
-              ('B', 'ln'): -12.354027025020278,
-              ('B', 'm'): -4.711023389459561,
-              ('B', 'mq'): -8.50387942331022,
-              ('B', 'n'): -0.7488506003459426,
-              ('B', 'nr'): -5.464435716665812,
-              ('B', 'nrfg'): -9.175973194672332,
-              ('B', 'nrt'): -7.653546659227862,
-              ('B', 'ns'): -4.893536719194941,
-              ('B', 'nt'): -6.744555229835318,
-              ('B', 'nz'): -5.697300500841886,
-              ('B', 'o'): -11.660879844460332,
-              ('B', 'p'): -6.151491507832356,
-              ('B', 'q'): -7.810732242750274,
-              ('B', 'r'): -5.393679295918971,
-              ('B', 'rz'): -10.967732663900387,
-              ('B', 's'): -6.102123141854389,
-              ('B', 't'): -6.11570239998077,
-              ('B', 'u'): -6.614234112841044,
-              ('B', 'v'): -2.302248786072008,
-              ('B', 'vd'): -9.869120375232278,
-              ('B', 'vn'): -2.882707963426864,
-              ('B', 'vq'): -11.660879844460332,
-              ('B', 'y'): -10.408116875964964,
-              ('B', 'z'): -7.758907174885688,
-              ('S', 'a'): -4.857374586851995,
-              ('S', 'ag'): -8.164372282993853,
-              ('S', 'b'): -5.649612670056171,
-              ('S', 'bg'): -12.354027025020278,
-              ('S', 'c'): -4.680338895752548,
-              ('S', 'd'): -4.707673302574278,
-              ('S', 'dg'): -10.274585483340442,
-              ('S', 'f'): -4.603412292249869,
-              ('S', 'g'): -7.748856839032187,
-              ('S', 'h'): -8.210892298628746,
-              ('S', 'j'): -6.216299970934044,
-              ('S', 'k'): -6.424437881630383,
-              ('S', 'm'): -4.805998055085264,
-              ('S', 'n'): -3.636344972854637,
-              ('S', 'ng'): -4.001944353667641,
-              ('S', 'nr'): -7.278853209786451,
-              ('S', 'o'): -10.967732663900387,
-              ('S', 'p'): -3.903828702428319,
-              ('S', 'q'): -4.428869512795575,
-              ('S', 'r'): -5.6883433072378695,
-              ('S', 'tg'): -8.328675334285128,
-              ('S', 'u'): -5.63139723016483,
-              ('S', 'ud'): -8.827666500404117,
-              ('S', 'ug'): -8.690465378890632,
-              ('S', 'uj'): -2.512468069106317,
-              ('S', 'ul'): -7.463677896798524,
-              ('S', 'uv'): -6.064311454111281,
-              ('S', 'uz'): -8.023293684733947,
-              ('S', 'v'): -2.7256344294304595,
-              ('S', 'vg'): -5.935662089084067,
-              ('S', 'vn'): -9.463655267124114,
-              ('S', 'x'): -8.857519463553798,
-              ('S', 'y'): -8.422201392295952,
-              ('S', 'yg'): -12.354027025020278},
- ('E', 'bg'): {},
- ('E', 'c'): {('B', 'a'): -4.316505787725195,
-              ('B', 'ad'): -5.657713206360876,
-              ('B', 'an'): -7.810927842700653,
-              ('B', 'b'): -4.974044769755475,
-              ('B', 'c'): -4.096441559872942,
-              ('B', 'd'): -3.4848930231958763,
-              ('B', 'df'): -8.56861354439817,
-              ('B', 'e'): -12.192954477374535,
-              ('B', 'f'): -5.183093975455244,
-              ('B', 'h'): -12.88610165793448,
-              ('B', 'i'): -5.377862883255817,
-              ('B', 'in'): -12.88610165793448,
-              ('B', 'j'): -5.2189434026153325,
-              ('B', 'l'): -5.076560333281069,
-              ('B', 'm'): -3.738914100963566,
-              ('B', 'mq'): -6.469369375422154,
-              ('B', 'n'): -1.8458874846215843,
-              ('B', 'nr'): -3.8640204354190053,
-              ('B', 'nrfg'): -7.302605349152781,
-              ('B', 'nrt'): -6.2985516431096835,
-              ('B', 'ns'): -3.8921775165230805,
-              ('B', 'nt'): -5.97734687861926,
-              ('B', 'nz'): -5.659892647833808,
-              ('B', 'o'): -9.66722583306628,
-              ('B', 'p'): -4.471605864756585,
-              ('B', 'q'): -6.472642700767123,
-              ('B', 'r'): -2.8554089311630637,
-              ('B', 'rr'): -10.940191508879167,
-              ('B', 'rz'): -8.39746528820234,
-              ('B', 's'): -5.159447993086838,
-              ('B', 't'): -3.6728654828462717,
-              ('B', 'u'): -8.504075023260599,
-              ('B', 'v'): -1.9334021670253692,
-              ('B', 'vd'): -8.491652503262042,
-              ('B', 'vn'): -4.158485479613413,
-              ('B', 'vq'): -12.88610165793448,
-              ('B', 'y'): -12.88610165793448,
-              ('B', 'z'): -7.00556867153378,
-              ('S', 'a'): -4.554515414303727,
-              ('S', 'ad'): -10.806660116254644,
-              ('S', 'ag'): -7.937341767556312,
-              ('S', 'an'): -11.787489369266371,
-              ('S', 'b'): -6.746217105708225,
-              ('S', 'c'): -5.593083978161698,
-              ('S', 'd'): -2.590031623121201,
-              ('S', 'dg'): -10.052888313878263,
-              ('S', 'e'): -9.94166267876804,
-              ('S', 'f'): -5.548513914395884,
-              ('S', 'g'): -7.7621376785312215,
-              ('S', 'h'): -8.251372669704844,
-              ('S', 'j'): -5.773774213223569,
-              ('S', 'k'): -8.86074996719933,
-              ('S', 'm'): -4.506792173881629,
-              ('S', 'mg'): -11.787489369266371,
-              ('S', 'n'): -4.452942462128252,
-              ('S', 'ng'): -5.8481956944872975,
-              ('S', 'nr'): -5.767275408872402,
-              ('S', 'nt'): -12.88610165793448,
-              ('S', 'o'): -9.553897147759276,
-              ('S', 'p'): -2.483628296436571,
-              ('S', 'q'): -5.585628843666681,
-              ('S', 'r'): -2.536487015571298,
-              ('S', 'rg'): -12.192954477374535,
-              ('S', 'tg'): -7.47000125573006,
-              ('S', 'u'): -6.286231158721643,
-              ('S', 'ud'): -7.792351457127718,
-              ('S', 'ug'): -7.817197455714249,
-              ('S', 'uj'): -6.159868255575733,
-              ('S', 'ul'): -8.80856421402876,
-              ('S', 'uv'): -8.301134179263908,
-              ('S', 'uz'): -9.75060744200533,
-              ('S', 'v'): -2.224569093260564,
-              ('S', 'vg'): -6.443561491466282,
-              ('S', 'vn'): -10.247044328319221,
-              ('S', 'x'): -9.222540011804833,
-              ('S', 'y'): -8.241710758793108},
- ('E', 'd'): {('B', 'a'): -2.8017387321396003,
-              ('B', 'ad'): -4.976725806196074,
-              ('B', 'an'): -6.517554503391935,
-              ('B', 'b'): -6.088576745933047,
-              ('B', 'c'): -5.389947368737205,
-              ('B', 'd'): -3.8123735976947555,
-              ('B', 'df'): -8.525193106593266,
-              ('B', 'e'): -11.610537538836944,
-              ('B', 'f'): -6.389506266248981,
-              ('B', 'i'): -4.684451303170083,
-              ('B', 'j'): -6.955387420543832,
-              ('B', 'l'): -5.46957598058305,
-              ('B', 'm'): -4.507215476310831,
-              ('B', 'mq'): -8.646553963597533,
-              ('B', 'n'): -2.893408012444315,
-              ('B', 'nr'): -5.092681644858881,
-              ('B', 'nrfg'): -8.679343786420525,
-              ('B', 'nrt'): -7.033252556338388,
-              ('B', 'ns'): -5.892687806969307,
-              ('B', 'nt'): -8.172526184052073,
-              ('B', 'nz'): -7.138898745473375,
-              ('B', 'o'): -8.734152022915518,
-              ('B', 'p'): -5.72686702153749,
-              ('B', 'q'): -8.230393566372621,
-              ('B', 'r'): -4.512988688222151,
-              ('B', 'rz'): -10.163618555900618,
-              ('B', 's'): -6.546361477812658,
-              ('B', 't'): -5.6165761115303745,
-              ('B', 'u'): -6.994180163458288,
-              ('B', 'v'): -1.0992734839585843,
-              ('B', 'vd'): -7.59190479835054,
-              ('B', 'vi'): -12.080541168082679,
-              ('B', 'vn'): -4.06514778922512,
-              ('B', 'vq'): -9.700995033952506,
-              ('B', 'y'): -10.69424680696279,
-              ('B', 'z'): -6.3286036515394315,
-              ('S', 'a'): -3.961440330445193,
-              ('S', 'ad'): -10.471103255648579,
-              ('S', 'ag'): -7.9469758927072975,
-              ('S', 'b'): -8.06596157432944,
-              ('S', 'c'): -5.224921643521071,
-              ('S', 'd'): -2.7332776619458645,
-              ('S', 'dg'): -9.579105216343468,
-              ('S', 'e'): -9.562844695471687,
-              ('S', 'f'): -5.49990203079773,
-              ('S', 'g'): -7.887860705139717,
-              ('S', 'h'): -9.738735361935353,
-              ('S', 'j'): -7.120497660102484,
-              ('S', 'k'): -9.470471375340674,
-              ('S', 'm'): -4.6755319453646464,
-              ('S', 'mg'): -11.29208380771841,
-              ('S', 'n'): -5.0330239467253834,
-              ('S', 'ng'): -6.327333810098955,
-              ('S', 'nr'): -6.9089214545806,
-              ('S', 'o'): -9.515591810621142,
-              ('S', 'p'): -2.6661829812307816,
-              ('S', 'q'): -5.613774553277754,
-              ('S', 'r'): -4.301074200624354,
-              ('S', 'rg'): -13.68997908051678,
-              ('S', 'tg'): -7.628522161588763,
-              ('S', 'u'): -6.08657974077611,
-              ('S', 'ud'): -7.079283035799021,
-              ('S', 'ug'): -7.316659290939767,
-              ('S', 'uj'): -3.663654618021589,
-              ('S', 'ul'): -7.112117722795733,
-              ('S', 'uv'): -4.379883875403605,
-              ('S', 'uz'): -8.391661713968743,
-              ('S', 'v'): -1.6807549996611406,
-              ('S', 'vg'): -5.703474141962785,
-              ('S', 'vn'): -11.49275450318056,
-              ('S', 'x'): -10.052392920790394,
-              ('S', 'y'): -7.483403153791852},
- ('E', 'df'): {('B', 'a'): -4.6866377692261105,
-               ('B', 'ad'): -5.142113297908936,
-               ('B', 'an'): -7.3015975472623085,
-               ('B', 'b'): -7.013915474810528,
-               ('B', 'c'): -5.627621113690637,
-               ('B', 'd'): -3.957558579440102,
-               ('B', 'df'): -5.566996491874202,
-               ('B', 'f'): -7.707062655370473,
-               ('B', 'i'): -4.374858145195269,
-               ('B', 'j'): -8.400209835930418,
-               ('B', 'l'): -5.76115250631516,
-               ('B', 'm'): -4.9344739331306915,
-               ('B', 'mq'): -7.707062655370473,
-               ('B', 'n'): -3.458567413321114,
-               ('B', 'nr'): -4.736648189800772,
-               ('B', 'nrfg'): -7.707062655370473,
-               ('B', 'nrt'): -8.400209835930418,
-               ('B', 'ns'): -7.013915474810528,
-               ('B', 'p'): -6.002314563132048,
-               ('B', 'q'): -8.400209835930418,
-               ('B', 'r'): -3.3376148029034516,
-               ('B', 's'): -6.097624742936373,
-               ('B', 't'): -6.454299686875105,
-               ('B', 'u'): -7.013915474810528,
-               ('B', 'v'): -1.8606238803127486,
-               ('B', 'vd'): -8.400209835930418,
-               ('B', 'vn'): -4.6866377692261105,
-               ('B', 'z'): -7.3015975472623085,
-               ('S', 'a'): -3.9004001656001535,
-               ('S', 'ag'): -8.400209835930418,
-               ('S', 'b'): -7.707062655370473,
-               ('S', 'c'): -4.903702274463938,
-               ('S', 'd'): -2.277717026416032,
-               ('S', 'f'): -5.455770856763977,
-               ('S', 'j'): -8.400209835930418,
-               ('S', 'm'): -4.241326752570746,
-               ('S', 'n'): -4.488186830502272,
-               ('S', 'ng'): -7.013915474810528,
-               ('S', 'nr'): -6.608450366702363,
-               ('S', 'p'): -2.7268865687589257,
-               ('S', 'q'): -6.454299686875105,
-               ('S', 'r'): -2.5537710608726942,
-               ('S', 'u'): -5.068005325755214,
-               ('S', 'uj'): -4.873849311314257,
-               ('S', 'ul'): -3.6127180931483722,
-               ('S', 'uv'): -8.400209835930418,
-               ('S', 'v'): -1.1229621092989344,
-               ('S', 'vg'): -5.627621113690637,
-               ('S', 'y'): -5.455770856763977},
- ('E', 'dg'): {},
- ('E', 'e'): {('B', 'a'): -6.498282149476434,
-              ('B', 'c'): -5.111987788356543,
-              ('B', 'd'): -3.665068805420218,
-              ('B', 'e'): -3.13098631948996,
-              ('B', 'j'): -6.498282149476434,
-              ('B', 'l'): -5.111987788356543,
-              ('B', 'm'): -2.7140925155581725,
-              ('B', 'mq'): -6.498282149476434,
-              ('B', 'n'): -2.293589530085468,
-              ('B', 'nr'): -3.453759711753011,
-              ('B', 'ns'): -5.805134968916488,
-              ('B', 'nz'): -5.805134968916488,
-              ('B', 'p'): -6.498282149476434,
-              ('B', 'q'): -6.498282149476434,
-              ('B', 'r'): -2.8094026953624978,
-              ('B', 'rz'): -6.498282149476434,
-              ('B', 's'): -6.498282149476434,
-              ('B', 't'): -4.706522680248379,
-              ('B', 'v'): -3.9333327920148973,
-              ('B', 'vn'): -6.498282149476434,
-              ('S', 'a'): -2.8347205033467873,
-              ('S', 'b'): -5.805134968916488,
-              ('S', 'c'): -5.805134968916488,
-              ('S', 'd'): -3.202445283472105,
-              ('S', 'e'): -5.3996698608083245,
-              ('S', 'j'): -4.3010575721402144,
-              ('S', 'm'): -3.9333327920148973,
-              ('S', 'n'): -3.7256934272366524,
-              ('S', 'ng'): -4.3010575721402144,
-              ('S', 'nr'): -4.3010575721402144,
-              ('S', 'p'): -4.3010575721402144,
-              ('S', 'q'): -5.805134968916488,
-              ('S', 'r'): -1.4678442280839983,
-              ('S', 'u'): -5.111987788356543,
-              ('S', 'ug'): -5.805134968916488,
-              ('S', 'uj'): -5.111987788356543,
-              ('S', 'ul'): -4.418840607796598,
-              ('S', 'uv'): -4.013375499688434,
-              ('S', 'v'): -2.4378391389300145,
-              ('S', 'vg'): -4.552372000421121,
-              ('S', 'y'): -3.5538431703099933},
- ('E', 'en'): {},
- ('E', 'f'): {('B', 'a'): -4.337384778823908,
-              ('B', 'ad'): -5.930084750763245,
-              ('B', 'an'): -6.992620982957545,
-              ('B', 'b'): -5.075814171829403,
-              ('B', 'c'): -4.413538177181877,
-              ('B', 'd'): -3.4622158465989212,
-              ('B', 'df'): -9.064219347176355,
-              ('B', 'f'): -4.533974775212322,
-              ('B', 'i'): -5.740983506983912,
-              ('B', 'j'): -5.418443133479925,
-              ('B', 'l'): -5.68727196773766,
-              ('B', 'm'): -3.3639848257358396,
-              ('B', 'mq'): -7.885564350834709,
-              ('B', 'n'): -1.7839096235433134,
-              ('B', 'nr'): -4.024834639794114,
-              ('B', 'nrfg'): -7.348171699683997,
-              ('B', 'nrt'): -6.303418580688616,
-              ('B', 'ns'): -3.519774592923733,
-              ('B', 'nt'): -6.3900706977498265,
-              ('B', 'nz'): -5.693695972699015,
-              ('B', 'o'): -8.469512239429662,
-              ('B', 'p'): -5.252707523344598,
-              ('B', 'q'): -6.81292754856986,
-              ('B', 'r'): -3.8025011330766483,
-              ('B', 'rr'): -12.529955249976082,
-              ('B', 'rz'): -9.234118383971753,
-              ('B', 's'): -5.20151789708092,
-              ('B', 't'): -5.099841111414281,
-              ('B', 'u'): -7.262097090912754,
-              ('B', 'v'): -2.0380978692772542,
-              ('B', 'vd'): -7.955244271472699,
-              ('B', 'vn'): -4.273347905349924,
-              ('B', 'vq'): -11.836808069416136,
-              ('B', 'y'): -10.920517337541982,
-              ('B', 'z'): -6.262754701434719,
-              ('S', 'a'): -4.305791737338221,
-              ('S', 'ad'): -10.738195780748027,
-              ('S', 'ag'): -7.904982436691811,
-              ('S', 'an'): -11.836808069416136,
-              ('S', 'b'): -6.849782640959014,
-              ('S', 'c'): -4.005389304230431,
-              ('S', 'd'): -2.6761307424590544,
-              ('S', 'dg'): -8.974607188486669,
-              ('S', 'e'): -10.584045100920768,
-              ('S', 'f'): -4.918112850395665,
-              ('S', 'g'): -7.382460773162629,
-              ('S', 'h'): -9.064219347176355,
-              ('S', 'j'): -5.6434236074455715,
-              ('S', 'k'): -7.602701564818877,
-              ('S', 'm'): -4.199091636751338,
-              ('S', 'mg'): -10.584045100920768,
-              ('S', 'n'): -4.3493543023816335,
-              ('S', 'ng'): -5.235577950687261,
-              ('S', 'nr'): -5.800131179486606,
-              ('S', 'o'): -9.31107942510788,
-              ('S', 'p'): -3.0611814059072415,
-              ('S', 'q'): -5.033302811807799,
-              ('S', 'r'): -3.4923029858256154,
-              ('S', 'rg'): -11.836808069416136,
-              ('S', 't'): -12.529955249976082,
-              ('S', 'tg'): -7.602701564818877,
-              ('S', 'u'): -5.482438028618786,
-              ('S', 'ud'): -8.55966333642396,
-              ('S', 'ug'): -8.111114642179484,
-              ('S', 'uj'): -2.077479612579614,
-              ('S', 'ul'): -6.655024519124051,
-              ('S', 'uv'): -7.168663084266656,
-              ('S', 'uz'): -9.821905048873871,
-              ('S', 'v'): -2.342680700957058,
-              ('S', 'vg'): -6.129697804667261,
-              ('S', 'vn'): -11.836808069416136,
-              ('S', 'x'): -9.585516270809642,
-              ('S', 'y'): -7.140883520159581},
- ('E', 'g'): {},
- ('E', 'h'): {('B', 'd'): -4.442651256490317,
-              ('B', 'n'): -0.2995165300987837,
-              ('B', 'nz'): -3.7495040759303713,
-              ('B', 'v'): -3.056356895370426,
-              ('S', 'b'): -4.442651256490317,
-              ('S', 'n'): -2.833213344056216,
-              ('S', 'uj'): -2.245426679154097},
- ('E', 'i'): {('B', 'a'): -4.71147680000632,
-              ('B', 'ad'): -5.813383984571282,
-              ('B', 'an'): -8.349062959732706,
-              ('B', 'b'): -6.242644830354667,
-              ('B', 'c'): -3.466024322741158,
-              ('B', 'd'): -3.158713672249576,
-              ('B', 'df'): -9.249849505070895,
-              ('B', 'e'): -10.716186573864322,
-              ('B', 'f'): -4.89610364351196,
-              ('B', 'i'): -3.3807699123769632,
-              ('B', 'j'): -6.7975190257175075,
-              ('B', 'l'): -4.583511858204817,
-              ('B', 'm'): -4.3705502130357266,
-              ('B', 'mq'): -7.625144120506007,
-              ('B', 'n'): -2.788140972989545,
-              ('B', 'nr'): -3.8061006795439027,
-              ('B', 'nrfg'): -7.3604515662789245,
-              ('B', 'nrt'): -6.496678868688216,
-              ('B', 'ns'): -5.140237470718006,
-              ('B', 'nt'): -7.625144120506007,
-              ('B', 'nz'): -6.363760408966732,
-              ('B', 'o'): -8.318291301065951,
-              ('B', 'p'): -5.523229722974112,
-              ('B', 'q'): -7.7039249983591205,
-              ('B', 'r'): -3.7280809422285266,
-              ('B', 'rz'): -9.86888871347712,
-              ('B', 's'): -5.683572373049291,
-              ('B', 't'): -4.362976626004502,
-              ('B', 'u'): -5.76979354849642,
-              ('B', 'v'): -2.4600984400494132,
-              ('B', 'vd'): -9.735357320852597,
-              ('B', 'vn'): -5.560970050956959,
-              ('B', 'y'): -7.105268661220098,
-              ('B', 'z'): -6.208996796236435,
-              ('S', 'a'): -4.760349204399492,
-              ('S', 'ad'): -9.042210140292651,
-              ('S', 'ag'): -7.7039249983591205,
-              ('S', 'an'): -11.121651681972487,
-              ('S', 'b'): -6.909524084094002,
-              ('S', 'c'): -3.60821524821168,
-              ('S', 'd'): -2.8120978553344935,
-              ('S', 'dg'): -8.636745032184486,
-              ('S', 'e'): -8.008136372762113,
-              ('S', 'f'): -4.917093919403796,
-              ('S', 'g'): -7.160838512374909,
-              ('S', 'h'): -8.518961996528104,
-              ('S', 'j'): -6.2853697750210085,
-              ('S', 'k'): -6.293337944670186,
-              ('S', 'm'): -4.695163224514796,
-              ('S', 'n'): -4.648532888398794,
-              ('S', 'ng'): -5.294177734973736,
-              ('S', 'nr'): -5.6857486524718865,
-              ('S', 'o'): -9.329892212744431,
-              ('S', 'p'): -3.3516395596086803,
-              ('S', 'q'): -5.318023872346569,
-              ('S', 'r'): -3.0909167578739454,
-              ('S', 'rg'): -11.814798862532433,
-              ('S', 'tg'): -6.94726441207685,
-              ('S', 'u'): -4.2630866471811215,
-              ('S', 'ud'): -7.45809003584284,
-              ('S', 'ug'): -7.4080796152681785,
-              ('S', 'uj'): -1.6368664643265434,
-              ('S', 'ul'): -4.025344296445759,
-              ('S', 'uv'): -2.5504439022500107,
-              ('S', 'uz'): -7.610106243141466,
-              ('S', 'v'): -2.6487239068542645,
-              ('S', 'vg'): -5.786520342301734,
-              ('S', 'vn'): -10.716186573864322,
-              ('S', 'x'): -9.416903589734062,
-              ('S', 'y'): -4.795502208817387},
- ('E', 'in'): {('B', 'd'): -2.03688192726104,
-               ('B', 'm'): -3.1354942159291497,
-               ('B', 'n'): -3.1354942159291497,
-               ('B', 'nr'): -3.1354942159291497,
-               ('B', 'nrt'): -2.03688192726104,
-               ('B', 'nz'): -2.4423470353692043,
-               ('S', 'c'): -3.1354942159291497,
-               ('S', 'd'): -2.03688192726104,
-               ('S', 'p'): -1.749199854809259,
-               ('S', 'tg'): -3.1354942159291497,
-               ('S', 'v'): -2.4423470353692043,
-               ('S', 'y'): -3.1354942159291497},
- ('E', 'j'): {('B', 'a'): -4.817381150280411,
-              ('B', 'ad'): -5.71856911396881,
-              ('B', 'an'): -7.6453906664616005,
-              ('B', 'b'): -5.092962815798105,
-              ('B', 'c'): -5.278726716783033,
-              ('B', 'd'): -3.9690899945545244,
-              ('B', 'df'): -11.864898371637707,
-              ('B', 'f'): -5.031866638851507,
-              ('B', 'i'): -6.78972455640388,
-              ('B', 'j'): -3.6924515532949287,
-              ('B', 'l'): -6.1347985886641325,
-              ('B', 'm'): -4.105710933129911,
-              ('B', 'mq'): -7.804455361091288,
-              ('B', 'n'): -1.1883209358684308,
-              ('B', 'nr'): -4.740420109144283,
-              ('B', 'nrfg'): -8.497602541651233,
-              ('B', 'nrt'): -7.036584634335406,
-              ('B', 'ns'): -4.222374237404805,
-              ('B', 'nt'): -6.0359527540275,
-              ('B', 'nz'): -5.050355474377749,
-              ('B', 'o'): -11.171751191077762,
-              ('B', 'p'): -5.973254159811936,
-              ('B', 'q'): -7.354038865120858,
-              ('B', 'r'): -5.150727841728235,
-              ('B', 'rz'): -9.156848170535497,
-              ('B', 's'): -5.7601051392227225,
-              ('B', 't'): -4.5358046353911154,
-              ('B', 'u'): -6.571593546913215,
-              ('B', 'v'): -1.7662141698383198,
-              ('B', 'vd'): -7.508189544948116,
-              ('B', 'vn'): -2.9994455458840847,
-              ('B', 'vq'): -11.864898371637707,
-              ('B', 'y'): -11.864898371637707,
-              ('B', 'z'): -8.686844541289762,
-              ('S', 'a'): -4.736402425957671,
-              ('S', 'ad'): -10.766286082969598,
-              ('S', 'ag'): -8.281379433181597,
-              ('S', 'b'): -5.308120015479665,
-              ('S', 'c'): -3.88077641293478,
-              ('S', 'd'): -3.306947187749302,
-              ('S', 'dg'): -9.299949014176171,
-              ('S', 'e'): -10.766286082969598,
-              ('S', 'f'): -4.403257979429132,
-              ('S', 'g'): -8.309550310148294,
-              ('S', 'h'): -10.255460459203606,
-              ('S', 'j'): -5.2870370139166605,
-              ('S', 'k'): -7.192069537175801,
-              ('S', 'm'): -4.070899282133712,
-              ('S', 'n'): -3.580899067389181,
-              ('S', 'ng'): -5.042700981017217,
-              ('S', 'nr'): -6.740934392234449,
-              ('S', 'o'): -11.864898371637707,
-              ('S', 'p'): -3.5708487315356794,
-              ('S', 'q'): -3.7726589649134965,
-              ('S', 'r'): -5.335479533375482,
-              ('S', 'tg'): -5.998430314704411,
-              ('S', 'u'): -4.496558685326327,
-              ('S', 'ud'): -8.569061505633378,
-              ('S', 'ug'): -8.253980458993484,
-              ('S', 'uj'): -3.071893280340176,
-              ('S', 'ul'): -6.909071314036447,
-              ('S', 'uv'): -7.857565186405236,
-              ('S', 'uz'): -8.43091116715256,
-              ('S', 'v'): -2.840767103182672,
-              ('S', 'vg'): -5.652292275886189,
-              ('S', 'vn'): -10.766286082969598,
-              ('S', 'x'): -10.073138902409653,
-              ('S', 'y'): -8.058235881867388,
-              ('S', 'yg'): -11.864898371637707},
- ('E', 'jn'): {('B', 'n'): -0.916290731874155,
-               ('B', 'vn'): -1.6094379124341003,
-               ('S', 'm'): -1.6094379124341003,
-               ('S', 'uj'): -1.6094379124341003},
- ('E', 'k'): {},
- ('E', 'l'): {('B', 'a'): -4.281994308212445,
-              ('B', 'ad'): -5.631355414286653,
-              ('B', 'an'): -7.781973234434385,
-              ('B', 'b'): -5.206986151539336,
-              ('B', 'c'): -3.6487758283119094,
-              ('B', 'd'): -3.4303213085337663,
-              ('B', 'df'): -9.494951825809325,
-              ('B', 'e'): -10.283409186173595,
-              ('B', 'f'): -4.843592257351859,
-              ('B', 'h'): -11.892847098607696,
-              ('B', 'i'): -4.812820598685105,
-              ('B', 'j'): -5.7232363661162395,
-              ('B', 'l'): -4.488567980570427,
-              ('B', 'm'): -4.232732779433767,
-              ('B', 'mq'): -7.229408004495628,
-              ('B', 'n'): -1.9874613487884873,
-              ('B', 'nr'): -4.183090234153531,
-              ('B', 'nrfg'): -7.6301672215663805,
-              ('B', 'nrt'): -6.780859310251152,
-              ('B', 'ns'): -4.471669570012302,
-              ('B', 'nt'): -6.67791134099871,
-              ('B', 'nz'): -5.982050454567168,
-              ('B', 'o'): -9.184796897505485,
-              ('B', 'p'): -5.11976672295216,
-              ('B', 'q'): -7.338970207007155,
-              ('B', 'r'): -3.5985474897504606,
-              ('B', 'rz'): -8.897114825053704,
-              ('B', 's'): -5.792528146587632,
-              ('B', 't'): -4.407355490576941,
-              ('B', 'u'): -5.916496189309762,
-              ('B', 'v'): -2.2468357764662827,
-              ('B', 'vd'): -9.120258376367914,
-              ('B', 'vi'): -11.892847098607696,
-              ('B', 'vn'): -3.873234304207428,
-              ('B', 'y'): -8.458859894122549,
-              ('B', 'z'): -6.842991091358159,
-              ('S', 'a'): -4.584304301068506,
-              ('S', 'ad'): -10.794234809939587,
-              ('S', 'ag'): -8.25526093888131,
-              ('S', 'b'): -6.494684397089943,
-              ('S', 'c'): -3.28563040454387,
-              ('S', 'd'): -2.81649536663483,
-              ('S', 'dg'): -9.494951825809325,
-              ('S', 'e'): -8.396339537141216,
-              ('S', 'f'): -4.153487895918597,
-              ('S', 'g'): -7.7497123722161625,
-              ('S', 'h'): -9.184796897505485,
-              ('S', 'j'): -6.0263790416743985,
-              ('S', 'k'): -6.6888404115309,
-              ('S', 'm'): -4.333287602599996,
-              ('S', 'mg'): -11.892847098607696,
-              ('S', 'n'): -4.068401167730077,
-              ('S', 'ng'): -5.246456583759966,
-              ('S', 'nr'): -6.0179163677556655,
-              ('S', 'o'): -9.81340555692786,
-              ('S', 'p'): -3.020079568696759,
-              ('S', 'q'): -4.843592257351859,
-              ('S', 'r'): -3.145018490118953,
-              ('S', 'tg'): -7.426938979953112,
-              ('S', 'u'): -4.567039596011923,
-              ('S', 'ud'): -7.248456199466323,
-              ('S', 'ug'): -7.210715871483476,
-              ('S', 'uj'): -1.999409881925069,
-              ('S', 'ul'): -4.667365625825401,
-              ('S', 'uv'): -4.095555825060223,
-              ('S', 'uz'): -7.815309654701976,
-              ('S', 'v'): -2.593397551559737,
-              ('S', 'vg'): -6.437525983249994,
-              ('S', 'vn'): -10.506552737487805,
-              ('S', 'x'): -10.101087629379641,
-              ('S', 'y'): -5.233553178924058},
- ('E', 'ln'): {('B', 'a'): -3.6635616461296463,
-               ('B', 'd'): -2.9704144655697013,
-               ('B', 'n'): -1.466337068793427,
-               ('B', 'ns'): -3.6635616461296463,
-               ('B', 'nt'): -3.6635616461296463,
-               ('B', 't'): -3.6635616461296463,
-               ('B', 'v'): -1.5841201044498106,
-               ('S', 'c'): -3.6635616461296463,
-               ('S', 'd'): -2.277267285009756,
-               ('S', 'f'): -3.6635616461296463,
-               ('S', 'n'): -2.5649493574615367,
-               ('S', 'p'): -2.9704144655697013,
-               ('S', 'uj'): -2.277267285009756,
-               ('S', 'v'): -3.6635616461296463},
- ('E', 'm'): {('B', 'a'): -3.4312981852350974,
-              ('B', 'ad'): -6.006821180675518,
-              ('B', 'an'): -7.110240120503148,
-              ('B', 'b'): -4.5609797564036345,
-              ('B', 'c'): -4.739222979044614,
-              ('B', 'd'): -3.9444158261482496,
-              ('B', 'df'): -8.877339027909251,
-              ('B', 'e'): -11.036823277262624,
-              ('B', 'f'): -4.381211341445001,
-              ('B', 'h'): -13.051726297804889,
-              ('B', 'i'): -5.178509242942146,
-              ('B', 'j'): -4.918726079221275,
-              ('B', 'l'): -5.3433156305475205,
-              ('B', 'm'): -3.9961701396295717,
-              ('B', 'mq'): -8.146451519366458,
-              ('B', 'n'): -1.2428418586344567,
-              ('B', 'nr'): -4.136428352686779,
-              ('B', 'nrfg'): -8.172719446187068,
-              ('B', 'nrt'): -6.70258730642509,
-              ('B', 'ns'): -4.445423931316875,
-              ('B', 'nt'): -6.700840581090149,
-              ('B', 'nz'): -5.532576340135065,
-              ('B', 'o'): -8.862071555778464,
-              ('B', 'p'): -6.041865795885597,
-              ('B', 'q'): -6.600466298043695,
-              ('B', 'r'): -4.274941914103396,
-              ('B', 'rr'): -13.051726297804889,
-              ('B', 'rz'): -10.37757764837836,
-              ('B', 's'): -5.703460568971786,
-              ('B', 't'): -4.520531586752837,
-              ('B', 'u'): -8.031140672855464,
-              ('B', 'v'): -2.286794983034085,
-              ('B', 'vd'): -9.223084901315794,
-              ('B', 'vn'): -4.136831388898321,
-              ('B', 'vq'): -11.547648901028614,
-              ('B', 'y'): -8.885061074003161,
-              ('B', 'z'): -5.454580887140518,
-              ('S', 'a'): -3.5027731247083813,
-              ('S', 'ad'): -11.179924120903296,
-              ('S', 'ag'): -7.368146530466206,
-              ('S', 'an'): -11.346978205566463,
-              ('S', 'b'): -6.055960141500038,
-              ('S', 'bg'): -13.744873478364834,
-              ('S', 'c'): -4.432427883451497,
-              ('S', 'd'): -3.08158527471424,
-              ('S', 'dg'): -9.139703292376742,
-              ('S', 'e'): -9.180525286896998,
-              ('S', 'f'): -4.028318095180343,
-              ('S', 'g'): -7.057764870498319,
-              ('S', 'h'): -8.342196096492554,
-              ('S', 'j'): -5.936550427973778,
-              ('S', 'k'): -7.6490489159326085,
-              ('S', 'm'): -4.276099634295993,
-              ('S', 'mg'): -11.953114009136778,
-              ('S', 'n'): -2.584047725401541,
-              ('S', 'ng'): -4.605170185988091,
-              ('S', 'nr'): -6.031982516874704,
-              ('S', 'nt'): -12.358579117244943,
-              ('S', 'o'): -9.234013971847984,
-              ('S', 'p'): -3.4681685652706618,
-              ('S', 'q'): -4.5302423249714945,
-              ('S', 'r'): -4.087222527690592,
-              ('S', 'rg'): -13.744873478364834,
-              ('S', 'tg'): -7.0162448652801315,
-              ('S', 'u'): -5.667115914627914,
-              ('S', 'ud'): -8.397765947647365,
-              ('S', 'ug'): -8.041091003708633,
-              ('S', 'uj'): -3.3506609737697177,
-              ('S', 'ul'): -5.751591150263242,
-              ('S', 'uv'): -6.294212682153294,
-              ('S', 'uz'): -8.563089928072749,
-              ('S', 'v'): -2.5891802554522334,
-              ('S', 'vg'): -5.722960699379124,
-              ('S', 'vn'): -10.107287318638448,
-              ('S', 'x'): -8.824892552536708,
-              ('S', 'y'): -6.280936873895908},
- ('E', 'mg'): {},
- ('E', 'mq'): {('B', 'a'): -4.102081544724253,
-               ('B', 'ad'): -6.251903883165888,
-               ('B', 'an'): -7.4150546929715695,
-               ('B', 'b'): -5.139498272365443,
-               ('B', 'c'): -5.011117105717236,
-               ('B', 'd'): -3.8926234464952976,
-               ('B', 'f'): -4.300058998590761,
-               ('B', 'i'): -5.692288095230466,
-               ('B', 'j'): -4.470615713805129,
-               ('B', 'l'): -5.590505400920524,
-               ('B', 'm'): -4.919098206996984,
-               ('B', 'mq'): -8.331345424845724,
-               ('B', 'n'): -1.1575148271658653,
-               ('B', 'nr'): -4.919098206996984,
-               ('B', 'nrfg'): -9.429957713513835,
-               ('B', 'nrt'): -7.4150546929715695,
-               ('B', 'ns'): -4.506333796407208,
-               ('B', 'nt'): -7.032062440715464,
-               ('B', 'nz'): -6.1341208475095055,
-               ('B', 'o'): -9.429957713513835,
-               ('B', 'p'): -6.191279261349454,
-               ('B', 'q'): -8.177194745018467,
-               ('B', 'r'): -4.484750224740034,
-               ('B', 's'): -5.263292489712107,
-               ('B', 't'): -6.08005362623923,
-               ('B', 'u'): -6.512186981429555,
-               ('B', 'v'): -2.2702770817920355,
-               ('B', 'vd'): -7.4150546929715695,
-               ('B', 'vn'): -3.33076046660297,
-               ('B', 'y'): -10.12310489407378,
-               ('B', 'z'): -6.385435275790411,
-               ('S', 'a'): -3.871201010907891,
-               ('S', 'ag'): -6.98761067814463,
-               ('S', 'b'): -6.4855187343473935,
-               ('S', 'c'): -4.634167167917093,
-               ('S', 'd'): -3.211357593822105,
-               ('S', 'dg'): -9.429957713513835,
-               ('S', 'f'): -3.201446709922651,
-               ('S', 'g'): -8.513666981639679,
-               ('S', 'h'): -8.513666981639679,
-               ('S', 'j'): -5.995970509028688,
-               ('S', 'k'): -9.024492605405669,
-               ('S', 'm'): -4.597651954941996,
-               ('S', 'n'): -2.239281679181627,
-               ('S', 'ng'): -5.132672307295043,
-               ('S', 'nr'): -6.596744369457618,
-               ('S', 'o'): -10.12310489407378,
-               ('S', 'p'): -3.844583469907935,
-               ('S', 'q'): -4.865609522045998,
-               ('S', 'r'): -4.273780114126921,
-               ('S', 'tg'): -8.73681053295389,
-               ('S', 'u'): -5.903597188897673,
-               ('S', 'ud'): -7.820519801079734,
-               ('S', 'ug'): -8.177194745018467,
-               ('S', 'uj'): -2.7700229735583473,
-               ('S', 'ul'): -7.725209621275409,
-               ('S', 'uv'): -6.3164424043034595,
-               ('S', 'uz'): -10.12310489407378,
-               ('S', 'v'): -2.9286680429734453,
-               ('S', 'vg'): -6.409532827369472,
-               ('S', 'x'): -10.12310489407378,
-               ('S', 'y'): -8.177194745018467},
- ('E', 'n'): {('B', 'a'): -3.978080739676936,
-              ('B', 'ad'): -5.66511002885322,
-              ('B', 'an'): -7.226405423299325,
-              ('B', 'b'): -5.180636619931472,
-              ('B', 'c'): -4.190342829817711,
-              ('B', 'd'): -3.4944759036200104,
-              ('B', 'df'): -9.747411617977368,
-              ('B', 'e'): -11.829165299415585,
-              ('B', 'f'): -4.73057541992539,
-              ('B', 'h'): -14.026389876751804,
-              ('B', 'i'): -5.891042927845096,
-              ('B', 'in'): -15.818149345979858,
-              ('B', 'j'): -5.768485683286129,
-              ('B', 'l'): -5.674897141113285,
-              ('B', 'ln'): -13.738707804300022,
-              ('B', 'm'): -4.315425743494227,
-              ('B', 'mq'): -8.021269003196336,
-              ('B', 'n'): -1.5681852668440757,
-              ('B', 'nr'): -4.176030634548956,
-              ('B', 'nrfg'): -7.857476737591742,
-              ('B', 'nrt'): -6.497072932409011,
-              ('B', 'ns'): -4.627304180183864,
-              ('B', 'nt'): -6.569839042752047,
-              ('B', 'nz'): -5.824501213735774,
-              ('B', 'o'): -9.081182387978004,
-              ('B', 'p'): -5.564674159804854,
-              ('B', 'q'): -6.871253822091411,
-              ('B', 'r'): -4.237621308874419,
-              ('B', 'rr'): -13.420254073181487,
-              ('B', 'rz'): -10.201378248313288,
-              ('B', 's'): -5.680815718996385,
-              ('B', 't'): -4.820777330015851,
-              ('B', 'u'): -5.920026155942882,
-              ('B', 'v'): -1.9576816748949826,
-              ('B', 'vd'): -7.835391643968746,
-              ('B', 'vi'): -12.321641784513378,
-              ('B', 'vn'): -3.4432626270142315,
-              ('B', 'vq'): -11.946948335071967,
-              ('B', 'y'): -8.971206206394479,
-              ('B', 'z'): -6.491449172887481,
-              ('S', 'a'): -4.463563321458343,
-              ('S', 'ad'): -10.848336046403858,
-              ('S', 'ag'): -8.012674720709002,
-              ('S', 'an'): -11.675014619588326,
-              ('S', 'b'): -6.352779233827144,
-              ('S', 'c'): -3.269153885047312,
-              ('S', 'd'): -2.843798856577224,
-              ('S', 'dg'): -8.438517193370306,
-              ('S', 'e'): -9.56048175809722,
-              ('S', 'f'): -3.2992131105507476,
-              ('S', 'g'): -7.393071443471427,
-              ('S', 'h'): -9.078812718622684,
-              ('S', 'j'): -6.05157031071119,
-              ('S', 'k'): -5.577225735733038,
-              ('S', 'm'): -4.139353573657507,
-              ('S', 'mg'): -11.461440519290267,
-              ('S', 'n'): -4.0025817700435695,
-              ('S', 'ng'): -4.867518253150814,
-              ('S', 'nr'): -5.886852092804464,
-              ('S', 'nt'): -13.515564252985813,
-              ('S', 'o'): -9.60554325022834,
-              ('S', 'p'): -3.02036718444358,
-              ('S', 'q'): -4.609902920306358,
-              ('S', 'r'): -4.088613625268949,
-              ('S', 'rg'): -12.450853515993385,
-              ('S', 't'): -15.818149345979858,
-              ('S', 'tg'): -7.514396930416446,
-              ('S', 'u'): -4.439406914477365,
-              ('S', 'ud'): -8.510947031215121,
-              ('S', 'ug'): -7.750059719701615,
-              ('S', 'uj'): -2.6041753509928776,
-              ('S', 'ul'): -6.198484655569791,
-              ('S', 'uv'): -7.019845627494879,
-              ('S', 'uz'): -8.139822989472973,
-              ('S', 'v'): -2.5678396434451454,
-              ('S', 'vg'): -6.1850279881302805,
-              ('S', 'vn'): -10.333352412489203,
-              ('S', 'x'): -9.153740325629451,
-              ('S', 'y'): -6.125876773892667},
- ('E', 'ng'): {},
- ('E', 'nr'): {('B', 'a'): -4.8510677626421845,
-               ('B', 'ad'): -5.7730519464060785,
-               ('B', 'an'): -8.937924040051959,
-               ('B', 'b'): -6.217255374990538,
-               ('B', 'c'): -4.94735395033205,
-               ('B', 'd'): -3.4849255221566655,
-               ('B', 'df'): -10.008365451753372,
-               ('B', 'e'): -10.500841936851167,
-               ('B', 'f'): -5.053712792408054,
-               ('B', 'i'): -5.352554962307688,
-               ('B', 'in'): -13.591884390209483,
-               ('B', 'j'): -6.552224040347407,
-               ('B', 'l'): -5.9317700710355545,
-               ('B', 'm'): -4.240478577954697,
-               ('B', 'mq'): -8.06245530269806,
-               ('B', 'n'): -2.215924780312412,
-               ('B', 'nr'): -3.092945179586863,
-               ('B', 'nrfg'): -6.730173049728752,
-               ('B', 'nrt'): -5.017932864974637,
-               ('B', 'ns'): -4.2940827424633055,
-               ('B', 'nt'): -7.532761194627686,
-               ('B', 'nz'): -5.81367291569699,
-               ('B', 'o'): -8.293567023661446,
-               ('B', 'p'): -6.002042878026825,
-               ('B', 'q'): -8.031202759193954,
-               ('B', 'r'): -4.444164380214968,
-               ('B', 'rr'): -12.898737209649537,
-               ('B', 'rz'): -9.274396276673173,
-               ('B', 's'): -5.003115000304024,
-               ('B', 't'): -4.5453579034715155,
-               ('B', 'u'): -6.356985969894652,
-               ('B', 'v'): -2.0990187856170266,
-               ('B', 'vd'): -10.647445411043043,
-               ('B', 'vn'): -5.154383967702493,
-               ('B', 'vq'): -11.026935032747947,
-               ('B', 'y'): -9.548833122374933,
-               ('B', 'z'): -6.252346694801808,
-               ('S', 'a'): -4.393717819165009,
-               ('S', 'ad'): -10.259679880034279,
-               ('S', 'ag'): -6.779539296032004,
-               ('S', 'an'): -11.64597424115417,
-               ('S', 'b'): -6.165930733131942,
-               ('S', 'c'): -3.553254243731061,
-               ('S', 'd'): -2.7497772603161366,
-               ('S', 'dg'): -8.438592795711704,
-               ('S', 'e'): -8.492017962385285,
-               ('S', 'f'): -4.177624061886849,
-               ('S', 'g'): -5.9924830567936676,
-               ('S', 'h'): -9.584551204977013,
-               ('S', 'j'): -4.797210988826062,
-               ('S', 'k'): -6.774053818755333,
-               ('S', 'm'): -4.1913369671653555,
-               ('S', 'mg'): -10.819295667969701,
-               ('S', 'n'): -3.2610397831490916,
-               ('S', 'ng'): -4.049725450293434,
-               ('S', 'nr'): -4.33599720327733,
-               ('S', 'nt'): -13.591884390209483,
-               ('S', 'o'): -9.070095813160442,
-               ('S', 'p'): -2.6531504246270647,
-               ('S', 'q'): -3.8870307199596144,
-               ('S', 'r'): -4.153771198535428,
-               ('S', 'rg'): -8.254346310508165,
-               ('S', 't'): -10.259679880034279,
-               ('S', 'tg'): -5.890684209352036,
-               ('S', 'u'): -3.62584466301639,
-               ('S', 'ud'): -7.176787431037887,
-               ('S', 'ug'): -7.496059827777258,
-               ('S', 'uj'): -2.72112786103457,
-               ('S', 'ul'): -5.437671695295254,
-               ('S', 'uv'): -7.210068372803384,
-               ('S', 'uz'): -6.729126477158082,
-               ('S', 'v'): -2.0218227338684454,
-               ('S', 'vg'): -4.549252862659409,
-               ('S', 'vn'): -10.647445411043043,
-               ('S', 'x'): -6.955937834522836,
-               ('S', 'y'): -6.3869918800048096,
-               ('S', 'yg'): -12.898737209649537,
-               ('S', 'zg'): -12.205590029089592},
- ('E', 'nrfg'): {('B', 'a'): -4.722301912631971,
-                 ('B', 'ad'): -5.214199526512442,
-                 ('B', 'an'): -7.986788248752224,
-                 ('B', 'b'): -5.651413332935188,
-                 ('B', 'c'): -4.421961443308267,
-                 ('B', 'd'): -3.0839856594591835,
-                 ('B', 'df'): -9.77854771798028,
-                 ('B', 'f'): -4.880707918029367,
-                 ('B', 'i'): -5.060048846685184,
-                 ('B', 'j'): -5.396521083306397,
-                 ('B', 'l'): -5.16342720113902,
-                 ('B', 'm'): -3.8253043836924947,
-                 ('B', 'mq'): -7.832637568924966,
-                 ('B', 'n'): -2.1427608565846947,
-                 ('B', 'nr'): -2.720649780568422,
-                 ('B', 'nrfg'): -4.880707918029367,
-                 ('B', 'nrt'): -6.114986071850632,
-                 ('B', 'ns'): -4.403269310296114,
-                 ('B', 'nt'): -5.846722085255953,
-                 ('B', 'nz'): -5.886727419869652,
-                 ('B', 'o'): -8.392253356860389,
-                 ('B', 'p'): -5.771214532747808,
-                 ('B', 'q'): -9.77854771798028,
-                 ('B', 'r'): -4.241213450961743,
-                 ('B', 'rz'): -8.169109805546178,
-                 ('B', 's'): -4.754667197134003,
-                 ('B', 't'): -4.3318103463139686,
-                 ('B', 'u'): -6.734025280256856,
-                 ('B', 'v'): -1.925331329824207,
-                 ('B', 'vd'): -9.085400537420334,
-                 ('B', 'vn'): -4.974526673247023,
-                 ('B', 'y'): -9.77854771798028,
-                 ('B', 'z'): -6.344560513495133,
-                 ('S', 'a'): -4.43144018726281,
-                 ('S', 'ag'): -7.986788248752224,
-                 ('S', 'b'): -6.559671893112078,
-                 ('S', 'c'): -4.500433058749762,
-                 ('S', 'd'): -3.1611447400058017,
-                 ('S', 'dg'): -9.085400537420334,
-                 ('S', 'e'): -9.77854771798028,
-                 ('S', 'f'): -4.0387548058010445,
-                 ('S', 'g'): -5.324200421726771,
-                 ('S', 'h'): -9.085400537420334,
-                 ('S', 'j'): -5.75319602724513,
-                 ('S', 'k'): -7.699106176300443,
-                 ('S', 'm'): -4.165419611592209,
-                 ('S', 'mg'): -9.77854771798028,
-                 ('S', 'n'): -3.7920957126958412,
-                 ('S', 'ng'): -4.888198589758526,
-                 ('S', 'nr'): -5.153574904696008,
-                 ('S', 'p'): -2.7818662298037404,
-                 ('S', 'q'): -4.0848155791775795,
-                 ('S', 'r'): -3.9525476105998285,
-                 ('S', 'tg'): -6.0408780996969105,
-                 ('S', 'u'): -4.515857529075394,
-                 ('S', 'ud'): -7.832637568924966,
-                 ('S', 'ug'): -6.782815444426288,
-                 ('S', 'uj'): -2.3579688125694784,
-                 ('S', 'ul'): -5.75319602724513,
-                 ('S', 'uv'): -9.085400537420334,
-                 ('S', 'uz'): -8.392253356860389,
-                 ('S', 'v'): -2.238988888679249,
-                 ('S', 'vg'): -4.991055975198233,
-                 ('S', 'vn'): -9.085400537420334,
-                 ('S', 'x'): -9.085400537420334,
-                 ('S', 'y'): -6.48271085197595},
- ('E', 'nrt'): {('B', 'a'): -4.103149768384549,
-                ('B', 'ad'): -6.169770621635323,
-                ('B', 'an'): -7.824819045321476,
-                ('B', 'b'): -5.907896433139415,
-                ('B', 'c'): -4.916098148757115,
-                ('B', 'd'): -3.7238299403807074,
-                ('B', 'df'): -10.532869246423687,
-                ('B', 'f'): -4.703923628813479,
-                ('B', 'i'): -4.889190695837191,
-                ('B', 'j'): -6.102052447580373,
-                ('B', 'l'): -5.874158293507565,
-                ('B', 'm'): -4.047470943219932,
-                ('B', 'mq'): -8.517966225881421,
-                ('B', 'n'): -1.7629737014516949,
-                ('B', 'nr'): -2.6547139099203623,
-                ('B', 'nrfg'): -7.115142562810321,
-                ('B', 'nrt'): -3.537103090118836,
-                ('B', 'ns'): -3.7433345988289806,
-                ('B', 'nt'): -7.218683241751161,
-                ('B', 'nz'): -4.78826477724723,
-                ('B', 'o'): -9.280106277928319,
-                ('B', 'p'): -6.038630621142877,
-                ('B', 'q'): -6.516486225671298,
-                ('B', 'r'): -4.615320382265873,
-                ('B', 'rz'): -9.434256957755577,
-                ('B', 's'): -5.178644247937354,
-                ('B', 't'): -4.744439297707201,
-                ('B', 'u'): -6.935556985835241,
-                ('B', 'v'): -2.1201480766041603,
-                ('B', 'vd'): -10.532869246423687,
-                ('B', 'vn'): -4.812557469816275,
-                ('B', 'vq'): -10.532869246423687,
-                ('B', 'y'): -10.127404138315523,
-                ('B', 'z'): -6.819297179719379,
-                ('S', 'a'): -4.559059634554425,
-                ('S', 'ad'): -10.127404138315523,
-                ('S', 'ag'): -6.306035501155507,
-                ('S', 'an'): -11.226016426983632,
-                ('S', 'b'): -6.748679612505425,
-                ('S', 'c'): -3.8982358885620005,
-                ('S', 'd'): -3.153861118795382,
-                ('S', 'dg'): -8.18149398926021,
-                ('S', 'e'): -8.335644669087467,
-                ('S', 'f'): -4.385469897694945,
-                ('S', 'g'): -6.35081910378248,
-                ('S', 'h'): -9.434256957755577,
-                ('S', 'j'): -4.204932462694492,
-                ('S', 'k'): -6.228804153219516,
-                ('S', 'm'): -3.9875195860892667,
-                ('S', 'mg'): -11.226016426983632,
-                ('S', 'n'): -3.0755485153596283,
-                ('S', 'ng'): -4.076884828426225,
-                ('S', 'nr'): -4.8475902433320455,
-                ('S', 'o'): -10.532869246423687,
-                ('S', 'p'): -3.1021621638777184,
-                ('S', 'q'): -3.884532574620471,
-                ('S', 'r'): -4.272332216113095,
-                ('S', 'rg'): -7.615098514339407,
-                ('S', 'tg'): -5.312513421345361,
-                ('S', 'u'): -4.404908954727167,
-                ('S', 'ud'): -7.670668365494218,
-                ('S', 'ug'): -9.280106277928319,
-                ('S', 'uj'): -2.972528398637727,
-                ('S', 'ul'): -5.947901767753114,
-                ('S', 'uv'): -7.615098514339407,
-                ('S', 'uz'): -7.562454780853986,
-                ('S', 'v'): -2.433618684626726,
-                ('S', 'vg'): -5.309814364376197,
-                ('S', 'vn'): -11.226016426983632,
-                ('S', 'x'): -7.69965590236747,
-                ('S', 'y'): -6.84398979230975,
-                ('S', 'yg'): -11.226016426983632},
- ('E', 'ns'): {('B', 'a'): -4.533345781203185,
-               ('B', 'ad'): -6.417350824011239,
-               ('B', 'an'): -8.632653132767416,
-               ('B', 'b'): -4.862640865016976,
-               ('B', 'c'): -5.3415260690694515,
-               ('B', 'd'): -4.463330330418472,
-               ('B', 'df'): -11.921055020284227,
-               ('B', 'e'): -13.530492932718326,
-               ('B', 'f'): -3.5763122658666804,
-               ('B', 'i'): -6.795901272745379,
-               ('B', 'j'): -4.4404011333383195,
-               ('B', 'l'): -5.754377455619585,
-               ('B', 'ln'): -12.837345752158381,
-               ('B', 'm'): -4.206734593706587,
-               ('B', 'mq'): -8.647691010131956,
-               ('B', 'n'): -1.2788161453831373,
-               ('B', 'nr'): -3.6954448334047196,
-               ('B', 'nrfg'): -7.969811301702799,
-               ('B', 'nrt'): -5.336816266763086,
-               ('B', 'ns'): -2.1933742915728085,
-               ('B', 'nt'): -5.630968460686129,
-               ('B', 'nz'): -4.611307322672897,
-               ('B', 'o'): -10.891435603103067,
-               ('B', 'p'): -6.810272777583032,
-               ('B', 'q'): -7.71636240089326,
-               ('B', 'r'): -4.822514106096005,
-               ('B', 'rz'): -11.132597659919956,
-               ('B', 's'): -4.323959799085098,
-               ('B', 't'): -4.303590472443165,
-               ('B', 'u'): -6.907756608768487,
-               ('B', 'v'): -2.5084760916737308,
-               ('B', 'vd'): -9.61846992729018,
-               ('B', 'vi'): -13.530492932718326,
-               ('B', 'vn'): -4.318054762659997,
-               ('B', 'vq'): -10.822442731616116,
-               ('B', 'y'): -10.640121174822163,
-               ('B', 'z'): -7.502214412487628,
-               ('S', 'a'): -4.648934444079351,
-               ('S', 'ad'): -10.96554357525679,
-               ('S', 'ag'): -7.713381772755122,
-               ('S', 'b'): -6.523797705881286,
-               ('S', 'c'): -3.698877392419994,
-               ('S', 'd'): -3.757057119542472,
-               ('S', 'dg'): -9.946973994262217,
-               ('S', 'e'): -11.132597659919956,
-               ('S', 'f'): -3.947348394873541,
-               ('S', 'g'): -6.93744839857589,
-               ('S', 'h'): -9.680345331008269,
-               ('S', 'j'): -4.971198565283454,
-               ('S', 'k'): -7.504626958893012,
-               ('S', 'm'): -4.05678879594157,
-               ('S', 'mg'): -13.530492932718326,
-               ('S', 'n'): -3.1798546505869276,
-               ('S', 'ng'): -4.434890238212567,
-               ('S', 'nr'): -5.394267377809866,
-               ('S', 'o'): -10.891435603103067,
-               ('S', 'p'): -3.42202579949566,
-               ('S', 'q'): -4.609035353770444,
-               ('S', 'r'): -4.929510215572406,
-               ('S', 'rg'): -11.921055020284227,
-               ('S', 't'): -13.530492932718326,
-               ('S', 'tg'): -5.458337624530077,
-               ('S', 'u'): -4.1341710431167025,
-               ('S', 'ud'): -9.136043778045888,
-               ('S', 'ug'): -8.640143804496573,
-               ('S', 'uj'): -2.9164604224458333,
-               ('S', 'ul'): -7.497406710919526,
-               ('S', 'uv'): -6.88800613135107,
-               ('S', 'uz'): -8.46789789969136,
-               ('S', 'v'): -3.0720576133813164,
-               ('S', 'vg'): -6.226649707440623,
-               ('S', 'vn'): -10.586053953551886,
-               ('S', 'x'): -8.560679633142326,
-               ('S', 'y'): -7.777920293892693},
- ('E', 'nt'): {('B', 'a'): -4.972479528443855,
-               ('B', 'ad'): -5.2608818025832305,
-               ('B', 'an'): -7.974712366600939,
-               ('B', 'b'): -4.2600804163845885,
-               ('B', 'c'): -5.235275851678058,
-               ('B', 'd'): -3.8810927047367874,
-               ('B', 'df'): -11.11020658253009,
-               ('B', 'f'): -5.440325659549569,
-               ('B', 'i'): -7.281565186040994,
-               ('B', 'j'): -4.866039681866353,
-               ('B', 'l'): -6.060350575280552,
-               ('B', 'ln'): -11.11020658253009,
-               ('B', 'm'): -3.779801370685687,
-               ('B', 'mq'): -7.349006466836527,
-               ('B', 'n'): -1.267424905111356,
-               ('B', 'nr'): -4.8411102988238275,
-               ('B', 'nrfg'): -8.545257225068552,
-               ('B', 'nrt'): -6.779473242243758,
-               ('B', 'ns'): -3.5315497319353266,
-               ('B', 'nt'): -3.518344867640156,
-               ('B', 'nz'): -4.709949137221268,
-               ('B', 'p'): -4.560555840296279,
-               ('B', 'q'): -9.500768670095988,
-               ('B', 'r'): -5.299065589553389,
-               ('B', 'rz'): -11.11020658253009,
-               ('B', 's'): -5.832091923299572,
-               ('B', 't'): -4.077582321502083,
-               ('B', 'u'): -6.535495604026706,
-               ('B', 'v'): -1.7587139307980229,
-               ('B', 'vd'): -8.40215638142788,
-               ('B', 'vn'): -3.8942315798786233,
-               ('B', 'y'): -11.11020658253009,
-               ('B', 'z'): -9.030765040850254,
-               ('S', 'a'): -5.613038357236888,
-               ('S', 'ag'): -10.417059401970144,
-               ('S', 'b'): -3.6085721246466758,
-               ('S', 'c'): -3.4648088831014556,
-               ('S', 'd'): -3.2941927433710614,
-               ('S', 'dg'): -10.417059401970144,
-               ('S', 'e'): -11.11020658253009,
-               ('S', 'f'): -4.833563093188445,
-               ('S', 'g'): -11.11020658253009,
-               ('S', 'h'): -9.723912221410199,
-               ('S', 'j'): -6.356616391423724,
-               ('S', 'k'): -8.91298200519387,
-               ('S', 'm'): -3.554824638289816,
-               ('S', 'n'): -4.601437445558408,
-               ('S', 'ng'): -6.140393282954089,
-               ('S', 'nr'): -7.178380949805764,
-               ('S', 'p'): -3.04180362396039,
-               ('S', 'q'): -4.134792655074137,
-               ('S', 'r'): -5.447246102394144,
-               ('S', 'rg'): -8.471149252914831,
-               ('S', 'tg'): -7.421327128416153,
-               ('S', 'u'): -4.32236160022051,
-               ('S', 'ud'): -9.723912221410199,
-               ('S', 'ug'): -11.11020658253009,
-               ('S', 'uj'): -2.8425009177676634,
-               ('S', 'ul'): -8.807621489536043,
-               ('S', 'uv'): -9.723912221410199,
-               ('S', 'uz'): -9.723912221410199,
-               ('S', 'v'): -3.562704899715122,
-               ('S', 'vg'): -7.81436971652576,
-               ('S', 'x'): -10.417059401970144,
-               ('S', 'y'): -8.807621489536043},
- ('E', 'nz'): {('B', 'a'): -4.9490278735999,
-               ('B', 'ad'): -6.253492216472158,
-               ('B', 'an'): -8.843759381917984,
-               ('B', 'b'): -4.6983596488956,
-               ('B', 'c'): -5.1094969219562305,
-               ('B', 'd'): -4.328201354619581,
-               ('B', 'df'): -11.195134639081463,
-               ('B', 'f'): -4.1273886237903845,
-               ('B', 'i'): -6.600014788946872,
-               ('B', 'j'): -5.381004107256396,
-               ('B', 'l'): -6.350947552622872,
-               ('B', 'm'): -3.640276118040787,
-               ('B', 'mq'): -7.8629301289062585,
-               ('B', 'n'): -1.1714669262892294,
-               ('B', 'nr'): -3.8902825016616775,
-               ('B', 'nrfg'): -8.017080808733517,
-               ('B', 'nrt'): -5.801507092729101,
-               ('B', 'ns'): -3.911343062681973,
-               ('B', 'nt'): -5.906867608386928,
-               ('B', 'nz'): -3.331867915071889,
-               ('B', 'o'): -10.096522350413352,
-               ('B', 'p'): -5.964026022226876,
-               ('B', 'q'): -7.544476397787724,
-               ('B', 'r'): -5.02239074475797,
-               ('B', 'rz'): -10.789669530973297,
-               ('B', 's'): -5.848027108363993,
-               ('B', 't'): -4.577063435221779,
-               ('B', 'u'): -6.625591630736523,
-               ('B', 'v'): -2.334635471465447,
-               ('B', 'vd'): -9.115693097401627,
-               ('B', 'vi'): -11.888281819641408,
-               ('B', 'vn'): -3.8926382153541366,
-               ('B', 'y'): -10.501987458521517,
-               ('B', 'z'): -7.051999912689929,
-               ('S', 'a'): -4.481571089463768,
-               ('S', 'ad'): -11.888281819641408,
-               ('S', 'ag'): -7.196933937412264,
-               ('S', 'an'): -11.888281819641408,
-               ('S', 'b'): -6.123090716856563,
-               ('S', 'c'): -3.635835729394455,
-               ('S', 'd'): -3.576883541204767,
-               ('S', 'dg'): -10.278843907207307,
-               ('S', 'e'): -10.789669530973297,
-               ('S', 'f'): -3.474672944481741,
-               ('S', 'g'): -6.897849232862671,
-               ('S', 'h'): -8.843759381917984,
-               ('S', 'j'): -4.734448018062565,
-               ('S', 'k'): -6.395220376300859,
-               ('S', 'm'): -4.04130083750262,
-               ('S', 'mg'): -10.501987458521517,
-               ('S', 'n'): -3.3175478612971405,
-               ('S', 'ng'): -4.065436529361635,
-               ('S', 'nr'): -5.619185535935146,
-               ('S', 'o'): -10.096522350413352,
-               ('S', 'p'): -3.319825334287629,
-               ('S', 'q'): -4.20257875840686,
-               ('S', 'r'): -4.670104981238,
-               ('S', 'rg'): -10.096522350413352,
-               ('S', 'tg'): -6.541174288923939,
-               ('S', 'u'): -4.105057803305371,
-               ('S', 'ud'): -7.7611474345963165,
-               ('S', 'ug'): -8.304762881185297,
-               ('S', 'uj'): -3.027640777867532,
-               ('S', 'ul'): -6.806877454656944,
-               ('S', 'uv'): -7.020747369185825,
-               ('S', 'uz'): -8.556077309466204,
-               ('S', 'v'): -2.8506295554909413,
-               ('S', 'vg'): -5.937639267053681,
-               ('S', 'vn'): -9.180231618539198,
-               ('S', 'x'): -8.15061220135804,
-               ('S', 'y'): -7.044094733182816},
- ('E', 'o'): {('B', 'a'): -5.7903423608503095,
-              ('B', 'ad'): -8.562931083090092,
-              ('B', 'an'): -8.562931083090092,
-              ('B', 'b'): -8.562931083090092,
-              ('B', 'c'): -6.365706505753872,
-              ('B', 'd'): -4.671110784979464,
-              ('B', 'e'): -8.562931083090092,
-              ('B', 'f'): -7.464318794421981,
-              ('B', 'i'): -6.260345990096045,
-              ('B', 'j'): -6.260345990096045,
-              ('B', 'l'): -5.997981725628555,
-              ('B', 'm'): -2.245766396342807,
-              ('B', 'mq'): -7.464318794421981,
-              ('B', 'n'): -3.4691808822833288,
-              ('B', 'nr'): -4.712783481380033,
-              ('B', 'nrt'): -7.869783902530146,
-              ('B', 'ns'): -6.365706505753872,
-              ('B', 'nz'): -7.464318794421981,
-              ('B', 'o'): -2.690813293614675,
-              ('B', 'p'): -8.562931083090092,
-              ('B', 'q'): -8.562931083090092,
-              ('B', 'r'): -4.899369436960445,
-              ('B', 's'): -6.260345990096045,
-              ('B', 't'): -6.16503581029172,
-              ('B', 'v'): -2.5467739233917377,
-              ('B', 'vn'): -7.464318794421981,
-              ('B', 'z'): -6.771171613862037,
-              ('S', 'a'): -5.230726572914887,
-              ('S', 'ag'): -7.869783902530146,
-              ('S', 'c'): -5.7903423608503095,
-              ('S', 'd'): -3.249725104048304,
-              ('S', 'dg'): -8.562931083090092,
-              ('S', 'e'): -5.923873753474832,
-              ('S', 'f'): -5.5184086453666685,
-              ('S', 'j'): -4.59263916953797,
-              ('S', 'm'): -3.1512850312350515,
-              ('S', 'n'): -4.519879815255541,
-              ('S', 'ng'): -6.483489541410255,
-              ('S', 'nr'): -5.923873753474832,
-              ('S', 'o'): -3.326489120260142,
-              ('S', 'p'): -4.631105450365766,
-              ('S', 'q'): -3.532493161697656,
-              ('S', 'r'): -3.9882201045867083,
-              ('S', 'tg'): -7.869783902530146,
-              ('S', 'u'): -5.0365705584739295,
-              ('S', 'ud'): -7.464318794421981,
-              ('S', 'ug'): -8.562931083090092,
-              ('S', 'uj'): -2.3403548150187223,
-              ('S', 'ul'): -5.304834545068609,
-              ('S', 'uv'): -1.7773434380821618,
-              ('S', 'uz'): -4.849359016385783,
-              ('S', 'v'): -1.9549304577940043,
-              ('S', 'vg'): -5.0365705584739295,
-              ('S', 'x'): -4.358238463699125,
-              ('S', 'y'): -5.007583021600677},
- ('E', 'p'): {('B', 'a'): -3.707686938726001,
-              ('B', 'ad'): -5.171603498030898,
-              ('B', 'an'): -7.4460177140582475,
-              ('B', 'b'): -4.260468893306113,
-              ('B', 'c'): -6.470410405027673,
-              ('B', 'd'): -3.937378650534441,
-              ('B', 'f'): -4.929217700494293,
-              ('B', 'i'): -5.748874221205041,
-              ('B', 'j'): -4.469921415021115,
-              ('B', 'l'): -5.156011403271061,
-              ('B', 'm'): -3.366833792066828,
-              ('B', 'mq'): -5.905572673111098,
-              ('B', 'n'): -1.2672095197672428,
-              ('B', 'nr'): -3.707686938726001,
-              ('B', 'nrfg'): -7.059244738962235,
-              ('B', 'nrt'): -5.970111194248669,
-              ('B', 'ns'): -3.4303857260110813,
-              ('B', 'nt'): -4.620184477299653,
-              ('B', 'nz'): -4.969245914476523,
-              ('B', 'o'): -9.525459255738083,
-              ('B', 'p'): -5.844948051294663,
-              ('B', 'q'): -6.414416135673098,
-              ('B', 'r'): -2.954265106216899,
-              ('B', 'rr'): -9.930924363846247,
-              ('B', 'rz'): -8.059122186944656,
-              ('B', 's'): -4.696257024374667,
-              ('B', 't'): -3.535941045960784,
-              ('B', 'u'): -8.544630002726358,
-              ('B', 'v'): -1.82571749752844,
-              ('B', 'vd'): -7.985014214790934,
-              ('B', 'vn'): -3.4046735555274314,
-              ('B', 'z'): -7.117513647086211,
-              ('S', 'a'): -4.23103835946917,
-              ('S', 'ag'): -8.111765920430077,
-              ('S', 'b'): -6.5693922385765235,
-              ('S', 'c'): -5.69923624011327,
-              ('S', 'd'): -4.625962454579542,
-              ('S', 'dg'): -9.77677368401899,
-              ('S', 'f'): -5.16165316717773,
-              ('S', 'g'): -7.200895256025262,
-              ('S', 'h'): -7.851482822166411,
-              ('S', 'j'): -5.368313792276952,
-              ('S', 'k'): -9.014633631972092,
-              ('S', 'm'): -4.000892056256767,
-              ('S', 'mg'): -11.722683833074303,
-              ('S', 'n'): -4.115799301854673,
-              ('S', 'ng'): -5.310865565364406,
-              ('S', 'nr'): -5.6045866350329545,
-              ('S', 'nt'): -11.029536652514357,
-              ('S', 'o'): -10.113245920640201,
-              ('S', 'p'): -3.5493903941080744,
-              ('S', 'q'): -5.1816538338844,
-              ('S', 'r'): -3.182164816354568,
-              ('S', 'tg'): -7.697332142339153,
-              ('S', 'u'): -6.795430147917098,
-              ('S', 'ud'): -8.631641379715987,
-              ('S', 'ug'): -9.324788560275932,
-              ('S', 'uj'): -4.737967512956037,
-              ('S', 'ul'): -4.653660406496043,
-              ('S', 'uv'): -8.085097673347917,
-              ('S', 'uz'): -9.014633631972092,
-              ('S', 'v'): -3.303324002006828,
-              ('S', 'vg'): -6.409477854032515,
-              ('S', 'vn'): -10.624071544406192,
-              ('S', 'x'): -9.237777183286303,
-              ('S', 'y'): -9.083626503459044},
- ('E', 'q'): {('B', 'a'): -3.7031528191769754,
-              ('B', 'ad'): -6.543262742292252,
-              ('B', 'an'): -6.646446978527482,
-              ('B', 'b'): -4.9105679676938845,
-              ('B', 'c'): -4.973830164471851,
-              ('B', 'd'): -4.134729071288826,
-              ('B', 'f'): -3.5763738406865895,
-              ('B', 'i'): -5.704403750550913,
-              ('B', 'j'): -5.381338174209815,
-              ('B', 'l'): -5.9212114834160365,
-              ('B', 'm'): -3.649628338761271,
-              ('B', 'mq'): -8.865650462582478,
-              ('B', 'n'): -1.2517330659629002,
-              ('B', 'nr'): -4.468735215414845,
-              ('B', 'nrfg'): -9.376476086348468,
-              ('B', 'nrt'): -6.068369127752325,
-              ('B', 'ns'): -4.2003263537746385,
-              ('B', 'nt'): -7.641875030960361,
-              ('B', 'nz'): -6.044271576173264,
-              ('B', 'o'): -8.683328905788523,
-              ('B', 'p'): -6.432037107182027,
-              ('B', 'q'): -4.35699117697523,
-              ('B', 'r'): -4.439606942491821,
-              ('B', 's'): -5.282131524126367,
-              ('B', 't'): -4.473673497055428,
-              ('B', 'u'): -7.256212550148377,
-              ('B', 'v'): -2.149055689061499,
-              ('B', 'vd'): -5.9212114834160365,
-              ('B', 'vn'): -4.2003263537746385,
-              ('B', 'y'): -10.475088375016577,
-              ('B', 'z'): -7.216991836995096,
-              ('S', 'a'): -4.083171261623976,
-              ('S', 'ag'): -7.530649395850137,
-              ('S', 'b'): -6.316205291656906,
-              ('S', 'c'): -4.1172461085084775,
-              ('S', 'd'): -3.2131612823138265,
-              ('S', 'dg'): -9.376476086348468,
-              ('S', 'f'): -4.4911520943293874,
-              ('S', 'g'): -8.172503282022532,
-              ('S', 'h'): -8.865650462582478,
-              ('S', 'j'): -5.132754123051766,
-              ('S', 'k'): -8.395646833336741,
-              ('S', 'm'): -3.7322077392246746,
-              ('S', 'n'): -3.3251715388844687,
-              ('S', 'ng'): -5.063442323161538,
-              ('S', 'nr'): -6.270395755625612,
-              ('S', 'o'): -10.475088375016577,
-              ('S', 'p'): -3.1284332118400386,
-              ('S', 'q'): -4.207887826475215,
-              ('S', 'r'): -4.926012290121358,
-              ('S', 'rg'): -9.376476086348468,
-              ('S', 'tg'): -6.919740313527164,
-              ('S', 'u'): -5.526328484638409,
-              ('S', 'ud'): -9.376476086348468,
-              ('S', 'ug'): -8.277863797680357,
-              ('S', 'uj'): -2.728787712785138,
-              ('S', 'ul'): -8.395646833336741,
-              ('S', 'uv'): -7.179251509012248,
-              ('S', 'uz'): -10.475088375016577,
-              ('S', 'v'): -2.5481248301535993,
-              ('S', 'vg'): -5.986452005284438,
-              ('S', 'vn'): -9.376476086348468,
-              ('S', 'x'): -9.088794013896687,
-              ('S', 'y'): -6.919740313527164},
- ('E', 'qe'): {('B', 'n'): -0.6931471805599453,
-               ('S', 'q'): -0.6931471805599453},
- ('E', 'qg'): {},
- ('E', 'r'): {('B', 'a'): -3.546611504512179,
-              ('B', 'ad'): -5.605998004408728,
-              ('B', 'an'): -6.694425832790958,
-              ('B', 'b'): -5.161194529167501,
-              ('B', 'c'): -4.892411646081026,
-              ('B', 'd'): -3.478237052952054,
-              ('B', 'df'): -8.340153746630259,
-              ('B', 'e'): -12.456477215571136,
-              ('B', 'f'): -5.405198959836823,
-              ('B', 'h'): -13.555089504239245,
-              ('B', 'i'): -4.812196032727107,
-              ('B', 'j'): -6.073533802329728,
-              ('B', 'l'): -5.275646016526579,
-              ('B', 'm'): -3.8052777443071637,
-              ('B', 'mq'): -7.864730049915184,
-              ('B', 'n'): -1.497882363047387,
-              ('B', 'nr'): -4.52591136133717,
-              ('B', 'nrfg'): -8.062028060898696,
-              ('B', 'nrt'): -6.9661630267057255,
-              ('B', 'ns'): -5.044518189131894,
-              ('B', 'nt'): -7.400231410222827,
-              ('B', 'nz'): -6.189276667029772,
-              ('B', 'o'): -9.124272705395931,
-              ('B', 'p'): -5.911127555236715,
-              ('B', 'q'): -7.888662816126812,
-              ('B', 'r'): -3.9153071147734493,
-              ('B', 'rr'): -11.945651591805143,
-              ('B', 'rz'): -9.477552060333526,
-              ('B', 's'): -5.034103514584311,
-              ('B', 't'): -4.62023916394948,
-              ('B', 'u'): -6.710274025030982,
-              ('B', 'v'): -2.022822302480277,
-              ('B', 'vd'): -9.022490011085988,
-              ('B', 'vn'): -4.0450149787871394,
-              ('B', 'vq'): -10.721876160183028,
-              ('B', 'y'): -8.726775766936944,
-              ('B', 'z'): -6.184229337702528,
-              ('S', 'a'): -3.9618023355855,
-              ('S', 'ad'): -10.559357230685254,
-              ('S', 'ag'): -7.805696518330991,
-              ('S', 'an'): -12.8619423236793,
-              ('S', 'b'): -6.573154827082856,
-              ('S', 'c'): -5.016917906437816,
-              ('S', 'd'): -2.510217571191138,
-              ('S', 'dg'): -8.83659063294415,
-              ('S', 'e'): -9.224356163952914,
-              ('S', 'f'): -5.6360970160739985,
-              ('S', 'g'): -7.6857925911054705,
-              ('S', 'h'): -8.037636607774537,
-              ('S', 'j'): -6.365921765818922,
-              ('S', 'k'): -9.033300927190204,
-              ('S', 'm'): -4.268529106351653,
-              ('S', 'mg'): -12.168795143119354,
-              ('S', 'n'): -3.4480898423381343,
-              ('S', 'ng'): -5.313122944007442,
-              ('S', 'nr'): -6.330336098471274,
-              ('S', 'nt'): -13.555089504239245,
-              ('S', 'o'): -9.683888493331354,
-              ('S', 'p'): -3.278384591145073,
-              ('S', 'q'): -4.629768087295359,
-              ('S', 'r'): -3.897310692677474,
-              ('S', 'rg'): -12.8619423236793,
-              ('S', 't'): -13.555089504239245,
-              ('S', 'tg'): -7.571153223552054,
-              ('S', 'u'): -5.4920265929124525,
-              ('S', 'ud'): -7.558637415620224,
-              ('S', 'ug'): -7.486663915995134,
-              ('S', 'uj'): -2.551091465751927,
-              ('S', 'ul'): -5.8126874824234624,
-              ('S', 'uv'): -7.200719463441894,
-              ('S', 'uz'): -8.57835576181867,
-              ('S', 'v'): -2.186253833298424,
-              ('S', 'vg'): -6.453413532619801,
-              ('S', 'vn'): -10.336213679371044,
-              ('S', 'x'): -9.320982999641986,
-              ('S', 'y'): -5.442561740760607},
- ('E', 'rg'): {},
- ('E', 'rr'): {('B', 'a'): -5.10594547390058,
-               ('B', 'b'): -5.10594547390058,
-               ('B', 'c'): -4.412798293340635,
-               ('B', 'd'): -3.0265039322207445,
-               ('B', 'df'): -5.10594547390058,
-               ('B', 'f'): -4.412798293340635,
-               ('B', 'i'): -5.10594547390058,
-               ('B', 'm'): -5.10594547390058,
-               ('B', 'nr'): -5.10594547390058,
-               ('B', 'nrt'): -5.10594547390058,
-               ('B', 'ns'): -5.10594547390058,
-               ('B', 'r'): -3.1600353248452673,
-               ('B', 'rr'): -5.10594547390058,
-               ('B', 's'): -5.10594547390058,
-               ('B', 'u'): -4.412798293340635,
-               ('B', 'v'): -2.3333567516607996,
-               ('B', 'vn'): -4.412798293340635,
-               ('B', 'z'): -5.10594547390058,
-               ('S', 'a'): -3.4965075614664802,
-               ('S', 'b'): -5.10594547390058,
-               ('S', 'c'): -3.4965075614664802,
-               ('S', 'd'): -2.16150649473414,
-               ('S', 'm'): -4.412798293340635,
-               ('S', 'n'): -5.10594547390058,
-               ('S', 'nr'): -5.10594547390058,
-               ('S', 'p'): -2.540996116439044,
-               ('S', 'r'): -3.4965075614664802,
-               ('S', 'uj'): -1.1741198411762548,
-               ('S', 'ul'): -5.10594547390058,
-               ('S', 'v'): -2.70805020110221},
- ('E', 'rz'): {('B', 'a'): -2.993855513541131,
-               ('B', 'ad'): -6.970417040106848,
-               ('B', 'an'): -6.682734967655067,
-               ('B', 'b'): -5.235815984718742,
-               ('B', 'c'): -5.989587787095122,
-               ('B', 'd'): -4.240387932285863,
-               ('B', 'f'): -5.671134055976587,
-               ('B', 'i'): -3.738295988488627,
-               ('B', 'j'): -5.871804751438739,
-               ('B', 'l'): -5.360979127672747,
-               ('B', 'm'): -4.773192462770629,
-               ('B', 'n'): -0.7672069866370257,
-               ('B', 'nr'): -2.8928795962011287,
-               ('B', 'nrfg'): -6.1231191797196445,
-               ('B', 'nrt'): -6.2772698595469025,
-               ('B', 'ns'): -3.6623100815107046,
-               ('B', 'nt'): -6.459591416340857,
-               ('B', 'nz'): -5.671134055976587,
-               ('B', 'p'): -8.069029328774958,
-               ('B', 'r'): -6.682734967655067,
-               ('B', 'rz'): -8.069029328774958,
-               ('B', 's'): -5.766444235780912,
-               ('B', 't'): -4.177209030664331,
-               ('B', 'v'): -2.981432993542574,
-               ('B', 'vn'): -4.736824818599754,
-               ('B', 'z'): -5.504079971313421,
-               ('S', 'a'): -2.8167559007283276,
-               ('S', 'ag'): -6.459591416340857,
-               ('S', 'b'): -4.240387932285863,
-               ('S', 'c'): -6.970417040106848,
-               ('S', 'd'): -4.043677638039808,
-               ('S', 'f'): -5.0245068910515345,
-               ('S', 'g'): -8.069029328774958,
-               ('S', 'j'): -5.235815984718742,
-               ('S', 'm'): -4.850153503906757,
-               ('S', 'n'): -4.177209030664331,
-               ('S', 'ng'): -4.431443169048572,
-               ('S', 'nr'): -4.405467682645312,
-               ('S', 'p'): -3.6870026941010763,
-               ('S', 'q'): -4.810932790753475,
-               ('S', 'qg'): -8.069029328774958,
-               ('S', 'r'): -6.459591416340857,
-               ('S', 'tg'): -8.069029328774958,
-               ('S', 'u'): -7.3758821482150125,
-               ('S', 'ud'): -7.3758821482150125,
-               ('S', 'uj'): -8.069029328774958,
-               ('S', 'v'): -2.993855513541131,
-               ('S', 'vg'): -5.766444235780912},
- ('E', 's'): {('B', 'a'): -4.116698496101698,
-              ('B', 'ad'): -5.9592873005373885,
-              ('B', 'an'): -7.419246796694014,
-              ('B', 'b'): -5.049543867229909,
-              ('B', 'c'): -4.762634891067116,
-              ('B', 'd'): -3.4165826462256597,
-              ('B', 'df'): -9.91245224929671,
-              ('B', 'e'): -11.52189016173081,
-              ('B', 'f'): -5.134169445599974,
-              ('B', 'i'): -5.301299991631071,
-              ('B', 'j'): -5.850286585438844,
-              ('B', 'l'): -5.554462192451069,
-              ('B', 'm'): -3.9432333111360474,
-              ('B', 'mq'): -8.071902615899223,
-              ('B', 'n'): -1.632146626986941,
-              ('B', 'nr'): -4.4945756476910335,
-              ('B', 'nrfg'): -8.207704157058284,
-              ('B', 'nrt'): -6.978595379460806,
-              ('B', 'ns'): -4.685093971689167,
-              ('B', 'nt'): -7.630069863620183,
-              ('B', 'nz'): -6.359965420088328,
-              ('B', 'o'): -6.863179208814689,
-              ('B', 'p'): -6.251457998672309,
-              ('B', 'q'): -6.48169606539301,
-              ('B', 'r'): -4.22853240373676,
-              ('B', 'rz'): -9.817142069492384,
-              ('B', 's'): -4.763795657303079,
-              ('B', 't'): -5.371287393284531,
-              ('B', 'u'): -7.079238905240493,
-              ('B', 'v'): -1.8412024695773868,
-              ('B', 'vd'): -10.017812764954536,
-              ('B', 'vn'): -3.8433324576231236,
-              ('B', 'vq'): -9.575980012675497,
-              ('B', 'y'): -9.817142069492384,
-              ('B', 'z'): -5.628865687436081,
-              ('S', 'a'): -4.331214127398602,
-              ('S', 'ad'): -11.116425053622645,
-              ('S', 'ag'): -7.682437849137499,
-              ('S', 'an'): -11.116425053622645,
-              ('S', 'b'): -6.569590444647518,
-              ('S', 'c'): -4.375117982278173,
-              ('S', 'd'): -2.7868474074614724,
-              ('S', 'dg'): -8.120692780068655,
-              ('S', 'e'): -8.996161517422555,
-              ('S', 'f'): -4.65704238375995,
-              ('S', 'g'): -7.339840019089603,
-              ('S', 'h'): -9.079543126361605,
-              ('S', 'j'): -6.389037234910305,
-              ('S', 'k'): -8.154594331744336,
-              ('S', 'm'): -4.153865982599834,
-              ('S', 'n'): -3.9414455440911236,
-              ('S', 'ng'): -5.0364918585270555,
-              ('S', 'nr'): -6.334504355890055,
-              ('S', 'nt'): -12.215037342290755,
-              ('S', 'o'): -8.120692780068655,
-              ('S', 'p'): -3.571211499941152,
-              ('S', 'q'): -5.267100273675786,
-              ('S', 'r'): -3.8373361296931168,
-              ('S', 'tg'): -6.8969173484465385,
-              ('S', 'u'): -5.266140119977443,
-              ('S', 'ud'): -8.244745428738634,
-              ('S', 'ug'): -7.324688214069002,
-              ('S', 'uj'): -2.274494881803616,
-              ('S', 'ul'): -5.738064979401073,
-              ('S', 'uv'): -7.28778365713355,
-              ('S', 'uz'): -7.640326363787373,
-              ('S', 'v'): -1.9623023616446913,
-              ('S', 'vg'): -6.160597996021385,
-              ('S', 'vn'): -9.91245224929671,
-              ('S', 'x'): -8.8138399606286,
-              ('S', 'y'): -6.5246778879666945},
- ('E', 't'): {('B', 'a'): -4.4115592866919,
-              ('B', 'ad'): -5.931133218221465,
-              ('B', 'an'): -7.986690387030758,
-              ('B', 'b'): -5.373950365732873,
-              ('B', 'c'): -5.017890995836355,
-              ('B', 'd'): -3.59535407533881,
-              ('B', 'df'): -9.85849256393235,
-              ('B', 'e'): -12.25638783673072,
-              ('B', 'f'): -3.725094520935701,
-              ('B', 'h'): -11.340097104856564,
-              ('B', 'i'): -5.983510830184553,
-              ('B', 'in'): -11.850922728622557,
-              ('B', 'j'): -4.968827196420996,
-              ('B', 'l'): -5.821841317943267,
-              ('B', 'ln'): -12.949535017290666,
-              ('B', 'm'): -3.327946292450591,
-              ('B', 'mq'): -5.868667120599883,
-              ('B', 'n'): -1.7392699079529312,
-              ('B', 'nr'): -3.7356011098043527,
-              ('B', 'nrfg'): -7.144400048374177,
-              ('B', 'nrt'): -6.4289138897319695,
-              ('B', 'ns'): -3.6552212115383043,
-              ('B', 'nt'): -5.780185000620066,
-              ('B', 'nz'): -5.3317754406821605,
-              ('B', 'o'): -10.87009347561083,
-              ('B', 'p'): -5.601591194141978,
-              ('B', 'q'): -6.983388278166974,
-              ('B', 'r'): -3.857415276701914,
-              ('B', 'rr'): -12.949535017290666,
-              ('B', 'rz'): -8.701039775241307,
-              ('B', 's'): -5.119506934756826,
-              ('B', 't'): -3.385584392748595,
-              ('B', 'u'): -5.780185000620066,
-              ('B', 'v'): -2.0780565212948656,
-              ('B', 'vd'): -7.912582414877036,
-              ('B', 'vn'): -4.354270290454273,
-              ('B', 'vq'): -10.551639744492295,
-              ('B', 'y'): -10.464628367502666,
-              ('B', 'z'): -7.1843439145058205,
-              ('S', 'a'): -4.4813220080961464,
-              ('S', 'ad'): -11.157775548062611,
-              ('S', 'ag'): -8.23103614599557,
-              ('S', 'an'): -12.949535017290666,
-              ('S', 'b'): -6.9188497570294025,
-              ('S', 'c'): -4.686460181488068,
-              ('S', 'd'): -2.6197671702657876,
-              ('S', 'dg'): -9.078334006382775,
-              ('S', 'e'): -9.653698151286337,
-              ('S', 'f'): -4.0086439495052035,
-              ('S', 'g'): -7.473071465359155,
-              ('S', 'h'): -9.905012579567243,
-              ('S', 'j'): -5.271208660783779,
-              ('S', 'k'): -9.01770938456634,
-              ('S', 'm'): -3.3582271688067187,
-              ('S', 'mg'): -9.814040801361516,
-              ('S', 'n'): -4.311186704317961,
-              ('S', 'ng'): -3.93180899159387,
-              ('S', 'nr'): -5.618474712072033,
-              ('S', 'nt'): -12.949535017290666,
-              ('S', 'o'): -10.0591632593945,
-              ('S', 'p'): -3.227389501434992,
-              ('S', 'q'): -4.68285657398477,
-              ('S', 'r'): -3.4420574140919467,
-              ('S', 't'): -11.003624868235352,
-              ('S', 'tg'): -6.461850998806055,
-              ('S', 'u'): -5.429842613174126,
-              ('S', 'ud'): -7.626525038152257,
-              ('S', 'ug'): -7.68684482838578,
-              ('S', 'uj'): -2.6619762493340455,
-              ('S', 'ul'): -5.661290616270541,
-              ('S', 'uv'): -8.240004815978331,
-              ('S', 'uz'): -9.338617104646442,
-              ('S', 'v'): -2.632283553831678,
-              ('S', 'vg'): -6.021977111012348,
-              ('S', 'vn'): -10.241484816188455,
-              ('S', 'x'): -9.77148118694272,
-              ('S', 'y'): -7.117652540007149},
- ('E', 'tg'): {},
- ('E', 'u'): {('B', 'a'): -3.591552560215763,
-              ('B', 'ad'): -5.404747310163883,
-              ('B', 'an'): -7.092146764067696,
-              ('B', 'b'): -5.002621103321234,
-              ('B', 'c'): -3.391178512634755,
-              ('B', 'd'): -2.9328414725531347,
-              ('B', 'df'): -9.316770315592029,
-              ('B', 'e'): -10.70306467671192,
-              ('B', 'f'): -5.482708851633595,
-              ('B', 'i'): -4.916167295345212,
-              ('B', 'j'): -5.8588775902533285,
-              ('B', 'l'): -5.097262610415923,
-              ('B', 'm'): -4.126595107663696,
-              ('B', 'mq'): -6.3210380420380385,
-              ('B', 'n'): -2.1061365172768287,
-              ('B', 'nr'): -4.17656981714113,
-              ('B', 'nrfg'): -7.7586256975454795,
-              ('B', 'nrt'): -6.559929950320387,
-              ('B', 'ns'): -4.455021802203491,
-              ('B', 'nt'): -6.6957314914794495,
-              ('B', 'nz'): -5.843252272350248,
-              ('B', 'o'): -6.831863665804029,
-              ('B', 'p'): -4.937873573927075,
-              ('B', 'q'): -6.21442830697978,
-              ('B', 'r'): -3.096677286939268,
-              ('B', 'rz'): -8.21815802692392,
-              ('B', 's'): -5.585070864295165,
-              ('B', 't'): -3.898450156649296,
-              ('B', 'u'): -6.118097198041348,
-              ('B', 'v'): -2.2208770944944978,
-              ('B', 'vd'): -9.60445238804381,
-              ('B', 'vn'): -4.744639983682138,
-              ('B', 'y'): -8.911305207483865,
-              ('B', 'z'): -5.4097598519874275,
-              ('S', 'a'): -4.0412099361666085,
-              ('S', 'ag'): -7.484188851843719,
-              ('S', 'an'): -10.70306467671192,
-              ('S', 'b'): -6.677712985976771,
-              ('S', 'c'): -4.2928897947457525,
-              ('S', 'd'): -2.473553557747463,
-              ('S', 'dg'): -8.623623135032084,
-              ('S', 'e'): -8.064007347096661,
-              ('S', 'f'): -5.783083750883795,
-              ('S', 'g'): -7.658542238988497,
-              ('S', 'h'): -10.009917496151974,
-              ('S', 'j'): -6.049104326554397,
-              ('S', 'k'): -8.623623135032084,
-              ('S', 'm'): -4.4207979298159135,
-              ('S', 'mg'): -10.70306467671192,
-              ('S', 'n'): -4.375127892982725,
-              ('S', 'ng'): -5.414797646017385,
-              ('S', 'nr'): -6.237156558057336,
-              ('S', 'o'): -7.707332403157929,
-              ('S', 'p'): -3.0252011760337094,
-              ('S', 'q'): -5.515678870871165,
-              ('S', 'r'): -2.6923731375816184,
-              ('S', 'tg'): -7.99501447560971,
-              ('S', 'u'): -6.159769894441916,
-              ('S', 'ud'): -7.869851332655704,
-              ('S', 'ug'): -8.138115319250383,
-              ('S', 'uj'): -2.6296617077255147,
-              ('S', 'ul'): -5.002621103321234,
-              ('S', 'uv'): -5.273719047757479,
-              ('S', 'v'): -2.2363230287917806,
-              ('S', 'vg'): -5.783083750883795,
-              ('S', 'vn'): -10.70306467671192,
-              ('S', 'x'): -9.09362676427782,
-              ('S', 'y'): -5.634160474491688},
- ('E', 'ud'): {},
- ('E', 'ug'): {},
- ('E', 'uj'): {},
- ('E', 'ul'): {},
- ('E', 'uv'): {},
- ('E', 'uz'): {},
- ('E', 'v'): {('B', 'a'): -3.8989602169930455,
-              ('B', 'ad'): -5.664196681536004,
-              ('B', 'an'): -7.241241872313853,
-              ('B', 'b'): -4.983028657736162,
-              ('B', 'c'): -4.3380116903822,
-              ('B', 'd'): -3.8745522679749045,
-              ('B', 'df'): -10.032168700504307,
-              ('B', 'e'): -11.316993601459338,
-              ('B', 'f'): -4.943164989794456,
-              ('B', 'h'): -12.415605890127447,
-              ('B', 'i'): -5.688363278650623,
-              ('B', 'in'): -14.261432580625778,
-              ('B', 'j'): -5.3950859946696585,
-              ('B', 'l'): -5.490165807931589,
-              ('B', 'ln'): -12.962149596495518,
-              ('B', 'm'): -3.5306822505857616,
-              ('B', 'mq'): -7.025093237871435,
-              ('B', 'n'): -1.6039998551365695,
-              ('B', 'nr'): -4.019082792649434,
-              ('B', 'nrfg'): -7.4248153294769805,
-              ('B', 'nrt'): -6.382393461475447,
-              ('B', 'ns'): -3.744887778540468,
-              ('B', 'nt'): -6.079525662696459,
-              ('B', 'nz'): -5.510169086206409,
-              ('B', 'o'): -9.353691709692155,
-              ('B', 'p'): -5.648989817302444,
-              ('B', 'q'): -7.203534643213922,
-              ('B', 'qe'): -15.360044869293889,
-              ('B', 'r'): -3.5669605605219843,
-              ('B', 'rr'): -11.696483223164241,
-              ('B', 'rz'): -8.953164883224574,
-              ('B', 's'): -5.184318885799832,
-              ('B', 't'): -4.342268548704642,
-              ('B', 'u'): -7.170522758545795,
-              ('B', 'v'): -2.0813343688678403,
-              ('B', 'vd'): -8.046158037660426,
-              ('B', 'vi'): -13.057459776299842,
-              ('B', 'vn'): -3.7598963830655916,
-              ('B', 'vq'): -11.083378750277832,
-              ('B', 'y'): -8.855756695757242,
-              ('B', 'z'): -6.985798687197583,
-              ('S', 'a'): -4.397101743290844,
-              ('S', 'ad'): -11.249171005120576,
-              ('S', 'ag'): -7.838726889094648,
-              ('S', 'an'): -11.958847487631733,
-              ('S', 'b'): -6.800942274800441,
-              ('S', 'bg'): -14.666897688733943,
-              ('S', 'c'): -3.8437550700482332,
-              ('S', 'd'): -3.43503624391392,
-              ('S', 'dg'): -8.829167241568003,
-              ('S', 'e'): -9.24194767125254,
-              ('S', 'f'): -4.217342859093619,
-              ('S', 'g'): -7.3231480966088185,
-              ('S', 'h'): -8.639824714158593,
-              ('S', 'j'): -5.620724662971672,
-              ('S', 'k'): -6.62403748472467,
-              ('S', 'm'): -4.031138400953819,
-              ('S', 'mg'): -11.671165415179951,
-              ('S', 'n'): -3.930272778440694,
-              ('S', 'ng'): -4.673089656997769,
-              ('S', 'nr'): -5.7769692138324595,
-              ('S', 'nt'): -12.962149596495518,
-              ('S', 'o'): -9.626703592396142,
-              ('S', 'p'): -3.045831077644524,
-              ('S', 'q'): -4.80202103532547,
-              ('S', 'r'): -3.3708541699088914,
-              ('S', 'rg'): -12.315522431570464,
-              ('S', 't'): -13.568285400065832,
-              ('S', 'tg'): -7.429479015059923,
-              ('S', 'u'): -5.276488295017099,
-              ('S', 'ud'): -6.6060419357996265,
-              ('S', 'ug'): -6.0622432215477104,
-              ('S', 'uj'): -2.7223489109035683,
-              ('S', 'ul'): -3.0502430380012373,
-              ('S', 'uv'): -6.114916671832042,
-              ('S', 'uz'): -5.113712570631263,
-              ('S', 'v'): -2.68146236274217,
-              ('S', 'vg'): -6.1368869936070904,
-              ('S', 'vn'): -10.39720023903398,
-              ('S', 'x'): -9.163600741499367,
-              ('S', 'y'): -5.864375190449522},
- ('E', 'vd'): {('B', 'a'): -3.306416029258377,
-               ('B', 'ad'): -6.725402952484031,
-               ('B', 'an'): -6.9877672169515215,
-               ('B', 'b'): -6.032255771924086,
-               ('B', 'c'): -5.358526677221241,
-               ('B', 'd'): -3.6273918298096217,
-               ('B', 'df'): -9.290352309945568,
-               ('B', 'f'): -6.6512949803303085,
-               ('B', 'i'): -7.344442160890254,
-               ('B', 'j'): -6.517763587705786,
-               ('B', 'l'): -6.6512949803303085,
-               ('B', 'm'): -3.421055396811793,
-               ('B', 'n'): -2.4017798503802044,
-               ('B', 'nr'): -6.8054456601575675,
-               ('B', 'nrt'): -8.597205129385623,
-               ('B', 'ns'): -6.6512949803303085,
-               ('B', 'nt'): -8.597205129385623,
-               ('B', 'nz'): -8.597205129385623,
-               ('B', 'p'): -7.344442160890254,
-               ('B', 'q'): -9.290352309945568,
-               ('B', 'r'): -4.7470575276755635,
-               ('B', 's'): -7.093127732609348,
-               ('B', 't'): -6.199309856587251,
-               ('B', 'u'): -9.290352309945568,
-               ('B', 'v'): -0.7653893812649694,
-               ('B', 'vd'): -8.191740021277457,
-               ('B', 'vn'): -2.348195604246098,
-               ('B', 'y'): -9.290352309945568,
-               ('B', 'z'): -7.344442160890254,
-               ('S', 'a'): -4.3345252523443065,
-               ('S', 'c'): -4.400003181723814,
-               ('S', 'd'): -3.8831805384854485,
-               ('S', 'f'): -6.294620036391576,
-               ('S', 'g'): -9.290352309945568,
-               ('S', 'j'): -9.290352309945568,
-               ('S', 'k'): -9.290352309945568,
-               ('S', 'm'): -4.279717015849312,
-               ('S', 'n'): -5.679434397301343,
-               ('S', 'ng'): -6.9877672169515215,
-               ('S', 'nr'): -7.680914397511467,
-               ('S', 'p'): -4.131297010731038,
-               ('S', 'q'): -5.358526677221241,
-               ('S', 'r'): -6.154858094016418,
-               ('S', 'u'): -6.582302108843358,
-               ('S', 'ud'): -7.498592840717513,
-               ('S', 'ug'): -7.680914397511467,
-               ('S', 'uj'): -2.9273242064051024,
-               ('S', 'ul'): -4.160453595022494,
-               ('S', 'uv'): -5.378329304517421,
-               ('S', 'uz'): -7.344442160890254,
-               ('S', 'v'): -2.8967615559949356,
-               ('S', 'vg'): -7.344442160890254,
-               ('S', 'y'): -8.597205129385623},
- ('E', 'vg'): {},
- ('E', 'vi'): {('B', 'a'): -2.2512917986064953,
-               ('B', 'b'): -2.9444389791664407,
-               ('B', 'd'): -3.1675825304806504,
-               ('B', 'i'): -3.8607297110405954,
-               ('B', 'm'): -2.474435349920705,
-               ('B', 'n'): -1.0881409888008142,
-               ('B', 'ns'): -4.553876891600541,
-               ('B', 'r'): -2.762117422372486,
-               ('B', 's'): -4.553876891600541,
-               ('B', 't'): -3.8607297110405954,
-               ('B', 'v'): -3.8607297110405954,
-               ('B', 'vn'): -3.455264602932431,
-               ('S', 'a'): -3.8607297110405954,
-               ('S', 'd'): -4.553876891600541,
-               ('S', 'f'): -4.553876891600541,
-               ('S', 'j'): -3.455264602932431,
-               ('S', 'n'): -3.455264602932431,
-               ('S', 'p'): -3.1675825304806504,
-               ('S', 'q'): -3.8607297110405954,
-               ('S', 'r'): -4.553876891600541,
-               ('S', 'v'): -3.8607297110405954},
- ('E', 'vn'): {('B', 'a'): -4.235664336765162,
-               ('B', 'ad'): -5.524392453954045,
-               ('B', 'an'): -7.4911762261521115,
-               ('B', 'b'): -5.168876240552239,
-               ('B', 'c'): -4.043072489013538,
-               ('B', 'd'): -3.7895152698882213,
-               ('B', 'df'): -10.64929584159924,
-               ('B', 'e'): -13.59373482076568,
-               ('B', 'f'): -5.059881188456336,
-               ('B', 'h'): -13.59373482076568,
-               ('B', 'i'): -6.636237449888729,
-               ('B', 'j'): -5.6113184739379465,
-               ('B', 'jn'): -13.59373482076568,
-               ('B', 'l'): -5.682044300057342,
-               ('B', 'm'): -4.591895723366838,
-               ('B', 'mq'): -8.064305733254256,
-               ('B', 'n'): -1.0298723530045988,
-               ('B', 'nr'): -4.8745808573031395,
-               ('B', 'nrfg'): -8.280528841723893,
-               ('B', 'nrt'): -7.004808343232161,
-               ('B', 'ns'): -4.762022902944103,
-               ('B', 'nt'): -6.746791681180301,
-               ('B', 'nz'): -6.083304264387674,
-               ('B', 'o'): -11.028785463304143,
-               ('B', 'p'): -5.7475360052682545,
-               ('B', 'q'): -8.12567467963055,
-               ('B', 'r'): -4.438907158719756,
-               ('B', 'rr'): -13.59373482076568,
-               ('B', 'rz'): -10.01021588230957,
-               ('B', 's'): -6.084399554749089,
-               ('B', 't'): -4.911705386896508,
-               ('B', 'u'): -6.933159670925995,
-               ('B', 'v'): -2.225881371689506,
-               ('B', 'vd'): -8.100673377425132,
-               ('B', 'vn'): -3.0687035065292996,
-               ('B', 'vq'): -12.900587640205735,
-               ('B', 'y'): -9.27624670722937,
-               ('B', 'z'): -8.275614826921464,
-               ('S', 'a'): -4.913402891972262,
-               ('S', 'ad'): -11.801975351537624,
-               ('S', 'ag'): -8.96876200748141,
-               ('S', 'b'): -7.022851858426096,
-               ('S', 'c'): -3.1133530444938566,
-               ('S', 'd'): -3.3569944942353125,
-               ('S', 'dg'): -8.603302233986945,
-               ('S', 'e'): -10.549212383042258,
-               ('S', 'f'): -3.6644333333365724,
-               ('S', 'g'): -8.280528841723893,
-               ('S', 'h'): -9.51619737685996,
-               ('S', 'j'): -6.083304264387674,
-               ('S', 'k'): -6.652544765697305,
-               ('S', 'm'): -4.49869307315296,
-               ('S', 'mg'): -12.20744045964579,
-               ('S', 'n'): -4.1613715251439904,
-               ('S', 'ng'): -5.009069914234431,
-               ('S', 'nr'): -6.993864321552843,
-               ('S', 'o'): -11.98429690833158,
-               ('S', 'p'): -3.3008776672862745,
-               ('S', 'q'): -5.208474300610268,
-               ('S', 'r'): -4.350249850197195,
-               ('S', 'rg'): -12.20744045964579,
-               ('S', 't'): -12.900587640205735,
-               ('S', 'tg'): -8.164389191811239,
-               ('S', 'u'): -4.5877162458631195,
-               ('S', 'ud'): -7.332243136444638,
-               ('S', 'ug'): -6.922968499919806,
-               ('S', 'uj'): -2.521658147877695,
-               ('S', 'ul'): -4.946917861555937,
-               ('S', 'uv'): -7.536950807537056,
-               ('S', 'uz'): -6.591578866362059,
-               ('S', 'v'): -3.2021274819991996,
-               ('S', 'vg'): -7.046949410005157,
-               ('S', 'vn'): -11.19583954796731,
-               ('S', 'x'): -9.787072330995361,
-               ('S', 'y'): -6.886872484162933},
- ('E', 'vq'): {('B', 'a'): -4.941642422609305,
-               ('B', 'ad'): -6.327936783729195,
-               ('B', 'an'): -6.327936783729195,
-               ('B', 'b'): -5.634789603169249,
-               ('B', 'c'): -4.248495242049359,
-               ('B', 'd'): -4.718498871295094,
-               ('B', 'f'): -4.53617731450114,
-               ('B', 'i'): -5.2293244950610855,
-               ('B', 'l'): -6.327936783729195,
-               ('B', 'm'): -2.0938302791319354,
-               ('B', 'n'): -2.2503993398234754,
-               ('B', 'nr'): -3.032099917724866,
-               ('B', 'nrfg'): -6.327936783729195,
-               ('B', 'ns'): -2.0374773425808037,
-               ('B', 'nt'): -6.327936783729195,
-               ('B', 'nz'): -6.327936783729195,
-               ('B', 'q'): -6.327936783729195,
-               ('B', 'r'): -2.4777891820191362,
-               ('B', 's'): -6.327936783729195,
-               ('B', 't'): -4.718498871295094,
-               ('B', 'v'): -3.8430301339411947,
-               ('B', 'vn'): -6.327936783729195,
-               ('B', 'y'): -6.327936783729195,
-               ('S', 'a'): -3.1924425678000454,
-               ('S', 'c'): -5.634789603169249,
-               ('S', 'd'): -3.5553480614894135,
-               ('S', 'f'): -5.2293244950610855,
-               ('S', 'j'): -5.634789603169249,
-               ('S', 'm'): -4.02535169073515,
-               ('S', 'n'): -2.744417845273085,
-               ('S', 'ng'): -5.634789603169249,
-               ('S', 'nr'): -4.718498871295094,
-               ('S', 'p'): -4.941642422609305,
-               ('S', 'q'): -4.382026634673881,
-               ('S', 'r'): -2.744417845273085,
-               ('S', 'tg'): -5.2293244950610855,
-               ('S', 'ug'): -6.327936783729195,
-               ('S', 'uj'): -2.772588722239781,
-               ('S', 'ul'): -3.3834978045627544,
-               ('S', 'v'): -3.332204510175204,
-               ('S', 'y'): -4.53617731450114},
- ('E', 'w'): {},
- ('E', 'x'): {},
- ('E', 'y'): {('B', 'a'): -4.603957329562882,
-              ('B', 'ad'): -6.714170529909472,
-              ('B', 'an'): -8.100464891029363,
-              ('B', 'b'): -6.714170529909472,
-              ('B', 'c'): -2.6755148735479595,
-              ('B', 'd'): -2.7581306390645515,
-              ('B', 'f'): -5.797879798035317,
-              ('B', 'i'): -4.804628025025033,
-              ('B', 'j'): -7.4073177104694174,
-              ('B', 'l'): -4.436903244899716,
-              ('B', 'm'): -4.075113200294213,
-              ('B', 'mq'): -6.491026978595262,
-              ('B', 'n'): -2.4067327522266626,
-              ('B', 'nr'): -2.924315158455533,
-              ('B', 'nrfg'): -8.100464891029363,
-              ('B', 'nrt'): -6.714170529909472,
-              ('B', 'ns'): -4.768260380854159,
-              ('B', 'nt'): -8.100464891029363,
-              ('B', 'nz'): -6.714170529909472,
-              ('B', 'o'): -8.100464891029363,
-              ('B', 'p'): -4.699267509367207,
-              ('B', 'q'): -8.100464891029363,
-              ('B', 'r'): -2.8481914629827325,
-              ('B', 'rz'): -8.100464891029363,
-              ('B', 's'): -5.903240313693143,
-              ('B', 't'): -3.5571701087593586,
-              ('B', 'u'): -8.100464891029363,
-              ('B', 'v'): -2.6032966657361607,
-              ('B', 'vn'): -5.156025911862922,
-              ('B', 'y'): -4.603957329562882,
-              ('B', 'z'): -7.4073177104694174,
-              ('S', 'a'): -4.057413623194813,
-              ('S', 'ag'): -5.903240313693143,
-              ('S', 'b'): -5.903240313693143,
-              ('S', 'c'): -3.381966019734268,
-              ('S', 'd'): -2.33214389523559,
-              ('S', 'dg'): -8.100464891029363,
-              ('S', 'e'): -6.491026978595262,
-              ('S', 'f'): -5.797879798035317,
-              ('S', 'g'): -7.4073177104694174,
-              ('S', 'j'): -5.535515533567826,
-              ('S', 'm'): -5.156025911862922,
-              ('S', 'n'): -4.0061203288072615,
-              ('S', 'ng'): -5.615558241241362,
-              ('S', 'nr'): -4.666477686544217,
-              ('S', 'p'): -3.2721511537270613,
-              ('S', 'q'): -5.615558241241362,
-              ('S', 'r'): -2.1241139817314285,
-              ('S', 'tg'): -6.021023349349527,
-              ('S', 'u'): -5.535515533567826,
-              ('S', 'ud'): -6.154554741974049,
-              ('S', 'ug'): -7.4073177104694174,
-              ('S', 'uj'): -6.3087054218013074,
-              ('S', 'ul'): -7.4073177104694174,
-              ('S', 'uv'): -7.4073177104694174,
-              ('S', 'uz'): -7.4073177104694174,
-              ('S', 'v'): -2.524515787883046,
-              ('S', 'vg'): -5.797879798035317,
-              ('S', 'x'): -7.001852602361253,
-              ('S', 'y'): -4.666477686544217},
- ('E', 'yg'): {},
- ('E', 'z'): {('B', 'a'): -3.784718459481977,
-              ('B', 'ad'): -6.98058652610505,
-              ('B', 'an'): -7.062264557119317,
-              ('B', 'b'): -6.108391114096119,
-              ('B', 'c'): -5.107277189912887,
-              ('B', 'd'): -4.358478754803564,
-              ('B', 'e'): -10.912412158829376,
-              ('B', 'f'): -5.868987041910129,
-              ('B', 'i'): -4.969612783702675,
-              ('B', 'j'): -7.062264557119317,
-              ('B', 'l'): -5.770748602326716,
-              ('B', 'm'): -3.663908086458765,
-              ('B', 'mq'): -8.60982706583533,
-              ('B', 'n'): -1.9243407207567418,
-              ('B', 'nr'): -4.774685104743141,
-              ('B', 'nrfg'): -9.302974246395275,
-              ('B', 'nrt'): -7.105749669059056,
-              ('B', 'ns'): -5.584535990039795,
-              ('B', 'nt'): -9.12065268960132,
-              ('B', 'nz'): -6.923428112265102,
-              ('B', 'o'): -8.427505509041376,
-              ('B', 'p'): -6.663916916780017,
-              ('B', 'q'): -8.273354829214117,
-              ('B', 'r'): -4.974875953746949,
-              ('B', 'rz'): -9.813799870161265,
-              ('B', 's'): -5.71391512756355,
-              ('B', 't'): -5.487462141347973,
-              ('B', 'u'): -8.139823436589595,
-              ('B', 'v'): -2.0855308146987426,
-              ('B', 'vd'): -8.715187581493156,
-              ('B', 'vn'): -5.104269668848931,
-              ('B', 'y'): -9.813799870161265,
-              ('B', 'z'): -4.502237276863209,
-              ('S', 'a'): -4.400666829184647,
-              ('S', 'ag'): -7.223532704715439,
-              ('S', 'an'): -10.912412158829376,
-              ('S', 'b'): -5.551119993119951,
-              ('S', 'c'): -4.220328416322747,
-              ('S', 'd'): -3.6832982810360737,
-              ('S', 'dg'): -8.715187581493156,
-              ('S', 'e'): -7.867889721105953,
-              ('S', 'f'): -5.487462141347973,
-              ('S', 'g'): -7.446676256029649,
-              ('S', 'h'): -10.912412158829376,
-              ('S', 'j'): -6.530385524155494,
-              ('S', 'k'): -7.151212043135813,
-              ('S', 'm'): -4.476261790459948,
-              ('S', 'n'): -3.993716939808904,
-              ('S', 'ng'): -4.792114739878425,
-              ('S', 'nr'): -6.15023822403162,
-              ('S', 'nt'): -10.912412158829376,
-              ('S', 'o'): -9.302974246395275,
-              ('S', 'p'): -3.6681846432260254,
-              ('S', 'q'): -5.018009324564525,
-              ('S', 'r'): -4.241645837983501,
-              ('S', 'tg'): -7.446676256029649,
-              ('S', 'u'): -5.104269668848931,
-              ('S', 'ud'): -7.580207648654172,
-              ('S', 'ug'): -7.867889721105953,
-              ('S', 'uj'): -1.5104601831521456,
-              ('S', 'ul'): -5.403023822201399,
-              ('S', 'uv'): -2.414401786829912,
-              ('S', 'uz'): -6.818067596607275,
-              ('S', 'v'): -2.147265737190354,
-              ('S', 'vg'): -5.527917096040286,
-              ('S', 'vn'): -9.526117797709485,
-              ('S', 'x'): -8.60982706583533,
-              ('S', 'y'): -6.834874714923656},
- ('E', 'zg'): {},
- ('M', 'a'): {('E', 'a'): -0.15225895278450224,
-              ('M', 'a'): -1.9573362843447062},
- ('M', 'ad'): {('E', 'ad'): -0.640037355245997,
-               ('M', 'ad'): -0.7492366472109889},
- ('M', 'ag'): {},
- ('M', 'an'): {},
- ('M', 'b'): {('E', 'b'): -0.03697100476728258,
-              ('M', 'b'): -3.3160498792268744},
- ('M', 'bg'): {},
- ('M', 'c'): {('E', 'c'): -0.3618898524754362,
-              ('M', 'c'): -1.1919094133166193},
- ('M', 'd'): {('E', 'd'): -0.014864590735645855,
-              ('M', 'd'): -4.216196443872451},
- ('M', 'df'): {},
- ('M', 'dg'): {},
- ('M', 'e'): {('E', 'e'): 0.0},
- ('M', 'en'): {},
- ('M', 'f'): {('E', 'f'): 0.0},
- ('M', 'g'): {},
- ('M', 'h'): {},
- ('M', 'i'): {('E', 'i'): -0.7026619410944851,
-              ('M', 'i'): -0.6837220980982187},
- ('M', 'in'): {('E', 'in'): -0.6931471805599453,
-               ('M', 'in'): -0.6931471805599453},
- ('M', 'j'): {('E', 'j'): -0.14026125751410626,
-              ('M', 'j'): -2.0335595159078217},
- ('M', 'jn'): {('E', 'jn'): 0.0},
- ('M', 'k'): {},
- ('M', 'l'): {('E', 'l'): -0.6103493408406276,
-              ('M', 'l'): -0.7834244394528702},
- ('M', 'ln'): {('E', 'ln'): -0.6931471805599453,
-               ('M', 'ln'): -0.6931471805599453},
- ('M', 'm'): {('E', 'm'): -0.24867623061733957,
-              ('M', 'm'): -1.513366287948698},
- ('M', 'mg'): {},
- ('M', 'mq'): {('E', 'mq'): -0.020181594737323828,
-               ('M', 'mq'): -3.9130580682712353},
- ('M', 'n'): {('E', 'n'): -0.14378203809805257,
-              ('M', 'n'): -2.0104865313727696},
- ('M', 'ng'): {},
- ('M', 'nr'): {('E', 'nr'): -0.033952407837838455,
-               ('M', 'nr'): -3.399723676897525},
- ('M', 'nrfg'): {('E', 'nrfg'): -0.024812491911998164,
-                 ('M', 'nrfg'): -3.708788640097414},
- ('M', 'nrt'): {('E', 'nrt'): -0.43009105470816617,
-                ('M', 'nrt'): -1.0511082812555934},
- ('M', 'ns'): {('E', 'ns'): -0.41538716750484356,
-               ('M', 'ns'): -1.079058715594638},
- ('M', 'nt'): {('E', 'nt'): -1.0619399219246302,
-               ('M', 'nt'): -0.42431826412433127},
- ('M', 'nz'): {('E', 'nz'): -0.6129122790767475,
-               ('M', 'nz'): -0.7803857433216695},
- ('M', 'o'): {('E', 'o'): -0.43913545259227216,
-              ('M', 'o'): -1.0344929668659584},
- ('M', 'p'): {('E', 'p'): 0.0},
- ('M', 'q'): {('E', 'q'): -0.5887911556507256,
-              ('M', 'q'): -0.8096760200284628},
- ('M', 'qe'): {},
- ('M', 'qg'): {},
- ('M', 'r'): {('E', 'r'): -0.001225584220815199,
-              ('M', 'r'): -6.704950363246782},
- ('M', 'rg'): {},
- ('M', 'rr'): {('E', 'rr'): 0.0},
- ('M', 'rz'): {},
- ('M', 's'): {('E', 's'): -0.038706454714843914,
-              ('M', 's'): -3.2710397079253735},
- ('M', 't'): {('E', 't'): -0.0390980816630263, ('M', 't'): -3.261167222997749},
- ('M', 'tg'): {},
- ('M', 'u'): {('E', 'u'): 0.0},
- ('M', 'ud'): {},
- ('M', 'ug'): {},
- ('M', 'uj'): {},
- ('M', 'ul'): {},
- ('M', 'uv'): {},
- ('M', 'uz'): {},
- ('M', 'v'): {('E', 'v'): -0.02741220765591975,
-              ('M', 'v'): -3.6104416243987187},
- ('M', 'vd'): {},
- ('M', 'vg'): {},
- ('M', 'vi'): {('E', 'vi'): 0.0},
- ('M', 'vn'): {('E', 'vn'): -0.005719329272592161,
-               ('M', 'vn'): -5.16676204219196},
- ('M', 'vq'): {},
- ('M', 'w'): {},
- ('M', 'x'): {},
- ('M', 'y'): {('E', 'y'): 0.0},
- ('M', 'yg'): {},
- ('M', 'z'): {('E', 'z'): -0.2694884162268495,
-              ('M', 'z'): -1.4429499090882365},
- ('M', 'zg'): {},
- ('S', 'a'): {('B', 'a'): -4.882268156170318,
-              ('B', 'ad'): -7.26639576964248,
-              ('B', 'an'): -8.094236458007124,
-              ('B', 'b'): -5.938156924782082,
-              ('B', 'c'): -4.575014898361772,
-              ('B', 'd'): -4.518890361306889,
-              ('B', 'df'): -10.030887281649642,
-              ('B', 'e'): -12.078580125014897,
-              ('B', 'f'): -5.706968277783041,
-              ('B', 'i'): -6.6042108146865015,
-              ('B', 'in'): -13.464874486134788,
-              ('B', 'j'): -5.855507948180576,
-              ('B', 'l'): -6.165077119376627,
-              ('B', 'm'): -3.640321921686802,
-              ('B', 'mq'): -8.395970283914556,
-              ('B', 'n'): -1.5213751269156488,
-              ('B', 'nr'): -4.008377408535394,
-              ('B', 'nrfg'): -8.31158289163701,
-              ('B', 'nrt'): -6.749491099800107,
-              ('B', 'ns'): -4.607643991932841,
-              ('B', 'nt'): -8.217850413974302,
-              ('B', 'nz'): -5.942474254747663,
-              ('B', 'o'): -9.337740101089697,
-              ('B', 'p'): -6.78905126449994,
-              ('B', 'q'): -6.283282541522923,
-              ('B', 'r'): -4.909037671126346,
-              ('B', 'rz'): -10.899925128673251,
-              ('B', 's'): -5.736018662282245,
-              ('B', 't'): -5.077106842159008,
-              ('B', 'u'): -7.540618688720256,
-              ('B', 'v'): -2.858363682368508,
-              ('B', 'vd'): -9.04603387833819,
-              ('B', 'vn'): -4.333902049542178,
-              ('B', 'y'): -9.108165659445197,
-              ('B', 'z'): -6.90101895960266,
-              ('S', 'a'): -3.4485941061235375,
-              ('S', 'ad'): -10.979967836346788,
-              ('S', 'ag'): -6.040112724311578,
-              ('S', 'an'): -9.095426633667767,
-              ('S', 'b'): -6.462718531731166,
-              ('S', 'c'): -4.129223923193158,
-              ('S', 'd'): -3.3661902843354006,
-              ('S', 'dg'): -8.636560748832487,
-              ('S', 'e'): -9.02222322964447,
-              ('S', 'f'): -4.871831982435112,
-              ('S', 'g'): -5.620241841670107,
-              ('S', 'h'): -8.132155692869418,
-              ('S', 'j'): -4.824932829459497,
-              ('S', 'k'): -6.466364843884187,
-              ('S', 'm'): -4.0801607272138245,
-              ('S', 'mg'): -9.636233089645692,
-              ('S', 'n'): -2.5035098376626337,
-              ('S', 'ng'): -3.385544655402463,
-              ('S', 'nr'): -4.72198101462265,
-              ('S', 'nt'): -12.771727305574842,
-              ('S', 'o'): -9.02222322964447,
-              ('S', 'p'): -3.5267922888341605,
-              ('S', 'q'): -3.5263094069859635,
-              ('S', 'r'): -4.241617888892058,
-              ('S', 'rg'): -11.267649908798568,
-              ('S', 't'): -12.366262197466678,
-              ('S', 'tg'): -6.808147961956396,
-              ('S', 'u'): -5.47599223282556,
-              ('S', 'ud'): -5.130402931533845,
-              ('S', 'ug'): -6.744654330999492,
-              ('S', 'uj'): -2.5906269560137267,
-              ('S', 'ul'): -3.7186257100251514,
-              ('S', 'uv'): -5.67417845496005,
-              ('S', 'uz'): -5.990102303736918,
-              ('S', 'v'): -2.018836966706191,
-              ('S', 'vg'): -4.905388382528299,
-              ('S', 'vn'): -8.352886697778244,
-              ('S', 'x'): -6.413885039066743,
-              ('S', 'y'): -5.131363777151846,
-              ('S', 'zg'): -13.464874486134788},
- ('S', 'ad'): {('B', 'a'): -5.972111818592167,
-               ('B', 'ad'): -6.377576926700331,
-               ('B', 'b'): -7.0707241072602764,
-               ('B', 'c'): -6.377576926700331,
-               ('B', 'd'): -4.50577474979874,
-               ('B', 'f'): -6.377576926700331,
-               ('B', 'i'): -5.972111818592167,
-               ('B', 'j'): -6.377576926700331,
-               ('B', 'l'): -7.0707241072602764,
-               ('B', 'm'): -4.298135385020496,
-               ('B', 'mq'): -7.0707241072602764,
-               ('B', 'n'): -4.180352349364112,
-               ('B', 'nr'): -4.5858174574722765,
-               ('B', 'nrt'): -4.23751076320406,
-               ('B', 'ns'): -5.124813958204963,
-               ('B', 'nz'): -5.972111818592167,
-               ('B', 'p'): -7.0707241072602764,
-               ('B', 'r'): -3.8126275692387948,
-               ('B', 's'): -5.124813958204963,
-               ('B', 't'): -5.684429746140386,
-               ('B', 'u'): -6.377576926700331,
-               ('B', 'v'): -2.6640048599960235,
-               ('B', 'vn'): -7.0707241072602764,
-               ('B', 'z'): -7.0707241072602764,
-               ('S', 'a'): -3.7748872412559478,
-               ('S', 'ad'): -5.124813958204963,
-               ('S', 'ag'): -5.461286194826176,
-               ('S', 'c'): -4.5858174574722765,
-               ('S', 'd'): -3.2865344733420154,
-               ('S', 'dg'): -7.0707241072602764,
-               ('S', 'f'): -5.684429746140386,
-               ('S', 'g'): -3.264061617489957,
-               ('S', 'h'): -5.972111818592167,
-               ('S', 'j'): -5.684429746140386,
-               ('S', 'k'): -6.377576926700331,
-               ('S', 'm'): -4.126285128093836,
-               ('S', 'n'): -3.8126275692387948,
-               ('S', 'ng'): -3.851848282392076,
-               ('S', 'nr'): -4.672828834461907,
-               ('S', 'p'): -2.616376811006769,
-               ('S', 'q'): -3.0633909220278057,
-               ('S', 'r'): -4.298135385020496,
-               ('S', 'tg'): -5.684429746140386,
-               ('S', 'u'): -4.873499529924057,
-               ('S', 'ud'): -7.0707241072602764,
-               ('S', 'uj'): -4.180352349364112,
-               ('S', 'ul'): -5.972111818592167,
-               ('S', 'uv'): -6.377576926700331,
-               ('S', 'v'): -0.9704051552402126,
-               ('S', 'vg'): -2.9435897222151852,
-               ('S', 'x'): -4.5858174574722765,
-               ('S', 'y'): -7.0707241072602764},
- ('S', 'ag'): {('B', 'a'): -4.577175405927603,
-               ('B', 'ad'): -6.896289800872859,
-               ('B', 'an'): -9.60434000197507,
-               ('B', 'b'): -6.063380677937755,
-               ('B', 'c'): -5.2285829803147825,
-               ('B', 'd'): -4.846448728969314,
-               ('B', 'df'): -10.297487182535015,
-               ('B', 'f'): -6.007027741386623,
-               ('B', 'i'): -6.219949738629295,
-               ('B', 'j'): -6.831751279735288,
-               ('B', 'l'): -6.713968244078904,
-               ('B', 'm'): -4.881386780330594,
-               ('B', 'mq'): -8.911192821415124,
-               ('B', 'n'): -2.3961098287423988,
-               ('B', 'nr'): -3.291698163281512,
-               ('B', 'nrfg'): -7.899591909736643,
-               ('B', 'nrt'): -4.56738739956144,
-               ('B', 'ns'): -4.890315411074895,
-               ('B', 'nz'): -5.903038027862576,
-               ('B', 'o'): -8.505727713306959,
-               ('B', 'p'): -7.161992966605864,
-               ('B', 'q'): -7.899591909736643,
-               ('B', 'r'): -5.2223133673011874,
-               ('B', 'rz'): -9.60434000197507,
-               ('B', 's'): -6.107832440508589,
-               ('B', 't'): -5.348727292156846,
-               ('B', 'u'): -7.658429852919756,
-               ('B', 'v'): -3.147570346402906,
-               ('B', 'vd'): -9.198874893866904,
-               ('B', 'vn'): -5.597006816742598,
-               ('B', 'y'): -7.899591909736643,
-               ('B', 'z'): -6.3854641771068685,
-               ('S', 'a'): -3.3640641568042993,
-               ('S', 'ad'): -9.60434000197507,
-               ('S', 'ag'): -3.475289791914524,
-               ('S', 'an'): -10.297487182535015,
-               ('S', 'b'): -5.775698605485974,
-               ('S', 'bg'): -9.60434000197507,
-               ('S', 'c'): -4.3160729712805335,
-               ('S', 'd'): -3.27819052881997,
-               ('S', 'dg'): -7.732537825073478,
-               ('S', 'e'): -7.899591909736643,
-               ('S', 'f'): -4.587060165160144,
-               ('S', 'g'): -3.477470817860884,
-               ('S', 'h'): -8.911192821415124,
-               ('S', 'j'): -4.157602630308759,
-               ('S', 'k'): -5.293540876589555,
-               ('S', 'm'): -4.717757356548792,
-               ('S', 'mg'): -7.658429852919756,
-               ('S', 'n'): -2.2300245155249567,
-               ('S', 'ng'): -2.319176212667293,
-               ('S', 'nr'): -3.8758649147284965,
-               ('S', 'o'): -6.405666884424388,
-               ('S', 'p'): -4.013353021464212,
-               ('S', 'q'): -3.4973171142328145,
-               ('S', 'r'): -4.092929419966324,
-               ('S', 'rg'): -8.351577033479701,
-               ('S', 'tg'): -4.587060165160144,
-               ('S', 'u'): -4.655580111596901,
-               ('S', 'ud'): -6.896289800872859,
-               ('S', 'ug'): -7.732537825073478,
-               ('S', 'uj'): -3.698978153920499,
-               ('S', 'ul'): -5.254062065615768,
-               ('S', 'uv'): -6.048991940485656,
-               ('S', 'uz'): -6.659901022808628,
-               ('S', 'v'): -1.8385588992507527,
-               ('S', 'vg'): -3.6141262367687395,
-               ('S', 'x'): -4.367898039145119,
-               ('S', 'y'): -4.931511167513163,
-               ('S', 'yg'): -9.60434000197507,
-               ('S', 'zg'): -10.297487182535015},
- ('S', 'an'): {('B', 'a'): -4.527980547296962,
-               ('B', 'an'): -6.473890696352274,
-               ('B', 'c'): -4.276666119016055,
-               ('B', 'd'): -3.908941338890738,
-               ('B', 'i'): -5.780743515792329,
-               ('B', 'l'): -5.780743515792329,
-               ('B', 'm'): -5.375278407684165,
-               ('B', 'n'): -2.623743094642216,
-               ('B', 'nr'): -4.276666119016055,
-               ('B', 'ns'): -6.473890696352274,
-               ('B', 'nz'): -6.473890696352274,
-               ('B', 'r'): -4.527980547296962,
-               ('B', 't'): -5.780743515792329,
-               ('B', 'v'): -2.4849066497880004,
-               ('B', 'vn'): -5.780743515792329,
-               ('B', 'y'): -6.473890696352274,
-               ('B', 'z'): -6.473890696352274,
-               ('S', 'a'): -3.58351893845611,
-               ('S', 'ag'): -5.780743515792329,
-               ('S', 'an'): -5.0875963352323845,
-               ('S', 'b'): -6.473890696352274,
-               ('S', 'c'): -3.58351893845611,
-               ('S', 'd'): -2.396353252446555,
-               ('S', 'f'): -3.765840495250065,
-               ('S', 'g'): -4.276666119016055,
-               ('S', 'j'): -5.375278407684165,
-               ('S', 'k'): -4.527980547296962,
-               ('S', 'm'): -5.375278407684165,
-               ('S', 'n'): -2.396353252446555,
-               ('S', 'ng'): -2.7850112422383386,
-               ('S', 'nr'): -4.276666119016055,
-               ('S', 'p'): -3.834833366737016,
-               ('S', 'q'): -3.58351893845611,
-               ('S', 'r'): -3.765840495250065,
-               ('S', 'tg'): -5.780743515792329,
-               ('S', 'u'): -3.908941338890738,
-               ('S', 'ug'): -6.473890696352274,
-               ('S', 'uj'): -2.890371757896165,
-               ('S', 'ul'): -5.375278407684165,
-               ('S', 'uv'): -6.473890696352274,
-               ('S', 'v'): -1.7203005052459102,
-               ('S', 'vg'): -3.908941338890738,
-               ('S', 'y'): -4.527980547296962},
- ('S', 'b'): {('B', 'a'): -5.5501579721628405,
-              ('B', 'ad'): -8.42560407984233,
-              ('B', 'an'): -9.054212739264702,
-              ('B', 'b'): -6.103216359552103,
-              ('B', 'c'): -6.2064005957873345,
-              ('B', 'd'): -5.491747210006426,
-              ('B', 'df'): -9.524216368510439,
-              ('B', 'e'): -11.133654280944539,
-              ('B', 'f'): -6.103216359552103,
-              ('B', 'i'): -6.726935033680286,
-              ('B', 'j'): -6.388722152581289,
-              ('B', 'l'): -6.199180347813847,
-              ('B', 'm'): -5.201409093496529,
-              ('B', 'mq'): -9.341894811716484,
-              ('B', 'n'): -0.8080411794071395,
-              ('B', 'nr'): -4.843938710035542,
-              ('B', 'nrfg'): -11.133654280944539,
-              ('B', 'nrt'): -7.039309718722438,
-              ('B', 'ns'): -5.03109568633097,
-              ('B', 'nt'): -6.856988161928484,
-              ('B', 'nz'): -6.406266462232199,
-              ('B', 'o'): -11.133654280944539,
-              ('B', 'p'): -8.137922007390548,
-              ('B', 'q'): -8.831069187950494,
-              ('B', 'r'): -5.27572112646108,
-              ('B', 'rz'): -11.133654280944539,
-              ('B', 's'): -6.590359498674536,
-              ('B', 't'): -6.569306089476703,
-              ('B', 'u'): -8.42560407984233,
-              ('B', 'v'): -2.9527733389481496,
-              ('B', 'vd'): -10.440507100384593,
-              ('B', 'vn'): -3.8922879976222213,
-              ('B', 'y'): -11.133654280944539,
-              ('B', 'z'): -7.914778456076339,
-              ('S', 'a'): -4.348066635936609,
-              ('S', 'ad'): -11.133654280944539,
-              ('S', 'ag'): -7.326991791174219,
-              ('S', 'b'): -3.777374404393791,
-              ('S', 'c'): -5.033335328924475,
-              ('S', 'd'): -3.9437321101987313,
-              ('S', 'dg'): -8.93642970360832,
-              ('S', 'e'): -11.133654280944539,
-              ('S', 'f'): -4.179015416063551,
-              ('S', 'g'): -5.5315354600648385,
-              ('S', 'h'): -7.667918378144813,
-              ('S', 'j'): -5.242010069118768,
-              ('S', 'k'): -6.8029209406582085,
-              ('S', 'm'): -4.703934802905402,
-              ('S', 'mg'): -9.341894811716484,
-              ('S', 'n'): -2.21206321738056,
-              ('S', 'ng'): -3.5845715701322534,
-              ('S', 'nr'): -5.52418248575958,
-              ('S', 'o'): -8.361065558704757,
-              ('S', 'p'): -3.5322519463608057,
-              ('S', 'q'): -4.266720996482658,
-              ('S', 'r'): -5.1623924411540765,
-              ('S', 'rg'): -11.133654280944539,
-              ('S', 'tg'): -6.764206428477518,
-              ('S', 'u'): -5.509636774757201,
-              ('S', 'ud'): -8.300440936888323,
-              ('S', 'ug'): -10.03504199227643,
-              ('S', 'uj'): -3.7324230165315244,
-              ('S', 'ul'): -7.99816006501539,
-              ('S', 'uv'): -8.137922007390548,
-              ('S', 'uz'): -8.42560407984233,
-              ('S', 'v'): -2.242417851428477,
-              ('S', 'vg'): -5.865796121881211,
-              ('S', 'vn'): -9.054212739264702,
-              ('S', 'x'): -6.829589187740369,
-              ('S', 'y'): -7.732456899282384,
-              ('S', 'zg'): -10.03504199227643},
- ('S', 'bg'): {('B', 'n'): -2.4159137783010487,
-               ('B', 'nr'): -4.02535169073515,
-               ('S', 'a'): -2.9267394020670396,
-               ('S', 'ag'): -2.639057329615259,
-               ('S', 'c'): -4.02535169073515,
-               ('S', 'dg'): -3.332204510175204,
-               ('S', 'f'): -4.02535169073515,
-               ('S', 'g'): -2.2335922215070942,
-               ('S', 'j'): -2.9267394020670396,
-               ('S', 'n'): -3.332204510175204,
-               ('S', 'ng'): -2.639057329615259,
-               ('S', 'nr'): -4.02535169073515,
-               ('S', 'q'): -3.332204510175204,
-               ('S', 'r'): -4.02535169073515,
-               ('S', 'v'): -1.3862943611198906,
-               ('S', 'vg'): -2.9267394020670396,
-               ('S', 'x'): -3.332204510175204,
-               ('S', 'y'): -4.02535169073515},
- ('S', 'c'): {('B', 'a'): -3.749888765843523,
-              ('B', 'ad'): -5.751212180108722,
-              ('B', 'an'): -6.839186070571776,
-              ('B', 'b'): -4.513975282142273,
-              ('B', 'c'): -4.925731962812107,
-              ('B', 'd'): -3.8634270737943943,
-              ('B', 'df'): -8.945438869702269,
-              ('B', 'f'): -4.951635536702046,
-              ('B', 'h'): -12.080933085631418,
-              ('B', 'i'): -5.971685502867053,
-              ('B', 'j'): -5.125578827850003,
-              ('B', 'l'): -4.973917195798404,
-              ('B', 'm'): -3.98754719657121,
-              ('B', 'mq'): -7.391881415662625,
-              ('B', 'n'): -1.3248137093316992,
-              ('B', 'nr'): -3.3451265889875033,
-              ('B', 'nrfg'): -8.220203374590824,
-              ('B', 'nrt'): -6.244661427929139,
-              ('B', 'ns'): -3.2528419087133984,
-              ('B', 'nt'): -5.618293720387238,
-              ('B', 'nz'): -5.084709158661673,
-              ('B', 'o'): -10.694638724511528,
-              ('B', 'p'): -5.304711196611131,
-              ('B', 'q'): -7.164608471006404,
-              ('B', 'r'): -3.721212753039745,
-              ('B', 'rr'): -10.98232079696331,
-              ('B', 'rz'): -9.308344363391637,
-              ('B', 's'): -5.163722647878527,
-              ('B', 't'): -4.300629997723045,
-              ('B', 'u'): -9.38969000284559,
-              ('B', 'v'): -1.8979878131047012,
-              ('B', 'vd'): -8.06005567529119,
-              ('B', 'vn'): -3.3817934077513097,
-              ('B', 'vq'): -12.774080266191364,
-              ('B', 'y'): -13.46722744675131,
-              ('B', 'z'): -7.100756999019872,
-              ('S', 'a'): -4.146240554688063,
-              ('S', 'ad'): -10.576855688855144,
-              ('S', 'ag'): -7.065310250024123,
-              ('S', 'an'): -10.066030065089153,
-              ('S', 'b'): -6.540650413528584,
-              ('S', 'bg'): -12.774080266191364,
-              ('S', 'c'): -5.9700202235479916,
-              ('S', 'd'): -2.981552207713544,
-              ('S', 'dg'): -9.66056495698099,
-              ('S', 'e'): -12.774080266191364,
-              ('S', 'f'): -5.020885996307023,
-              ('S', 'g'): -6.609713384205919,
-              ('S', 'h'): -6.678255703759139,
-              ('S', 'j'): -5.473269899177744,
-              ('S', 'k'): -7.289283332700709,
-              ('S', 'm'): -4.234147587805637,
-              ('S', 'mg'): -10.422705009027887,
-              ('S', 'n'): -3.771502343491089,
-              ('S', 'ng'): -5.150193970258906,
-              ('S', 'nr'): -5.5391818458765325,
-              ('S', 'nt'): -13.46722744675131,
-              ('S', 'o'): -10.471495173197319,
-              ('S', 'p'): -3.0984661834181555,
-              ('S', 'q'): -5.177687962127168,
-              ('S', 'r'): -3.44942954803777,
-              ('S', 'rg'): -11.069332173952938,
-              ('S', 't'): -13.46722744675131,
-              ('S', 'tg'): -7.451070287052956,
-              ('S', 'u'): -6.664832683426998,
-              ('S', 'ud'): -7.205735762430267,
-              ('S', 'ug'): -7.325190041163953,
-              ('S', 'uj'): -6.239564948022655,
-              ('S', 'ul'): -9.21873220470195,
-              ('S', 'uv'): -7.9065458157357815,
-              ('S', 'uz'): -8.483620825042973,
-              ('S', 'v'): -2.535299743524074,
-              ('S', 'vg'): -5.499254267088374,
-              ('S', 'vn'): -9.38969000284559,
-              ('S', 'x'): -8.592030123550158,
-              ('S', 'y'): -9.555204441323163},
- ('S', 'd'): {('B', 'a'): -3.247460873265525,
-              ('B', 'ad'): -5.180368772925723,
-              ('B', 'an'): -7.2331315265056615,
-              ('B', 'b'): -6.141564276760761,
-              ('B', 'c'): -5.854471537397445,
-              ('B', 'd'): -3.3844620971140142,
-              ('B', 'df'): -7.414829252961232,
-              ('B', 'e'): -11.750250834371018,
-              ('B', 'f'): -6.904939520700147,
-              ('B', 'h'): -14.389308163986277,
-              ('B', 'i'): -5.296963350247802,
-              ('B', 'j'): -7.628893472902849,
-              ('B', 'l'): -5.482779246391759,
-              ('B', 'm'): -4.4466960567661,
-              ('B', 'mq'): -8.908669240644286,
-              ('B', 'n'): -3.558332801482778,
-              ('B', 'nr'): -4.900200336947887,
-              ('B', 'nrfg'): -9.277320375629735,
-              ('B', 'nrt'): -7.263220890687153,
-              ('B', 'ns'): -6.287933492757696,
-              ('B', 'nt'): -9.301711828753893,
-              ('B', 'nz'): -7.56602204163059,
-              ('B', 'o'): -8.712554361717995,
-              ('B', 'p'): -6.003591335358426,
-              ('B', 'q'): -6.971727761571733,
-              ('B', 'r'): -4.805819285378473,
-              ('B', 'rz'): -11.556094819930061,
-              ('B', 's'): -6.960380969184005,
-              ('B', 't'): -5.802215845190373,
-              ('B', 'u'): -6.735338983507503,
-              ('B', 'v'): -1.552700715240268,
-              ('B', 'vd'): -7.78672027179694,
-              ('B', 'vi'): -11.253813948057127,
-              ('B', 'vn'): -5.258443993511891,
-              ('B', 'vq'): -9.372028327171353,
-              ('B', 'y'): -8.639915178078024,
-              ('B', 'z'): -6.510773967845916,
-              ('S', 'a'): -2.849594722259666,
-              ('S', 'ad'): -10.778390251342053,
-              ('S', 'ag'): -6.714226306269944,
-              ('S', 'b'): -7.68244582738353,
-              ('S', 'bg'): -14.389308163986277,
-              ('S', 'c'): -5.706770039983202,
-              ('S', 'd'): -2.671989848466785,
-              ('S', 'dg'): -7.655906272148918,
-              ('S', 'e'): -9.994859009313839,
-              ('S', 'f'): -5.232263089068319,
-              ('S', 'g'): -6.927667771777703,
-              ('S', 'h'): -8.58417319506979,
-              ('S', 'j'): -6.654749319631521,
-              ('S', 'k'): -8.433470794521446,
-              ('S', 'm'): -3.9899360515534585,
-              ('S', 'mg'): -12.443398014930963,
-              ('S', 'n'): -4.253320965211914,
-              ('S', 'ng'): -5.506083933707282,
-              ('S', 'nr'): -6.596546443169752,
-              ('S', 'o'): -9.207524613694192,
-              ('S', 'p'): -2.5374848351799977,
-              ('S', 'q'): -5.086479772574943,
-              ('S', 'r'): -4.810304990426035,
-              ('S', 'rg'): -12.086723070992232,
-              ('S', 't'): -11.344785726262854,
-              ('S', 'tg'): -6.879972897969686,
-              ('S', 'u'): -6.023635780211282,
-              ('S', 'ud'): -5.282441200486371,
-              ('S', 'ug'): -5.801097485334759,
-              ('S', 'uj'): -5.992250773810021,
-              ('S', 'ul'): -6.478717551729799,
-              ('S', 'uv'): -8.18273223726135,
-              ('S', 'uz'): -7.007183798248764,
-              ('S', 'v'): -1.1370329366057388,
-              ('S', 'vg'): -4.917450039578993,
-              ('S', 'vn'): -10.700428709872341,
-              ('S', 'x'): -8.311665920637243,
-              ('S', 'y'): -8.273416038503242,
-              ('S', 'yg'): -12.779870251552177},
- ('S', 'df'): {},
- ('S', 'dg'): {('B', 'a'): -3.0847761839373105,
-               ('B', 'ad'): -5.975147941833475,
-               ('B', 'an'): -6.973676771944603,
-               ('B', 'b'): -8.22643974043997,
-               ('B', 'c'): -6.280529591384657,
-               ('B', 'd'): -4.6569070439586,
-               ('B', 'f'): -7.127827451771861,
-               ('B', 'i'): -5.875064483276493,
-               ('B', 'j'): -7.533292559880025,
-               ('B', 'l'): -6.84014537932008,
-               ('B', 'm'): -6.1469981987601345,
-               ('B', 'n'): -2.987341733551905,
-               ('B', 'nr'): -4.1833884726054205,
-               ('B', 'nrt'): -5.74153309065197,
-               ('B', 'ns'): -6.1469981987601345,
-               ('B', 'nz'): -7.127827451771861,
-               ('B', 'o'): -8.919586920999915,
-               ('B', 'p'): -8.919586920999915,
-               ('B', 'r'): -5.587382410824712,
-               ('B', 's'): -7.533292559880025,
-               ('B', 't'): -5.923854647445925,
-               ('B', 'v'): -3.078945263626517,
-               ('B', 'vn'): -5.923854647445925,
-               ('B', 'z'): -6.5216916482015455,
-               ('S', 'a'): -1.6775045617429536,
-               ('S', 'ag'): -3.9023070841849914,
-               ('S', 'an'): -8.919586920999915,
-               ('S', 'b'): -7.820974632331806,
-               ('S', 'c'): -5.181917302716547,
-               ('S', 'd'): -3.2601047052402943,
-               ('S', 'dg'): -6.61700182800587,
-               ('S', 'e'): -8.919586920999915,
-               ('S', 'f'): -5.623750054995586,
-               ('S', 'g'): -4.700079215823809,
-               ('S', 'h'): -7.533292559880025,
-               ('S', 'j'): -4.237455693875696,
-               ('S', 'k'): -8.22643974043997,
-               ('S', 'm'): -2.8913084007692174,
-               ('S', 'n'): -3.3248755413980766,
-               ('S', 'ng'): -3.856991887972949,
-               ('S', 'nr'): -4.021747121049004,
-               ('S', 'o'): -8.919586920999915,
-               ('S', 'p'): -3.246263653828423,
-               ('S', 'q'): -3.942853178579341,
-               ('S', 'r'): -4.344875942496532,
-               ('S', 'tg'): -7.127827451771861,
-               ('S', 'u'): -3.011503982830985,
-               ('S', 'ud'): -5.181917302716547,
-               ('S', 'ug'): -8.22643974043997,
-               ('S', 'uj'): -4.760703837640244,
-               ('S', 'ul'): -5.875064483276493,
-               ('S', 'uv'): -5.700711096131715,
-               ('S', 'uz'): -7.310149008565815,
-               ('S', 'v'): -1.6117141402362094,
-               ('S', 'vg'): -3.819720493175717,
-               ('S', 'x'): -3.819720493175717,
-               ('S', 'y'): -5.336067982543805,
-               ('S', 'yg'): -8.919586920999915},
- ('S', 'e'): {('B', 'a'): -5.0759357200325885,
-              ('B', 'ad'): -7.180069874302796,
-              ('B', 'an'): -8.789507786736896,
-              ('B', 'b'): -6.997748317508842,
-              ('B', 'c'): -4.458774446450565,
-              ('B', 'd'): -3.19852080622604,
-              ('B', 'df'): -7.180069874302796,
-              ('B', 'e'): -6.843597637681583,
-              ('B', 'f'): -6.081457585634687,
-              ('B', 'i'): -5.422211956750423,
-              ('B', 'l'): -4.541012544687538,
-              ('B', 'm'): -4.370667178940299,
-              ('B', 'mq'): -7.403213425617006,
-              ('B', 'n'): -2.649623234510641,
-              ('B', 'nr'): -3.2326797250373587,
-              ('B', 'nrfg'): -6.71006624505706,
-              ('B', 'nrt'): -6.081457585634687,
-              ('B', 'ns'): -5.611453956388951,
-              ('B', 'nz'): -6.22455842927536,
-              ('B', 'o'): -6.592283209400677,
-              ('B', 'p'): -6.016919064497116,
-              ('B', 'r'): -2.8652519893223647,
-              ('B', 'rz'): -7.6908954980687865,
-              ('B', 's'): -6.22455842927536,
-              ('B', 't'): -4.135547436579373,
-              ('B', 'u'): -8.096360606176951,
-              ('B', 'v'): -2.889610433154405,
-              ('B', 'vn'): -6.150450457121638,
-              ('B', 'y'): -7.6908954980687865,
-              ('B', 'z'): -6.391612513938526,
-              ('S', 'a'): -3.6190237916987447,
-              ('S', 'ad'): -8.789507786736896,
-              ('S', 'ag'): -5.5706319618686955,
-              ('S', 'b'): -6.843597637681583,
-              ('S', 'c'): -5.95629444268068,
-              ('S', 'd'): -2.966461891253878,
-              ('S', 'e'): -2.770914572240662,
-              ('S', 'f'): -6.22455842927536,
-              ('S', 'g'): -4.02733385193914,
-              ('S', 'j'): -4.87748478130875,
-              ('S', 'k'): -8.096360606176951,
-              ('S', 'm'): -4.819215873184775,
-              ('S', 'n'): -4.035917595630532,
-              ('S', 'ng'): -4.31217097225869,
-              ('S', 'nr'): -4.02733385193914,
-              ('S', 'o'): -7.180069874302796,
-              ('S', 'p'): -4.300871417004757,
-              ('S', 'q'): -4.458774446450565,
-              ('S', 'r'): -1.6554140655440306,
-              ('S', 'tg'): -6.486922693742851,
-              ('S', 'u'): -6.081457585634687,
-              ('S', 'ud'): -7.6908954980687865,
-              ('S', 'ug'): -8.789507786736896,
-              ('S', 'uj'): -5.0759357200325885,
-              ('S', 'ul'): -3.2882495761921695,
-              ('S', 'uv'): -4.939360185026838,
-              ('S', 'uz'): -5.845068807570456,
-              ('S', 'v'): -2.4597868812142,
-              ('S', 'vg'): -4.819215873184775,
-              ('S', 'vn'): -8.789507786736896,
-              ('S', 'x'): -5.028307671043334,
-              ('S', 'y'): -3.217353754559132},
- ('S', 'en'): {},
- ('S', 'f'): {('B', 'a'): -4.5189380050412975,
-              ('B', 'ad'): -5.568568393368359,
-              ('B', 'an'): -8.630886271681646,
-              ('B', 'b'): -5.295175036697232,
-              ('B', 'c'): -4.829520114262749,
-              ('B', 'd'): -3.4704187423213764,
-              ('B', 'df'): -9.391856048580353,
-              ('B', 'e'): -12.336295027746793,
-              ('B', 'f'): -5.595381734710225,
-              ('B', 'i'): -5.543576558753014,
-              ('B', 'j'): -5.531311026800602,
-              ('B', 'l'): -5.76447879422421,
-              ('B', 'm'): -3.292520980620059,
-              ('B', 'mq'): -5.557889420792505,
-              ('B', 'n'): -2.2833391691771365,
-              ('B', 'nr'): -4.006556545236259,
-              ('B', 'nrfg'): -7.8665628126538065,
-              ('B', 'nrt'): -6.526152537099683,
-              ('B', 'ns'): -4.008166073991903,
-              ('B', 'nt'): -6.479314708018606,
-              ('B', 'nz'): -5.854717898470362,
-              ('B', 'o'): -8.136589949866867,
-              ('B', 'p'): -5.5213862991310085,
-              ('B', 'q'): -7.394652605137489,
-              ('B', 'r'): -4.091085553064239,
-              ('B', 'rr'): -13.434907316414902,
-              ('B', 'rz'): -9.543087018304277,
-              ('B', 's'): -5.524683609317559,
-              ('B', 't'): -4.941597065461997,
-              ('B', 'u'): -7.075333447742525,
-              ('B', 'v'): -1.8726489774260204,
-              ('B', 'vd'): -8.590720229956311,
-              ('B', 'vi'): -12.336295027746793,
-              ('B', 'vn'): -4.586398015526823,
-              ('B', 'vq'): -10.439175042860912,
-              ('B', 'y'): -10.299413100485754,
-              ('B', 'z'): -6.242725257701657,
-              ('S', 'a'): -4.341662716314968,
-              ('S', 'ad'): -10.490468337248462,
-              ('S', 'ag'): -7.385173861182945,
-              ('S', 'an'): -11.825469403980803,
-              ('S', 'b'): -6.248763011892578,
-              ('S', 'c'): -4.694410586483091,
-              ('S', 'd'): -2.6193579613346563,
-              ('S', 'dg'): -8.8916125341449,
-              ('S', 'e'): -9.969171413615177,
-              ('S', 'f'): -4.242934601796906,
-              ('S', 'g'): -6.3373584658001105,
-              ('S', 'h'): -9.245252574388477,
-              ('S', 'j'): -4.714446803689248,
-              ('S', 'k'): -7.594265659041505,
-              ('S', 'm'): -4.017715389901488,
-              ('S', 'mg'): -11.355465774735068,
-              ('S', 'n'): -3.206225167167223,
-              ('S', 'ng'): -4.366476190621413,
-              ('S', 'nr'): -5.358391988862574,
-              ('S', 'o'): -8.479080258813642,
-              ('S', 'p'): -3.130900198163625,
-              ('S', 'q'): -4.120206929114477,
-              ('S', 'r'): -3.7766172247244008,
-              ('S', 'rg'): -10.950000666626902,
-              ('S', 'tg'): -6.7231669213587235,
-              ('S', 'u'): -5.226415564674522,
-              ('S', 'ud'): -7.2993424253331645,
-              ('S', 'ug'): -7.562789526939487,
-              ('S', 'uj'): -2.442689475065116,
-              ('S', 'ul'): -4.533268384114577,
-              ('S', 'uv'): -7.594265659041505,
-              ('S', 'uz'): -8.172217127510017,
-              ('S', 'v'): -1.9293589957837238,
-              ('S', 'vg'): -5.149646182345955,
-              ('S', 'vn'): -8.980560020161395,
-              ('S', 'x'): -8.107031147625323,
-              ('S', 'y'): -7.2907216822892575,
-              ('S', 'yg'): -13.434907316414902},
- ('S', 'g'): {('B', 'a'): -5.476266964133363,
-              ('B', 'ad'): -7.22211673205734,
-              ('B', 'an'): -8.976135873302548,
-              ('B', 'b'): -6.491229223514548,
-              ('B', 'c'): -5.60501594687767,
-              ('B', 'd'): -4.53610241935431,
-              ('B', 'df'): -10.480213270078822,
-              ('B', 'f'): -5.793463097098308,
-              ('B', 'i'): -6.609012259170931,
-              ('B', 'j'): -7.772163068976612,
-              ('B', 'l'): -7.241534817914442,
-              ('B', 'm'): -4.950784182567399,
-              ('B', 'mq'): -9.381600981410712,
-              ('B', 'n'): -2.927713549764907,
-              ('B', 'nr'): -3.5941924832426912,
-              ('B', 'nrfg'): -7.995306620290822,
-              ('B', 'nrt'): -5.597411347492451,
-              ('B', 'ns'): -5.12362699540681,
-              ('B', 'nt'): -9.227450301583454,
-              ('B', 'nz'): -6.283011322417013,
-              ('B', 'o'): -9.381600981410712,
-              ('B', 'p'): -7.261337445210621,
-              ('B', 'q'): -7.995306620290822,
-              ('B', 'r'): -5.353277520286405,
-              ('B', 'rz'): -11.173360450638768,
-              ('B', 's'): -5.705300309503636,
-              ('B', 't'): -5.608840043316074,
-              ('B', 'u'): -7.646999926022606,
-              ('B', 'v'): -3.2602052647106996,
-              ('B', 'vn'): -5.8262529199212985,
-              ('B', 'y'): -10.480213270078822,
-              ('B', 'z'): -6.939253946041508,
-              ('S', 'a'): -3.550696499315172,
-              ('S', 'ad'): -7.509798804509121,
-              ('S', 'ag'): -4.379894318058758,
-              ('S', 'b'): -5.601206418461003,
-              ('S', 'bg'): -8.775465177840397,
-              ('S', 'c'): -4.357720460564436,
-              ('S', 'd'): -3.363819125985357,
-              ('S', 'dg'): -6.939253946041508,
-              ('S', 'e'): -6.568190264650676,
-              ('S', 'f'): -4.15944497582824,
-              ('S', 'g'): -2.4561695174156326,
-              ('S', 'h'): -8.34014710658255,
-              ('S', 'j'): -3.8331736153186515,
-              ('S', 'k'): -6.049396471235508,
-              ('S', 'm'): -4.53610241935431,
-              ('S', 'mg'): -7.562442537994543,
-              ('S', 'n'): -2.1568475756427414,
-              ('S', 'ng'): -2.455514745743852,
-              ('S', 'nr'): -3.5575693786029343,
-              ('S', 'nt'): -9.787066089518877,
-              ('S', 'o'): -6.002876455600616,
-              ('S', 'p'): -3.668418382242596,
-              ('S', 'q'): -3.5151329244774154,
-              ('S', 'r'): -4.273637343353895,
-              ('S', 'rg'): -8.608411093177232,
-              ('S', 'tg'): -5.267998602584197,
-              ('S', 'u'): -4.4246009031470885,
-              ('S', 'ud'): -7.646999926022606,
-              ('S', 'ug'): -7.806064620652293,
-              ('S', 'uj'): -4.073333284009507,
-              ('S', 'ul'): -6.268085672200338,
-              ('S', 'uv'): -5.816774175966755,
-              ('S', 'uz'): -6.882901009490376,
-              ('S', 'v'): -1.7862975002691117,
-              ('S', 'vg'): -3.248926265751207,
-              ('S', 'vn'): -8.976135873302548,
-              ('S', 'x'): -3.428790641284272,
-              ('S', 'y'): -5.659931704473785,
-              ('S', 'zg'): -8.870775357644721},
- ('S', 'h'): {('B', 'a'): -4.294919559325406,
-              ('B', 'ad'): -2.9543936166610956,
-              ('B', 'an'): -7.057036981697891,
-              ('B', 'b'): -3.9509566509750353,
-              ('B', 'c'): -5.2934483894365325,
-              ('B', 'd'): -3.9584473227041928,
-              ('B', 'f'): -5.670742620578001,
-              ('B', 'i'): -4.337936944409097,
-              ('B', 'j'): -5.237878538281722,
-              ('B', 'l'): -4.878504537373825,
-              ('B', 'm'): -4.572130331909891,
-              ('B', 'mq'): -8.155649270366002,
-              ('B', 'n'): -0.8545014645099691,
-              ('B', 'nr'): -3.633860693316961,
-              ('B', 'nrfg'): -6.450901178127576,
-              ('B', 'nrt'): -6.140746249823736,
-              ('B', 'ns'): -4.1853573568138795,
-              ('B', 'nt'): -6.450901178127576,
-              ('B', 'nz'): -4.689913367566275,
-              ('B', 'p'): -8.155649270366002,
-              ('B', 'q'): -5.211210291199561,
-              ('B', 'r'): -4.139266249613613,
-              ('B', 'rz'): -8.848796450925946,
-              ('B', 's'): -5.211210291199561,
-              ('B', 't'): -4.721662065880855,
-              ('B', 'u'): -8.155649270366002,
-              ('B', 'v'): -4.078111826460282,
-              ('B', 'vd'): -7.057036981697891,
-              ('B', 'vn'): -3.2690666249397244,
-              ('B', 'z'): -6.209739121310688,
-              ('S', 'a'): -5.211210291199561,
-              ('S', 'ad'): -8.848796450925946,
-              ('S', 'ag'): -6.076207728686165,
-              ('S', 'b'): -7.239358538491846,
-              ('S', 'c'): -4.95697615281532,
-              ('S', 'd'): -4.194836100768423,
-              ('S', 'dg'): -7.462502089806056,
-              ('S', 'e'): -8.848796450925946,
-              ('S', 'f'): -5.4475990692637914,
-              ('S', 'g'): -5.4475990692637914,
-              ('S', 'h'): -6.651571873589727,
-              ('S', 'j'): -3.7612001156935624,
-              ('S', 'k'): -7.057036981697891,
-              ('S', 'm'): -4.5583370097775555,
-              ('S', 'n'): -3.1893142351663255,
-              ('S', 'ng'): -3.5454915428668707,
-              ('S', 'nr'): -4.754451888703846,
-              ('S', 'p'): -4.112598002531451,
-              ('S', 'q'): -3.7989404436764094,
-              ('S', 'r'): -3.492210176253934,
-              ('S', 'rg'): -6.76935490924611,
-              ('S', 'tg'): -6.76935490924611,
-              ('S', 'u'): -4.878504537373825,
-              ('S', 'ud'): -8.155649270366002,
-              ('S', 'ug'): -7.239358538491846,
-              ('S', 'uj'): -4.382888332271363,
-              ('S', 'ul'): -6.651571873589727,
-              ('S', 'uv'): -6.651571873589727,
-              ('S', 'uz'): -8.155649270366002,
-              ('S', 'v'): -4.2436262649378556,
-              ('S', 'vg'): -4.771259007020227,
-              ('S', 'x'): -8.848796450925946,
-              ('S', 'y'): -6.902886301870633},
- ('S', 'i'): {},
- ('S', 'in'): {},
- ('S', 'j'): {('B', 'a'): -5.172473979259473,
-              ('B', 'ad'): -6.87283716800434,
-              ('B', 'an'): -8.009601222636825,
-              ('B', 'b'): -5.893345707834273,
-              ('B', 'c'): -5.573068157133041,
-              ('B', 'd'): -4.6084038409746695,
-              ('B', 'df'): -11.41079860429898,
-              ('B', 'e'): -10.717651423739035,
-              ('B', 'f'): -4.908758464680218,
-              ('B', 'i'): -6.85692171269844,
-              ('B', 'j'): -5.335452573210296,
-              ('B', 'l'): -6.578492845727142,
-              ('B', 'm'): -4.73308561832221,
-              ('B', 'mq'): -9.464888455243667,
-              ('B', 'n'): -1.945544732919786,
-              ('B', 'nr'): -3.3086664146643545,
-              ('B', 'nrfg'): -7.945062701499254,
-              ('B', 'nrt'): -4.648647299175636,
-              ('B', 'ns'): -3.5537047393964882,
-              ('B', 'nt'): -6.933461789820774,
-              ('B', 'nz'): -4.892389051545124,
-              ('B', 'o'): -8.390373718154619,
-              ('B', 'p'): -6.52799668171261,
-              ('B', 'q'): -8.319756150940664,
-              ('B', 'r'): -5.250646691672848,
-              ('B', 'rz'): -10.02450424317909,
-              ('B', 's'): -5.098156765605424,
-              ('B', 't'): -5.267686507581859,
-              ('B', 'u'): -7.582157207809885,
-              ('B', 'v'): -2.874979948759578,
-              ('B', 'vd'): -9.706050512060555,
-              ('B', 'vn'): -4.615092829125467,
-              ('B', 'y'): -11.005333496190817,
-              ('B', 'z'): -7.638037666204342,
-              ('S', 'a'): -3.0959664250144248,
-              ('S', 'ad'): -7.9930719206856145,
-              ('S', 'ag'): -5.816087224697141,
-              ('S', 'an'): -10.717651423739035,
-              ('S', 'b'): -5.418084837790567,
-              ('S', 'bg'): -11.41079860429898,
-              ('S', 'c'): -3.7580155228799095,
-              ('S', 'd'): -3.389378234022441,
-              ('S', 'dg'): -7.914291042832501,
-              ('S', 'e'): -9.464888455243667,
-              ('S', 'f'): -3.656102671577482,
-              ('S', 'g'): -4.71006749475117,
-              ('S', 'h'): -6.776069616069345,
-              ('S', 'j'): -2.551080104548453,
-              ('S', 'k'): -6.516697126458676,
-              ('S', 'm'): -4.04025315058941,
-              ('S', 'mg'): -9.906721207522706,
-              ('S', 'n'): -2.173475560992911,
-              ('S', 'ng'): -3.277504743076347,
-              ('S', 'nr'): -4.037738216852662,
-              ('S', 'nz'): -12.103945784858926,
-              ('S', 'o'): -7.550068893258385,
-              ('S', 'p'): -3.53510936029085,
-              ('S', 'q'): -3.522464103560327,
-              ('S', 'r'): -4.578845038733125,
-              ('S', 'rg'): -8.638209882059199,
-              ('S', 'tg'): -5.921860878142295,
-              ('S', 'u'): -4.292782399833648,
-              ('S', 'ud'): -6.674600155904485,
-              ('S', 'ug'): -8.845849246837444,
-              ('S', 'uj'): -3.9122057635814684,
-              ('S', 'ul'): -7.308155239262185,
-              ('S', 'uv'): -5.61019194500724,
-              ('S', 'uz'): -7.9930719206856145,
-              ('S', 'v'): -2.2954834527319083,
-              ('S', 'vg'): -4.727437658532706,
-              ('S', 'vn'): -10.312186315630871,
-              ('S', 'x'): -5.334303808006423,
-              ('S', 'y'): -6.719450722069837,
-              ('S', 'yg'): -9.80136069186488},
- ('S', 'jn'): {},
- ('S', 'k'): {('B', 'a'): -4.430072474283456,
-              ('B', 'ad'): -5.732752695362214,
-              ('B', 'an'): -8.130647968160584,
-              ('B', 'b'): -4.668595310777154,
-              ('B', 'c'): -4.510236313324109,
-              ('B', 'd'): -3.051072091526119,
-              ('B', 'df'): -7.562663930554645,
-              ('B', 'f'): -5.347090214550229,
-              ('B', 'h'): -10.9638613122168,
-              ('B', 'i'): -4.804765923724867,
-              ('B', 'j'): -6.348740795375541,
-              ('B', 'l'): -5.100230136618703,
-              ('B', 'm'): -4.013046543774216,
-              ('B', 'mq'): -8.565966039418429,
-              ('B', 'n'): -1.6616712866107384,
-              ('B', 'nr'): -4.8657870300505595,
-              ('B', 'nrfg'): -8.25581111111459,
-              ('B', 'nrt'): -7.072041014106174,
-              ('B', 'ns'): -5.776475506376045,
-              ('B', 'nt'): -7.300299666087153,
-              ('B', 'nz'): -5.839897332813541,
-              ('B', 'o'): -8.398911954755263,
-              ('B', 'p'): -5.593223284089137,
-              ('B', 'q'): -6.6331279719304685,
-              ('B', 'r'): -4.17827366720887,
-              ('B', 's'): -4.96244643425565,
-              ('B', 't'): -5.1232196548434015,
-              ('B', 'u'): -6.184737819105271,
-              ('B', 'v'): -2.0100920176673456,
-              ('B', 'vd'): -9.577566951096909,
-              ('B', 'vn'): -4.719694411553064,
-              ('B', 'vq'): -10.9638613122168,
-              ('B', 'y'): -9.86524902354869,
-              ('B', 'z'): -6.431261819063544,
-              ('S', 'a'): -4.418511651882381,
-              ('S', 'ad'): -9.017951163161486,
-              ('S', 'ag'): -7.113713710506741,
-              ('S', 'b'): -6.7443536070406935,
-              ('S', 'c'): -3.6223774598536393,
-              ('S', 'd'): -2.3396090485071546,
-              ('S', 'dg'): -6.729754807619541,
-              ('S', 'e'): -10.270714131656854,
-              ('S', 'f'): -4.676002752055016,
-              ('S', 'g'): -6.729754807619541,
-              ('S', 'h'): -8.4789546624288,
-              ('S', 'j'): -6.281730085092581,
-              ('S', 'k'): -5.680657583478811,
-              ('S', 'm'): -4.051118491723623,
-              ('S', 'mg'): -10.9638613122168,
-              ('S', 'n'): -3.9644388447088392,
-              ('S', 'ng'): -4.852393972714122,
-              ('S', 'nr'): -6.509514015963292,
-              ('S', 'o'): -8.884419770536963,
-              ('S', 'p'): -2.8920181626076418,
-              ('S', 'q'): -4.907077298988176,
-              ('S', 'r'): -4.34512232869958,
-              ('S', 'tg'): -7.032035679492474,
-              ('S', 'u'): -5.158726343300311,
-              ('S', 'ud'): -7.38034237376069,
-              ('S', 'ug'): -7.596565482230326,
-              ('S', 'uj'): -2.5749561411020934,
-              ('S', 'ul'): -7.300299666087153,
-              ('S', 'uv'): -8.073489554320636,
-              ('S', 'uz'): -8.661276219222755,
-              ('S', 'v'): -2.081886127967933,
-              ('S', 'vg'): -5.55221526036176,
-              ('S', 'vn'): -10.270714131656854,
-              ('S', 'x'): -7.872818858858484,
-              ('S', 'y'): -6.509514015963292},
- ('S', 'l'): {},
- ('S', 'ln'): {},
- ('S', 'm'): {('B', 'a'): -4.681467579073693,
-              ('B', 'ad'): -6.248786735889066,
-              ('B', 'an'): -8.34941116733404,
-              ('B', 'b'): -5.113227428758092,
-              ('B', 'c'): -5.254608839888542,
-              ('B', 'd'): -4.753386346811339,
-              ('B', 'df'): -10.603469219433425,
-              ('B', 'e'): -12.449295909931756,
-              ('B', 'f'): -4.3012358973762925,
-              ('B', 'h'): -12.85476101803992,
-              ('B', 'i'): -7.054154358748179,
-              ('B', 'j'): -5.180840465761266,
-              ('B', 'l'): -6.371653666582722,
-              ('B', 'ln'): -13.547908198599865,
-              ('B', 'm'): -4.314046631582337,
-              ('B', 'mq'): -6.713799459786027,
-              ('B', 'n'): -1.6921663778419098,
-              ('B', 'nr'): -4.03605681623546,
-              ('B', 'nrfg'): -8.423944219196606,
-              ('B', 'nrt'): -6.333403784448722,
-              ('B', 'ns'): -3.8279228996058547,
-              ('B', 'nt'): -5.443506890678253,
-              ('B', 'nz'): -5.290263240391638,
-              ('B', 'o'): -10.775319476360085,
-              ('B', 'p'): -6.049592327832884,
-              ('B', 'q'): -5.522718876709031,
-              ('B', 'qe'): -13.547908198599865,
-              ('B', 'r'): -4.779956288836445,
-              ('B', 'rz'): -10.908850868984608,
-              ('B', 's'): -5.970786267723187,
-              ('B', 't'): -4.277131457819852,
-              ('B', 'u'): -7.653505364335015,
-              ('B', 'v'): -2.304235670613051,
-              ('B', 'vd'): -9.504856930765316,
-              ('B', 'vn'): -4.725733437653786,
-              ('B', 'y'): -10.908850868984608,
-              ('B', 'z'): -7.761010817233158,
-              ('S', 'a'): -3.6441706773085305,
-              ('S', 'ad'): -11.150012925801494,
-              ('S', 'ag'): -7.296004315433977,
-              ('S', 'an'): -13.547908198599865,
-              ('S', 'b'): -6.346737315318187,
-              ('S', 'bg'): -13.547908198599865,
-              ('S', 'c'): -4.536628707421936,
-              ('S', 'd'): -3.693505853754229,
-              ('S', 'dg'): -9.88434655247022,
-              ('S', 'e'): -10.412413982670715,
-              ('S', 'f'): -4.305778504134276,
-              ('S', 'g'): -6.6572990784526995,
-              ('S', 'h'): -8.635253312863814,
-              ('S', 'j'): -5.061380421494514,
-              ('S', 'k'): -6.692499399989938,
-              ('S', 'm'): -2.07154298894144,
-              ('S', 'mg'): -10.775319476360085,
-              ('S', 'n'): -2.513244366522365,
-              ('S', 'ng'): -3.786329892246431,
-              ('S', 'nr'): -5.6640849837077125,
-              ('S', 'nt'): -13.547908198599865,
-              ('S', 'o'): -10.71469485454365,
-              ('S', 'p'): -3.2018203312933133,
-              ('S', 'q'): -4.091880310874579,
-              ('S', 'r'): -4.736404948441626,
-              ('S', 'rg'): -9.763718564681605,
-              ('S', 'tg'): -5.929165820929453,
-              ('S', 'u'): -6.098410193217016,
-              ('S', 'ud'): -7.7702558753772095,
-              ('S', 'ug'): -7.857548744275805,
-              ('S', 'uj'): -3.411920999825503,
-              ('S', 'ul'): -5.48075915868976,
-              ('S', 'uv'): -6.323154792831895,
-              ('S', 'uz'): -10.146710816937711,
-              ('S', 'v'): -2.1327389024275285,
-              ('S', 'vg'): -5.230630432378631,
-              ('S', 'vn'): -10.11392099411472,
-              ('S', 'x'): -7.968178372613644,
-              ('S', 'y'): -6.600932206464448},
- ('S', 'mg'): {('B', 'a'): -5.269145989247757,
-               ('B', 'b'): -6.655440350367647,
-               ('B', 'c'): -5.046002437933547,
-               ('B', 'd'): -4.709530201312334,
-               ('B', 'i'): -6.655440350367647,
-               ('B', 'l'): -5.269145989247757,
-               ('B', 'm'): -5.556828061699537,
-               ('B', 'n'): -2.685148436815526,
-               ('B', 'nr'): -4.0163830207523885,
-               ('B', 'nrt'): -5.556828061699537,
-               ('B', 'ns'): -4.458215773031428,
-               ('B', 'nt'): -6.655440350367647,
-               ('B', 'nz'): -4.458215773031428,
-               ('B', 'o'): -6.655440350367647,
-               ('B', 'p'): -5.962293169807702,
-               ('B', 'r'): -5.962293169807702,
-               ('B', 's'): -5.962293169807702,
-               ('B', 't'): -5.556828061699537,
-               ('B', 'v'): -3.189704447567921,
-               ('S', 'a'): -4.3528552573736015,
-               ('S', 'ag'): -4.709530201312334,
-               ('S', 'b'): -5.962293169807702,
-               ('S', 'c'): -5.556828061699537,
-               ('S', 'd'): -3.765068592471483,
-               ('S', 'dg'): -6.655440350367647,
-               ('S', 'f'): -3.765068592471483,
-               ('S', 'g'): -2.917770732084279,
-               ('S', 'j'): -4.1705337005796475,
-               ('S', 'k'): -4.863680881139593,
-               ('S', 'm'): -3.4773865200197016,
-               ('S', 'mg'): -5.046002437933547,
-               ('S', 'n'): -1.9640924681385037,
-               ('S', 'ng'): -1.9826115159057414,
-               ('S', 'nr'): -3.189704447567921,
-               ('S', 'p'): -3.4773865200197016,
-               ('S', 'q'): -3.3232358401924436,
-               ('S', 'r'): -3.1290798257514862,
-               ('S', 'rg'): -5.556828061699537,
-               ('S', 'tg'): -4.3528552573736015,
-               ('S', 'u'): -3.3596034843633182,
-               ('S', 'ud'): -6.655440350367647,
-               ('S', 'uj'): -5.556828061699537,
-               ('S', 'uv'): -5.269145989247757,
-               ('S', 'v'): -2.577902906461928,
-               ('S', 'vg'): -3.9473901492654373,
-               ('S', 'x'): -3.822227006311431},
- ('S', 'mq'): {},
- ('S', 'n'): {('B', 'a'): -4.686340403757639,
-              ('B', 'ad'): -6.376123176014915,
-              ('B', 'an'): -8.580965984236023,
-              ('B', 'b'): -5.6517715300296745,
-              ('B', 'c'): -4.494207478442838,
-              ('B', 'd'): -3.6985628652441704,
-              ('B', 'df'): -9.426915226751934,
-              ('B', 'e'): -11.14591534169756,
-              ('B', 'f'): -4.765614408579322,
-              ('B', 'h'): -14.090354320864,
-              ('B', 'i'): -5.741106520297211,
-              ('B', 'in'): -14.090354320864,
-              ('B', 'j'): -5.969171078785172,
-              ('B', 'l'): -5.9134004526382205,
-              ('B', 'm'): -4.233172521204384,
-              ('B', 'mq'): -8.45556471769475,
-              ('B', 'n'): -2.139541734531748,
-              ('B', 'nr'): -3.8383600940569904,
-              ('B', 'nrfg'): -7.92493646663258,
-              ('B', 'nrt'): -6.198275899615881,
-              ('B', 'ns'): -4.4897301627753174,
-              ('B', 'nt'): -7.394555403805509,
-              ('B', 'nz'): -5.803832947182764,
-              ('B', 'o'): -8.43087210510438,
-              ('B', 'p'): -6.179763708607522,
-              ('B', 'q'): -7.639883898719824,
-              ('B', 'r'): -4.299251898922663,
-              ('B', 'rz'): -10.479436408219776,
-              ('B', 's'): -5.148285627819775,
-              ('B', 't'): -4.802127410230747,
-              ('B', 'u'): -6.129681712475883,
-              ('B', 'v'): -2.3490351109974346,
-              ('B', 'vd'): -9.127509690604093,
-              ('B', 'vi'): -13.397207140304054,
-              ('B', 'vn'): -4.829225782055713,
-              ('B', 'vq'): -11.257140976807785,
-              ('B', 'y'): -8.797049496139508,
-              ('B', 'z'): -6.3730030486786715,
-              ('S', 'a'): -3.8619250389526267,
-              ('S', 'ad'): -10.139110602282573,
-              ('S', 'ag'): -6.618422242618879,
-              ('S', 'an'): -9.60171795113186,
-              ('S', 'b'): -5.90584056783028,
-              ('S', 'bg'): -13.397207140304054,
-              ('S', 'c'): -3.7021900670569434,
-              ('S', 'd'): -2.7155421580234065,
-              ('S', 'dg'): -7.954789429782262,
-              ('S', 'e'): -8.64361694919769,
-              ('S', 'f'): -3.303305861076636,
-              ('S', 'g'): -5.406630258560132,
-              ('S', 'h'): -8.88086816802258,
-              ('S', 'j'): -4.874131285729662,
-              ('S', 'k'): -6.1161656515779885,
-              ('S', 'm'): -4.063985638952057,
-              ('S', 'mg'): -9.93147123750433,
-              ('S', 'n'): -2.560001596571246,
-              ('S', 'ng'): -3.387087381052046,
-              ('S', 'nr'): -4.6523207628750365,
-              ('S', 'nt'): -12.99174203219589,
-              ('S', 'o'): -8.334612107277088,
-              ('S', 'p'): -3.1431155344510278,
-              ('S', 'q'): -3.9510439398565893,
-              ('S', 'r'): -3.7057068525176384,
-              ('S', 'rg'): -10.999311867505686,
-              ('S', 'tg'): -6.090004825539316,
-              ('S', 'u'): -4.403345081773321,
-              ('S', 'ud'): -6.884719144453637,
-              ('S', 'ug'): -7.5111031088538995,
-              ('S', 'uj'): -2.910791930970953,
-              ('S', 'ul'): -5.339512945488468,
-              ('S', 'uv'): -6.671573438113207,
-              ('S', 'uz'): -7.500053272667315,
-              ('S', 'v'): -1.9713112343069297,
-              ('S', 'vg'): -4.846192400412307,
-              ('S', 'vn'): -8.832858948836218,
-              ('S', 'x'): -6.674577345448607,
-              ('S', 'y'): -5.386183761117614,
-              ('S', 'zg'): -13.397207140304054},
- ('S', 'ng'): {('B', 'a'): -4.697871606694985,
-               ('B', 'ad'): -6.304364008899328,
-               ('B', 'an'): -8.94568634514544,
-               ('B', 'b'): -5.642819573212852,
-               ('B', 'c'): -4.7012810883476055,
-               ('B', 'd'): -3.7775499809823483,
-               ('B', 'df'): -9.099837024972697,
-               ('B', 'e'): -11.297061602308917,
-               ('B', 'f'): -4.788540881684308,
-               ('B', 'i'): -5.838895534818984,
-               ('B', 'j'): -6.204334419494189,
-               ('B', 'l'): -6.116214820235219,
-               ('B', 'm'): -4.321959249867169,
-               ('B', 'mq'): -8.444430172395599,
-               ('B', 'n'): -2.1141095564293915,
-               ('B', 'nr'): -3.5597361016571902,
-               ('B', 'nrfg'): -7.790503704988935,
-               ('B', 'nrt'): -5.90192005112534,
-               ('B', 'ns'): -4.448702533283436,
-               ('B', 'nt'): -7.304995889207234,
-               ('B', 'nz'): -5.639904968992771,
-               ('B', 'o'): -8.826141194495657,
-               ('B', 'p'): -6.207409767894436,
-               ('B', 'q'): -7.790503704988935,
-               ('B', 'r'): -4.4395475397635265,
-               ('B', 'rr'): -13.088821071536971,
-               ('B', 'rz'): -9.425259425407326,
-               ('B', 's'): -5.4656680030600695,
-               ('B', 't'): -4.886338624960435,
-               ('B', 'u'): -6.750226993333789,
-               ('B', 'v'): -2.366368997756193,
-               ('B', 'vd'): -10.31623234929719,
-               ('B', 'vn'): -4.9953587970357916,
-               ('B', 'vq'): -11.70252671041708,
-               ('B', 'y'): -8.9299379881773,
-               ('B', 'z'): -6.512351502488747,
-               ('S', 'a'): -3.7492962411799633,
-               ('S', 'ad'): -9.099837024972697,
-               ('S', 'ag'): -5.7702815229690705,
-               ('S', 'an'): -11.479383159102872,
-               ('S', 'b'): -6.0749055967264445,
-               ('S', 'bg'): -12.395673890977026,
-               ('S', 'c'): -3.817385600200978,
-               ('S', 'd'): -2.8382393242190087,
-               ('S', 'dg'): -7.677175019681932,
-               ('S', 'e'): -8.556221578383715,
-               ('S', 'f'): -3.375042294228816,
-               ('S', 'g'): -4.515247546684627,
-               ('S', 'h'): -9.011283627631252,
-               ('S', 'j'): -4.625028656847849,
-               ('S', 'k'): -5.85392265122214,
-               ('S', 'm'): -4.085012985069802,
-               ('S', 'mg'): -9.953326855607822,
-               ('S', 'n'): -2.6526192099772157,
-               ('S', 'ng'): -2.9829234280735464,
-               ('S', 'nr'): -4.4907854922766335,
-               ('S', 'nt'): -12.395673890977026,
-               ('S', 'o'): -8.252539164585494,
-               ('S', 'p'): -3.054085982391171,
-               ('S', 'q'): -3.7196836878137916,
-               ('S', 'r'): -3.7349865999220597,
-               ('S', 'rg'): -10.044298633813549,
-               ('S', 't'): -13.088821071536971,
-               ('S', 'tg'): -6.0597335073873095,
-               ('S', 'u'): -4.31683063500473,
-               ('S', 'ud'): -7.280678581556528,
-               ('S', 'ug'): -7.169927217263825,
-               ('S', 'uj'): -3.261620787172963,
-               ('S', 'ul'): -6.311174477901855,
-               ('S', 'uv'): -6.430810025666223,
-               ('S', 'uz'): -7.464803565349633,
-               ('S', 'v'): -1.996119085650453,
-               ('S', 'vg'): -4.4010415795452005,
-               ('S', 'vn'): -9.11852915798485,
-               ('S', 'x'): -5.687589807123957,
-               ('S', 'y'): -6.055314587249274,
-               ('S', 'yg'): -11.479383159102872,
-               ('S', 'zg'): -11.70252671041708},
- ('S', 'nr'): {('B', 'a'): -5.2245052086251365,
-               ('B', 'ad'): -6.9481268726859735,
-               ('B', 'an'): -9.86889610776651,
-               ('B', 'b'): -6.202489509504631,
-               ('B', 'c'): -5.3740369425961,
-               ('B', 'd'): -4.238879783349917,
-               ('B', 'df'): -10.274361215874674,
-               ('B', 'e'): -11.372973504542783,
-               ('B', 'f'): -5.4171361350779526,
-               ('B', 'i'): -6.194002895627312,
-               ('B', 'j'): -6.288468361880072,
-               ('B', 'l'): -6.8034304961978425,
-               ('B', 'm'): -4.442478738591157,
-               ('B', 'mq'): -9.021598247379305,
-               ('B', 'n'): -1.7432322467199572,
-               ('B', 'nr'): -3.2703870791519933,
-               ('B', 'nrfg'): -7.803440808061413,
-               ('B', 'nrt'): -4.9586952109920235,
-               ('B', 'ns'): -4.310353514999731,
-               ('B', 'nt'): -8.304920569409166,
-               ('B', 'nz'): -5.677559279557099,
-               ('B', 'o'): -9.501171327641192,
-               ('B', 'p'): -6.895636690064577,
-               ('B', 'q'): -8.377241230988792,
-               ('B', 'r'): -5.033496424074722,
-               ('B', 'rr'): -12.066120685102728,
-               ('B', 'rz'): -9.986679143422892,
-               ('B', 's'): -5.439402935853703,
-               ('B', 't'): -4.7978976639431625,
-               ('B', 'u'): -6.984716320118265,
-               ('B', 'v'): -2.7372864190787567,
-               ('B', 'vd'): -10.679826323982837,
-               ('B', 'vn'): -5.629970316733301,
-               ('B', 'y'): -10.456682772668628,
-               ('B', 'z'): -7.110293627501467,
-               ('S', 'a'): -3.4741911475724736,
-               ('S', 'ad'): -9.358070484000518,
-               ('S', 'ag'): -5.86764196861042,
-               ('S', 'an'): -12.066120685102728,
-               ('S', 'b'): -5.181634033059946,
-               ('S', 'bg'): -10.967508396434619,
-               ('S', 'c'): -4.133040913222314,
-               ('S', 'd'): -3.2773748031645935,
-               ('S', 'dg'): -8.664923303440572,
-               ('S', 'e'): -8.569613123636248,
-               ('S', 'f'): -4.131965451566406,
-               ('S', 'g'): -4.12767513393794,
-               ('S', 'h'): -8.455202772458504,
-               ('S', 'j'): -4.008426490287141,
-               ('S', 'k'): -6.4457198193855785,
-               ('S', 'm'): -4.3073601409450655,
-               ('S', 'mg'): -8.770283819098399,
-               ('S', 'n'): -2.5035753446592652,
-               ('S', 'ng'): -3.1405333460724467,
-               ('S', 'nr'): -3.3559957577805206,
-               ('S', 'nt'): -11.372973504542783,
-               ('S', 'o'): -8.194919674194837,
-               ('S', 'p'): -3.0260942507962234,
-               ('S', 'q'): -3.8497623527165725,
-               ('S', 'r'): -4.068121367122998,
-               ('S', 'rg'): -9.293531962862946,
-               ('S', 't'): -10.679826323982837,
-               ('S', 'tg'): -5.389037223855593,
-               ('S', 'u'): -4.049142938340466,
-               ('S', 'ud'): -6.777853654408193,
-               ('S', 'ug'): -5.333909978635522,
-               ('S', 'uj'): -3.5616075468438653,
-               ('S', 'ul'): -6.615082231537028,
-               ('S', 'uv'): -6.623702974580935,
-               ('S', 'uz'): -8.174300386992101,
-               ('S', 'v'): -2.032350762303678,
-               ('S', 'vg'): -3.9275559478410957,
-               ('S', 'vn'): -10.967508396434619,
-               ('S', 'x'): -5.3080261806749975,
-               ('S', 'y'): -6.577182958946042,
-               ('S', 'yg'): -11.372973504542783,
-               ('S', 'zg'): -12.066120685102728},
- ('S', 'nrfg'): {},
- ('S', 'nrt'): {},
- ('S', 'ns'): {},
- ('S', 'nt'): {('B', 'ns'): -1.791759469228055,
-               ('B', 'vn'): -3.9318256327243257,
-               ('S', 'a'): -3.9318256327243257,
-               ('S', 'b'): -3.9318256327243257,
-               ('S', 'd'): -4.624972813284271,
-               ('S', 'f'): -4.624972813284271,
-               ('S', 'g'): -3.2386784521643803,
-               ('S', 'j'): -0.4978384282391796,
-               ('S', 'k'): -4.624972813284271,
-               ('S', 'ng'): -4.624972813284271,
-               ('S', 'p'): -4.624972813284271,
-               ('S', 'q'): -3.5263605246161616,
-               ('S', 'v'): -4.624972813284271,
-               ('S', 'vg'): -4.624972813284271,
-               ('S', 'x'): -3.5263605246161616},
- ('S', 'nz'): {('B', 'nz'): 0.0},
- ('S', 'o'): {('B', 'a'): -6.403905268952571,
-              ('B', 'ad'): -8.013343181386672,
-              ('B', 'b'): -7.607878073278508,
-              ('B', 'c'): -5.3391945319601435,
-              ('B', 'd'): -5.487614537078416,
-              ('B', 'e'): -8.706490361946617,
-              ('B', 'f'): -7.097052449512517,
-              ('B', 'i'): -7.097052449512517,
-              ('B', 'j'): -8.013343181386672,
-              ('B', 'l'): -6.760580212891304,
-              ('B', 'm'): -3.418223331252082,
-              ('B', 'mq'): -8.706490361946617,
-              ('B', 'n'): -3.464743346886975,
-              ('B', 'nr'): -4.968820743663249,
-              ('B', 'nrt'): -7.097052449512517,
-              ('B', 'ns'): -5.710758088392626,
-              ('B', 'nz'): -8.706490361946617,
-              ('B', 'o'): -4.337042509479596,
-              ('B', 'p'): -7.607878073278508,
-              ('B', 'r'): -5.762051382780177,
-              ('B', 's'): -6.914730892718563,
-              ('B', 't'): -6.509265784610398,
-              ('B', 'v'): -3.349904087274605,
-              ('B', 'vn'): -8.013343181386672,
-              ('B', 'z'): -7.320196000826726,
-              ('S', 'a'): -4.516835619920192,
-              ('S', 'ad'): -8.706490361946617,
-              ('S', 'ag'): -5.410653495942288,
-              ('S', 'b'): -7.320196000826726,
-              ('S', 'c'): -6.067433032331358,
-              ('S', 'd'): -4.101320175958526,
-              ('S', 'e'): -6.627048820266781,
-              ('S', 'f'): -5.410653495942288,
-              ('S', 'g'): -3.669537759532988,
-              ('S', 'j'): -4.6289529180408975,
-              ('S', 'k'): -8.706490361946617,
-              ('S', 'm'): -4.899827872176298,
-              ('S', 'n'): -3.524706811654532,
-              ('S', 'ng'): -3.122994053164918,
-              ('S', 'nr'): -4.48698265677051,
-              ('S', 'o'): -1.313842841224994,
-              ('S', 'p'): -4.992918295242309,
-              ('S', 'q'): -3.944316427148861,
-              ('S', 'r'): -4.006009996154201,
-              ('S', 'rg'): -7.320196000826726,
-              ('S', 'tg'): -6.760580212891304,
-              ('S', 'u'): -6.403905268952571,
-              ('S', 'ud'): -7.607878073278508,
-              ('S', 'ug'): -8.013343181386672,
-              ('S', 'uj'): -2.353860965627051,
-              ('S', 'ul'): -5.122971423490507,
-              ('S', 'uv'): -2.211224806009609,
-              ('S', 'uz'): -5.710758088392626,
-              ('S', 'v'): -2.267139990846519,
-              ('S', 'vg'): -4.2638391054563005,
-              ('S', 'x'): -4.184701784897577,
-              ('S', 'y'): -3.8236884393602466},
- ('S', 'p'): {('B', 'a'): -4.05760152463721,
-              ('B', 'ad'): -6.282052474887318,
-              ('B', 'an'): -7.575710610013756,
-              ('B', 'b'): -4.492210551788535,
-              ('B', 'c'): -6.715195970417627,
-              ('B', 'd'): -4.516276894329455,
-              ('B', 'df'): -12.945185170878121,
-              ('B', 'e'): -13.638332351438066,
-              ('B', 'f'): -4.4327030591920025,
-              ('B', 'h'): -13.232867243329903,
-              ('B', 'i'): -5.9542383010092195,
-              ('B', 'j'): -5.078846247831577,
-              ('B', 'jn'): -14.331479531998012,
-              ('B', 'l'): -5.366144958193173,
-              ('B', 'm'): -3.37680328913977,
-              ('B', 'mq'): -6.221953872245138,
-              ('B', 'n'): -1.3806449631903925,
-              ('B', 'nr'): -3.105503074903735,
-              ('B', 'nrfg'): -7.286574414868641,
-              ('B', 'nrt'): -5.915654834970063,
-              ('B', 'ns'): -2.672075600649059,
-              ('B', 'nt'): -5.251589589405894,
-              ('B', 'nz'): -5.002112453600188,
-              ('B', 'o'): -9.788184749728007,
-              ('B', 'p'): -7.061166645918987,
-              ('B', 'q'): -6.444270946184079,
-              ('B', 'r'): -3.0878855462669708,
-              ('B', 'rr'): -10.930282150335856,
-              ('B', 'rz'): -8.624369267249136,
-              ('B', 's'): -3.7880082620180042,
-              ('B', 't'): -3.5438319543421133,
-              ('B', 'u'): -9.231613104173814,
-              ('B', 'v'): -2.439809459619229,
-              ('B', 'vd'): -8.604631784410815,
-              ('B', 'vi'): -13.638332351438066,
-              ('B', 'vn'): -4.057187331617344,
-              ('B', 'vq'): -14.331479531998012,
-              ('B', 'y'): -11.846572882210012,
-              ('B', 'z'): -6.723105057617228,
-              ('S', 'a'): -4.130780456793973,
-              ('S', 'ad'): -11.153425701650066,
-              ('S', 'ag'): -7.424724753349458,
-              ('S', 'an'): -11.335747258444021,
-              ('S', 'b'): -6.235880830619823,
-              ('S', 'c'): -5.605485150983441,
-              ('S', 'd'): -4.566507199318629,
-              ('S', 'dg'): -9.327533226052552,
-              ('S', 'e'): -11.11260370712981,
-              ('S', 'f'): -4.083055664428541,
-              ('S', 'g'): -6.48763089384554,
-              ('S', 'h'): -8.303201011767314,
-              ('S', 'j'): -4.9554552443808975,
-              ('S', 'k'): -7.7248293457997965,
-              ('S', 'm'): -3.215738554304725,
-              ('S', 'mg'): -10.36118761844589,
-              ('S', 'n'): -3.3559461412555853,
-              ('S', 'ng'): -4.578059340726505,
-              ('S', 'nr'): -5.163629211642781,
-              ('S', 'nt'): -11.195985316068862,
-              ('S', 'o'): -10.027414438793842,
-              ('S', 'p'): -4.259853867184403,
-              ('S', 'q'): -4.434261592475479,
-              ('S', 'r'): -2.678661698375892,
-              ('S', 'rg'): -11.11260370712981,
-              ('S', 't'): -12.72204161956391,
-              ('S', 'tg'): -6.014934814068613,
-              ('S', 'u'): -5.979632793169767,
-              ('S', 'ud'): -7.661981442140132,
-              ('S', 'ug'): -7.3265975422851515,
-              ('S', 'uj'): -5.456472045949615,
-              ('S', 'ul'): -5.268827432921433,
-              ('S', 'uv'): -6.617694915399257,
-              ('S', 'uz'): -6.574000765413833,
-              ('S', 'v'): -3.16988616655602,
-              ('S', 'vg'): -5.692776923184577,
-              ('S', 'vn'): -9.503165794695711,
-              ('S', 'x'): -8.445375500547856,
-              ('S', 'y'): -7.885759712612433,
-              ('S', 'yg'): -14.331479531998012,
-              ('S', 'zg'): -14.331479531998012},
- ('S', 'q'): {('B', 'a'): -4.030448538636748,
-              ('B', 'ad'): -6.522417525558315,
-              ('B', 'an'): -7.867067185406487,
-              ('B', 'b'): -5.265547775110294,
-              ('B', 'c'): -4.874497803261004,
-              ('B', 'd'): -4.011670227810285,
-              ('B', 'df'): -9.242890246659082,
-              ('B', 'e'): -10.06956881984355,
-              ('B', 'f'): -4.541463359262635,
-              ('B', 'i'): -5.305768207175917,
-              ('B', 'j'): -5.950918866720331,
-              ('B', 'l'): -5.704954813646845,
-              ('B', 'm'): -4.120539671266992,
-              ('B', 'mq'): -7.8410916990032264,
-              ('B', 'n'): -1.6252126137552978,
-              ('B', 'nr'): -3.9681827457501795,
-              ('B', 'nrfg'): -7.943607262528821,
-              ('B', 'nrt'): -6.185553439402308,
-              ('B', 'ns'): -4.340242372304078,
-              ('B', 'nt'): -7.093067908217447,
-              ('B', 'nz'): -5.659371308202973,
-              ('B', 'o'): -9.143799344014852,
-              ('B', 'p'): -6.365331710075294,
-              ('B', 'q'): -7.383991474593398,
-              ('B', 'r'): -4.081323735362541,
-              ('B', 'rr'): -12.420944077007029,
-              ('B', 'rz'): -9.307428767796653,
-              ('B', 's'): -5.650154653098048,
-              ('B', 't'): -4.706043513411534,
-              ('B', 'u'): -7.294008327214612,
-              ('B', 'v'): -2.4596122347864617,
-              ('B', 'vd'): -8.683274458723659,
-              ('B', 'vn'): -4.662824216266903,
-              ('B', 'vq'): -11.322331788338918,
-              ('B', 'y'): -8.614281587236707,
-              ('B', 'z'): -6.316150844592043,
-              ('S', 'a'): -3.4753508062001304,
-              ('S', 'ad'): -9.7467954275805,
-              ('S', 'ag'): -6.651061800646303,
-              ('S', 'an'): -10.629184607778972,
-              ('S', 'b'): -5.937836725549829,
-              ('S', 'c'): -4.038425788917392,
-              ('S', 'd'): -3.160861613136031,
-              ('S', 'dg'): -8.277809350615495,
-              ('S', 'e'): -7.830887528828985,
-              ('S', 'f'): -3.6236978403035005,
-              ('S', 'g'): -5.465351468610731,
-              ('S', 'h'): -8.986956872521882,
-              ('S', 'j'): -4.880322548349875,
-              ('S', 'k'): -5.880635838945534,
-              ('S', 'm'): -3.790332918555234,
-              ('S', 'mg'): -10.06956881984355,
-              ('S', 'n'): -2.6125367307211698,
-              ('S', 'ng'): -3.629610083705677,
-              ('S', 'nr'): -5.033544291742475,
-              ('S', 'o'): -8.732064622893091,
-              ('S', 'p'): -3.264479278000163,
-              ('S', 'q'): -3.740357338682355,
-              ('S', 'r'): -3.4628542856513613,
-              ('S', 'rg'): -10.916866680230754,
-              ('S', 't'): -13.114091257566974,
-              ('S', 'tg'): -6.238859170290397,
-              ('S', 'u'): -4.992313838405899,
-              ('S', 'ud'): -7.219688423302123,
-              ('S', 'ug'): -7.458099446747121,
-              ('S', 'uj'): -3.2362805518208284,
-              ('S', 'ul'): -5.217166601298109,
-              ('S', 'uv'): -6.238859170290397,
-              ('S', 'uz'): -6.597898181524009,
-              ('S', 'v'): -2.235893133027296,
-              ('S', 'vg'): -4.951004881983758,
-              ('S', 'vn'): -9.222270959456347,
-              ('S', 'x'): -6.752788779993978,
-              ('S', 'y'): -4.34567253070957,
-              ('S', 'yg'): -12.420944077007029},
- ('S', 'qe'): {},
- ('S', 'qg'): {('S', 'q'): 0.0},
- ('S', 'r'): {('B', 'a'): -4.524933076979363,
-              ('B', 'ad'): -5.679875906367215,
-              ('B', 'an'): -8.304326538634133,
-              ('B', 'b'): -5.73303527464731,
-              ('B', 'c'): -4.915612769062181,
-              ('B', 'd'): -3.1377376796068925,
-              ('B', 'df'): -7.424793390495161,
-              ('B', 'e'): -11.179772646313621,
-              ('B', 'f'): -5.108573131186785,
-              ('B', 'h'): -13.887822847415832,
-              ('B', 'i'): -5.252135761951804,
-              ('B', 'in'): -13.194675666855886,
-              ('B', 'j'): -6.923687234997586,
-              ('B', 'l'): -5.589532213056549,
-              ('B', 'm'): -2.9914354356356574,
-              ('B', 'mq'): -7.824037638728223,
-              ('B', 'n'): -2.2677933875314014,
-              ('B', 'nr'): -4.620913123951754,
-              ('B', 'nrfg'): -8.370369950951122,
-              ('B', 'nrt'): -7.056948612769651,
-              ('B', 'ns'): -6.2272373857125745,
-              ('B', 'nt'): -8.953348914285138,
-              ('B', 'nz'): -7.178518507157532,
-              ('B', 'o'): -8.656714230561244,
-              ('B', 'p'): -6.271047038717458,
-              ('B', 'q'): -6.131627503467713,
-              ('B', 'r'): -3.668430263484182,
-              ('B', 'rr'): -13.194675666855886,
-              ('B', 'rz'): -9.14289071905258,
-              ('B', 's'): -4.76576739030722,
-              ('B', 't'): -4.521676024301448,
-              ('B', 'u'): -6.718472830745231,
-              ('B', 'v'): -2.121084965626463,
-              ('B', 'vd'): -10.30430390895972,
-              ('B', 'vi'): -12.096063378187775,
-              ('B', 'vn'): -5.173912218921906,
-              ('B', 'vq'): -9.862471156680682,
-              ('B', 'y'): -9.713435577520194,
-              ('B', 'z'): -6.109611372903338,
-              ('S', 'a'): -4.533468715300743,
-              ('S', 'ad'): -11.248765517800573,
-              ('S', 'ag'): -7.778575264651465,
-              ('S', 'an'): -11.40291619762783,
-              ('S', 'b'): -6.151515750867546,
-              ('S', 'c'): -4.4905051071095,
-              ('S', 'd'): -2.250390337029464,
-              ('S', 'dg'): -9.531114020726239,
-              ('S', 'e'): -8.800226512183446,
-              ('S', 'f'): -5.345937043409222,
-              ('S', 'g'): -7.118180870563328,
-              ('S', 'h'): -9.205691620291612,
-              ('S', 'j'): -6.399529332256403,
-              ('S', 'k'): -6.226766465054001,
-              ('S', 'm'): -3.6704373802970287,
-              ('S', 'mg'): -11.941912698360518,
-              ('S', 'n'): -3.584720600449714,
-              ('S', 'ng'): -4.857446812659925,
-              ('S', 'nr'): -6.350392810829322,
-              ('S', 'nt'): -13.194675666855886,
-              ('S', 'o'): -8.997473719194078,
-              ('S', 'p'): -2.989159448161055,
-              ('S', 'q'): -3.4468190558606673,
-              ('S', 'r'): -3.7558062712891553,
-              ('S', 'rg'): -13.194675666855886,
-              ('S', 'tg'): -7.316939885076247,
-              ('S', 'u'): -5.1806706720764275,
-              ('S', 'ud'): -6.8179487189572585,
-              ('S', 'ug'): -7.987925493833339,
-              ('S', 'uj'): -2.757696320054855,
-              ('S', 'ul'): -6.068588393556761,
-              ('S', 'uv'): -7.12163113275548,
-              ('S', 'uz'): -8.489660145898078,
-              ('S', 'v'): -1.7177608727420508,
-              ('S', 'vg'): -5.9376729597638125,
-              ('S', 'vn'): -9.744688121024298,
-              ('S', 'x'): -8.315668815238066,
-              ('S', 'y'): -5.562032321529741},
- ('S', 'rg'): {('B', 'a'): -4.983606621708336,
-               ('B', 'b'): -4.983606621708336,
-               ('B', 'c'): -4.647134385087123,
-               ('B', 'd'): -4.395819956806218,
-               ('B', 'f'): -5.8998973535824915,
-               ('B', 'j'): -6.593044534142437,
-               ('B', 'l'): -5.8998973535824915,
-               ('B', 'm'): -4.513602992462601,
-               ('B', 'n'): -2.465910149097345,
-               ('B', 'nr'): -2.721843523234546,
-               ('B', 'nrfg'): -6.593044534142437,
-               ('B', 'nrt'): -2.661218901418111,
-               ('B', 'ns'): -4.395819956806218,
-               ('B', 'nt'): -5.8998973535824915,
-               ('B', 'nz'): -3.414990703794491,
-               ('B', 'p'): -6.593044534142437,
-               ('B', 'q'): -4.983606621708336,
-               ('B', 's'): -5.8998973535824915,
-               ('B', 't'): -5.494432245474327,
-               ('B', 'u'): -5.8998973535824915,
-               ('B', 'v'): -2.622752620590315,
-               ('B', 'vn'): -4.983606621708336,
-               ('S', 'a'): -3.457550318213287,
-               ('S', 'ag'): -4.983606621708336,
-               ('S', 'b'): -4.395819956806218,
-               ('S', 'c'): -4.290459441148391,
-               ('S', 'd'): -4.0280951766809,
-               ('S', 'f'): -3.7026727762462723,
-               ('S', 'g'): -3.457550318213287,
-               ('S', 'j'): -3.8204558119026557,
-               ('S', 'k'): -4.801285064914382,
-               ('S', 'm'): -3.884994333040227,
-               ('S', 'n'): -3.3741687092742363,
-               ('S', 'ng'): -2.018333555639054,
-               ('S', 'nr'): -4.647134385087123,
-               ('S', 'p'): -3.648605554975996,
-               ('S', 'q'): -3.502002080784121,
-               ('S', 'r'): -4.647134385087123,
-               ('S', 'tg'): -5.8998973535824915,
-               ('S', 'u'): -4.290459441148391,
-               ('S', 'ud'): -6.593044534142437,
-               ('S', 'uj'): -3.597312260588446,
-               ('S', 'uv'): -6.593044534142437,
-               ('S', 'v'): -2.764403137653342,
-               ('S', 'vg'): -3.597312260588446,
-               ('S', 'vn'): -6.593044534142437,
-               ('S', 'x'): -5.206750173022546,
-               ('S', 'y'): -5.494432245474327},
- ('S', 'rr'): {},
- ('S', 'rz'): {},
- ('S', 's'): {},
- ('S', 't'): {('B', 'f'): -3.506557897319982,
-              ('B', 'n'): -3.506557897319982,
-              ('B', 'nr'): -2.659260036932778,
-              ('B', 'ns'): -4.605170185988091,
-              ('B', 'nz'): -3.912023005428146,
-              ('B', 'r'): -3.506557897319982,
-              ('B', 't'): -4.605170185988091,
-              ('B', 'v'): -2.995732273553991,
-              ('S', 'c'): -4.605170185988091,
-              ('S', 'd'): -2.8134107167600364,
-              ('S', 'f'): -4.605170185988091,
-              ('S', 'g'): -4.605170185988091,
-              ('S', 'j'): -4.605170185988091,
-              ('S', 'k'): -3.912023005428146,
-              ('S', 'n'): -2.3025850929940455,
-              ('S', 'nr'): -3.2188758248682006,
-              ('S', 'p'): -3.506557897319982,
-              ('S', 'q'): -2.659260036932778,
-              ('S', 'r'): -3.912023005428146,
-              ('S', 'tg'): -3.912023005428146,
-              ('S', 'uj'): -2.995732273553991,
-              ('S', 'ul'): -4.605170185988091,
-              ('S', 'v'): -1.2378743560016174},
- ('S', 'tg'): {('B', 'a'): -5.510668424580223,
-               ('B', 'ad'): -7.354613646978849,
-               ('B', 'an'): -8.489593579817834,
-               ('B', 'b'): -6.343012735300369,
-               ('B', 'c'): -5.977287955841718,
-               ('B', 'd'): -4.789664289517312,
-               ('B', 'f'): -5.8585044198517515,
-               ('B', 'i'): -6.754992524429727,
-               ('B', 'j'): -6.187008486823788,
-               ('B', 'l'): -7.252830952668907,
-               ('B', 'm'): -4.1573993188918275,
-               ('B', 'mq'): -9.300523796034161,
-               ('B', 'n'): -2.7806393167592383,
-               ('B', 'nr'): -3.56395149855497,
-               ('B', 'nrfg'): -7.103299218697942,
-               ('B', 'nrt'): -5.6179139549338215,
-               ('B', 'ns'): -1.3578950693509222,
-               ('B', 'nt'): -6.143523374884048,
-               ('B', 'nz'): -5.717004857578052,
-               ('B', 'o'): -10.686818157154052,
-               ('B', 'p'): -7.190310595687572,
-               ('B', 'q'): -8.201911507366052,
-               ('B', 'r'): -5.516334162115901,
-               ('B', 'rz'): -10.686818157154052,
-               ('B', 's'): -5.959430338441712,
-               ('B', 't'): -4.412056135912114,
-               ('B', 'u'): -8.607376615474216,
-               ('B', 'v'): -3.008954656475842,
-               ('B', 'vd'): -9.993670976594107,
-               ('B', 'vn'): -5.941886028790803,
-               ('B', 'vq'): -10.686818157154052,
-               ('B', 'z'): -7.4287216191325705,
-               ('S', 'a'): -3.715149552428263,
-               ('S', 'ad'): -9.993670976594107,
-               ('S', 'ag'): -6.661466466418903,
-               ('S', 'an'): -10.686818157154052,
-               ('S', 'b'): -6.643766889319503,
-               ('S', 'c'): -4.899920775787345,
-               ('S', 'd'): -2.996532136477285,
-               ('S', 'dg'): -8.288922884355681,
-               ('S', 'e'): -8.740908008098739,
-               ('S', 'f'): -4.253878064414873,
-               ('S', 'g'): -5.358941988364472,
-               ('S', 'h'): -8.047760827538793,
-               ('S', 'j'): -4.986374583763366,
-               ('S', 'k'): -6.679484971921582,
-               ('S', 'm'): -4.586499205133989,
-               ('S', 'mg'): -9.300523796034161,
-               ('S', 'n'): -2.65705963671323,
-               ('S', 'ng'): -3.586790990524793,
-               ('S', 'nr'): -5.070047059487481,
-               ('S', 'nt'): -10.686818157154052,
-               ('S', 'o'): -8.895058687925998,
-               ('S', 'p'): -2.74090855854092,
-               ('S', 'q'): -3.617794730575793,
-               ('S', 'r'): -4.43298934557858,
-               ('S', 'rg'): -10.686818157154052,
-               ('S', 't'): -10.686818157154052,
-               ('S', 'tg'): -3.991019240095561,
-               ('S', 'u'): -5.077346361969093,
-               ('S', 'ud'): -6.754992524429727,
-               ('S', 'ug'): -8.121868799692516,
-               ('S', 'uj'): -4.118740245742076,
-               ('S', 'ul'): -4.188536007677619,
-               ('S', 'uv'): -7.103299218697942,
-               ('S', 'uz'): -8.607376615474216,
-               ('S', 'v'): -2.0451090910402474,
-               ('S', 'vg'): -4.690366068535032,
-               ('S', 'vn'): -10.686818157154052,
-               ('S', 'x'): -6.54368343076252,
-               ('S', 'y'): -6.626375146607633},
- ('S', 'u'): {('B', 'a'): -4.060820938042829,
-              ('B', 'ad'): -6.703913242870266,
-              ('B', 'an'): -7.9441760486014035,
-              ('B', 'b'): -4.5052920172623265,
-              ('B', 'c'): -5.164142283512511,
-              ('B', 'd'): -4.611195442151311,
-              ('B', 'df'): -11.079670264530552,
-              ('B', 'f'): -5.875663577453757,
-              ('B', 'i'): -6.317496329732797,
-              ('B', 'in'): -11.772817445090498,
-              ('B', 'j'): -5.828706594365986,
-              ('B', 'l'): -5.694029069810841,
-              ('B', 'm'): -3.5922164974960498,
-              ('B', 'mq'): -8.161899532446274,
-              ('B', 'n'): -1.6086208433540188,
-              ('B', 'nr'): -4.198772439718298,
-              ('B', 'nrfg'): -8.096516773183422,
-              ('B', 'nrt'): -6.634082148366926,
-              ('B', 'ns'): -4.664982554392703,
-              ('B', 'nt'): -7.721032497287193,
-              ('B', 'nz'): -6.229595035446739,
-              ('B', 'o'): -10.52005447659513,
-              ('B', 'p'): -6.176249054741446,
-              ('B', 'q'): -7.33606591072737,
-              ('B', 'r'): -4.185506939067882,
-              ('B', 'rr'): -12.465964625650443,
-              ('B', 'rz'): -10.856526713216343,
-              ('B', 's'): -5.832646192370067,
-              ('B', 't'): -5.3684157750356505,
-              ('B', 'u'): -7.613934361730826,
-              ('B', 'v'): -2.1293967979731776,
-              ('B', 'vd'): -9.521525646484003,
-              ('B', 'vn'): -4.172915485881999,
-              ('B', 'y'): -10.268740048314225,
-              ('B', 'z'): -7.568124825699532,
-              ('S', 'a'): -3.8152900428597247,
-              ('S', 'ad'): -11.367352336982334,
-              ('S', 'ag'): -7.177697594955908,
-              ('S', 'an'): -9.57559286775428,
-              ('S', 'b'): -6.803004145514498,
-              ('S', 'c'): -4.962123878951492,
-              ('S', 'd'): -3.36443515953244,
-              ('S', 'dg'): -7.621777539191852,
-              ('S', 'e'): -10.856526713216343,
-              ('S', 'f'): -4.499031127245604,
-              ('S', 'g'): -6.528428420568017,
-              ('S', 'h'): -7.7746167434213,
-              ('S', 'j'): -4.902764033292373,
-              ('S', 'k'): -8.175505184502052,
-              ('S', 'm'): -3.665699974340108,
-              ('S', 'mg'): -11.772817445090498,
-              ('S', 'n'): -2.2963123472499105,
-              ('S', 'ng'): -2.942055160270633,
-              ('S', 'nr'): -5.673620198179634,
-              ('S', 'o'): -11.367352336982334,
-              ('S', 'p'): -3.529009021425217,
-              ('S', 'q'): -3.7912549963592226,
-              ('S', 'r'): -3.9600346265129165,
-              ('S', 'tg'): -6.3217789915247975,
-              ('S', 'u'): -5.56422741899387,
-              ('S', 'ud'): -6.8064824098908225,
-              ('S', 'ug'): -7.234856008795857,
-              ('S', 'uj'): -4.808209354515578,
-              ('S', 'ul'): -6.5826422371621645,
-              ('S', 'uv'): -3.886548091054074,
-              ('S', 'uz'): -4.890892926142882,
-              ('S', 'v'): -2.074572132732893,
-              ('S', 'vg'): -4.232727124945173,
-              ('S', 'vn'): -9.330470409721293,
-              ('S', 'x'): -8.355090761477133,
-              ('S', 'y'): -7.821573726509071,
-              ('S', 'zg'): -12.465964625650443},
- ('S', 'ud'): {('B', 'a'): -3.1518593137220194,
-               ('B', 'ad'): -5.886559768042297,
-               ('B', 'an'): -8.761664053807674,
-               ('B', 'b'): -6.815753904752361,
-               ('B', 'c'): -6.347374971233627,
-               ('B', 'd'): -2.965882660650804,
-               ('B', 'df'): -9.550121414171944,
-               ('B', 'e'): -9.773264965486154,
-               ('B', 'f'): -5.961062295340219,
-               ('B', 'i'): -3.1812483567383234,
-               ('B', 'j'): -7.099116316059625,
-               ('B', 'l'): -4.435726885784836,
-               ('B', 'm'): -3.7799271739964917,
-               ('B', 'mq'): -7.758361944943889,
-               ('B', 'n'): -2.7553108942059414,
-               ('B', 'nr'): -3.9457910184874034,
-               ('B', 'nrfg'): -7.693823423806318,
-               ('B', 'nrt'): -6.292024876150462,
-               ('B', 'ns'): -5.400657552728764,
-               ('B', 'nt'): -9.367799857377989,
-               ('B', 'nz'): -6.515168427464672,
-               ('B', 'o'): -6.189746027030044,
-               ('B', 'p'): -7.082021882700325,
-               ('B', 'q'): -8.386970604366264,
-               ('B', 'r'): -3.417157304790263,
-               ('B', 'rz'): -9.080117784926209,
-               ('B', 's'): -5.472583970266225,
-               ('B', 't'): -5.8077011931299785,
-               ('B', 'u'): -8.386970604366264,
-               ('B', 'v'): -2.5053906801627295,
-               ('B', 'vn'): -6.129121405213609,
-               ('B', 'vq'): -11.159559326606045,
-               ('B', 'y'): -9.213649177550732,
-               ('B', 'z'): -3.7473989916608397,
-               ('S', 'a'): -2.925259690909791,
-               ('S', 'ag'): -7.016424600214512,
-               ('S', 'b'): -8.11503688888262,
-               ('S', 'c'): -5.3943682238212,
-               ('S', 'd'): -2.0242658289527733,
-               ('S', 'dg'): -7.267739028495418,
-               ('S', 'e'): -8.962334749269825,
-               ('S', 'f'): -4.41785863195399,
-               ('S', 'g'): -6.882893207589989,
-               ('S', 'h'): -10.4664121460461,
-               ('S', 'j'): -5.866254501881552,
-               ('S', 'k'): -8.386970604366264,
-               ('S', 'm'): -3.2656141883700855,
-               ('S', 'mg'): -10.4664121460461,
-               ('S', 'n'): -3.186748542484641,
-               ('S', 'ng'): -4.8698437556970475,
-               ('S', 'nr'): -5.8562544185469685,
-               ('S', 'o'): -6.752840079341792,
-               ('S', 'p'): -3.4674459870105783,
-               ('S', 'q'): -4.736312363072525,
-               ('S', 'r'): -3.3323184248532334,
-               ('S', 'rg'): -11.159559326606045,
-               ('S', 'tg'): -6.855494233401875,
-               ('S', 'u'): -5.531938212915407,
-               ('S', 'ud'): -7.247536321177899,
-               ('S', 'ug'): -5.287441537130629,
-               ('S', 'uj'): -4.799985457933667,
-               ('S', 'ul'): -3.6210643271925793,
-               ('S', 'uv'): -7.758361944943889,
-               ('S', 'uz'): -5.479386717588977,
-               ('S', 'v'): -1.9145277148399316,
-               ('S', 'vg'): -6.109703319356508,
-               ('S', 'vn'): -11.159559326606045,
-               ('S', 'x'): -7.9014627885845625,
-               ('S', 'y'): -6.372067583823998},
- ('S', 'ug'): {('B', 'a'): -4.212048792566965,
-               ('B', 'ad'): -6.357448302038598,
-               ('B', 'an'): -7.502580606341601,
-               ('B', 'b'): -5.982754852597188,
-               ('B', 'c'): -4.818627956818451,
-               ('B', 'd'): -4.456358932865219,
-               ('B', 'df'): -10.14163793595686,
-               ('B', 'f'): -5.281825531595188,
-               ('B', 'i'): -5.641828265626595,
-               ('B', 'j'): -6.302185623363549,
-               ('B', 'l'): -5.974972712155133,
-               ('B', 'm'): -2.2268375618321037,
-               ('B', 'mq'): -6.586289874467446,
-               ('B', 'n'): -2.2186519772456643,
-               ('B', 'nr'): -3.962657015177819,
-               ('B', 'nrfg'): -7.369049213717078,
-               ('B', 'nrt'): -6.249817637846233,
-               ('B', 'ns'): -3.9062472983521395,
-               ('B', 'nt'): -7.400797912031659,
-               ('B', 'nz'): -5.759611301282979,
-               ('B', 'o'): -10.14163793595686,
-               ('B', 'p'): -6.55811899750075,
-               ('B', 'q'): -7.3382775550503245,
-               ('B', 'r'): -2.926030377733559,
-               ('B', 'rz'): -8.062196394277024,
-               ('B', 's'): -5.593038101457163,
-               ('B', 't'): -4.466597930166313,
-               ('B', 'u'): -5.851178494808469,
-               ('B', 'v'): -3.208214910226145,
-               ('B', 'vd'): -9.225347204082706,
-               ('B', 'vn'): -4.915891262243659,
-               ('B', 'y'): -9.225347204082706,
-               ('B', 'z'): -6.883541397935378,
-               ('S', 'a'): -2.7231570382090657,
-               ('S', 'ag'): -6.691650390125273,
-               ('S', 'an'): -10.834785116516805,
-               ('S', 'b'): -7.028122626746486,
-               ('S', 'c'): -4.894613863796374,
-               ('S', 'd'): -3.796879153069623,
-               ('S', 'dg'): -7.43358773485465,
-               ('S', 'e'): -8.269835759055269,
-               ('S', 'f'): -4.464884133688578,
-               ('S', 'g'): -7.1971989567904195,
-               ('S', 'h'): -9.448490755396914,
-               ('S', 'j'): -5.886025226138637,
-               ('S', 'k'): -8.755343574836969,
-               ('S', 'm'): -3.2893953669049814,
-               ('S', 'mg'): -9.736172827848696,
-               ('S', 'n'): -2.82708510363278,
-               ('S', 'ng'): -4.47175701297634,
-               ('S', 'nr'): -4.926702178347874,
-               ('S', 'nt'): -10.834785116516805,
-               ('S', 'o'): -9.448490755396914,
-               ('S', 'p'): -4.400238597729352,
-               ('S', 'q'): -4.07321234771275,
-               ('S', 'r'): -2.67169874093359,
-               ('S', 'tg'): -5.990598030058214,
-               ('S', 'u'): -6.116286245221711,
-               ('S', 'ud'): -4.770999907829197,
-               ('S', 'ug'): -7.502580606341601,
-               ('S', 'uj'): -2.848620256184078,
-               ('S', 'ul'): -2.5465020713091144,
-               ('S', 'uv'): -7.22386720387258,
-               ('S', 'uz'): -5.258836013370489,
-               ('S', 'v'): -2.651108533896148,
-               ('S', 'vg'): -6.0985866681223095,
-               ('S', 'vn'): -10.14163793595686,
-               ('S', 'x'): -9.04302564728875,
-               ('S', 'y'): -5.383746662951104},
- ('S', 'uj'): {('B', 'a'): -3.3174172564405104,
-               ('B', 'ad'): -5.952569054914462,
-               ('B', 'an'): -5.994046844318946,
-               ('B', 'b'): -4.240407040754704,
-               ('B', 'c'): -5.044076023252886,
-               ('B', 'd'): -4.406817606884705,
-               ('B', 'df'): -11.295899620601222,
-               ('B', 'e'): -11.90900409348763,
-               ('B', 'f'): -5.375327068602986,
-               ('B', 'h'): -11.03996624646402,
-               ('B', 'i'): -5.749746090148603,
-               ('B', 'in'): -13.087659089829277,
-               ('B', 'j'): -5.489510418483815,
-               ('B', 'jn'): -14.473953450949168,
-               ('B', 'l'): -5.1242860137518855,
-               ('B', 'ln'): -12.394511909269331,
-               ('B', 'm'): -3.436438204523975,
-               ('B', 'mq'): -7.547376417726443,
-               ('B', 'n'): -0.7152037388066569,
-               ('B', 'nr'): -4.297618314919713,
-               ('B', 'nrfg'): -8.277509323154646,
-               ('B', 'nrt'): -6.5070199525443275,
-               ('B', 'ns'): -4.275969595653588,
-               ('B', 'nt'): -6.811015600487632,
-               ('B', 'nz'): -5.471868017793444,
-               ('B', 'o'): -9.583604322727414,
-               ('B', 'p'): -6.925397471779294,
-               ('B', 'q'): -7.27203713341754,
-               ('B', 'r'): -4.325208666853718,
-               ('B', 'rr'): -11.90900409348763,
-               ('B', 'rz'): -9.338155013898906,
-               ('B', 's'): -5.168302899168659,
-               ('B', 't'): -5.27214940999527,
-               ('B', 'u'): -8.624628671002307,
-               ('B', 'v'): -2.394987168536261,
-               ('B', 'vd'): -7.543458684997541,
-               ('B', 'vn'): -2.7399666008690535,
-               ('B', 'y'): -11.141748940773963,
-               ('B', 'z'): -6.69993837369844,
-               ('S', 'a'): -4.015632958654051,
-               ('S', 'ad'): -12.17136835795512,
-               ('S', 'ag'): -7.51170998668296,
-               ('S', 'an'): -10.863035538304942,
-               ('S', 'b'): -6.088921163135269,
-               ('S', 'bg'): -13.780806270389222,
-               ('S', 'c'): -5.641949519692896,
-               ('S', 'd'): -4.297732502758833,
-               ('S', 'dg'): -10.396416007043447,
-               ('S', 'e'): -10.031302194458851,
-               ('S', 'f'): -5.595874194822732,
-               ('S', 'g'): -7.336675013688781,
-               ('S', 'h'): -8.293936797296594,
-               ('S', 'j'): -5.94206871078994,
-               ('S', 'k'): -8.02823363156359,
-               ('S', 'm'): -4.60754490665446,
-               ('S', 'mg'): -12.076058178150797,
-               ('S', 'n'): -3.1169919755256617,
-               ('S', 'ng'): -5.411301351872589,
-               ('S', 'nr'): -5.923518925753128,
-               ('S', 'nt'): -13.375341162281057,
-               ('S', 'o'): -9.801124616487261,
-               ('S', 'p'): -5.192316197090951,
-               ('S', 'q'): -5.258824562241187,
-               ('S', 'r'): -4.473883800566795,
-               ('S', 'rg'): -11.701364728709386,
-               ('S', 't'): -13.780806270389222,
-               ('S', 'tg'): -7.9939088890225145,
-               ('S', 'u'): -7.956282178036892,
-               ('S', 'ud'): -9.8105143568371,
-               ('S', 'ug'): -8.928776006469604,
-               ('S', 'uj'): -7.965184313977486,
-               ('S', 'ul'): -7.291601339063904,
-               ('S', 'uv'): -7.6594105536892085,
-               ('S', 'uz'): -9.941353957795911,
-               ('S', 'v'): -3.4068152135657073,
-               ('S', 'vg'): -6.502177328068539,
-               ('S', 'vn'): -9.450072930102891,
-               ('S', 'x'): -9.098675043265002,
-               ('S', 'y'): -6.7508333586828355},
- ('S', 'ul'): {('B', 'a'): -3.616755007317491,
-               ('B', 'ad'): -5.796477741523672,
-               ('B', 'an'): -7.389440816754267,
-               ('B', 'b'): -4.993032090981543,
-               ('B', 'c'): -4.173182794428145,
-               ('B', 'd'): -3.677543992753583,
-               ('B', 'df'): -9.81718905270232,
-               ('B', 'e'): -10.117293645152657,
-               ('B', 'f'): -5.146439221068246,
-               ('B', 'i'): -5.315323883189958,
-               ('B', 'j'): -5.479656269027064,
-               ('B', 'jn'): -12.419878738146704,
-               ('B', 'l'): -5.223566769302124,
-               ('B', 'ln'): -11.503588006272548,
-               ('B', 'm'): -1.9410426658290847,
-               ('B', 'mq'): -6.26078334965477,
-               ('B', 'n'): -1.7777927421467123,
-               ('B', 'nr'): -3.364264211373676,
-               ('B', 'nrfg'): -7.01046732409308,
-               ('B', 'nrt'): -6.083053007000262,
-               ('B', 'ns'): -3.7355622336944077,
-               ('B', 'nt'): -6.339945543051113,
-               ('B', 'nz'): -5.426404583762029,
-               ('B', 'o'): -8.538314940203266,
-               ('B', 'p'): -5.801139754629483,
-               ('B', 'q'): -7.194132064433502,
-               ('B', 'r'): -3.005822312522409,
-               ('B', 'rr'): -11.503588006272548,
-               ('B', 'rz'): -8.440197084244742,
-               ('B', 's'): -4.893430464529568,
-               ('B', 't'): -3.947369154357106,
-               ('B', 'u'): -7.141764078916186,
-               ('B', 'v'): -2.5798636085661486,
-               ('B', 'vd'): -8.795537805170337,
-               ('B', 'vn'): -4.467263626495703,
-               ('B', 'y'): -9.124041872142374,
-               ('B', 'z'): -6.291918446450183,
-               ('S', 'a'): -3.8784808580336483,
-               ('S', 'ad'): -11.726731557586758,
-               ('S', 'ag'): -7.688075901225246,
-               ('S', 'an'): -11.726731557586758,
-               ('S', 'b'): -6.567676258372229,
-               ('S', 'c'): -4.925726648551501,
-               ('S', 'd'): -3.3013795698361004,
-               ('S', 'dg'): -9.241824907798758,
-               ('S', 'e'): -7.7013798668516085,
-               ('S', 'f'): -5.372361516789407,
-               ('S', 'g'): -7.131611707452167,
-               ('S', 'h'): -8.878919414109388,
-               ('S', 'j'): -5.576661980302137,
-               ('S', 'k'): -8.682209119863336,
-               ('S', 'm'): -3.524043652666177,
-               ('S', 'mg'): -10.628119268918647,
-               ('S', 'n'): -3.422669707358005,
-               ('S', 'ng'): -5.039311277596791,
-               ('S', 'nr'): -5.001697915419915,
-               ('S', 'nt'): -11.726731557586758,
-               ('S', 'o'): -8.850346041665333,
-               ('S', 'p'): -3.9465329465107417,
-               ('S', 'q'): -3.921155063014127,
-               ('S', 'r'): -2.4740982734203234,
-               ('S', 'rg'): -11.503588006272548,
-               ('S', 'tg'): -7.263701138759789,
-               ('S', 'u'): -6.619272078854962,
-               ('S', 'ud'): -7.556197857007111,
-               ('S', 'ug'): -8.001038130350105,
-               ('S', 'uj'): -5.312862848313688,
-               ('S', 'ul'): -8.822566477558258,
-               ('S', 'uv'): -7.575691651688111,
-               ('S', 'uz'): -9.502108006062423,
-               ('S', 'v'): -2.892940902305051,
-               ('S', 'vg'): -6.317320143533134,
-               ('S', 'vn'): -10.404975717604438,
-               ('S', 'x'): -8.954142835346977,
-               ('S', 'y'): -4.944822988470596,
-               ('S', 'zg'): -13.113025918706649},
- ('S', 'uv'): {('B', 'a'): -4.628041966911131,
-               ('B', 'ad'): -5.920532105901576,
-               ('B', 'an'): -8.384385346491744,
-               ('B', 'b'): -6.766648631242949,
-               ('B', 'c'): -5.701652953373824,
-               ('B', 'd'): -4.152697222758766,
-               ('B', 'df'): -10.869291996279744,
-               ('B', 'e'): -9.259854083845644,
-               ('B', 'f'): -5.96772779723785,
-               ('B', 'i'): -5.466614614407464,
-               ('B', 'j'): -7.50199616629327,
-               ('B', 'l'): -6.073501450683003,
-               ('B', 'm'): -4.724033975992345,
-               ('B', 'mq'): -8.92338184722443,
-               ('B', 'n'): -3.198164091848165,
-               ('B', 'nr'): -5.115133314298476,
-               ('B', 'nrfg'): -8.618000197673249,
-               ('B', 'nrt'): -7.801239061146127,
-               ('B', 'ns'): -5.422554624613434,
-               ('B', 'nt'): -9.95300126440559,
-               ('B', 'nz'): -6.88030794971547,
-               ('B', 'o'): -7.712291575129631,
-               ('B', 'p'): -5.86870703803699,
-               ('B', 'q'): -7.691238165931798,
-               ('B', 'r'): -5.4182535427140435,
-               ('B', 's'): -6.499844143812722,
-               ('B', 't'): -5.55855210973315,
-               ('B', 'u'): -8.343563351971488,
-               ('B', 'v'): -1.1082036105401516,
-               ('B', 'vd'): -8.566706903285699,
-               ('B', 'vi'): -10.46382688817158,
-               ('B', 'vn'): -4.1281817947065536,
-               ('B', 'y'): -10.869291996279744,
-               ('B', 'z'): -6.750254821467272,
-               ('S', 'a'): -4.62415469282273,
-               ('S', 'ad'): -10.176144815719798,
-               ('S', 'ag'): -7.25837408363552,
-               ('S', 'an'): -9.95300126440559,
-               ('S', 'b'): -7.898877530710043,
-               ('S', 'c'): -4.849482976162619,
-               ('S', 'd'): -3.5892837433955562,
-               ('S', 'dg'): -9.770679707611635,
-               ('S', 'e'): -7.5921472632875675,
-               ('S', 'f'): -4.593588798497741,
-               ('S', 'g'): -7.231705836553358,
-               ('S', 'h'): -9.770679707611635,
-               ('S', 'j'): -6.085975624908179,
-               ('S', 'k'): -6.987728198336306,
-               ('S', 'm'): -4.8954823844104824,
-               ('S', 'mg'): -10.869291996279744,
-               ('S', 'n'): -3.965544738695146,
-               ('S', 'ng'): -3.9848053442369613,
-               ('S', 'nr'): -6.115701805173379,
-               ('S', 'o'): -8.384385346491744,
-               ('S', 'p'): -2.6112582103820863,
-               ('S', 'q'): -4.203608278497335,
-               ('S', 'r'): -4.961209058110813,
-               ('S', 'tg'): -7.25837408363552,
-               ('S', 'u'): -5.803537402962409,
-               ('S', 'ud'): -8.789850454599907,
-               ('S', 'ug'): -7.167990022167251,
-               ('S', 'uj'): -4.400041679483971,
-               ('S', 'ul'): -7.451565312666378,
-               ('S', 'uv'): -7.205730350150097,
-               ('S', 'uz'): -9.07753252705169,
-               ('S', 'v'): -1.1814449633304263,
-               ('S', 'vg'): -5.534160656608991,
-               ('S', 'vn'): -11.562439176839689,
-               ('S', 'x'): -8.672067418943525,
-               ('S', 'y'): -7.271979735691298},
- ('S', 'uz'): {('B', 'a'): -3.6847973057368475,
-               ('B', 'ad'): -6.299867942373015,
-               ('B', 'an'): -7.058766500495741,
-               ('B', 'b'): -5.513478835072804,
-               ('B', 'c'): -5.407497394216512,
-               ('B', 'd'): -3.7995503504894175,
-               ('B', 'df'): -9.208588838937377,
-               ('B', 'e'): -9.747585339670064,
-               ('B', 'f'): -5.482895411700723,
-               ('B', 'h'): -11.693495488725377,
-               ('B', 'i'): -5.142415153681972,
-               ('B', 'j'): -6.295332787207624,
-               ('B', 'l'): -5.5259789978370355,
-               ('B', 'm'): -2.507652748349594,
-               ('B', 'mq'): -6.818298165524225,
-               ('B', 'n'): -1.5932083602146407,
-               ('B', 'nr'): -3.2867870304844113,
-               ('B', 'nrfg'): -6.841465224805759,
-               ('B', 'nrt'): -5.999763349922677,
-               ('B', 'ns'): -4.699562513502188,
-               ('B', 'nt'): -7.582621624552066,
-               ('B', 'nz'): -6.051588417787263,
-               ('B', 'o'): -7.742251770143949,
-               ('B', 'p'): -7.239148192471869,
-               ('B', 'q'): -7.108528010054805,
-               ('B', 'r'): -3.1235201118701696,
-               ('B', 'rr'): -11.000348308165432,
-               ('B', 'rz'): -7.8868329989550565,
-               ('B', 's'): -4.805942917060759,
-               ('B', 't'): -4.958903828752429,
-               ('B', 'u'): -8.167134964109215,
-               ('B', 'v'): -2.6797784582540083,
-               ('B', 'vd'): -9.901736019497323,
-               ('B', 'vn'): -5.236725833153214,
-               ('B', 'vq'): -11.693495488725377,
-               ('B', 'y'): -9.61405394704554,
-               ('B', 'z'): -5.012640809935162,
-               ('S', 'a'): -3.7042740799101006,
-               ('S', 'ag'): -7.239148192471869,
-               ('S', 'an'): -10.307201127605486,
-               ('S', 'b'): -6.70306290194664,
-               ('S', 'c'): -5.658014056200621,
-               ('S', 'd'): -3.451792328995558,
-               ('S', 'dg'): -8.920906766485595,
-               ('S', 'e'): -8.397658622721048,
-               ('S', 'f'): -5.55145808313802,
-               ('S', 'g'): -6.766241803568172,
-               ('S', 'h'): -9.496270911389157,
-               ('S', 'j'): -5.818564757873347,
-               ('S', 'k'): -9.054438159110118,
-               ('S', 'm'): -4.438610678648039,
-               ('S', 'mg'): -10.594883200057266,
-               ('S', 'n'): -2.685638565367101,
-               ('S', 'ng'): -4.96726208636663,
-               ('S', 'nr'): -4.968461846558534,
-               ('S', 'o'): -8.082577576081151,
-               ('S', 'p'): -3.7586239227802,
-               ('S', 'q'): -3.9819465090962307,
-               ('S', 'r'): -2.419898667114179,
-               ('S', 'tg'): -7.650444220890827,
-               ('S', 'u'): -6.380289509683589,
-               ('S', 'ud'): -8.082577576081151,
-               ('S', 'ug'): -7.8868329989550565,
-               ('S', 'uj'): -3.7898991991110753,
-               ('S', 'ul'): -5.031640748180066,
-               ('S', 'uv'): -8.920906766485595,
-               ('S', 'uz'): -9.054438159110118,
-               ('S', 'v'): -2.2393465649914,
-               ('S', 'vg'): -6.095073529727002,
-               ('S', 'vn'): -10.084057576291276,
-               ('S', 'x'): -8.558001272796227,
-               ('S', 'y'): -4.911303432718586},
- ('S', 'v'): {('B', 'a'): -4.244285160192155,
-              ('B', 'ad'): -5.95251064842533,
-              ('B', 'an'): -7.751567260771836,
-              ('B', 'b'): -5.474726402012031,
-              ('B', 'c'): -5.0807413505320165,
-              ('B', 'd'): -4.097275563085078,
-              ('B', 'df'): -8.676206282037462,
-              ('B', 'e'): -10.238852032964804,
-              ('B', 'f'): -5.583328279708699,
-              ('B', 'h'): -14.487347275014162,
-              ('B', 'i'): -5.436588972862445,
-              ('B', 'in'): -13.571056543140008,
-              ('B', 'j'): -5.973359214546873,
-              ('B', 'jn'): -15.180494455574108,
-              ('B', 'l'): -5.663920165751617,
-              ('B', 'ln'): -14.487347275014162,
-              ('B', 'm'): -3.2656969966726006,
-              ('B', 'mq'): -7.588632740684174,
-              ('B', 'n'): -2.0667602022011873,
-              ('B', 'nr'): -3.6437938719531098,
-              ('B', 'nrfg'): -7.595213376934982,
-              ('B', 'nrt'): -6.107464034562532,
-              ('B', 'ns'): -3.8325379778670166,
-              ('B', 'nt'): -6.44095803301443,
-              ('B', 'nz'): -5.694266291028855,
-              ('B', 'o'): -9.086924685528972,
-              ('B', 'p'): -5.687911779896509,
-              ('B', 'q'): -7.210445150597972,
-              ('B', 'r'): -3.5243348225179716,
-              ('B', 'rr'): -12.236055476407667,
-              ('B', 'rz'): -9.302758673794468,
-              ('B', 's'): -5.433602235261054,
-              ('B', 't'): -4.582985105067373,
-              ('B', 'u'): -7.608506006196667,
-              ('B', 'v'): -2.3674672508364196,
-              ('B', 'vd'): -7.768938167762944,
-              ('B', 'vn'): -4.746584555525431,
-              ('B', 'vq'): -11.44282483729074,
-              ('B', 'y'): -9.191533038684245,
-              ('B', 'z'): -6.826290892652333,
-              ('S', 'a'): -3.744082931704126,
-              ('S', 'ad'): -9.348611978290592,
-              ('S', 'ag'): -6.84818610335499,
-              ('S', 'an'): -10.056530476170849,
-              ('S', 'b'): -6.137626437541674,
-              ('S', 'bg'): -12.541437125958849,
-              ('S', 'c'): -5.002486060864022,
-              ('S', 'd'): -3.4127949979671715,
-              ('S', 'dg'): -8.04719850067804,
-              ('S', 'e'): -8.361570390298587,
-              ('S', 'f'): -4.212141005669752,
-              ('S', 'g'): -5.68437381843574,
-              ('S', 'h'): -8.946083729855737,
-              ('S', 'j'): -5.004235443321953,
-              ('S', 'k'): -7.090092158980787,
-              ('S', 'm'): -3.976883363182774,
-              ('S', 'mg'): -10.507665621112201,
-              ('S', 'n'): -2.9524548599183777,
-              ('S', 'ng'): -3.962718877903181,
-              ('S', 'nr'): -4.91573752967251,
-              ('S', 'nt'): -12.983269878237888,
-              ('S', 'o'): -8.69738710411691,
-              ('S', 'p'): -3.0310874041630016,
-              ('S', 'q'): -3.70677770382916,
-              ('S', 'r'): -3.0141454496435216,
-              ('S', 'rg'): -10.890035014425717,
-              ('S', 't'): -12.290122697677942,
-              ('S', 'tg'): -6.843385326011633,
-              ('S', 'u'): -5.451598413770024,
-              ('S', 'ud'): -4.700562092264176,
-              ('S', 'ug'): -5.261478101420352,
-              ('S', 'uj'): -3.836958527586723,
-              ('S', 'ul'): -3.027854232841401,
-              ('S', 'uv'): -6.53702109824754,
-              ('S', 'uz'): -3.9542116034809975,
-              ('S', 'v'): -2.0158132429772246,
-              ('S', 'vg'): -5.014450349366935,
-              ('S', 'vn'): -9.277861122172741,
-              ('S', 'x'): -7.030315185891782,
-              ('S', 'y'): -5.5300299330049185,
-              ('S', 'yg'): -14.487347275014162,
-              ('S', 'zg'): -13.571056543140008},
- ('S', 'vd'): {},
- ('S', 'vg'): {('B', 'a'): -4.766108483951023,
-               ('B', 'ad'): -7.053015764225838,
-               ('B', 'an'): -8.867248089305953,
-               ('B', 'b'): -5.93001202243357,
-               ('B', 'c'): -5.184066656306654,
-               ('B', 'd'): -4.382705891106475,
-               ('B', 'df'): -10.348852630230168,
-               ('B', 'e'): -10.859678253996158,
-               ('B', 'f'): -5.915657708981887,
-               ('B', 'i'): -5.979404777763146,
-               ('B', 'j'): -6.094659367066171,
-               ('B', 'l'): -6.295330062528322,
-               ('B', 'm'): -4.002514761130081,
-               ('B', 'mq'): -8.66245367665994,
-               ('B', 'n'): -2.1407967032951163,
-               ('B', 'nr'): -3.1965837741976286,
-               ('B', 'nrfg'): -7.016648120054964,
-               ('B', 'nrt'): -5.753732780095578,
-               ('B', 'ns'): -4.291600342584183,
-               ('B', 'nt'): -7.576263907990387,
-               ('B', 'nz'): -5.71996591762476,
-               ('B', 'o'): -8.82279632673512,
-               ('B', 'p'): -7.179167049552738,
-               ('B', 'q'): -8.10814294095421,
-               ('B', 'r'): -4.7133489963272615,
-               ('B', 'rz'): -11.265143362104324,
-               ('B', 's'): -5.679769118498424,
-               ('B', 't'): -4.6707299023545445,
-               ('B', 'u'): -7.831156157619176,
-               ('B', 'v'): -2.9461572367122635,
-               ('B', 'vd'): -9.878849000984433,
-               ('B', 'vi'): -11.958290542664269,
-               ('B', 'vn'): -5.384610375703622,
-               ('B', 'vq'): -11.958290542664269,
-               ('B', 'y'): -9.39334118520273,
-               ('B', 'z'): -6.981556800243694,
-               ('S', 'a'): -3.605971994438265,
-               ('S', 'ad'): -9.878849000984433,
-               ('S', 'ag'): -5.136093152043777,
-               ('S', 'an'): -9.31923321304901,
-               ('S', 'b'): -6.15315557374778,
-               ('S', 'bg'): -11.265143362104324,
-               ('S', 'c'): -4.209830518764571,
-               ('S', 'd'): -3.254451822974022,
-               ('S', 'dg'): -7.333317729379997,
-               ('S', 'e'): -8.24471847595996,
-               ('S', 'f'): -4.158127472271308,
-               ('S', 'g'): -3.987895635472839,
-               ('S', 'h'): -7.738782837488161,
-               ('S', 'j'): -4.21893133997517,
-               ('S', 'k'): -5.727809095085786,
-               ('S', 'm'): -4.130650996297846,
-               ('S', 'mg'): -8.66245367665994,
-               ('S', 'n'): -2.3555703021285765,
-               ('S', 'ng'): -2.603070909370001,
-               ('S', 'nr'): -4.2516776287000715,
-               ('S', 'nt'): -11.265143362104324,
-               ('S', 'o'): -7.373323063993696,
-               ('S', 'p'): -3.3807551222418692,
-               ('S', 'q'): -3.4829615553467295,
-               ('S', 'r'): -3.32100587099021,
-               ('S', 'rg'): -8.82279632673512,
-               ('S', 't'): -11.958290542664269,
-               ('S', 'tg'): -5.376265403771442,
-               ('S', 'u'): -4.315286907103551,
-               ('S', 'ud'): -5.8141049085386225,
-               ('S', 'ug'): -6.345162436276198,
-               ('S', 'uj'): -4.179660395338459,
-               ('S', 'ul'): -4.09080197396514,
-               ('S', 'uv'): -5.889864954420158,
-               ('S', 'uz'): -5.0923994677808295,
-               ('S', 'v'): -1.943485253996187,
-               ('S', 'vg'): -3.85237934467776,
-               ('S', 'vn'): -8.197090426970705,
-               ('S', 'x'): -5.10288174405434,
-               ('S', 'y'): -5.979404777763146,
-               ('S', 'yg'): -10.859678253996158,
-               ('S', 'zg'): -10.571996181544378},
- ('S', 'vi'): {},
- ('S', 'vn'): {('B', 'a'): -5.462418377228463,
-               ('B', 'ad'): -7.659642954564682,
-               ('B', 'b'): -6.561030665896573,
-               ('B', 'c'): -4.826429610508466,
-               ('B', 'd'): -4.076124016108572,
-               ('B', 'f'): -5.580201412884847,
-               ('B', 'i'): -5.713732805509369,
-               ('B', 'j'): -7.659642954564682,
-               ('B', 'm'): -5.020585624949423,
-               ('B', 'n'): -1.7434408919572473,
-               ('B', 'nr'): -3.970763500450746,
-               ('B', 'nrfg'): -6.050205042130582,
-               ('B', 'nrt'): -4.8870542323249015,
-               ('B', 'ns'): -5.867883485336628,
-               ('B', 'nz'): -6.2733485934447915,
-               ('B', 'p'): -6.2733485934447915,
-               ('B', 'r'): -4.481589124216737,
-               ('B', 's'): -5.261747681766312,
-               ('B', 't'): -5.174736304776682,
-               ('B', 'v'): -3.024913966335047,
-               ('B', 'vn'): -5.580201412884847,
-               ('B', 'z'): -6.966495774004737,
-               ('S', 'a'): -3.382976835548627,
-               ('S', 'ad'): -6.966495774004737,
-               ('S', 'ag'): -5.357057861570636,
-               ('S', 'b'): -5.580201412884847,
-               ('S', 'c'): -2.8889583300990176,
-               ('S', 'd'): -2.8974690197669264,
-               ('S', 'dg'): -7.659642954564682,
-               ('S', 'f'): -3.4401352493885757,
-               ('S', 'g'): -4.826429610508466,
-               ('S', 'j'): -4.826429610508466,
-               ('S', 'k'): -6.561030665896573,
-               ('S', 'm'): -4.524148738635533,
-               ('S', 'n'): -1.7488463105241552,
-               ('S', 'ng'): -3.3691835134162913,
-               ('S', 'nr'): -4.826429610508466,
-               ('S', 'p'): -3.670658908000408,
-               ('S', 'q'): -4.258445572902527,
-               ('S', 'r'): -3.6893510410125607,
-               ('S', 'tg'): -6.561030665896573,
-               ('S', 'u'): -4.327438444389479,
-               ('S', 'ud'): -6.966495774004737,
-               ('S', 'ug'): -6.966495774004737,
-               ('S', 'uj'): -3.6523097693322115,
-               ('S', 'ul'): -6.561030665896573,
-               ('S', 'uv'): -7.659642954564682,
-               ('S', 'uz'): -7.659642954564682,
-               ('S', 'v'): -2.221563645641487,
-               ('S', 'vg'): -4.440767129696482,
-               ('S', 'vn'): -5.580201412884847,
-               ('S', 'x'): -6.2733485934447915,
-               ('S', 'y'): -6.050205042130582},
- ('S', 'vq'): {},
- ('S', 'w'): {},
- ('S', 'x'): {('B', 'a'): -5.527565702477573,
-              ('B', 'ad'): -7.724790279813792,
-              ('B', 'an'): -9.228867676590067,
-              ('B', 'b'): -6.626177991145682,
-              ('B', 'c'): -5.914681671917541,
-              ('B', 'd'): -4.872158849900475,
-              ('B', 'f'): -6.2331354030360755,
-              ('B', 'i'): -6.703139032281811,
-              ('B', 'j'): -9.922014857150012,
-              ('B', 'l'): -7.282957527534753,
-              ('B', 'm'): -5.1345231143679655,
-              ('B', 'mq'): -8.823402568481901,
-              ('B', 'n'): -3.2151525205472646,
-              ('B', 'nr'): -3.5976558947687005,
-              ('B', 'nrfg'): -8.535720496030121,
-              ('B', 'nrt'): -5.6879083525527525,
-              ('B', 'ns'): -5.970771138568584,
-              ('B', 'nt'): -9.228867676590067,
-              ('B', 'nz'): -7.088801513093796,
-              ('B', 'o'): -8.535720496030121,
-              ('B', 'p'): -7.524119584351641,
-              ('B', 'q'): -7.842573315470176,
-              ('B', 'r'): -5.515295609885759,
-              ('B', 's'): -6.071867255439953,
-              ('B', 't'): -6.366666795660598,
-              ('B', 'u'): -7.357065499688475,
-              ('B', 'v'): -3.562440988477634,
-              ('B', 'vn'): -6.284428697423626,
-              ('B', 'z'): -7.149426134910231,
-              ('S', 'a'): -3.4087847462377048,
-              ('S', 'ad'): -7.282957527534753,
-              ('S', 'ag'): -4.122922202689486,
-              ('S', 'an'): -9.922014857150012,
-              ('S', 'b'): -5.59128151686368,
-              ('S', 'bg'): -7.842573315470176,
-              ('S', 'c'): -4.85311065492978,
-              ('S', 'd'): -3.5940780734208166,
-              ('S', 'dg'): -6.743961026802066,
-              ('S', 'e'): -6.877492419426589,
-              ('S', 'f'): -4.757228883226498,
-              ('S', 'g'): -2.2751834657195293,
-              ('S', 'h'): -8.823402568481901,
-              ('S', 'j'): -3.8628916615682147,
-              ('S', 'k'): -6.115352367379692,
-              ('S', 'm'): -4.701659032071687,
-              ('S', 'mg'): -6.786520641220862,
-              ('S', 'n'): -2.424807633946694,
-              ('S', 'ng'): -2.4795221343555713,
-              ('S', 'nr'): -3.1874231971770635,
-              ('S', 'o'): -5.659334980108696,
-              ('S', 'p'): -3.7907883676668708,
-              ('S', 'q'): -3.410269527505284,
-              ('S', 'r'): -4.24526105488173,
-              ('S', 'rg'): -6.66391831912853,
-              ('S', 'tg'): -5.63155541600162,
-              ('S', 'u'): -5.039212934563641,
-              ('S', 'ud'): -7.282957527534753,
-              ('S', 'ug'): -8.31257694471591,
-              ('S', 'uj'): -4.096014749769561,
-              ('S', 'ul'): -6.115352367379692,
-              ('S', 'uv'): -5.914681671917541,
-              ('S', 'uz'): -6.366666795660598,
-              ('S', 'v'): -1.7075496963908263,
-              ('S', 'vg'): -3.0112640691880763,
-              ('S', 'vn'): -9.228867676590067,
-              ('S', 'x'): -2.756521382089166,
-              ('S', 'y'): -5.31684467116192,
-              ('S', 'yg'): -9.922014857150012,
-              ('S', 'zg'): -8.535720496030121},
- ('S', 'y'): {('B', 'a'): -5.035070048455653,
-              ('B', 'ad'): -6.579044920106327,
-              ('B', 'an'): -8.62921607948605,
-              ('B', 'b'): -6.259691503816894,
-              ('B', 'c'): -3.38584238655653,
-              ('B', 'd'): -3.2457801518356866,
-              ('B', 'df'): -7.6388173754581725,
-              ('B', 'e'): -7.9752896120793855,
-              ('B', 'f'): -5.680736690782604,
-              ('B', 'i'): -5.921165878383839,
-              ('B', 'j'): -6.311363514361215,
-              ('B', 'l'): -4.993656262904896,
-              ('B', 'm'): -4.133689070947785,
-              ('B', 'mq'): -6.787446189683333,
-              ('B', 'n'): -2.2688440200037006,
-              ('B', 'nr'): -2.6912740302422082,
-              ('B', 'nrfg'): -6.588995250959495,
-              ('B', 'nrt'): -5.84230730347152,
-              ('B', 'ns'): -4.505810723000824,
-              ('B', 'nt'): -5.796002735429833,
-              ('B', 'nz'): -4.648815776613167,
-              ('B', 'o'): -7.019778167051949,
-              ('B', 'p'): -5.538173626127733,
-              ('B', 'q'): -8.796270164149215,
-              ('B', 'r'): -2.852755225485721,
-              ('B', 'rz'): -7.9752896120793855,
-              ('B', 's'): -5.809670374158497,
-              ('B', 't'): -3.706991742733847,
-              ('B', 'u'): -7.409975803029325,
-              ('B', 'v'): -2.872987129457306,
-              ('B', 'vd'): -9.807871075827695,
-              ('B', 'vn'): -5.696997211654384,
-              ('B', 'vq'): -11.194165436947586,
-              ('B', 'y'): -8.996940859611367,
-              ('B', 'z'): -6.824717584480565,
-              ('S', 'a'): -3.677188212343265,
-              ('S', 'ad'): -10.50101825638764,
-              ('S', 'ag'): -6.799716282275147,
-              ('S', 'b'): -6.349978350488994,
-              ('S', 'c'): -4.3493499577393235,
-              ('S', 'd'): -2.8773763098760687,
-              ('S', 'dg'): -8.555108107332327,
-              ('S', 'e'): -5.709368503456931,
-              ('S', 'f'): -5.467317689360389,
-              ('S', 'g'): -5.460824160049841,
-              ('S', 'h'): -8.36095209289137,
-              ('S', 'j'): -5.098340874515361,
-              ('S', 'k'): -9.402405967719531,
-              ('S', 'm'): -4.381820342770107,
-              ('S', 'mg'): -10.50101825638764,
-              ('S', 'n'): -3.870334870745269,
-              ('S', 'ng'): -4.709530201312334,
-              ('S', 'nr'): -4.206675189946595,
-              ('S', 'nt'): -9.584727524513486,
-              ('S', 'o'): -6.863432096661255,
-              ('S', 'p'): -3.750501753831995,
-              ('S', 'q'): -5.0182981668418245,
-              ('S', 'r'): -1.6485678519067353,
-              ('S', 'tg'): -6.118991621713759,
-              ('S', 'u'): -4.67501814900719,
-              ('S', 'ud'): -6.9746577317714795,
-              ('S', 'ug'): -7.2429217183661585,
-              ('S', 'uj'): -4.942261553781697,
-              ('S', 'ul'): -6.088219963047005,
-              ('S', 'uv'): -5.818887029263421,
-              ('S', 'uz'): -7.9752896120793855,
-              ('S', 'v'): -2.367430838726674,
-              ('S', 'vg'): -5.507190080607766,
-              ('S', 'vn'): -11.194165436947586,
-              ('S', 'x'): -6.559436448717951,
-              ('S', 'y'): -4.479994907038114},
- ('S', 'yg'): {('B', 'n'): -3.0204248861443626,
-               ('B', 'nrt'): -2.327277705584417,
-               ('B', 'nz'): -3.713572066704308,
-               ('B', 'v'): -3.713572066704308,
-               ('B', 'vn'): -3.713572066704308,
-               ('S', 'a'): -2.327277705584417,
-               ('S', 'd'): -3.713572066704308,
-               ('S', 'g'): -3.713572066704308,
-               ('S', 'j'): -2.1041341542702074,
-               ('S', 'm'): -3.0204248861443626,
-               ('S', 'n'): -3.0204248861443626,
-               ('S', 'ng'): -3.0204248861443626,
-               ('S', 'nr'): -3.713572066704308,
-               ('S', 'p'): -3.0204248861443626,
-               ('S', 'q'): -2.1041341542702074,
-               ('S', 'r'): -3.713572066704308,
-               ('S', 'tg'): -3.713572066704308,
-               ('S', 'v'): -2.1041341542702074},
- ('S', 'z'): {},
- ('S', 'zg'): {('B', 'v'): -3.713572066704308,
-               ('S', 'a'): -3.713572066704308,
-               ('S', 'ag'): -3.0204248861443626,
-               ('S', 'd'): -3.713572066704308,
-               ('S', 'f'): -3.713572066704308,
-               ('S', 'g'): -2.1041341542702074,
-               ('S', 'j'): -3.713572066704308,
-               ('S', 'n'): -2.6149597780361984,
-               ('S', 'ng'): -2.6149597780361984,
-               ('S', 'nr'): -2.6149597780361984,
-               ('S', 'o'): -3.0204248861443626,
-               ('S', 'q'): -3.0204248861443626,
-               ('S', 'tg'): -3.0204248861443626,
-               ('S', 'v'): -1.6341305250244718,
-               ('S', 'vg'): -2.327277705584417,
-               ('S', 'x'): -3.713572066704308,
-               ('S', 'y'): -3.713572066704308}}
@@ -1,4 +1,5 @@
 import operator
+import heapq
 MIN_FLOAT=-3.14e100
 
 def get_top_states(t_state_v,K=4):
@@ -40,4 +41,101 @@ def viterbi(obs, states, start_p, trans_p, emit_p):
         route[i] = state
         state = mem_path[i][state]
         i-=1
-    return (prob, route)
\ No newline at end of file
+    return (prob, route)
+
+class BeamDecoder(object):
+    '''
+    A Viterbi over integer states that keeps only the K best states at each
+    character. The successors of every state are precomputed, so a step
+    costs at most K times the states the character allows.
+    '''
+
+    def __init__(self, states, start_p, trans_p, emit_p):
+        self.names = sorted(trans_p)
+        index = dict((y, i) for i, y in enumerate(self.names))
+        self.all_states = range(len(self.names))
+        self.start = [start_p.get(y, MIN_FLOAT) for y in self.names]
+        # trans[i]: {successor j: log prob}
+        self.trans = [dict((index[y], p) for y, p in trans_p[y0].iteritems() if y in index) for y0 in self.names]
+        self.emit = [emit_p.get(y, {}) for y in self.names]
+        self._char_states = states
+        self._index = index
+        self._states = {}
+
+    def states(self, char):
+        # the states char may be in, as ints; cached
+        L = self._states.get(char)
+        if L is None:
+            names = self._char_states.get(char)
+            L = self.all_states if names is None else [self._index[y] for y in names if y in self._index]
+            self._states[char] = L
+        return L
+
+    def decode(self, obs, K=8):
+        '''
+        Return (prob, route) like viterbi(), route being the (BMES, tag)
+        state of each character.
+        '''
+        trans, emit = self.trans, self.emit
+        c = obs[0]
+        V = [(self.start[y] + emit[y].get(c, MIN_FLOAT), y) for y in self.states(c)]
+        back = []
+        for t in xrange(1, len(obs)):
+            if len(V) > K:
+                V = heapq.nlargest(K, V)
+            c = obs[t]
+            best = {}
+            for y in self.states(c):
+                em_p = emit[y].get(c, MIN_FLOAT)
+                for prob, y0 in V:
+                    tp = trans[y0].get(y)
+                    if tp is not None:
+                        prob += tp + em_p
+                        if y not in best or prob > best[y][0]:
+                            best[y] = (prob, y0)
+            if not best:
+                # no state of c can follow the beam; like viterbi(), allow
+                # any state at the MIN_FLOAT transition cost
+                prob, y0 = max(V)
+                for y in self.all_states:
+                    best[y] = (prob + MIN_FLOAT + emit[y].get(c, MIN_FLOAT), y0)
+            back.append(dict((y, y0) for y, (prob, y0) in best.iteritems()))
+            V = [(prob, y) for y, (prob, y0) in best.iteritems()]
+        prob, state = max(V)
+        route = [None] * len(obs)
+        for t in xrange(len(obs) - 1, 0, -1):
+            route[t] = self.names[state]
+            state = back[t - 1][state]
+        route[0] = self.names[state]
+        return (prob, route)
+
+def report(sentences, decoder, states, start_p, trans_p, emit_p, widths=(1, 2, 4, 8, 16, 32)):
+    '''
+    Compare BeamDecoder at each beam width with the unpruned viterbi() on
+    sentences: print the time taken and the share of characters given the
+    same state, and of sentences decoded the same.
+    '''
+    import time
+    t = time.time()
+    expected = [viterbi(s, states, start_p, trans_p, emit_p)[1] for s in sentences]
+    n_chars = sum(len(s) for s in sentences)
+    print 'unpruned  %.2fs' % (time.time() - t)
+    for K in widths:
+        t = time.time()
+        routes = [decoder.decode(s, K)[1] for s in sentences]
+        dt = time.time() - t
+        same_chars = sum(1 for r, e in zip(routes, expected) for a, b in zip(r, e) if a == b)
+        same = sum(1 for r, e in zip(routes, expected) if r == e)
+        print 'K=%-4d    %.2fs  chars %.2f%%  sentences %.2f%%' % (K, dt, 100.0 * same_chars / n_chars, 100.0 * same / len(sentences))
+
+if __name__=='__main__':
+    # python viterbi.py corpus.txt: accuracy of the beam widths against the
+    # unpruned decoder, on the Chinese blocks of corpus.txt
+    import sys, re, os
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    import hmmfile
+    text = open(sys.argv[1], 'rb').read().decode('utf-8')
+    sentences = re.findall(ur"[\u4E00-\u9FA5]+", text)
+    hmm = hmmfile.HMMFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hmm.bin'))
+    args = (hmm.char_state_tab, hmm.start_p, hmm.trans_p, hmm.emit_p)
+    report(sentences, BeamDecoder(*args), *args)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+The emotion classifier in one binary file.
+
+classifierdata.dat and word_features.dat are protocol 0 pickles of an nltk
+NaiveBayesClassifier and of its word features: loading them imports nltk
+and builds thousands of ELEProbDist and FreqDist objects, only for
+emotion.CompiledClassifier.compile() to reduce them to a base score and a
+delta per word and label. A model file holds those tables, and loads
+through mmap without nltk.
+
+Layout, little endian:
+
+    header   MAGIC, n_labels, n_words, labels_size, words_size, version,
+             checksum
+    base     float64 * n_labels             the base score of each label
+    delta    float64 * (n_labels*n_words)   the deltas of each label, in
+                                            word order
+    offsets  int32 * (n_words+1)            utf-8 offsets of the words
+    labels   the labels, '\\n' separated
+    words    the utf-8 encoded words, in feature column order
+
+version is CompiledClassifier.version() of the model, and checksum the md5
+of everything after the header, checked when the file is loaded.
+
+Convert the pickles with:
+
+    python modelfile.py classifierdata.dat word_features.dat model.bin
+'''
+
+import sys, mmap, struct, hashlib
+from array import array
+
+from jieba.atomicfile import write_file
+from emotion import CompiledClassifier
+from features import FeatureIndex
+
+MAGIC = 'EMOMDL01'
+_HEADER = struct.Struct('<8siiii12s16s')
+
+def compile_model(classifier):
+    '''
+    Return an emotion.CompiledClassifier as the str of a model file.
+    '''
+    labels = '\n'.join(classifier.labels())
+    words = [w.encode('utf-8') for w in classifier.word_features().words()]
+    offsets = [0]
+    for w in words:
+        offsets.append(offsets[-1] + len(w))
+    base, delta = classifier._base, classifier._delta
+    body = ''.join([struct.pack('<%dd' % len(base), *base)] +
+                   [struct.pack('<%dd' % len(d), *d) for d in delta] +
+                   [struct.pack('<%di' % len(offsets), *offsets), labels, ''.join(words)])
+    return _HEADER.pack(MAGIC, len(base), len(words), len(labels), offsets[-1],
+                        classifier.version(), hashlib.md5(body).digest()) + body
+
+def write_model(classifier, f_name):
+    '''
+    Write an emotion.CompiledClassifier to the model file f_name. The file
+    is written to a temporary name and renamed, so processes never see a
+    partial file.
+    '''
+    write_file(compile_model(classifier), f_name)
+
+def _array(typecode, data):
+    a = array(typecode)
+    a.fromstring(data)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a
+
+def load_model(f_name=None, data=None):
+    '''
+    Return the emotion.CompiledClassifier of the model file f_name, or of
+    the str data of one.
+
+    >>> c = CompiledClassifier(['0', '1'], [u'a', u'\u4e2d'], [-1.0, -2.0], [[0.0, 0.5], [3.0, 0.0]])
+    >>> c2 = load_model(data=compile_model(c))
+    >>> c2.labels(), c2.word_features().words(), c2.version() == c.version()
+    (['0', '1'], [u'a', u'\u4e2d'], True)
+    >>> c2.logprobs(set([0, 1])) == c.logprobs(set([0, 1]))
+    True
+    '''
+    if f_name is None:
+        mm = data
+    else:
+        with open(f_name, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n_labels, n_words, labels_size, words_size, version, checksum = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError('not an emotion model file: %s' % f_name)
+    delta = _HEADER.size + 8 * n_labels
+    offsets = delta + 8 * n_labels * n_words
+    labels = offsets + 4 * (n_words + 1)
+    words = labels + labels_size
+    if words + words_size != len(mm) or hashlib.md5(mm[_HEADER.size:]).digest() != checksum:
+        raise ValueError('broken emotion model file: %s' % f_name)
+    base = _array('d', mm[_HEADER.size:delta])
+    rows = [_array('d', mm[delta + 8 * n_words * k:delta + 8 * n_words * (k + 1)]) for k in xrange(n_labels)]
+    blob = mm[words:]
+    o = _array('i', mm[offsets:labels])
+    classifier = CompiledClassifier(mm[labels:words].split('\n'),
+                                    FeatureIndex([blob[o[i]:o[i + 1]].decode('utf-8') for i in xrange(n_words)]),
+                                    base, rows)
+    classifier._version = version
+    return classifier
+
+if __name__=='__main__':
+    if len(sys.argv) == 4:
+        # python modelfile.py classifierdata.dat word_features.dat model.bin
+        import pickle
+        word_features = FeatureIndex.load(sys.argv[2])
+        with open(sys.argv[1], 'r') as f:
+            classifier = CompiledClassifier.compile(pickle.load(f), word_features)
+        write_model(classifier, sys.argv[3])
+    else:
+        import doctest
+        doctest.testmod()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Hot reload of the emotion model in running workers.
+
+ModelRegistry holds the model loaded from a model file (see modelfile.py)
+and a watcher thread that checks the mtime of the file every few seconds.
+A changed file is loaded by the watcher, away from the requests, and the
+model replaced by rebinding a single reference: a request takes
+registry.current() once and finishes on that model, even if a new one is
+swapped in meanwhile.
+
+Each LoadedModel has its own ResultCache, keyed by the version of the
+model, so the results cached for the old model are never seen by the new
+one. They are deleted when the model is replaced, or when a worker starts
+with another model than the one last loaded with the same cache.
+
+Usage in urls.py:
+
+    models = ModelRegistry('model.bin', cache_client)
+    models.start()
+    ...
+    model = models.current()
+    pipeline.analyse(statuses, model.classifier, cache=model.result_cache)
+'''
+
+import os, time, atexit, logging, threading
+
+import modelfile
+from resultcache import ResultCache
+
+# the cache key of the version of the model last loaded
+_VERSION_KEY = 'model:version'
+
+def _rss():
+    # the resident memory of this process in bytes, or None where it is
+    # not known
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class LoadedModel(object):
+    '''
+    A classifier, its result cache, and how it was loaded.
+    '''
+
+    def __init__(self, classifier, result_cache, mtime, load_seconds, rss_delta):
+        self.classifier = classifier
+        self.result_cache = result_cache
+        self.version = classifier.version()
+        self.mtime = mtime
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.rss_delta = rss_delta
+
+    def stats(self):
+        return dict(version=self.version, mtime=self.mtime, loaded_at=self.loaded_at,
+                    load_seconds=self.load_seconds, rss_delta=self.rss_delta,
+                    result_cache=self.result_cache.stats())
+
+class ModelRegistry(object):
+    '''
+    The current model of a model file, reloaded when the file changes.
+
+    >>> import tempfile, shutil
+    >>> from emotion import CompiledClassifier
+    >>> from transwarp.cache import DiskClient
+    >>> d = tempfile.mkdtemp()
+    >>> path = os.path.join(d, 'model.bin')
+    >>> modelfile.write_model(CompiledClassifier(['0', '1'], [u'a'], [-1.0, -2.0], [[0.0], [3.0]]), path)
+    >>> r = ModelRegistry(path, DiskClient(':memory:'))
+    >>> old = r.current()
+    >>> old.classifier.classify_words([u'a']), r.check()
+    ('1', False)
+    >>> modelfile.write_model(CompiledClassifier(['0', '1'], [u'a'], [-1.0, -2.0], [[0.0], [0.5]]), path)
+    >>> os.utime(path, (old.mtime + 1, old.mtime + 1))
+    >>> r.check(), r.current().classifier.classify_words([u'a']), old.classifier.classify_words([u'a'])
+    (True, '0', '1')
+    >>> r.current().result_cache is old.result_cache, r.stats()['reloads']
+    (False, 1)
+
+    The results of the old model are deleted, here from the disk cache:
+
+    >>> st, cur = dict(id=1), r.current()
+    >>> cur.result_cache.set(st, 0, {}); cur.result_cache.get(st)
+    (0, {})
+    >>> modelfile.write_model(CompiledClassifier(['0', '1'], [u'a'], [-1.0, -2.0], [[0.0], [3.0]]), path)
+    >>> os.utime(path, (old.mtime + 2, old.mtime + 2))
+    >>> r.check(), cur.result_cache.get(st)
+    (True, None)
+    >>> shutil.rmtree(d)
+    '''
+
+    def __init__(self, path, cache_client, interval=5.0, expires=0):
+        '''
+        Load the model file path.
+
+        Args:
+            path: the model file.
+            cache_client: cache client of the ResultCache of each model.
+            interval: seconds between two checks of the file by the watcher.
+            expires: cache time of the results in seconds, default to 0
+                (never expires).
+        '''
+        self.path = path
+        self.interval = interval
+        self._client = cache_client
+        self._expires = expires
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = threading.Event()
+        self._reloads = 0
+        self._errors = 0
+        self._last_error = None
+        self._model = self._load()
+        # a worker started with a new model file: the results of the model
+        # last loaded with this cache are no longer used
+        last = cache_client.get(_VERSION_KEY)
+        if last != self._model.version:
+            if last is not None:
+                ResultCache(cache_client, last).clear()
+            cache_client.set(_VERSION_KEY, self._model.version)
+
+    def _load(self):
+        mtime = os.path.getmtime(self.path)
+        rss = _rss()
+        t = time.time()
+        classifier = modelfile.load_model(self.path)
+        load_seconds = time.time() - t
+        rss_delta = None if rss is None else _rss() - rss
+        return LoadedModel(classifier, ResultCache(self._client, classifier.version(), self._expires),
+                           mtime, load_seconds, rss_delta)
+
+    def current(self):
+        '''
+        Return the current LoadedModel.
+        '''
+        return self._model
+
+    def check(self):
+        '''
+        Load the model file if it changed since it was loaded, and swap the
+        new model in if its version differs. Return True if the model was
+        swapped. A file that fails to load leaves the current model.
+        '''
+        with self._lock:
+            old = self._model
+            try:
+                if os.path.getmtime(self.path) == old.mtime:
+                    return False
+                model = self._load()
+            except Exception, e:
+                self._errors += 1
+                self._last_error = '%s: %s' % (e.__class__.__name__, e)
+                logging.warning('model reload failed: %s' % self._last_error)
+                return False
+            if model.version == old.version:
+                # the same model written again:
+                old.mtime = model.mtime
+                return False
+            self._model = model
+            self._reloads += 1
+        logging.info('model %s replaced by %s, loaded in %.3fs' % (old.version, model.version, model.load_seconds))
+        # the requests still on the old model may add a few results after
+        # this; the next worker to swap deletes them
+        self._client.set(_VERSION_KEY, model.version)
+        old.result_cache.clear()
+        return True
+
+    def start(self):
+        '''
+        Start the watcher thread, which calls check() every interval
+        seconds, unless it is running.
+        '''
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._watch, name='model-watcher')
+            self._thread.daemon = True
+            self._thread.start()
+        # before the modules are torn down at exit:
+        atexit.register(self.stop)
+
+    def stop(self):
+        '''
+        Stop the watcher thread.
+        '''
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopped.set()
+            thread.join()
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def stats(self):
+        '''
+        Return the stats of the current model, with the numbers of reloads
+        and of failed loads, and the last error.
+        '''
+        d = self._model.stats()
+        d.update(reloads=self._reloads, errors=self._errors, last_error=self._last_error)
+        return d
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
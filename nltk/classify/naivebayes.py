@@ -32,6 +32,11 @@ sum to one:
 
 from collections import defaultdict
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from nltk.probability import FreqDist, DictionaryProbDist, ELEProbDist, sum_logs
 
 from api import ClassifierI
@@ -120,6 +125,82 @@ class NaiveBayesClassifier(ClassifierI):
 
         return DictionaryProbDist(logprob, normalize=True, log=True)
 
+    def classify_many(self, featuresets):
+        return [pdist.max() for pdist in self.prob_classify_many(featuresets)]
+
+    def prob_classify_many(self, featuresets):
+        """
+        Return the probability distributions for a list of featuresets,
+        as ``prob_classify()`` would, but score the whole batch at once.
+
+        Every distinct ``(fname, fval)`` pair in the batch becomes one
+        column of a sparse document-by-feature matrix, and its
+        log-probability under each label is looked up only once.  If
+        numpy is available, the label scores of all featuresets are then
+        computed with one sparse matrix product.
+        """
+        labels = self._labels
+        columns = {}
+        weights = []
+        rows = []
+        cols = []
+        n = 0
+        for featureset in featuresets:
+            for feature in featureset.items():
+                col = columns.get(feature)
+                if col is None:
+                    col = columns[feature] = len(weights)
+                    weights.append(self._feature_logprobs(*feature))
+                if weights[col] is not None:
+                    rows.append(n)
+                    cols.append(col)
+            n += 1
+
+        # Weights for features that were never seen are never indexed.
+        weights = [w or [0.0] * len(labels) for w in weights]
+        label_logprobs = [self._label_probdist.logprob(label)
+                          for label in labels]
+        if numpy is not None and n > 0:
+            rows = numpy.array(rows, dtype=int)
+            matrix = numpy.array(weights, dtype=float).reshape(-1, len(labels))
+            scores = numpy.empty((n, len(labels)))
+            for k, label_logprob in enumerate(label_logprobs):
+                scores[:, k] = numpy.bincount(
+                    rows, weights=matrix[cols, k], minlength=n)
+                scores[:, k] += label_logprob
+            scores = scores.tolist()
+        else:
+            scores = [list(label_logprobs) for i in range(n)]
+            for row, col in zip(rows, cols):
+                score, weight = scores[row], weights[col]
+                for k in range(len(labels)):
+                    score[k] += weight[k]
+
+        return [DictionaryProbDist(dict(zip(labels, score)),
+                                   normalize=True, log=True)
+                for score in scores]
+
+    batch_classify = classify_many
+    batch_prob_classify = prob_classify_many
+
+    def _feature_logprobs(self, fname, fval):
+        """
+        Return the list of log probabilities of ``fname=fval`` given each
+        label, or None if ``fname`` has never been seen with any label.
+        """
+        logprobs = []
+        seen = False
+        for label in self._labels:
+            if (label, fname) in self._feature_probdist:
+                logprobs.append(
+                    self._feature_probdist[label, fname].logprob(fval))
+                seen = True
+            else:
+                logprobs.append(sum_logs([])) # = -INF.
+        if seen:
+            return logprobs
+        return None
+
     def show_most_informative_features(self, n=10):
         # Determine the most relevant features, and display them.
         cpdist = self._feature_probdist
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Streaming weibo analysis.
+
+Each stage of the analysis runs in its own thread and hands its results to
+the next stage through a bounded queue, so segmentation and classification
+of the first statuses overlap with fetching the later pages, and no more
+than a queue's depth of statuses waits between two stages.
+
+    keywords = jieba.analyse.KeywordAggregator()
+    for st, rank, terms in analyse(fetch_timeline(client, since), classifier):
+        keywords.add_freqs(terms)
+    keywords.top(300)
+'''
+
+import sys, threading, Queue
+
+import jieba, jieba.analyse
+
+_DONE = object()
+
+def stage(func, source, depth=100):
+    '''
+    Apply func to every item of source in a background thread, and generate
+    the results in order. At most depth results are buffered. An exception
+    raised by func or by source is raised again by the generator.
+
+    >>> list(stage(lambda x: x * 2, iter([1, 2, 3]), depth=1))
+    [2, 4, 6]
+    >>> list(stage(lambda x: 1 / x, iter([1, 0])))
+    Traceback (most recent call last):
+      ...
+    ZeroDivisionError: integer division or modulo by zero
+    '''
+    q = Queue.Queue(depth)
+    stopped = threading.Event()
+
+    def _put(item):
+        while not stopped.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def _run():
+        try:
+            for item in source:
+                if not _put((func(item), None)):
+                    return
+        except Exception:
+            _put((_DONE, sys.exc_info()))
+        else:
+            _put((_DONE, None))
+        finally:
+            # let an upstream stage know nobody reads its results any more:
+            if hasattr(source, 'close'):
+                source.close()
+
+    t = threading.Thread(target=_run)
+    t.daemon = True
+    t.start()
+    return _results(q, stopped)
+
+def _results(q, stopped):
+    try:
+        while True:
+            r, exc_info = q.get()
+            if r is _DONE:
+                if exc_info:
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                return
+            yield r
+    finally:
+        stopped.set()
+
+def _text(st):
+    text = st['text']
+    if 'retweeted_status' in st:
+        text += st['retweeted_status']['text']
+    return text
+
+def analyse(statuses, classifier, depth=100, cache=None):
+    '''
+    Segment, classify and count the keyword candidates of statuses, and
+    generate a (status, rank, terms) tuple per status, in order. terms is
+    the jieba.analyse.term_freqs() of a retweet, or {}, for a
+    jieba.analyse.KeywordAggregator of the whole timeline.
+
+    Args:
+        statuses: iterable of statuses, e.g. fetch_timeline().
+        classifier: emotion.CompiledClassifier.
+        depth: max number of statuses buffered between two stages.
+        cache: resultcache.ResultCache, statuses found in it skip all stages.
+    '''
+    def _segment(st):
+        cached = cache.get(st) if cache else None
+        if cached:
+            return st, None, cached
+        return st, list(jieba.cut(_text(st))), None
+
+    def _classify(item):
+        st, words, cached = item
+        if cached:
+            return item
+        return st, words, int(classifier.classify_words(words))
+
+    def _keywords(item):
+        st, words, rank = item
+        if words is None:
+            # a cached (rank, terms), from _segment
+            return (st,) + rank
+        terms = {}
+        if 'retweeted_status' in st:
+            # the words the classifier saw, not cut again:
+            terms = jieba.analyse.term_freqs(words)
+        if cache:
+            cache.set(st, rank, terms)
+        return st, rank, terms
+
+    segmented = stage(_segment, statuses, depth)
+    classified = stage(_classify, segmented, depth)
+    return stage(_keywords, classified, depth)
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
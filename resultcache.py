@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Cache of analysis results by status id.
+
+The text of a status never changes, so neither does its rank nor its
+keyword term frequencies under a given model. ResultCache stores them in any transwarp.cache
+style client (DiskClient, MemcacheClient, pylibmc.Client, ...) keyed by model
+version and status id, so a repeated analysis only classifies the statuses
+posted since the last one, and a new model never sees stale results.
+'''
+
+import threading
+
+class ResultCache(object):
+    '''
+    >>> from transwarp.cache import DiskClient
+    >>> c = ResultCache(DiskClient(':memory:'), 'v1')
+    >>> st = dict(id=3525512345678901, text=u'...')
+    >>> c.get(st)
+    >>> c.set(st, 2, {u'keyword': 1.0})
+    >>> c.get(st)
+    (2, {u'keyword': 1.0})
+    >>> ResultCache(c._client, 'v2').get(st)
+    >>> sorted(c.stats().items())
+    [('hits', 1), ('misses', 1)]
+    >>> c.clear()
+    1
+    >>> c.get(st)
+    '''
+
+    def __init__(self, client, version, expires=0):
+        '''
+        Args:
+            client: cache client with get(key) and set(key, value, expires).
+            version: model version, part of every key.
+            expires: cache time in seconds, default to 0 (never expires).
+        '''
+        self._client = client
+        self._version = version
+        self._expires = expires
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, st):
+        return 'terms:%s:%s' % (self._version, st['id'])
+
+    def clear(self):
+        '''
+        Delete the results cached for this model version, once the model is
+        replaced, and return how many were deleted. Only clients with
+        delete_prefix, e.g. DiskClient, need and support it: memcache
+        evicts the unused keys by itself. Return None for the others.
+        '''
+        delete_prefix = getattr(self._client, 'delete_prefix', None)
+        if delete_prefix is None:
+            return None
+        return delete_prefix('terms:%s:' % self._version)
+
+    def get(self, st):
+        '''
+        Return the (rank, terms) of a status, or None if not cached.
+        '''
+        r = self._client.get(self._key(st))
+        with self._lock:
+            if r is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return None if r is None else tuple(r)
+
+    def set(self, st, rank, terms):
+        self._client.set(self._key(st), (rank, terms), self._expires)
+
+    def stats(self):
+        '''
+        Return the numbers of cache hits and misses since the cache was made.
+        '''
+        with self._lock:
+            return dict(hits=self._hits, misses=self._misses)
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
@@ -11,5 +11,58 @@ $.extend({
             dataType: "json",
             success: callback
         });
+    },
+
+    /*
+     * Post data and read a response of one json object per line, calling
+     * callback with each object as soon as its line has arrived. At the
+     * end, complete(xhr, status) is called as by $.ajax: status is
+     * 'success', 'error' for an http error, or 'parsererror' for a line
+     * that is not json, after which the rest is not read.
+     */
+    postJSONStream: function(url, data, callback, complete) {
+        var xhr = new XMLHttpRequest(), seen = 0, failed = null;
+        function emit(line) {
+            var obj;
+            try {
+                obj = JSON.parse(line);
+            } catch (e) {
+                failed = 'parsererror';
+                return;
+            }
+            callback(obj);
+        }
+        function consume(done) {
+            var text = xhr.responseText, end;
+            while (!failed && (end = text.indexOf('\n', seen)) >= 0) {
+                var line = text.substring(seen, end);
+                seen = end + 1;
+                if (line)
+                    emit(line);
+            }
+            if (done && !failed && seen < text.length) {
+                emit(text.substring(seen));
+                seen = text.length;
+            }
+        }
+        xhr.open('POST', url, true);
+        xhr.setRequestHeader('Content-Type', 'application/x-www-form-urlencoded; charset=UTF-8');
+        xhr.onreadystatechange = function() {
+            // only a 200 response is json lines, not e.g. the html page of
+            // a 500
+            if (xhr.readyState === 3) {
+                if (xhr.status === 200)
+                    consume(false);
+            } else if (xhr.readyState === 4) {
+                if (xhr.status === 200)
+                    consume(true);
+                else
+                    failed = 'error';
+                if (complete)
+                    complete(xhr, failed || 'success');
+            }
+        };
+        xhr.send($.param(data));
+        return xhr;
     }
 });
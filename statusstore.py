@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Local store of user timelines.
+
+Statuses fetched from statuses/user_timeline are kept in table statuses, and
+table timelines records per user the newest status synced (since_id), the
+oldest one (max_id) and the date the stored history goes back to. sync()
+only asks the API for statuses newer than since_id, plus older ones when a
+longer period than ever before is requested, so an analysis of the last 3,
+6, 9 or 12 months becomes a local range query. iter_synced() does both,
+generating each fetched page as soon as it is stored:
+
+    for st in statusstore.iter_synced(client, uid, since):
+        ...
+
+Statuses deleted on weibo after they were synced stay in the store.
+'''
+
+__SQL__ = '''
+create table statuses (
+    id bigint not null,
+    user_id varchar(200) not null,
+    created_date varchar(8) not null,
+    status_data mediumtext not null,
+    primary key(id),
+    index(user_id, created_date)
+);
+
+create table timelines (
+    user_id varchar(200) not null,
+    since_id bigint not null,
+    max_id bigint not null,
+    synced_date varchar(8) not null,
+    last_sync real not null,
+    primary key(user_id)
+);
+'''
+
+import os, sys, time, json, logging
+
+from transwarp import db
+from weibo import _parse_json
+from timeline import fetch_timeline, transformTime
+
+def _log(s):
+    logging.info(s)
+
+def get_timeline(uid):
+    '''
+    Return the sync state of a user, or None if never synced.
+    '''
+    L = db.select('select * from timelines where user_id=?', uid)
+    return L[0] if L else None
+
+def sync(client, uid, since, **kw):
+    '''
+    Bring the stored timeline of a user up to date, and make sure it goes
+    back to since. Return the number of statuses added.
+
+    Args:
+        client: APIClient with the access token of user uid.
+        uid: user id.
+        since: 'YYYYMMDD' str, the oldest date to keep.
+        kw: other parameters of fetch_timeline(), e.g. prefetch=2.
+
+    >>> server = timeline._StubServer([[_st(5, 'Sun Jun 30 12:27:28 +0800 2013'), _st(4, 'Sat Jun 01 08:00:00 +0800 2013')], [_st(3, 'Fri May 31 23:59:59 +0800 2013')]])
+    >>> sync(server.client(), '1', '20130601', count=2)
+    2
+    >>> t = get_timeline('1')
+    >>> t.since_id, t.max_id, t.synced_date
+    (5, 4, u'20130601')
+    >>> [st.id for st in iter_statuses('1', '20130101')]
+    [5, 4]
+    >>> server.shutdown()
+
+    Next sync, two newer statuses and a longer period:
+
+    >>> server = timeline._StubServer([[_st(7, 'Mon Jul 08 09:00:00 +0800 2013'), _st(6, 'Mon Jul 01 09:00:00 +0800 2013')], [_st(5, 'Sun Jun 30 12:27:28 +0800 2013'), _st(4, 'Sat Jun 01 08:00:00 +0800 2013')], [_st(3, 'Fri May 31 23:59:59 +0800 2013'), _st(2, 'Mon Apr 01 08:00:00 +0800 2013')]])
+    >>> client = server.client()
+    >>> sync(client, '1', '20130501', count=2)
+    3
+    >>> get_timeline('1').max_id
+    3
+    >>> [st.id for st in iter_statuses('1', '20130101')]
+    [7, 6, 5, 4, 3]
+    >>> [st.id for st in iter_statuses('1', '20130701')]
+    [7, 6]
+    >>> server.shutdown()
+    '''
+    return sum(1 for st, new in _sync(client, uid, since, kw, False) if new)
+
+def iter_synced(client, uid, since, **kw):
+    '''
+    Sync the stored timeline of a user as sync() does, and generate the
+    statuses iter_statuses(uid, since) would generate after it, newest
+    first: each page fetched as soon as it is stored, and the statuses
+    stored before in between, read in batches.
+
+    >>> server = timeline._StubServer([[_st(19, 'Tue Jul 09 09:00:00 +0800 2013'), _st(18, 'Tue Jul 09 08:00:00 +0800 2013')], [_st(17, 'Mon Jul 08 09:00:00 +0800 2013'), _st(16, 'Mon Jul 01 09:00:00 +0800 2013')], [_st(15, 'Sun Jun 30 12:27:28 +0800 2013'), _st(14, 'Sat Jun 01 08:00:00 +0800 2013')], [_st(13, 'Fri May 31 23:59:59 +0800 2013'), _st(12, 'Mon Apr 01 08:00:00 +0800 2013')], [_st(11, 'Fri Mar 01 08:00:00 +0800 2013')]])
+    >>> [st.id for st in iter_synced(server.client(), '2', '20130301', count=2)]
+    [19, 18, 17, 16, 15, 14, 13, 12, 11]
+    >>> t = get_timeline('2')
+    >>> t.since_id, t.max_id, t.synced_date
+    (19, 11, u'20130301')
+    >>> [st.id for st in iter_synced(server.client(), '2', '20130701', count=2)]
+    [19, 18, 17, 16]
+    >>> [st.id for st in _iter_stored('2', '20130101', batch=2)]
+    [19, 18, 17, 16, 15, 14, 13, 12, 11]
+    >>> server.shutdown()
+    '''
+    for st, new in _sync(client, uid, since, kw, True):
+        if transformTime(st['created_at']) >= since:
+            yield st
+
+def _sync(client, uid, since, kw, stored):
+    # (status, True) for the statuses fetched, and with stored
+    # (status, False) for those stored before, newest first
+    t = get_timeline(uid)
+    n = 0
+    if t is None or t.since_id == 0:
+        # nothing stored yet, since_id=0 would fetch the whole history:
+        for st in _sync_older(client, uid, since, None, kw):
+            n += 1
+            yield st, True
+    else:
+        for st in _sync_newer(client, uid, t.since_id, kw):
+            n += 1
+            yield st, True
+        if stored:
+            for st in _iter_stored(uid, since, None, t.max_id, t.since_id):
+                yield st, False
+        if since < t.synced_date:
+            for st in _sync_older(client, uid, since, t.max_id, kw):
+                n += 1
+                yield st, True
+    _log('synced %d new statuses of user %s.' % (n, uid))
+
+def _pages(statuses, count):
+    # lists of count statuses, the last one shorter
+    page = []
+    for st in statuses:
+        page.append(st)
+        if len(page) == count:
+            yield page
+            page = []
+    if page:
+        yield page
+
+def _sync_newer(client, uid, since_id, kw):
+    # all statuses newer than since_id must be stored before since_id moves,
+    # so the cutoff date is ignored here, and since_id is set after the last
+    # page; a sync stopped before stores the same statuses again next time.
+    newest = None
+    for page in _pages(fetch_timeline(client, '', since_id=since_id, **kw), kw.get('count', 100)):
+        _save(uid, page)
+        if newest is None:
+            newest = page[0]['id']
+        for st in page:
+            yield st
+    if newest is not None:
+        _save(uid, [], since_id=newest)
+
+def _sync_older(client, uid, since, max_id, kw):
+    # max_id moves with every page stored, so the stored history stays
+    # contiguous if the sync stops before since is reached
+    if max_id is not None:
+        kw = dict(kw, max_id=max_id - 1)
+    first = max_id is None
+    for page in _pages(fetch_timeline(client, since, **kw), kw.get('count', 100)):
+        _save(uid, page, since_id=page[0]['id'] if first else None, max_id=page[-1]['id'])
+        first = False
+        for st in page:
+            yield st
+    _save(uid, [], synced_date=since)
+
+def _save(uid, statuses, since_id=None, max_id=None, synced_date=None):
+    try:
+        _save_once(uid, statuses, since_id, max_id, synced_date)
+    except Exception, e:
+        # the IntegrityError of the db driver: a sync of the same user in
+        # another request stored some of these statuses, or its first
+        # timelines row, after they were looked up. That sync is committed
+        # now, so a second try skips what it stored.
+        if e.__class__.__name__ != 'IntegrityError':
+            raise
+        _log('concurrent sync of user %s: %s, retrying.' % (uid, e))
+        _save_once(uid, statuses, since_id, max_id, synced_date)
+
+@db.with_transaction
+def _save_once(uid, statuses, since_id, max_id, synced_date):
+    # the statuses and the timelines row in one transaction
+    t = get_timeline(uid)
+    existed = set()
+    if statuses:
+        ids = [st['id'] for st in statuses]
+        existed = set(r.id for r in db.select('select id from statuses where user_id=? and id between ? and ?', uid, min(ids), max(ids)))
+    for st in statuses:
+        if st['id'] in existed:
+            continue
+        db.insert('statuses', id=st['id'], user_id=uid, created_date=transformTime(st['created_at']), status_data=json.dumps(st))
+    if t is None:
+        db.insert('timelines', user_id=uid, since_id=since_id or 0, max_id=max_id or sys.maxint, synced_date=synced_date or '99999999', last_sync=time.time())
+        return
+    kw = dict(last_sync=time.time())
+    if since_id is not None and since_id > t.since_id:
+        kw['since_id'] = since_id
+    if max_id is not None and max_id < t.max_id:
+        kw['max_id'] = max_id
+    if synced_date is not None and synced_date < t.synced_date:
+        kw['synced_date'] = synced_date
+    db.update_kw('timelines', 'user_id=?', uid, **kw)
+
+def iter_statuses(uid, since, until=None):
+    '''
+    Generate the stored statuses of a user created on or after since, and
+    before until if given, newest first.
+    '''
+    return _iter_stored(uid, since, until)
+
+def _iter_stored(uid, since, until=None, min_id=0, max_id=sys.maxint, batch=500):
+    # the statuses with ids from min_id to max_id, read batch at a time so
+    # a long history is never all in memory
+    where = 'user_id=? and created_date>=?'
+    args = [uid, since]
+    if until:
+        where += ' and created_date<?'
+        args.append(until)
+    while True:
+        L = db.select('select id, status_data from statuses where %s and id between ? and ? order by id desc limit ?' % where, *(args + [min_id, max_id, batch]))
+        for r in L:
+            yield _parse_json(r.status_data)
+        if len(L) < batch:
+            return
+        max_id = L[-1].id - 1
+
+def _st(id, created_at, text=u''):
+    return dict(id=id, created_at=created_at, text=text)
+
+if __name__=='__main__':
+    sys.path.append('.')
+    import timeline
+    logging.basicConfig(level=logging.WARNING)
+    dbpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'doc_test.sqlite3.db')
+    if os.path.isfile(dbpath):
+        os.remove(dbpath)
+    db.init('sqlite3', dbpath, '')
+    db.update('create table statuses (id bigint not null, user_id text not null, created_date text not null, status_data text not null, primary key(id))')
+    db.update('create table timelines (user_id text not null, since_id bigint not null, max_id bigint not null, synced_date text not null, last_sync real not null, primary key(user_id))')
+    import doctest
+    doctest.testmod()
+    os.remove(dbpath)
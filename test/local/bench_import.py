@@ -0,0 +1,40 @@
+#encoding=utf-8
+# Time and peak RSS of "import jieba.posseg" in fresh interpreters:
+#   python bench_import.py [--root DIR] [runs]
+# --root times the jieba of another checkout, e.g. a baseline worktree; it
+# defaults to the tree of this script.
+# Run it once before to write the .pyc files, or with PYTHONDONTWRITEBYTECODE=1
+# to measure the workers that compile every module.
+import os
+import sys
+import subprocess
+
+CODE = '''
+import sys, time, resource
+sys.path.insert(0, %r)
+t = time.time()
+import jieba.posseg
+print time.time() - t, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+'''
+
+def run_once(root):
+    out = subprocess.check_output([sys.executable, '-c', CODE % root])
+    seconds, rss = out.split()[-2:]
+    # ru_maxrss is in KB on linux
+    return float(seconds), int(rss) / 1024.0
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    root = os.path.join(os.path.dirname(__file__), '..', '..')
+    if args[:1] == ['--root']:
+        if len(args) < 2:
+            print >> sys.stderr, 'usage: python bench_import.py [--root DIR] [runs]'
+            sys.exit(2)
+        root = args[1]
+        args = args[2:]
+    root = os.path.abspath(root)
+    runs = int(args[0]) if args else 5
+    results = sorted(run_once(root) for i in xrange(runs))
+    seconds = [s for s, rss in results]
+    print '%s: import jieba.posseg: median %.3fs, min %.3fs, max rss %.1f MB (%d runs)' % (
+        root, seconds[len(seconds) // 2], seconds[0], max(rss for s, rss in results), runs)
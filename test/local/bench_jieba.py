@@ -0,0 +1,147 @@
+#encoding=utf-8
+# Throughput of jieba over the bundled corpora and scaled-up copies of them:
+#   python bench_jieba.py [--scale 1,10] [--repeat 3] [--only cut,posseg]
+#                         [--json results.jsonl] [--cold]
+# Every workload runs on every corpus in a fresh interpreter, which reports
+# one JSON record: the start (imports and dictionary loading) in
+# init_seconds, the best of repeat passes over the lines of the corpus in
+# seconds, chars_per_sec, tokens_per_sec, peak_rss_mb and the md5 of the
+# tokens, so a change of output shows up as well as a change of speed.
+# The records go to --json, or stdout, and a table to stderr.
+# init_seconds is a warm start: the compiled dictionary and IDF table are
+# already cached in the temp directory. --cold also starts each workload
+# with an empty TMPDIR, as a new server does, and reports that start in
+# cold_init_seconds, measured once per workload; a jieba/dict.bin made by
+# "fab build" is still used.
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import tempfile
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPORA = ['sentimentweibo.txt', 'data3.txt']
+WORKLOADS = ['cut', 'cut_all', 'cut_for_search', 'posseg', 'finalseg', 'extract_tags']
+
+def _setup(workload):
+    # import what workload needs and return a function of a line to tokens
+    import jieba
+    jieba.initialize()
+    if workload == 'cut':
+        return lambda line: list(jieba.cut(line))
+    if workload == 'cut_all':
+        return lambda line: list(jieba.cut(line, cut_all=True))
+    if workload == 'cut_for_search':
+        return lambda line: list(jieba.cut_for_search(line))
+    if workload == 'posseg':
+        import jieba.posseg
+        return lambda line: [unicode(w) for w in jieba.posseg.cut(line)]
+    if workload == 'finalseg':
+        from jieba import finalseg
+        return lambda line: list(finalseg.cut(line))
+    if workload == 'extract_tags':
+        import jieba.analyse
+        jieba.analyse.get_idf()
+        return lambda line: jieba.analyse.extract_tags(line, topK=10)
+    raise ValueError('unknown workload: %s' % workload)
+
+def worker(workload, corpus, repeat):
+    # repeat 0 only measures the start
+    import resource
+    lines = [l for l in open(corpus, 'rb').read().decode('utf-8').split('\n') if l.strip()]
+    t = time.time()
+    func = _setup(workload)
+    init_seconds = time.time() - t
+    if not repeat:
+        return dict(workload=workload, init_seconds=round(init_seconds, 4))
+    best = None
+    for i in xrange(repeat):
+        t = time.time()
+        tokens = [func(l) for l in lines]
+        dt = time.time() - t
+        best = dt if best is None else min(best, dt)
+    chars = sum(len(l) for l in lines)
+    n_tokens = sum(len(ts) for ts in tokens)
+    md5 = hashlib.md5(u'\n'.join(u' '.join(ts) for ts in tokens).encode('utf-8')).hexdigest()
+    return dict(workload=workload, corpus=os.path.basename(corpus), lines=len(lines), chars=chars,
+                tokens=n_tokens, init_seconds=round(init_seconds, 4), seconds=round(best, 4),
+                chars_per_sec=int(chars / best), tokens_per_sec=int(n_tokens / best),
+                peak_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+                md5=md5)
+
+def make_corpus(scale, out_dir):
+    # the lines of all the bundled corpora, shuffled and repeated scale
+    # times; the same for every run
+    lines = []
+    for name in CORPORA:
+        lines.extend(l for l in open(os.path.join(HERE, name), 'rb').read().split('\n') if l.strip())
+    rnd = random.Random(scale)
+    L = []
+    for i in xrange(scale):
+        rnd.shuffle(lines)
+        L.extend(lines)
+    path = os.path.join(out_dir, 'synthetic_x%d.txt' % scale)
+    with open(path, 'wb') as f:
+        f.write('\n'.join(L))
+    return path
+
+def run_worker(workload, corpus, repeat, env=None):
+    r = subprocess.check_output([sys.executable, __file__, '--worker', workload, corpus, repeat], env=env)
+    return json.loads(r.strip().split('\n')[-1])
+
+def cold_init(workload):
+    # the start of workload with nothing cached in the temp directory
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        return run_worker(workload, os.path.join(HERE, CORPORA[0]), '0', dict(os.environ, TMPDIR=tmp_dir))['init_seconds']
+    finally:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+
+def main(argv):
+    args = dict(scale='1,10', repeat='3', only=','.join(WORKLOADS), json=None)
+    cold = False
+    i = 0
+    while i < len(argv):
+        if argv[i] == '--cold':
+            cold = True
+            i += 1
+            continue
+        if not argv[i].startswith('--') or argv[i][2:] not in args or i + 1 == len(argv):
+            print >> sys.stderr, 'usage: python bench_jieba.py [--scale 1,10] [--repeat 3] [--only %s] [--json file] [--cold]' % ','.join(WORKLOADS)
+            return 2
+        args[argv[i][2:]] = argv[i + 1]
+        i += 2
+    tmp_dir = tempfile.mkdtemp()
+    corpora = [os.path.join(HERE, name) for name in CORPORA]
+    corpora.extend(make_corpus(int(s), tmp_dir) for s in args['scale'].split(','))
+    out = open(args['json'], 'w') if args['json'] else sys.stdout
+    print >> sys.stderr, '%-16s %-22s %10s %10s %12s %12s %8s %9s' % ('workload', 'corpus', 'init s', 'cold s', 'chars/s', 'tokens/s', 'rss MB', 'md5')
+    for workload in args['only'].split(','):
+        cold_seconds = cold_init(workload) if cold else None
+        for corpus in corpora:
+            result = run_worker(workload, corpus, args['repeat'])
+            if cold:
+                result['cold_init_seconds'] = cold_seconds
+            out.write(json.dumps(result, sort_keys=True) + '\n')
+            out.flush()
+            print >> sys.stderr, '%-16s %-22s %10.3f %10s %12d %12d %8.1f %9s' % (workload, result['corpus'], result['init_seconds'],
+                '%.3f' % result['cold_init_seconds'] if cold else '-',
+                result['chars_per_sec'], result['tokens_per_sec'], result['peak_rss_mb'], result['md5'][:8])
+    for name in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, name))
+    os.rmdir(tmp_dir)
+    return 0
+
+if __name__ == '__main__':
+    if len(sys.argv) == 5 and sys.argv[1] == '--worker':
+        sys.path.insert(0, ROOT)
+        # jieba logs its loading to stderr; the record is the last line of stdout
+        print json.dumps(worker(sys.argv[2], sys.argv[3], int(sys.argv[4])))
+    else:
+        sys.exit(main(sys.argv[1:]))
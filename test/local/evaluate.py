@@ -0,0 +1,98 @@
+#coding=utf-8
+# k-fold cross-validation of the Naive Bayes classifier, for several
+# vocabulary sizes:
+#   python evaluate.py [--corpus sentimentweibo.txt] [--folds 5]
+#                      [--sizes 500,1000,1500,3000] [--processes N]
+# The corpus is segmented once, before the worker processes are forked, so
+# they share it. Each (size, fold) job counts the other folds with a
+# NaiveBayesTrainer, takes the most common words but stop words as the
+# vocabulary, and scores the fold with the compiled classifier. For each
+# size it reports the accuracy, its spread over the folds, the scoring
+# throughput and the confusion matrix of all the folds.
+
+import sys
+import time
+import random
+sys.path.append('../..')
+import jieba
+import nltk
+from multiprocessing import Pool, cpu_count
+from training import NaiveBayesTrainer, read_labeled
+
+posts = [] # (label, tokens), shared with the workers
+stop_words = []
+
+def readin(path):
+    fin = open(path,"r")
+    content = fin.readlines()
+    fin.close()
+    return content
+
+def run(job):
+    # train without fold, test on it; return the gold and predicted labels
+    # and the seconds spent scoring
+    size, fold, folds = job
+    trainer = NaiveBayesTrainer()
+    test = []
+    for i, (label, tokens) in enumerate(posts):
+        if i % folds == fold:
+            test.append((label, tokens))
+        else:
+            trainer.add(label, tokens)
+    classifier = trainer.compile(trainer.most_common(size, stop_words))
+    t = time.time()
+    predicted = classifier.classify_features_many([classifier.features(tokens) for label, tokens in test])
+    return size, fold, [label for label, tokens in test], predicted, time.time() - t
+
+def main(argv):
+    global posts, stop_words
+    args = dict(corpus='sentimentweibo.txt', folds='5', sizes='500,1000,1500,3000', processes=str(cpu_count()))
+    i = 0
+    while i < len(argv):
+        if not argv[i].startswith('--') or argv[i][2:] not in args or i + 1 == len(argv):
+            print >> sys.stderr, 'usage: python evaluate.py [--corpus sentimentweibo.txt] [--folds 5] [--sizes 500,1000,1500,3000] [--processes N]'
+            return 2
+        args[argv[i][2:]] = argv[i + 1]
+        i += 2
+    folds = int(args['folds'])
+    sizes = [int(s) for s in args['sizes'].split(',')]
+    stop_words = [w[:-1].decode('utf8') for w in readin("stopwords.txt")]
+
+    t = time.time()
+    labeled = list(read_labeled(args['corpus']))
+    # the folds are the posts in a fixed random order, dealt out in turn
+    random.Random(0).shuffle(labeled)
+    posts = zip([label for label, text in labeled], jieba.cut_many([text for label, text in labeled]))
+    print "segmented %d posts in %.2fs" % (len(posts), time.time() - t)
+    # the cut pool runs handler threads, which a fork must not inherit:
+    jieba.close_cut_pool()
+
+    t = time.time()
+    jobs = [(size, fold, folds) for size in sizes for fold in xrange(folds)]
+    processes = int(args['processes'])
+    if processes > 1:
+        pool = Pool(processes)
+        results = pool.map(run, jobs, 1)
+        pool.close()
+    else:
+        results = map(run, jobs)
+    print "%d jobs in %.2fs with %d processes" % (len(jobs), time.time() - t, processes)
+
+    for size in sizes:
+        gold, predicted, seconds, accuracies = [], [], 0.0, []
+        for s, fold, g, p, dt in results:
+            if s != size:
+                continue
+            gold.extend(g)
+            predicted.extend(p)
+            seconds += dt
+            accuracies.append(sum(1 for a, b in zip(g, p) if a == b) / float(len(g)))
+        mean = sum(accuracies) / len(accuracies)
+        print
+        print "features %d: accuracy %.4f (folds %.4f-%.4f), scoring %d posts/s" % (
+            size, mean, min(accuracies), max(accuracies), len(gold) / seconds if seconds else 0)
+        print nltk.ConfusionMatrix(gold, predicted)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
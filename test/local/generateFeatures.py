@@ -34,8 +34,7 @@ if __name__ == '__main__':
     stop_words = [w[:-1] for w in stop_words]
     # for i in stop_words:print i
     # for i in stop_words:print i.decode('utf8').encode('gbk')
-    for line in content:
-        a = jieba.cut(line[1:])
+    for a in jieba.cut_many([line[1:] for line in content]):
         fl = (" ".join(a)).split()
         # for w in fl:
         #     if w not in stop_words:
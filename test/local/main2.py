@@ -4,17 +4,17 @@ import random
 import jieba
 import nltk
 import pickle
+import sys
+sys.path.append('../..')
+from features import FeatureIndex
+from training import NaiveBayesTrainer, read_labeled
+import modelfile
 def run():
     pass
 
 def gender_features(weibo):
-    global word_features
-    a = jieba.cut(weibo)
-    fl = (" ".join(a)).split()
-    fd = {}
-    for word in word_features:
-        fd[u'contains(%s)'%word] = (word in fl)
-    return fd
+    global word_index
+    return word_index.featureset(jieba.cut(weibo))
 
 def readin(path):
     fin = open(path,"r")
@@ -25,28 +25,27 @@ def readin(path):
 
 if __name__ == '__main__':
     print "main function"
-    content = readin("sentimentweibo.txt")
-    # content = readin("finaldata2.txt")
-    words = []
     stop_words = readin("stopwords.txt")
     stop_words = [w[:-1].decode('utf8') for w in stop_words]
     # for i in stop_words:print i
     # for i in stop_words:print i.decode('utf8').encode('gbk')
-    for line in content:
-        a = jieba.cut(line[1:])
-        fl = (" ".join(a)).split()
-        # for w in fl:
-        #     if w not in stop_words:
-        #         try:
-        #             print w
-        #         except Exception, e:
-        #             print e
-        words = words + [w for w in fl if w not in stop_words]
-        # print words[0],words[1]
-    all_words = nltk.FreqDist(words)
+
+    # one pass over the posts: 80% of them are counted for training, the
+    # others kept for the test
+    rate = 0.8
+    test = []
+    def train_lines():
+        for label, text in read_labeled("sentimentweibo.txt"):
+        # for label, text in read_labeled("finaldata2.txt"):
+            if random.random() < rate:
+                yield label, text
+            else:
+                test.append((label, text))
+    trainer = NaiveBayesTrainer()
+    trainer.add_texts(train_lines())
     global word_features 
-    print "ssssss",len(all_words)
-    word_features = all_words.keys()[:1500]
+    word_features = trainer.most_common(1500, stop_words)
+    word_index = FeatureIndex(word_features)
     wf = pickle.dumps(word_features)
     fout = open('word_features.dat','w')
     fout.write(wf)
@@ -65,14 +64,8 @@ if __name__ == '__main__':
         except Exception, e:
             pass
 
-    features = [(gender_features(line[1:]),line[0]) for line in content]    
-    random.shuffle(features)
-
-    rate = 0.8
-    features_len = len(features)
-    train_set = features[:int(rate*features_len)]
-    test_set = features[int(rate*features_len):]
-    classifier = nltk.NaiveBayesClassifier.train(train_set)
+    test_set = [(word_index.featureset(a),label) for a, (label, text) in zip(jieba.cut_many([text for label, text in test]), test)]
+    classifier = trainer.classifier(word_index)
     # classifier = nltk.DecisionTreeClassifier.train(train_set)
     
     # classifier = nltk.MaxentClassifier.train(train_set)
@@ -81,6 +74,7 @@ if __name__ == '__main__':
     fout = open("classifierdata.dat","w")
     fout.write(classifierdata)
     fout.close()
+    modelfile.write_model(trainer.compile(word_index), "model.bin")
     print "Save Classifier!"
     print classifier.classify(gender_features(u'[哈哈]我肚子痛死了'))
     print nltk.classify.accuracy(classifier,test_set)
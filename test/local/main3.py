@@ -4,21 +4,19 @@ import random
 import jieba
 import nltk
 import pickle
+import sys
+sys.path.append('../..')
+from features import FeatureIndex
 
 
 def gender_features(weibo):
-    global word_features
-    a = jieba.cut(weibo)
-    fl = (" ".join(a)).split()
-    fd = {}
-    for word in word_features:
-        fd[u'contains(%s)'%word] = (word in fl)
-    return fd
+    global word_index
+    return word_index.featureset(jieba.cut(weibo))
 
         
 if __name__ == '__main__':
    
-    word_features = pickle.load(open('word_features.dat','r'))
+    word_index = FeatureIndex.load('word_features.dat')
     classifier = pickle.load(open("classifierdata.dat","r"))
     
     print "Readed Classifier!"
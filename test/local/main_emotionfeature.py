@@ -5,28 +5,18 @@ import random
 import jieba
 import nltk
 import pickle
+import sys
+sys.path.append('../..')
+from features import FeatureIndex
+from training import NaiveBayesTrainer, read_labeled
+import modelfile
 jieba.load_userdict("userdict.txt")
 def run():
     pass
 
 def gender_features(weibo):
-    global word_features
-    a = jieba.cut(weibo)
-    fl = (" ".join(a)).split()
-    for i in fl:print i
-    # print '嘻嘻' in fl
-    fd = {}
-    for word in word_features:
-
-        fd['contains(%s)'%word] = (word in fl)
-        #print word.decode('utf8').encode('utf8')
-        # print isinstance(fl[0],unicode)
-        # if isinstance(word,unicode):
-        #     print word
-        # else:
-        #     print type(word).__name__
-        #print word, word.decode('utf8').encode('utf8') in fl
-    return fd
+    global word_index
+    return word_index.featureset(jieba.cut(weibo))
 
 def readin(path):
     fin = open(path,"r")
@@ -40,6 +30,7 @@ if __name__ == '__main__':
     global word_features 
     word_features = open('features.dat', 'r').readlines()
     word_features = [w[:-1].decode('utf8') for w in word_features]
+    word_index = FeatureIndex(word_features)
     wf = pickle.dumps(word_features)
     fout = open('word_features.dat','w')
     fout.write(wf)
@@ -60,15 +51,20 @@ if __name__ == '__main__':
     #     except Exception, e:
     #         pass
 
-    content = readin("sentimentweibo.txt")
-    features = [(gender_features(line[1:]),line[0]) for line in content]    
-    random.shuffle(features)
-
+    # one pass over the posts: 80% of them are counted for training, the
+    # others kept for the test
     rate = 0.8
-    features_len = len(features)
-    train_set = features[:int(rate*features_len)]
-    test_set = features[int(rate*features_len):]
-    classifier = nltk.NaiveBayesClassifier.train(train_set)
+    test = []
+    def train_lines():
+        for label, text in read_labeled("sentimentweibo.txt"):
+            if random.random() < rate:
+                yield label, text
+            else:
+                test.append((label, text))
+    trainer = NaiveBayesTrainer(word_index)
+    trainer.add_texts(train_lines())
+    test_set = [(word_index.featureset(words),label) for words, (label, text) in zip(jieba.cut_many([text for label, text in test]), test)]
+    classifier = trainer.classifier()
     # classifier = nltk.DecisionTreeClassifier.train(train_set)
     
     # classifier = nltk.MaxentClassifier.train(train_set)
@@ -77,6 +73,7 @@ if __name__ == '__main__':
     fout = open("classifierdata.dat","w")
     fout.write(classifierdata)
     fout.close()
+    modelfile.write_model(trainer.compile(), "model.bin")
     print "Save Classifier!"
     print classifier.classify(gender_features(u'[哈哈]我肚子痛死了'))
     print nltk.classify.accuracy(classifier,test_set)
@@ -0,0 +1,35 @@
+#coding=utf-8
+# Add newly labeled posts to the model, without training again:
+#   python update_model.py new_posts.txt [counts.dat] [model.bin]
+# new_posts.txt has one post per line, the label first, as in
+# sentimentweibo.txt. The counts of the posts seen so far are kept in
+# counts.dat, made from sentimentweibo.txt on the first run, over the words
+# of word_features.dat; model.bin is written from them, and loaded by the
+# running workers.
+
+import sys
+import time
+sys.path.append('../..')
+import os
+from features import FeatureIndex
+from training import NaiveBayesTrainer, OnlineNaiveBayes, read_labeled
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print "usage: python update_model.py new_posts.txt [counts.dat] [model.bin]"
+        sys.exit(2)
+    counts = sys.argv[2] if len(sys.argv) > 2 else 'counts.dat'
+    model = sys.argv[3] if len(sys.argv) > 3 else 'model.bin'
+    word_features = FeatureIndex.load('word_features.dat')
+    if os.path.exists(counts):
+        trainer = NaiveBayesTrainer.load(counts)
+    else:
+        trainer = NaiveBayesTrainer(word_features)
+        trainer.add_texts(read_labeled("sentimentweibo.txt"))
+        print "counted %d posts of sentimentweibo.txt" % len(trainer)
+    t = time.time()
+    online = OnlineNaiveBayes(word_features, trainer)
+    online.add_texts(read_labeled(sys.argv[1]))
+    online.snapshot(model)
+    trainer.dump(counts)
+    print "%d posts counted, model %s written in %.2fs" % (len(trainer), online.classifier().version(), time.time() - t)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Concurrent timeline fetching.
+
+statuses/user_timeline returns one page of statuses per HTTP round trip.
+fetch_timeline() keeps several pages in flight over a small pool of worker
+threads, and yields the statuses in timeline order as soon as the pages
+before them have arrived, stopping at the first status older than the
+cutoff.
+'''
+
+import sys, time, json, threading, logging, urlparse, Queue, SocketServer, BaseHTTPServer
+
+def transformTime(created_time):
+    '''
+    Convert the created_at of a status to a 'YYYYMMDD' str.
+
+    >>> transformTime('Sun Jun 30 12:27:28 +0800 2013')
+    '20130630'
+    '''
+    a = created_time.split()
+    month_mapping = {'Jan' : '01', 'Feb' : '02', 'Mar' : '03', 'Apr' : '04', 'May' : '05', 'Jun' : '06', 'Jul' : '07', 'Aug' : '08', 'Sep' : '09', 'Oct' : '10', 'Nov' : '11', 'Dec' : '12'}
+    t = a[-1] + month_mapping[a[1]] + a[2]
+    return t
+
+def fetch_timeline(client, since, count=100, prefetch=4, workers=4, **kw):
+    '''
+    Generate the statuses of statuses/user_timeline created on or after
+    since, newest first.
+
+    Args:
+        client: APIClient with access token set.
+        since: cutoff date as 'YYYYMMDD' str.
+        count: statuses per page.
+        prefetch: number of pages requested ahead of the page being read.
+        workers: number of threads fetching pages.
+        kw: other parameters of statuses/user_timeline, e.g. trim_user=1.
+
+    Pages are requested speculatively after a full page, so up to prefetch
+    pages past the cutoff may be fetched and discarded; a timeline of one
+    short page, e.g. no status since since_id, costs one request. An error
+    fetching a page is raised when that page is reached.
+
+    >>> server = _StubServer([[_status(1, 'Sun Jun 30 12:27:28 +0800 2013'), _status(2, 'Sat Jun 01 08:00:00 +0800 2013')], [_status(3, 'Fri May 31 23:59:59 +0800 2013')]])
+    >>> [st.id for st in fetch_timeline(server.client(), '20130601', count=2)]
+    [1, 2]
+    >>> [st.id for st in fetch_timeline(server.client(), '20130101', count=2)]
+    [1, 2, 3]
+    >>> server.shutdown()
+    '''
+    return _fetch(client, since, count, max(0, prefetch), max(1, workers), kw)
+
+def _fetch(client, since, count, prefetch, workers, kw):
+    tasks = Queue.Queue()
+    results = {}
+    cond = threading.Condition()
+    stopped = []
+
+    def _work():
+        while True:
+            page = tasks.get()
+            if page is None or stopped:
+                return
+            try:
+                r = (client.statuses.user_timeline.get(count=count, page=page, **kw), None)
+            except Exception:
+                r = (None, sys.exc_info())
+            with cond:
+                results[page] = r
+                cond.notify_all()
+
+    threads = []
+    for i in range(workers):
+        t = threading.Thread(target=_work)
+        t.daemon = True
+        t.start()
+        threads.append(t)
+    page = 1
+    requested = 0
+    ahead = 0 # prefetch once a full page shows there may be more
+    try:
+        while True:
+            while requested < page + ahead:
+                requested += 1
+                tasks.put(requested)
+            with cond:
+                while not page in results:
+                    cond.wait()
+                r, exc_info = results.pop(page)
+            if exc_info:
+                raise exc_info[0], exc_info[1], exc_info[2]
+            statuses = r['statuses']
+            if not statuses:
+                return
+            for st in statuses:
+                if transformTime(st['created_at']) < since:
+                    return
+                yield st
+            ahead = prefetch if len(statuses) >= count else 0
+            page += 1
+    finally:
+        logging.info('timeline fetched %d pages, %d requested.' % (page, requested))
+        stopped.append(True)
+        for t in threads:
+            tasks.put(None)
+
+def _status(id, created_at, text=u''):
+    return dict(id=id, created_at=created_at, text=text)
+
+class _StubServer(object):
+    '''
+    A local http server standing in for api.weibo.com, serving the given
+    pages of statuses/user_timeline. With since_id or max_id the statuses
+    of all pages are filtered and paged again by count, like the real API
+    does. Used by the doctests.
+    '''
+
+    def __init__(self, pages, delay=0.0):
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                qs = urlparse.parse_qs(urlparse.urlparse(self.path).query)
+                page = int(qs.get('page', ['1'])[0])
+                time.sleep(delay)
+                if 'since_id' in qs or 'max_id' in qs:
+                    since_id = int(qs.get('since_id', ['0'])[0])
+                    max_id = int(qs.get('max_id', [str(sys.maxint)])[0])
+                    count = int(qs.get('count', ['20'])[0])
+                    L = [st for p in pages for st in p if since_id < st['id'] <= max_id]
+                    statuses = L[(page - 1) * count:page * count]
+                else:
+                    statuses = pages[page - 1] if page <= len(pages) else []
+                body = json.dumps(dict(statuses=statuses))
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+            daemon_threads = True
+
+        self._server = Server(('127.0.0.1', 0), Handler)
+        self.port = self._server.server_address[1]
+        t = threading.Thread(target=self._server.serve_forever)
+        t.daemon = True
+        t.start()
+
+    def client(self):
+        from weibo import APIClient
+        c = APIClient('app_key', 'app_secret')
+        c.api_url = 'http://127.0.0.1:%d/2/' % self.port
+        c.set_access_token('token', sys.maxint)
+        return c
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
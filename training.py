@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Streaming Naive Bayes training for the emotion classifier.
+
+nltk.NaiveBayesClassifier.train counts a featureset per post, a dict with
+one u'contains(word)' = True/False per word of word_features. With boolean
+features those counts come down to the number of posts of each label, and
+the number of posts of each label that contain each word.
+NaiveBayesTrainer keeps only those, in one integer array per label indexed
+by word, so training is one pass over the posts, each segmented once, in
+memory bounded by the vocabulary instead of the corpus.
+
+Usage from the training scripts in test/local:
+
+    import sys
+    sys.path.append('../..')
+    from training import NaiveBayesTrainer, read_labeled
+
+    trainer = NaiveBayesTrainer()
+    trainer.add_texts(read_labeled('sentimentweibo.txt'))
+    word_features = trainer.most_common(1500, stop_words)
+    classifier = trainer.classifier(word_features)
+
+OnlineNaiveBayes keeps the compiled classifier of such counts up to date as
+posts are added, e.g. user corrections, recomputing only what they change,
+and snapshot() writes it to a model file (see modelfile.py).
+'''
+
+import math, marshal, itertools
+from array import array
+
+import jieba
+
+from features import FeatureIndex
+
+def read_labeled(path):
+    '''
+    Generate the (label, text) pairs of a labeled file, one post per line,
+    the label being its first character, as in sentimentweibo.txt.
+    '''
+    with open(path, 'r') as f:
+        for line in f:
+            yield line[0], line[1:]
+
+def _logprob(count, n, bins):
+    # the log2 ELE estimate of nltk.probability.ELEProbDist
+    return math.log((count + 0.5) / (n + bins * 0.5), 2)
+
+class NaiveBayesTrainer(object):
+    '''
+    Counts of labeled posts for a Naive Bayes classifier over the features
+    u'contains(word)'. Without word_features every word seen is counted and
+    the features can be chosen afterwards, e.g. with most_common().
+
+    >>> t = NaiveBayesTrainer()
+    >>> t.add('1', [u'good', u'day']); t.add('1', [u'good']); t.add('0', [u'bad day'])
+    >>> t.most_common(2), t.labels()
+    ([u'day', u'good'], ['1', '0'])
+    >>> c = t.compile([u'good', u'bad'])
+    >>> c.classify_words([u'good']), c.classify_words([u'bad'])
+    ('1', '0')
+
+    The same classifier as nltk trains from the featuresets:
+
+    >>> import nltk
+    >>> index = FeatureIndex([u'good', u'bad'])
+    >>> posts = [('1', [u'good', u'day']), ('1', [u'good']), ('0', [u'bad day'])]
+    >>> c2 = nltk.NaiveBayesClassifier.train([(index.featureset(words), label) for label, words in posts])
+    >>> from emotion import CompiledClassifier
+    >>> c.version() == CompiledClassifier.compile(c2, index).version() == CompiledClassifier.compile(t.classifier(index), index).version()
+    True
+    '''
+
+    def __init__(self, word_features=None):
+        '''
+        Args:
+            word_features: FeatureIndex or list of words to count, or None
+                to count every word.
+        '''
+        if word_features is None:
+            self._fixed = False
+            self._index = {}
+            self._words = []
+        else:
+            if not isinstance(word_features, FeatureIndex):
+                word_features = FeatureIndex(word_features)
+            self._fixed = True
+            self._index = dict((w, i) for i, w in enumerate(word_features.words()))
+            self._words = list(word_features.words())
+        # the number of posts of each label, the number of posts of each
+        # label containing each word, and the number of times each word
+        # occurs:
+        self._posts = {}
+        self._docs = {}
+        self._tokens = array('i', [0]) * len(self._words)
+
+    def __len__(self):
+        return sum(self._posts.itervalues())
+
+    def labels(self):
+        '''
+        Return the labels, most frequent first, in the order of the labels
+        of the nltk classifier.
+        '''
+        return sorted(self._posts, key=lambda label: (-self._posts[label], label))
+
+    def add(self, label, tokens):
+        '''
+        Count a post of label, segmented to tokens, e.g. by jieba.cut().
+        Tokens are re-split on whitespace, as FeatureIndex.ids() does.
+        '''
+        index, counts = self._index, self._tokens
+        ids = set()
+        for t in tokens:
+            for w in t.split():
+                i = index.get(w)
+                if i is None:
+                    if self._fixed:
+                        continue
+                    i = index[w] = len(self._words)
+                    self._words.append(w)
+                    counts.append(0)
+                    for docs in self._docs.itervalues():
+                        docs.append(0)
+                counts[i] += 1
+                ids.add(i)
+        docs = self._docs.get(label)
+        if docs is None:
+            docs = self._docs[label] = array('i', [0]) * len(self._words)
+            self._posts[label] = 0
+        self._posts[label] += 1
+        for i in ids:
+            docs[i] += 1
+
+    def add_texts(self, labeled_texts, chunksize=1024):
+        '''
+        Segment and count (label, text) pairs, e.g. from read_labeled(),
+        reading chunksize of them at a time, segmented with jieba.cut_many().
+        '''
+        _add_texts(self, labeled_texts, chunksize)
+
+    def dump(self, f_name):
+        '''
+        Write the counts to f_name, to be counted further after load().
+        '''
+        with open(f_name, 'wb') as f:
+            marshal.dump(dict(fixed=self._fixed, words=self._words, posts=self._posts,
+                              docs=dict((label, docs.tostring()) for label, docs in self._docs.iteritems()),
+                              tokens=self._tokens.tostring()), f)
+
+    @staticmethod
+    def load(f_name):
+        '''
+        Return the NaiveBayesTrainer of the counts dump() wrote to f_name.
+
+        >>> import os, tempfile
+        >>> t = NaiveBayesTrainer(); t.add('1', [u'good day']); t.add('0', [u'bad'])
+        >>> f_name = os.path.join(tempfile.gettempdir(), 'training.doctest.dat')
+        >>> t.dump(f_name); t2 = NaiveBayesTrainer.load(f_name); os.remove(f_name)
+        >>> t2.compile([u'good']).version() == t.compile([u'good']).version(), t2.most_common(3)
+        (True, [u'bad', u'day', u'good'])
+        '''
+        with open(f_name, 'rb') as f:
+            d = marshal.load(f)
+        trainer = NaiveBayesTrainer(d['words'] if d['fixed'] else None)
+        trainer._words = d['words']
+        trainer._index = dict((w, i) for i, w in enumerate(trainer._words))
+        trainer._posts = d['posts']
+        for label, docs in d['docs'].iteritems():
+            trainer._docs[label] = array('i')
+            trainer._docs[label].fromstring(docs)
+        trainer._tokens = array('i')
+        trainer._tokens.fromstring(d['tokens'])
+        return trainer
+
+    def most_common(self, n, stop_words=()):
+        '''
+        Return the n words occurring most often, except stop_words, in the
+        order of nltk.FreqDist(words).keys()[:n].
+        '''
+        stop_words = set(stop_words)
+        counts = self._tokens
+        words = [(-counts[i], w) for i, w in enumerate(self._words) if counts[i] and w not in stop_words]
+        words.sort()
+        return [w for c, w in words[:n]]
+
+    def _feature_counts(self, word_features):
+        # the FeatureIndex of word_features, and for each label the number
+        # of its posts and the number containing each feature word
+        if word_features is None:
+            if not self._fixed:
+                raise ValueError('NaiveBayesTrainer: word_features are needed when every word is counted')
+            word_features = self._words
+        if not isinstance(word_features, FeatureIndex):
+            word_features = FeatureIndex(word_features)
+        columns = [self._index.get(w) for w in word_features.words()]
+        counts = []
+        for label in self.labels():
+            docs = self._docs[label]
+            counts.append((label, self._posts[label], [0 if i is None else docs[i] for i in columns]))
+        return word_features, counts
+
+    def _bins(self, counts, i):
+        # the number of values nltk records for feature i: True and False
+        # if seen, and None
+        return 1 + any(c[i] for label, n, c in counts) + any(c[i] < n for label, n, c in counts)
+
+    def classifier(self, word_features=None):
+        '''
+        Return the nltk NaiveBayesClassifier that
+        NaiveBayesClassifier.train() returns for the featuresets of the
+        posts over word_features, by default those counted.
+        '''
+        from nltk.probability import FreqDist, ELEProbDist
+        from nltk.classify import NaiveBayesClassifier
+        word_features, counts = self._feature_counts(word_features)
+        label_freqdist = FreqDist()
+        for label, n, c in counts:
+            label_freqdist.inc(label, n)
+        feature_probdist = {}
+        for i in xrange(len(word_features)):
+            fname = word_features.fname(i)
+            bins = self._bins(counts, i)
+            for label, n, c in counts:
+                freqdist = FreqDist()
+                freqdist.inc(True, c[i])
+                freqdist.inc(False, n - c[i])
+                feature_probdist[label, fname] = ELEProbDist(freqdist, bins=bins)
+        return NaiveBayesClassifier(ELEProbDist(label_freqdist), feature_probdist)
+
+    def compile(self, word_features=None):
+        '''
+        Return the emotion.CompiledClassifier of classifier(word_features),
+        computed from the counts, without nltk.
+        '''
+        from emotion import CompiledClassifier
+        word_features, counts = self._feature_counts(word_features)
+        labels = [label for label, n, c in counts]
+        total = sum(n for label, n, c in counts)
+        base = [_logprob(n, total, len(labels)) for label, n, c in counts]
+        delta = [[0.0] * len(word_features) for label in labels]
+        for i in xrange(len(word_features)):
+            bins = self._bins(counts, i)
+            for k, (label, n, c) in enumerate(counts):
+                absent = _logprob(n - c[i], n, bins)
+                base[k] += absent
+                delta[k][i] = _logprob(c[i], n, bins) - absent
+        return CompiledClassifier(labels, word_features, base, delta)
+
+class OnlineNaiveBayes(object):
+    '''
+    The compiled classifier of the counts of a NaiveBayesTrainer over fixed
+    word_features, kept up to date as posts are added.
+
+    Adding a post costs its tokens. The log probabilities are recomputed
+    when the classifier is next asked for, and only where the post changed
+    them: the columns of its words, and the rows of its label, which depend
+    on the number of posts of the label, from a cache of the values of each
+    (count, bins) pair. The result is the classifier trainer.compile()
+    returns, built from scratch.
+
+    >>> t = NaiveBayesTrainer(); t.add('1', [u'good', u'day']); t.add('0', [u'bad day']); t.add('0', [u'bad'])
+    >>> m = OnlineNaiveBayes([u'good', u'bad'], t)
+    >>> m.classifier().classify_words([u'good bad'])
+    '0'
+    >>> m.add('1', [u'good bad']); m.add('1', [u'bad day'])
+    >>> m.classifier().classify_words([u'good bad'])
+    '1'
+    >>> m.classifier().version() == t.compile([u'good', u'bad']).version()
+    True
+    '''
+
+    def __init__(self, word_features, trainer=None):
+        '''
+        Args:
+            word_features: FeatureIndex or list of the feature words.
+            trainer: NaiveBayesTrainer of the posts counted so far, by
+                default a new one counting word_features.
+        '''
+        if not isinstance(word_features, FeatureIndex):
+            word_features = FeatureIndex(word_features)
+        self._features = word_features
+        self._trainer = trainer if trainer is not None else NaiveBayesTrainer(word_features)
+        self._bins = array('i', [0]) * len(word_features)
+        # log probabilities of the absent words and deltas of each label,
+        # and the cache of their values for the number of posts of label:
+        self._absent = {}
+        self._delta = {}
+        self._tables = {}
+        # what the posts added since the last classifier() changed:
+        self._dirty_labels = set(self._trainer._posts)
+        self._dirty_columns = set(xrange(len(word_features)))
+        self._classifier = None
+
+    def trainer(self):
+        return self._trainer
+
+    def add(self, label, tokens):
+        '''
+        Count a post of label, segmented to tokens.
+        '''
+        tokens = list(tokens)
+        self._trainer.add(label, tokens)
+        self._dirty_labels.add(label)
+        self._dirty_columns.update(self._features.ids(tokens))
+        self._classifier = None
+
+    def add_texts(self, labeled_texts, chunksize=1024):
+        '''
+        Segment and count (label, text) pairs, as
+        NaiveBayesTrainer.add_texts() does.
+        '''
+        _add_texts(self, labeled_texts, chunksize)
+
+    def _value(self, label, n, c, bins):
+        # the log probability of the absent word and the delta of a column
+        # with count c of the n posts of label
+        table = self._tables[label]
+        value = table.get((c, bins))
+        if value is None:
+            absent = _logprob(n - c, n, bins)
+            value = table[c, bins] = (absent, _logprob(c, n, bins) - absent)
+        return value
+
+    def classifier(self):
+        '''
+        Return the emotion.CompiledClassifier of the posts counted so far.
+        '''
+        if self._classifier is not None:
+            return self._classifier
+        from emotion import CompiledClassifier
+        trainer = self._trainer
+        words = self._features.words()
+        columns = [trainer._index.get(w) for w in words]
+        labels = trainer.labels()
+        counts = [(label, trainer._posts[label], trainer._docs[label]) for label in labels]
+        def count(docs, i):
+            return 0 if columns[i] is None else docs[columns[i]]
+        # the bins of a column change with its counts, and, when labels got
+        # posts, if the word was in every post:
+        check = self._dirty_columns
+        if self._dirty_labels:
+            check = check | set(i for i in xrange(len(words)) if self._bins[i] < 3)
+        for i in check:
+            cs = [(count(docs, i), n) for label, n, docs in counts]
+            self._bins[i] = 1 + any(c for c, n in cs) + any(c < n for c, n in cs)
+        for label, n, docs in counts:
+            if label in self._dirty_labels or label not in self._absent:
+                self._tables[label] = {}
+                values = [self._value(label, n, count(docs, i), self._bins[i]) for i in xrange(len(words))]
+                self._absent[label] = array('d', [a for a, d in values])
+                self._delta[label] = array('d', [d for a, d in values])
+            else:
+                absent, delta = self._absent[label], self._delta[label]
+                for i in check:
+                    absent[i], delta[i] = self._value(label, n, count(docs, i), self._bins[i])
+        total = sum(n for label, n, docs in counts)
+        base = []
+        for label, n, docs in counts:
+            # summed in the order of NaiveBayesTrainer.compile(), to the
+            # same float
+            s = _logprob(n, total, len(labels))
+            for a in self._absent[label]:
+                s += a
+            base.append(s)
+        self._dirty_labels = set()
+        self._dirty_columns = set()
+        self._classifier = CompiledClassifier(labels, self._features, base, [self._delta[label] for label in labels])
+        return self._classifier
+
+    def snapshot(self, f_name):
+        '''
+        Write the classifier of the posts counted so far to the model file
+        f_name, which a modelregistry.ModelRegistry watching it loads.
+        '''
+        import modelfile
+        modelfile.write_model(self.classifier(), f_name)
+
+def _add_texts(counter, labeled_texts, chunksize):
+    labeled_texts = iter(labeled_texts)
+    while True:
+        chunk = list(itertools.islice(labeled_texts, chunksize))
+        if not chunk:
+            break
+        for (label, text), words in zip(chunk, jieba.cut_many([text for label, text in chunk])):
+            counter.add(label, words)
+
+if __name__=='__main__':
+    import doctest
+    doctest.testmod()
@@ -7,7 +7,7 @@ __author__ = 'Michael Liao'
 A simple cache interface.
 '''
 
-import os, time, datetime, functools, logging
+import os, time, pickle, datetime, functools, logging
 
 class DummyClient(object):
 
@@ -316,6 +316,158 @@ class RedisClient(object):
         '''
         return self._client.decr(key)
 
+class DiskClient(object):
+    '''
+    A cache stored in a local sqlite file, which survives restarts and is
+    shared by all processes using the same file.
+    '''
+
+    def __init__(self, path):
+        import sqlite3, threading
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.text_factory = str
+        # every set is a transaction of its own: with a write-ahead log and
+        # no fsync per commit, it costs about as much as a get. A crash may
+        # lose the last sets, which are only a cache.
+        self._conn.execute('pragma journal_mode=wal')
+        self._conn.execute('pragma synchronous=normal')
+        self._conn.execute('create table if not exists cache (key text not null, value blob not null, expires real not null, primary key(key))')
+
+    def _load(self, row):
+        if row is None:
+            return None
+        value, expires = row
+        if expires and expires < time.time():
+            return None
+        return pickle.loads(str(value))
+
+    def set(self, key, value, expires=0):
+        '''
+        Set object with key.
+
+        Args:
+            key: cache key as str.
+            value: object value.
+            expires: cache time in seconds, default to 0 (never expires)
+
+        >>> c = DiskClient(':memory:')
+        >>> c.set('key', u'Python\u4e2d\u6587')
+        >>> c.get('key')
+        u'Python\u4e2d\u6587'
+        >>> c.set('key', 'Expires after 1 sec', 1)
+        >>> c.get('key')
+        'Expires after 1 sec'
+        >>> time.sleep(2)
+        >>> c.get('key', 'Not Exist')
+        'Not Exist'
+        '''
+        data = buffer(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._conn.execute('insert or replace into cache (key, value, expires) values (?, ?, ?)', (key, data, time.time() + expires if expires else 0))
+
+    def get(self, key, default=None):
+        '''
+        Get object by key.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.get('key')
+        >>> c.get('key', 'DEFAULT_DISK')
+        'DEFAULT_DISK'
+        >>> c.set('key', dict(rank=2))
+        >>> c.get('key')
+        {'rank': 2}
+        '''
+        with self._lock:
+            row = self._conn.execute('select value, expires from cache where key=?', (key,)).fetchone()
+        r = self._load(row)
+        return default if r is None else r
+
+    def gets(self, *keys):
+        '''
+        Get objects by keys.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.set('key1', 'Key1')
+        >>> c.set('key3', 'Key3')
+        >>> c.gets('key1', 'key2', 'key3')
+        ['Key1', None, 'Key3']
+        '''
+        rows = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                part = keys[i:i+500]
+                sql = 'select key, value, expires from cache where key in (%s)' % ','.join(['?'] * len(part))
+                for key, value, expires in self._conn.execute(sql, part):
+                    rows[key] = (value, expires)
+        return [self._load(rows.get(k)) for k in keys]
+
+    def delete(self, key):
+        '''
+        Delete object from cache by key.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.set('key', 'delete from disk')
+        >>> c.delete('key')
+        >>> c.get('key')
+        '''
+        with self._lock:
+            self._conn.execute('delete from cache where key=?', (key,))
+
+    def delete_prefix(self, prefix):
+        '''
+        Delete the objects whose keys start with prefix, and return how many
+        were deleted. The file is never evicted, so keys that are no longer
+        used, e.g. of an old version, must be deleted this way.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.set('v1:a', 1)
+        >>> c.set('v1:b', 2)
+        >>> c.set('v2:a', 3)
+        >>> c.delete_prefix('v1:')
+        2
+        >>> c.gets('v1:a', 'v2:a')
+        [None, 3]
+        '''
+        with self._lock:
+            return self._conn.execute('delete from cache where substr(key, 1, ?)=?', (len(prefix), prefix)).rowcount
+
+    def incr(self, key):
+        '''
+        Increase counter.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.incr('key')
+        1
+        >>> c.set('key', 100)
+        >>> c.incr('key')
+        101
+        '''
+        return self._add(key, 1)
+
+    def decr(self, key):
+        '''
+        Decrease counter.
+
+        >>> c = DiskClient(':memory:')
+        >>> c.decr('key')
+        -1
+        '''
+        return self._add(key, -1)
+
+    def _add(self, key, n):
+        with self._lock:
+            self._conn.execute('begin immediate')
+            try:
+                row = self._conn.execute('select value, expires from cache where key=?', (key,)).fetchone()
+                r = (self._load(row) or 0) + n
+                self._conn.execute('insert or replace into cache (key, value, expires) values (?, ?, 0)', (key, buffer(pickle.dumps(r, pickle.HIGHEST_PROTOCOL))))
+                self._conn.execute('commit')
+            except:
+                self._conn.execute('rollback')
+                raise
+        return r
+
 client = DummyClient()
 
 if __name__=='__main__':
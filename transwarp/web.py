@@ -1671,6 +1671,23 @@ class Template(object):
         if '_' in __builtin__.__dict__:
             self.model['_'] = _
 
+class JsonStream(object):
+
+    def __init__(self, iterable):
+        '''
+        Init a streaming json result with an iterable of objects. Each object is
+        sent as one line of json as soon as the iterable generates it, so the
+        client can handle the first objects before the last ones are computed.
+
+        >>> list(JsonStream([dict(name='Bob'), [1, None]]))
+        ['{"name": "Bob"}\\n', '[1, null]\\n']
+        '''
+        self.iterable = iterable
+
+    def __iter__(self):
+        for obj in self.iterable:
+            yield _json_dumps(obj) + '\n'
+
 def _init_mako(templ_dir, **kw):
     '''
     Render using mako.
@@ -2046,6 +2063,9 @@ class WSGIApplication(object):
             return ()
         except Exception as e:
             return self.error_handler(e, start_response, self._debug)
+        if isinstance(ret, JsonStream):
+            ctx.response.content_type = 'application/x-json-stream; charset=utf-8'
+            ret = iter(ret)
         if isinstance(ret, types.GeneratorType):
             start_response(ctx.response.status, ctx.response.headers)
             return ret
@@ -3,31 +3,23 @@
 
 __author__ = 'Michael Liao'
 
-import time, json, base64, logging, hashlib
+import os, time, json, base64, logging, hashlib, tempfile
 from datetime import datetime, tzinfo, timedelta
 
-from transwarp.web import ctx, get, post, route, seeother, forbidden, jsonresult, Template
-from transwarp import db
+from transwarp.web import ctx, get, post, route, seeother, forbidden, jsonresult, JsonStream, Template
+from transwarp import db, cache
 
 from weibo import APIError, APIClient
-import pickle, random, jieba,jieba.analyse
+import random, jieba,jieba.analyse
+import pipeline, statusstore
+from timeline import fetch_timeline
+from modelregistry import ModelRegistry
 import StringIO
 try:
   	import pylibmc
 except Exception,e:
     pass
-try:
-   import nltk
-except Exception, e:
-   print e
-   try:
-       from nltk import FreqDist
-       import nltk.NaiveBayesClassifier
-   except Exception, e:
-       pass 
-   
-
-#import nltk
+
 
 _TD_ZERO = timedelta(0)
 _TD_8 = timedelta(hours=8)
@@ -40,11 +32,21 @@ _TD_8 = timedelta(hours=8)
 #word_features = mc.get('word_features')
 #classifier = mc.get('classifier')
 #if not mc.get('word_features'):
- #   word_features = pickle.load(open('word_features.dat','r'))
+ #   word_features = FeatureIndex.load('word_features.dat')
   #  mc.set("word_features", str(word_features) )
 
-word_features = pickle.load(open('word_features.dat','r'))
-classifier = pickle.load(open("classifierdata.dat","r"))
+def _create_cache_client():
+    try:
+        import sae
+    except Exception, e:
+        return cache.DiskClient(os.path.join(tempfile.gettempdir(), 'weibo.result.cache'))
+    else:
+        return pylibmc.Client()
+
+# python modelfile.py classifierdata.dat word_features.dat model.bin after
+# training; a new model.bin is loaded by the running workers:
+models = ModelRegistry('model.bin', _create_cache_client())
+models.start()
 
 class UTC8(tzinfo):
     def utcoffset(self, dt):
@@ -171,24 +173,54 @@ def bifriends():
         return dict(error='failed')
 
 @route('/analysis')
-@jsonresult
 def analysis():
     u = _check_cookie()
     if u is None:
-        return dict(error='failed', redirect='/signin')
+        return JsonStream([dict(error='failed', redirect='/signin')])
     month = int(ctx.request.get('month'))
-    weibo = getWeiboByTime(months = month)
-    analysis_result, weibo, keywords= weiboAnalysis(weibo)
-    # for w in weibo:
-    #     print "analysis", w['rank']
-    weibo = [_format_weibo(wb) for wb in weibo]
-    remark = ''
-    if analysis_result[0] > analysis_result[2]:
-        remark = u'经检测我这段时间内的负能量过高，需要补充正能量!'
-    else:
-        remark = u'经检测我这段时间内正能量爆棚啦哇咔咔！'
+    client = _create_client()
+    client.set_access_token(u.auth_token, u.expired_time)
+    return JsonStream(_analysis_stream(iterWeiboByTime(client, months = month, uid = u.id)))
 
-    return json.dumps({'total':len(weibo), 'pos' : analysis_result[2], 'neu' : analysis_result[1], 'neg' : analysis_result[0], 'weibo' : weibo, 'keywords' : keywords, 'remark' : remark})
+def _analysis_stream(weibo):
+    '''
+    Generate one dict per analysed weibo, with the counts so far, then the
+    summary of the whole period. Runs after the request context is gone.
+    '''
+    data = [0] * 3
+    keywords = jieba.analyse.KeywordAggregator()
+    # the whole stream on one model, even if a new one is loaded meanwhile:
+    model = models.current()
+    try:
+        for w, rank, terms in pipeline.analyse(weibo, model.classifier, cache=model.result_cache):
+            w['rank'] = rank
+            data[rank] += 1
+            keywords.add_freqs(terms)
+            yield {'weibo' : _format_weibo(w), 'pos' : data[2], 'neu' : data[1], 'neg' : data[0]}
+    except Exception, e:
+        # an APIError, or a failure of the store or of the model: the page
+        # waits for a line either way
+        if not isinstance(e, APIError):
+            logging.exception('analysis failed')
+        yield dict(error='failed')
+        return
+    logging.info('result cache: %s' % json.dumps(model.result_cache.stats()))
+    yield {'total' : sum(data), 'pos' : data[2], 'neu' : data[1], 'neg' : data[0], 'keywords' : keywords.top(300), 'remark' : _remark(data)}
+
+def _remark(data):
+    if data[0] > data[2]:
+        return u'经检测我这段时间内的负能量过高，需要补充正能量!'
+    return u'经检测我这段时间内正能量爆棚啦哇咔咔！'
+
+@get('/stats')
+@jsonresult
+def stats():
+    u = _check_cookie()
+    if u is None:
+        return dict(error='failed', redirect='/signin')
+    model = models.stats()
+    result_cache = model.pop('result_cache')
+    return dict(model_version=model['version'], result_cache=result_cache, model=model)
 
 @route('/load')
 @jsonresult
@@ -375,74 +407,52 @@ def _create_client():
         return APIClient(_APP_ID, _APP_SECRET, 'http://tobeornottobe.sinaapp.com/callback')
     
 
-def transformTime(created_time):
-    a = created_time.split()
-    month_mapping = {'Jan' : '01', 'Feb' : '02', 'Mar' : '03', 'Apr' : '04', 'May' : '05', 'Jun' : '06', 'Jul' : '07', 'Aug' : '08', 'Sep' : '09', 'Oct' : '10', 'Nov' : '11', 'Dec' : '12'}
-    t = a[-1] + month_mapping[a[1]] + a[2]
-    return t
-
-
-def getWeiboByTime(assigned_time = None, months = 3):
+def iterWeiboByTime(client, assigned_time = None, months = 3, uid = None):
+    '''
+    Generate the statuses since assigned_time, or since the first day of the
+    month months-1 months ago. With uid, the local status store is synced
+    first and the statuses are read from it.
+    '''
     import time
     t = time.strftime('%Y%m',time.localtime(time.time() - 2592000 * (months-1))) + '01'
     if assigned_time:
         t = assigned_time
-    weibo = []
-    page = 1
+    if uid is None:
+        return fetch_timeline(client, t, count = 100)
+    return statusstore.iter_synced(client, uid, t, count = 100)
+
+def getWeiboByTime(assigned_time = None, months = 3):
     u = _check_cookie()
     if u is None:
         return dict(error='failed', redirect='/signin')
     client = _create_client()
     client.set_access_token(u.auth_token, u.expired_time)
-    while True:
-        wbs = client.statuses.user_timeline.get( count = 100, page = page)
-        flag = False
-        for wb in wbs['statuses']:
-            if transformTime(wb['created_at']) >= t:
-                # text = wb['text']
-                # if 'retweeted_status' in wb:
-                #     text += wb['retweeted_status']['text']
-                weibo.append(wb)
-                # print transformTime(wb['created_at'])
-            else:
-                flag = True
-                break
-        page += 1
-        if flag:
-            break
+    weibo = list(iterWeiboByTime(client, assigned_time, months, uid = u.id))
     print "Total weibos: %d" %(len(weibo))
     return weibo
 
 def gender_features(weibo):
-    global word_features
-    a = jieba.cut(weibo)
-    fl = (" ".join(a)).split()
-    fd = {}
-    for word in word_features:
-        fd[u'contains(%s)'%word] = (word in fl)
-    return fd
+    return models.current().classifier.word_features().featureset(jieba.cut(weibo))
 
 def weiboAnalysis(weibo):
-    """weibo analysis tool"""
+    """weibo analysis tool, weibo is a list or a stream of statuses"""
     data = [0] * 3
-    keywords = []
-    global classifier 
-    for i in range(len(weibo)):
-        w = weibo[i]
-        text = w['text']
-        if 'retweeted_status' in w:
-            text += w['retweeted_status']['text']
-            keywords += jieba.analyse.extract_tags(text, topK=10)    
-        rank = int(classifier.classify(gender_features(text)))
-        weibo[i]['rank'] = rank
+    keywords = jieba.analyse.KeywordAggregator()
+    model = models.current()
+    analysed = []
+    for w, rank, terms in pipeline.analyse(weibo, model.classifier, cache=model.result_cache):
+        w['rank'] = rank
         data[rank] += 1
+        keywords.add_freqs(terms)
+        analysed.append(w)
         # print rank, '\n\n'
+    weibo = analysed
     # for w in weibo:
     #     print "rank", w['rank']
     print u'Total analysis: %d' %(len(weibo))
     for i in range(3) :
         print i, ' ', data[i]
-    keywords = nltk.FreqDist(keywords).keys()[:300]
+    keywords = keywords.top(300)
     # for i in keywords:
     #     print i
     return data, weibo,keywords
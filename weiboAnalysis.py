@@ -3,8 +3,7 @@
 
 import random
 import jieba
-import nltk
-import pickle
+import modelfile
 from weibo import APIError, APIClient
 
 APP_KEY = '3357173382'            # app key
@@ -12,17 +11,12 @@ APP_SECRET = '7429e1824d38c77b09258b3624345ad4'      # app secret
 CALLBACK_URL = 'http://127.0.0.1:8080/callback'  # callback url
 client = APIClient(app_key=APP_KEY, app_secret=APP_SECRET, redirect_uri=CALLBACK_URL)
 client.set_access_token('2.00UHhZqBmJ3MfD38221bf624hl6oCE', '1546415658')
-word_features = pickle.load(open('word_features.dat','r'))
-classifier = pickle.load(open("classifierdata.dat","r"))
+classifier = modelfile.load_model('model.bin')
+word_features = classifier.word_features()
 
 def gender_features(weibo):
     global word_features
-    a = jieba.cut(weibo)
-    fl = (" ".join(a)).split()
-    fd = {}
-    for word in word_features:
-        fd[u'contains(%s)'%word] = (word in fl)
-    return fd
+    return word_features.featureset(jieba.cut(weibo))
 
 def getWeiboPro(st):
     wb = []
@@ -77,9 +71,10 @@ def weiboAnalysis(weibo):
     """weibo analysis tool"""
     data = [0] * 3
     global classifier 
-    for w in weibo:
+    ranks = classifier.classify_many(weibo)
+    for w, rank in zip(weibo, ranks):
         print w
-        rank = int(classifier.classify(gender_features(w)))
+        rank = int(rank)
         data[rank] += 1
         print rank, '\n\n'
     print u'Total analysis: %d' %(len(weibo))